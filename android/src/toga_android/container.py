@@ -38,7 +38,7 @@ class Container(Scalable):
         if (self.native_width, self.native_height) != (width, height):
             self.native_width, self.native_height = (width, height)
             if self.content:
-                self.content.interface.refresh()
+                self.content.interface.refresh(immediate=True)
 
     def refreshed(self):
         if self.pre_refresh:
@@ -0,0 +1,217 @@
+"""Shared machinery for running Toga's benchmarks and recording their results.
+
+Each benchmark module defines a set of benchmark functions, and invokes `main()` to
+run them. Results are written as JSON, so that the results from different releases
+(or different branches) can be compared using `--compare`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from statistics import mean, median
+
+
+@dataclass
+class Result:
+    name: str
+    scale: int
+    repeat: int
+    min: float
+    median: float
+    mean: float
+
+    @property
+    def key(self) -> str:
+        return f"{self.name}[{self.scale}]"
+
+
+class Benchmark:
+    """A benchmark that can be run at a range of scales.
+
+    The wrapped function is invoked with the scale of the benchmark. It must return a
+    callable that performs a single timed iteration of the benchmark. Any set up that
+    shouldn't be included in the timing should be done before returning the callable.
+    If the iteration needs to be set up again before each repeat, the function can
+    instead return a tuple of `(setup, iteration)` callables.
+    """
+
+    def __init__(self, func, max_scale=None):
+        self.func = func
+        self.name = func.__name__.removeprefix("bench_")
+        self.max_scale = max_scale
+
+    def run(self, scale: int, repeat: int) -> Result:
+        prepared = self.func(scale)
+        if isinstance(prepared, tuple):
+            setup, iteration = prepared
+        else:
+            setup, iteration = None, prepared
+
+        timings = []
+        for _ in range(repeat):
+            if setup:
+                setup()
+            # Don't let a garbage collection pause distort an individual timing.
+            gc.collect()
+            gc.disable()
+            try:
+                start = time.perf_counter()
+                iteration()
+                timings.append(time.perf_counter() - start)
+            finally:
+                gc.enable()
+
+        return Result(
+            name=self.name,
+            scale=scale,
+            repeat=repeat,
+            min=min(timings),
+            median=median(timings),
+            mean=mean(timings),
+        )
+
+
+def benchmark(max_scale=None):
+    """Declare a benchmark function.
+
+    :param max_scale: The largest scale at which this benchmark should be run. Any
+        larger scale will be skipped (e.g., because it would take too long to run).
+    """
+
+    def decorator(func):
+        return Benchmark(func, max_scale=max_scale)
+
+    return decorator
+
+
+def _metadata() -> dict:
+    versions = {}
+    for package in ["toga-core", "toga-dummy", "travertino"]:
+        try:
+            versions[package] = version(package)
+        except PackageNotFoundError:  # pragma: no cover
+            versions[package] = None
+
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version,
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "versions": versions,
+    }
+
+
+def compare(results: list[Result], baseline_path: Path, threshold: float) -> bool:
+    """Compare results with a previous run, reporting any regressions.
+
+    :returns: True if any benchmark is slower than the baseline by more than the
+        threshold.
+    """
+    baseline = {
+        f"{entry['name']}[{entry['scale']}]": entry
+        for entry in json.loads(baseline_path.read_text(encoding="utf-8"))["results"]
+    }
+
+    regressed = False
+    print()
+    print(f"Comparison with {baseline_path} (threshold {threshold:.0%}):")
+    for result in results:
+        try:
+            previous = baseline[result.key]["min"]
+        except KeyError:
+            print(f"  {result.key:<45} (new)")
+            continue
+
+        change = (result.min - previous) / previous if previous else 0.0
+        if change > threshold:
+            marker = "REGRESSION"
+            regressed = True
+        elif change < -threshold:
+            marker = "improved"
+        else:
+            marker = ""
+        print(f"  {result.key:<45} {change:+8.1%} {marker}")
+
+    return regressed
+
+
+def main(benchmarks: dict[str, Benchmark], default_scales: list[int], argv=None):
+    parser = argparse.ArgumentParser(description=sys.modules["__main__"].__doc__)
+    parser.add_argument(
+        "--scales",
+        type=lambda value: [int(scale) for scale in value.split(",")],
+        default=default_scales,
+        help="Comma-separated list of scales (number of nodes) to run.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of timed repeats of each benchmark.",
+    )
+    parser.add_argument(
+        "-k",
+        dest="selection",
+        default=None,
+        help="Only run benchmarks whose name contains this string.",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="Write the results to this JSON file.",
+    )
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        default=None,
+        help="Compare the results with a previous JSON results file.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Fractional slowdown that is reported as a regression (default 0.1).",
+    )
+    args = parser.parse_args(argv)
+
+    results = []
+    for name, bench in benchmarks.items():
+        if args.selection and args.selection not in name:
+            continue
+        for scale in args.scales:
+            if bench.max_scale is not None and scale > bench.max_scale:
+                continue
+            result = bench.run(scale, repeat=args.repeat)
+            results.append(result)
+            print(
+                f"{result.key:<45} min {result.min * 1000:10.3f} ms"
+                f"   median {result.median * 1000:10.3f} ms"
+            )
+
+    if args.output:
+        args.output.write_text(
+            json.dumps(
+                {
+                    "metadata": _metadata(),
+                    "results": [asdict(result) for result in results],
+                },
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+        print(f"\nResults written to {args.output}")
+
+    if args.compare and compare(results, args.compare, args.threshold):
+        return 1
+    return 0
@@ -0,0 +1,318 @@
+"""Benchmarks for Travertino and Pack layout, using the dummy backend.
+
+Run from the root of the repository, with toga-core, toga-dummy and travertino
+installed:
+
+    $ python benchmarks/layout.py --output layout.json
+
+Trees of `toga.Box` widgets are built in three shapes:
+
+* `deep`: a single chain of nested boxes;
+* `wide`: a single box with every other widget as a direct child;
+* `mixed`: a balanced tree of boxes, with labels as leaves.
+
+The scale of a benchmark is the number of widgets in the tree. As layout is recursive,
+deep trees are only built at scales up to `MAX_DEPTH`.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+os.environ.setdefault("TOGA_BACKEND", "toga_dummy")
+
+from harness import benchmark, main
+from travertino.size import at_least
+
+import toga
+from toga.style.pack import COLUMN, ROW
+from toga_dummy.utils import EventLog
+
+# Each level of a deep tree needs a few stack frames during layout.
+sys.setrecursionlimit(max(sys.getrecursionlimit(), 10_000))
+
+SCALES = [10, 100, 1_000, 10_000, 50_000]
+# The fan-out of each box in a mixed tree.
+FAN_OUT = 8
+# Layout is recursive, so the depth of a deep tree is limited by the recursion limit.
+MAX_DEPTH = 1_000
+
+
+def _leaf(index):
+    label = toga.Label(f"Label {index}", flex=index % 2)
+    # The dummy backend doesn't compute an intrinsic size; provide a plausible one.
+    label.intrinsic.width = at_least(50 + index % 7)
+    label.intrinsic.height = 20
+    return label
+
+
+def deep_tree(size):
+    root = toga.Box(direction=COLUMN)
+    box = root
+    for i in range(size - 2):
+        child = toga.Box(direction=ROW if i % 2 else COLUMN, margin=1)
+        box.add(child)
+        box = child
+    box.add(_leaf(0))
+    return root
+
+
+def wide_tree(size):
+    root = toga.Box(direction=COLUMN, gap=2)
+    root.add(*(_leaf(i) for i in range(size - 1)))
+    return root
+
+
+def mixed_tree(size):
+    # Lay the tree out breadth-first; node i is the parent of nodes
+    # i * FAN_OUT + 1 to i * FAN_OUT + FAN_OUT.
+    nodes = []
+    for i in range(size):
+        if i * FAN_OUT + 1 < size:
+            nodes.append(
+                toga.Box(
+                    direction=ROW if i % 2 else COLUMN,
+                    flex=i % 3,
+                    margin=i % 4,
+                )
+            )
+        else:
+            nodes.append(_leaf(i))
+
+    for i in range(1, size):
+        nodes[(i - 1) // FAN_OUT].add(nodes[i])
+    return nodes[0]
+
+
+SHAPES = {
+    "deep": deep_tree,
+    "wide": wide_tree,
+    "mixed": mixed_tree,
+}
+
+
+def _in_window(root):
+    """Install a tree as the content of a window, so that it has a container."""
+    window = toga.Window()
+    window.content = root
+    EventLog.reset()
+    return window
+
+
+def _in_event_loop(func):
+    """Wrap a function so that it is invoked while the app's event loop is running.
+
+    This mirrors a change made by an event handler, where layout refreshes are
+    deferred until the next iteration of the event loop.
+    """
+
+    async def run():
+        func()
+
+    def wrapper():
+        toga.App.app.loop.run_until_complete(run())
+
+    return wrapper
+
+
+def _descendants(node):
+    yield node
+    for child in node.children:
+        yield from _descendants(child)
+
+
+def _dirty_all(root):
+    # Force a full layout; marking each leaf dirty also marks every ancestor.
+    for node in _descendants(root):
+        if not node.children:
+            node.mark_layout_dirty()
+
+
+def _deepest_leaf(root):
+    node = root
+    while node.children:
+        node = node.children[-1]
+    return node
+
+
+BENCHMARKS = {}
+
+
+def _register(name):
+    """Register a benchmark for each shape of tree."""
+
+    def decorator(factory):
+        for shape in SHAPES:
+            max_scale = MAX_DEPTH if shape == "deep" else None
+            bench = benchmark(max_scale=max_scale)(factory(shape))
+            bench.name = f"{name}[{shape}]"
+            BENCHMARKS[bench.name] = bench
+        return factory
+
+    return decorator
+
+
+@_register("layout_full")
+def layout_full(shape):
+    def bench_layout_full(scale):
+        root = SHAPES[shape](scale)
+        window = _in_window(root)
+        viewport = window._impl.container
+
+        def iteration():
+            root.style.layout(viewport)
+
+        return (lambda: _dirty_all(root)), iteration
+
+    return bench_layout_full
+
+
+@_register("layout_incremental")
+def layout_incremental(shape):
+    def bench_layout_incremental(scale):
+        root = SHAPES[shape](scale)
+        window = _in_window(root)
+        viewport = window._impl.container
+        leaf = _deepest_leaf(root)
+
+        def setup():
+            leaf.intrinsic.width = at_least(leaf.intrinsic.width.value % 100 + 1)
+
+        def iteration():
+            root.style.layout(viewport)
+
+        return setup, iteration
+
+    return bench_layout_incremental
+
+
+@_register("layout_resize")
+def layout_resize(shape):
+    def bench_layout_resize(scale):
+        root = SHAPES[shape](scale)
+        _in_window(root)
+
+        class Viewport:
+            width = 640
+            height = 480
+
+        viewport = Viewport()
+
+        def setup():
+            # A different size every time, so no previous layout can be reused.
+            viewport.width += 1
+
+        def iteration():
+            root.style.layout(viewport)
+
+        return setup, iteration
+
+    return bench_layout_resize
+
+
+@_register("set_bounds")
+def set_bounds(shape):
+    def bench_set_bounds(scale):
+        root = SHAPES[shape](scale)
+        _in_window(root)
+
+        def setup():
+            root.applicator.reset_bounds()
+            EventLog.reset()
+
+        def iteration():
+            root.applicator.set_bounds()
+
+        return setup, iteration
+
+    return bench_set_bounds
+
+
+@_register("style_update")
+def style_update(shape):
+    def bench_style_update(scale):
+        root = SHAPES[shape](scale)
+        window = _in_window(root)
+        nodes = list(_descendants(root))
+        margin = [0]
+
+        def setup():
+            margin[0] = (margin[0] + 1) % 10
+            EventLog.reset()
+
+        @_in_event_loop
+        def iteration():
+            for node in nodes:
+                node.style.update(margin=margin[0], flex=margin[0] % 3)
+            window.flush_layout()
+
+        return setup, iteration
+
+    return bench_style_update
+
+
+@_register("batch_apply")
+def batch_apply(shape):
+    def bench_batch_apply(scale):
+        root = SHAPES[shape](scale)
+        window = _in_window(root)
+        nodes = list(_descendants(root))
+        margin = [0]
+
+        def setup():
+            margin[0] = (margin[0] + 1) % 10
+            EventLog.reset()
+
+        @_in_event_loop
+        def iteration():
+            for node in nodes:
+                with node.style.batch_apply():
+                    node.style.margin_top = margin[0]
+                    node.style.margin_bottom = margin[0]
+                    node.style.color = "red" if margin[0] % 2 else "blue"
+            window.flush_layout()
+
+        return setup, iteration
+
+    return bench_batch_apply
+
+
+@_register("build")
+def build(shape):
+    def bench_build(scale):
+        @_in_event_loop
+        def iteration():
+            root = SHAPES[shape](scale)
+            _in_window(root).flush_layout()
+
+        return EventLog.reset, iteration
+
+    return bench_build
+
+
+@_register("add_remove")
+def add_remove(shape):
+    def bench_add_remove(scale):
+        root = SHAPES[shape](scale)
+        window = _in_window(root)
+        parent = _deepest_leaf(root).parent
+        extra = [toga.Label(f"Extra {i}") for i in range(10)]
+
+        @_in_event_loop
+        def iteration():
+            for label in extra:
+                parent.insert(0, label)
+            window.flush_layout()
+            for label in extra:
+                parent.remove(label)
+            window.flush_layout()
+
+        return EventLog.reset, iteration
+
+    return bench_add_remove
+
+
+if __name__ == "__main__":
+    toga.App(formal_name="Layout Benchmark", app_id="org.beeware.toga.benchmark")
+    sys.exit(main(BENCHMARKS, SCALES))
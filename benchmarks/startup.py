@@ -0,0 +1,99 @@
+"""Benchmarks for the time taken to start a Toga app, using the dummy backend.
+
+Run from the root of the repository, with toga-core, toga-dummy and travertino
+installed:
+
+    $ python benchmarks/startup.py --output startup.json
+
+Every iteration launches a new Python interpreter, so the times include the time taken
+for Python itself to start; the `python` benchmark measures that time on its own.
+
+* `python`: start Python, without importing anything;
+* `import_toga`: start Python, and import `toga`;
+* `first_window`: start an app, and display a main window containing a box of labels;
+* `first_window_cached`: as `first_window`, but with the entry points of the installed
+  packages read from a `TOGA_ENTRY_POINT_CACHE` file.
+
+The scale of the `first_window` benchmarks is the number of labels in the window. The
+other benchmarks don't depend on the scale, so they're only run at a scale of 1.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from harness import benchmark, main
+
+SCALES = [1, 100, 1_000]
+
+FIRST_WINDOW = """
+import toga
+
+class Startup(toga.App):
+    def startup(self):
+        self.main_window = toga.MainWindow()
+        self.main_window.content = toga.Box(
+            children=[toga.Label(f"Label {{i}}") for i in range({scale})]
+        )
+        self.main_window.show()
+
+app = Startup("Startup Benchmark", "org.beeware.toga.benchmark")
+app.main_window.flush_layout()
+"""
+
+
+def _launch(code, **environ):
+    """Return a callable that runs code in a new Python interpreter."""
+    env = {**os.environ, "TOGA_BACKEND": "toga_dummy"}
+    env.pop("TOGA_ENTRY_POINT_CACHE", None)
+    env.update(environ)
+
+    def iteration():
+        subprocess.run([sys.executable, "-c", code], env=env, check=True)
+
+    return iteration
+
+
+@benchmark(max_scale=1)
+def bench_python(scale):
+    return _launch("pass")
+
+
+@benchmark(max_scale=1)
+def bench_import_toga(scale):
+    return _launch("import toga")
+
+
+@benchmark()
+def bench_first_window(scale):
+    return _launch(FIRST_WINDOW.format(scale=scale))
+
+
+@benchmark()
+def bench_first_window_cached(scale):
+    cache = Path(tempfile.mkdtemp()) / "entry-points.json"
+    iteration = _launch(
+        FIRST_WINDOW.format(scale=scale), TOGA_ENTRY_POINT_CACHE=str(cache)
+    )
+    # Populate the cache, so that every timed launch can use it.
+    iteration()
+    return iteration
+
+
+BENCHMARKS = {
+    bench.name: bench
+    for bench in [
+        bench_python,
+        bench_import_toga,
+        bench_first_window,
+        bench_first_window_cached,
+    ]
+}
+
+
+if __name__ == "__main__":
+    sys.exit(main(BENCHMARKS, SCALES))
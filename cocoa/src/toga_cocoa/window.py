@@ -70,7 +70,7 @@ class TogaWindow(NSWindow):
             self.impl.interface.on_resize()
         if self.interface.content:
             # Set the window to the new size
-            self.interface.content.refresh()
+            self.interface.content.refresh(immediate=True)
 
     @objc_method
     def windowDidBecomeMain_(self, notification):
@@ -482,7 +482,7 @@ class Window:
                 # remains unchanged, hence the windowDidResize_ would not be notified
                 # when the window goes into presentation mode.
                 self.interface.on_resize()
-                self.interface.content.refresh()
+                self.interface.content.refresh(immediate=True)
 
                 # No need to check for other pending states, since this is fully applied
                 # at this point.
@@ -508,7 +508,7 @@ class Window:
                 # remains unchanged, hence the windowDidResize_ would not be notified
                 # when the window goes out of the presentation mode.
                 self.interface.on_resize()
-                self.interface.content.refresh()
+                self.interface.content.refresh(immediate=True)
 
                 self.interface.screen = self._before_presentation_mode_screen
                 del self._before_presentation_mode_screen
@@ -574,7 +574,7 @@ class MainWindow(Window):
 
         # Adding/removing a toolbar changes the size of the content window.
         if self.interface.content:
-            self.interface.content.refresh()
+            self.interface.content.refresh(immediate=True)
 
     def purge_toolbar(self):
         while self._toolbar_items:
@@ -1,21 +1,7 @@
 import importlib
 import warnings
-from importlib.metadata import version
-from pathlib import Path
 
-
-def lazy_load():
-    toga_core_imports = {}
-    pyi = Path(__file__).with_suffix(".pyi")
-    with pyi.open(encoding="utf-8") as f:
-        for line in f:
-            match line.split():
-                case "from", module_name, "import", class_name, "as", _:
-                    toga_core_imports[class_name] = module_name
-    return toga_core_imports
-
-
-toga_core_imports = lazy_load()
+from ._imports import toga_core_imports
 
 __all__ = list(toga_core_imports.keys())
 
@@ -24,6 +10,14 @@ def __getattr__(name):
     try:
         module_name = toga_core_imports[name]
     except KeyError:
+        if name == "__version__":
+            # Reading the version from the package metadata is slow, so it's only done
+            # if the version is requested.
+            from importlib.metadata import version
+
+            value = version("toga-core")
+            globals()[name] = value
+            return value
         raise AttributeError(f"module '{__name__}' has no attribute '{name}'") from None
     else:
         module = importlib.import_module(module_name)
@@ -43,6 +37,3 @@ class NotImplementedWarning(RuntimeWarning):
             NotImplementedWarning(f"[{platform}] Not implemented: {feature}"),
             stacklevel=2,
         )
-
-
-__version__ = version("toga-core")
@@ -21,6 +21,11 @@ from toga.dialogs import StackTraceDialog as StackTraceDialog
 from toga.documents import Document as Document
 from toga.documents import DocumentWindow as DocumentWindow
 from toga.fonts import Font as Font
+from toga.handlers import background as background
+from toga.handlers import coalesce as coalesce
+from toga.handlers import debounce as debounce
+from toga.handlers import run_in_executor as run_in_executor
+from toga.handlers import throttle as throttle
 from toga.icons import Icon as Icon
 from toga.images import Image as Image
 from toga.keys import Key as Key
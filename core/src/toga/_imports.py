@@ -0,0 +1,74 @@
+# This file is generated from __init__.pyi, so that the names that are imported on
+# demand by `toga` don't need to be parsed from the stub every time toga is imported.
+# After changing __init__.pyi, regenerate it by running (from the root of the
+# repository):
+#
+#     $ python tools/generate_imports.py
+
+toga_core_imports = {
+    "App": "toga.app",
+    "DocumentApp": "toga.app",
+    "hsl": "toga.colors",
+    "hsla": "toga.colors",
+    "rgb": "toga.colors",
+    "rgba": "toga.colors",
+    "Command": "toga.command",
+    "Group": "toga.command",
+    "ConfirmDialog": "toga.dialogs",
+    "ErrorDialog": "toga.dialogs",
+    "InfoDialog": "toga.dialogs",
+    "OpenFileDialog": "toga.dialogs",
+    "QuestionDialog": "toga.dialogs",
+    "SaveFileDialog": "toga.dialogs",
+    "SelectFolderDialog": "toga.dialogs",
+    "StackTraceDialog": "toga.dialogs",
+    "Document": "toga.documents",
+    "DocumentWindow": "toga.documents",
+    "Font": "toga.fonts",
+    "background": "toga.handlers",
+    "coalesce": "toga.handlers",
+    "debounce": "toga.handlers",
+    "run_in_executor": "toga.handlers",
+    "throttle": "toga.handlers",
+    "Icon": "toga.icons",
+    "Image": "toga.images",
+    "Key": "toga.keys",
+    "backend": "toga.platform",
+    "MenuStatusIcon": "toga.statusicons",
+    "SimpleStatusIcon": "toga.statusicons",
+    "LatLng": "toga.types",
+    "Position": "toga.types",
+    "Size": "toga.types",
+    "ActivityIndicator": "toga.widgets.activityindicator",
+    "Widget": "toga.widgets.base",
+    "Box": "toga.widgets.box",
+    "Button": "toga.widgets.button",
+    "Canvas": "toga.widgets.canvas",
+    "Column": "toga.widgets.box",
+    "DateInput": "toga.widgets.dateinput",
+    "DetailedList": "toga.widgets.detailedlist",
+    "Divider": "toga.widgets.divider",
+    "ImageView": "toga.widgets.imageview",
+    "Label": "toga.widgets.label",
+    "MapPin": "toga.widgets.mapview",
+    "MapView": "toga.widgets.mapview",
+    "MultilineTextInput": "toga.widgets.multilinetextinput",
+    "NumberInput": "toga.widgets.numberinput",
+    "OptionContainer": "toga.widgets.optioncontainer",
+    "OptionItem": "toga.widgets.optioncontainer",
+    "PasswordInput": "toga.widgets.passwordinput",
+    "ProgressBar": "toga.widgets.progressbar",
+    "Row": "toga.widgets.box",
+    "ScrollContainer": "toga.widgets.scrollcontainer",
+    "Selection": "toga.widgets.selection",
+    "Slider": "toga.widgets.slider",
+    "SplitContainer": "toga.widgets.splitcontainer",
+    "Switch": "toga.widgets.switch",
+    "Table": "toga.widgets.table",
+    "TextInput": "toga.widgets.textinput",
+    "TimeInput": "toga.widgets.timeinput",
+    "Tree": "toga.widgets.tree",
+    "WebView": "toga.widgets.webview",
+    "MainWindow": "toga.window",
+    "Window": "toga.window",
+}
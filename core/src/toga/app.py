@@ -9,13 +9,14 @@ import sys
 import warnings
 import webbrowser
 from collections.abc import Coroutine, Iterator
+from concurrent.futures import Executor, ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar, Protocol
 
 from toga.command import Command, CommandSet
 from toga.constants import WindowState
 from toga.documents import Document, DocumentSet
-from toga.handlers import simple_handler, wrapped_handler
+from toga.handlers import HandlerMonitor, simple_handler, wrapped_handler
 from toga.icons import Icon
 from toga.paths import Paths
 from toga.platform import get_factory
@@ -153,6 +154,9 @@ class App:
 
     _UNDEFINED: str = "<main window not assigned>"
 
+    BACKGROUND_THREADS: int = 4
+    """The maximum number of threads in the default [`executor`][toga.App.executor]."""
+
     def __init__(
         self,
         formal_name: str | None = None,
@@ -215,6 +219,12 @@ class App:
         # Initialize empty widgets registry
         self._widgets = WidgetRegistry()
 
+        # Event handlers aren't monitored until a monitor is assigned.
+        self._monitor: HandlerMonitor | None = None
+
+        # The executor for functions run in the background is created on first use.
+        self._executor: Executor | None = None
+
         # Keep an accessible copy of the app singleton instance
         App.app = self
 
@@ -468,8 +478,12 @@ class App:
         """Unconditionally exit the application.
 
         This *does not* invoke the `on_exit` handler; the app will be immediately
-        and unconditionally closed.
+        and unconditionally closed. Any functions that are waiting to run in the
+        app's [`executor`][toga.App.executor] are cancelled.
         """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
         self._impl.exit()
 
     @property
@@ -478,6 +492,52 @@ class App:
         of the app's main thread (read-only)."""
         return self._impl.loop
 
+    @property
+    def executor(self) -> Executor:
+        """The executor used to run functions in the background, with
+        [`toga.run_in_executor()`][toga.run_in_executor] and
+        [`@toga.background`][toga.background].
+
+        By default, this is a
+        [`ThreadPoolExecutor`][concurrent.futures.ThreadPoolExecutor] with at most
+        [`BACKGROUND_THREADS`][toga.App.BACKGROUND_THREADS] threads, which is created
+        the first time it is used. It can be replaced with any other
+        [`Executor`][concurrent.futures.Executor] (e.g., a
+        [`ProcessPoolExecutor`][concurrent.futures.ProcessPoolExecutor] for
+        CPU-bound work); the previous executor is shut down. Assigning `None` restores
+        the default.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.BACKGROUND_THREADS,
+                thread_name_prefix="toga-background",
+            )
+        return self._executor
+
+    @executor.setter
+    def executor(self, executor: Executor | None) -> None:
+        if self._executor is not None and self._executor is not executor:
+            self._executor.shutdown(wait=False)
+        self._executor = executor
+
+    @property
+    def monitor(self) -> HandlerMonitor | None:
+        """The monitor recording the time taken by the app's event handlers, and the
+        responsiveness of its event loop, or `None` if the app isn't being monitored.
+
+        Assigning a [`HandlerMonitor`][toga.handlers.HandlerMonitor] starts
+        monitoring; assigning `None` stops it.
+        """
+        return self._monitor
+
+    @monitor.setter
+    def monitor(self, monitor: HandlerMonitor | None) -> None:
+        if self._monitor is not None:
+            self._monitor._stop()
+        self._monitor = monitor
+        if monitor is not None:
+            monitor._start(self)
+
     def main_loop(self) -> None:
         """Start the application.
 
@@ -508,6 +568,8 @@ class App:
 
             self._running_tasks.add(task)
             task.add_done_callback(self._running_tasks.discard)
+            if self._monitor is not None:
+                self._monitor._task_created()
             return task
 
         self.loop.set_task_factory(factory)
@@ -1,10 +1,10 @@
 from typing import TYPE_CHECKING
 
-# Color, rgb, and hsl need to be explicitly imported in order for mkdocstrings to see
-# them. However, we also want to import all 148 named colors, and it seems silly to
-# list them here individually.
+# Color, rgb, hsl and the bulk conversion functions need to be explicitly imported in
+# order for mkdocstrings to see them. However, we also want to import all 148 named
+# colors, and it seems silly to list them here individually.
 from travertino.colors import *  # noqa: F403
-from travertino.colors import Color, hsl, rgb  # noqa: F401
+from travertino.colors import Color, blend_over, hsl, rgb, to_hsl, to_rgb  # noqa: F401
 
 if TYPE_CHECKING:
     from typing import TypeAlias
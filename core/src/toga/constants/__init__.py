@@ -1,4 +1,4 @@
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
 
 from travertino.constants import *  # noqa: F403  pragma: no cover
 
@@ -30,6 +30,25 @@ class FillRule(Enum):
     NONZERO = 1
 
 
+class PathCode(IntEnum):
+    """The operations that make up a path drawn with
+    [`Canvas.path()`][toga.Canvas.path].
+
+    Each operation uses the number of points noted below from the path's coordinates.
+    """
+
+    MOVE_TO = 0
+    """Start a new sub-path at a point (1 point)"""
+    LINE_TO = 1
+    """Draw a line segment to a point (1 point)"""
+    QUADRATIC_CURVE_TO = 2
+    """Draw a quadratic curve, using a control point and an end point (2 points)"""
+    BEZIER_CURVE_TO = 3
+    """Draw a Bézier curve, using two control points and an end point (3 points)"""
+    CLOSE_PATH = 4
+    """Close the current sub-path (no points)"""
+
+
 ##########################################################################
 # Camera
 ##########################################################################
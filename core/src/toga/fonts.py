@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, MutableMapping
+from dataclasses import dataclass
+from itertools import product
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 # Use the Travertino font definitions as-is
 from travertino import constants
@@ -31,14 +35,188 @@ FONT_STYLES = {NORMAL, ITALIC, OBLIQUE}
 FONT_VARIANTS = {NORMAL, SMALL_CAPS}
 
 _REGISTERED_FONT_CACHE: dict[tuple[str, str, str, str], str] = {}
-_IMPL_CACHE: dict[Font, Any] = {}
 
 
 class UnknownFontError(Exception):
     """Raised when an unknown font family is requested."""
 
 
+# Marks a font that is known not to exist.
+_UNKNOWN = object()
+
+
+@dataclass(frozen=True)
+class FontCacheStats:
+    """A snapshot of the activity of a [`FontCache`][toga.fonts.FontCache]."""
+
+    hits: int
+    """The number of fonts that were found in the cache (including fonts that are
+    known not to exist)."""
+
+    misses: int
+    """The number of fonts that had to be loaded."""
+
+    evictions: int
+    """The number of entries that have been discarded to stay within the limit."""
+
+    entries: int
+    """The number of entries currently in the cache."""
+
+    unknown: int
+    """The number of entries that record a font that doesn't exist."""
+
+
+class FontCache(MutableMapping):
+    def __init__(self, max_entries: int = 512):
+        """A cache of loaded fonts, shared by every [`toga.Font`][] in the process.
+
+        Loading a font involves looking up the font family in a series of places
+        (Toga's predefined fonts, fonts registered with
+        [`Font.register()`][toga.Font.register], and fonts installed on the
+        system). The result of that lookup is cached - including the fact that a font
+        doesn't exist, so a font family that can't be found is only looked for once.
+        Registering a font forgets every font that is known not to exist.
+
+        When the cache holds more than its limit, the least recently used entries are
+        discarded.
+
+        You shouldn't need to create a FontCache; use the one provided as
+        [`toga.Font.cache`][toga.Font.cache].
+
+        :param max_entries: The maximum number of fonts to retain.
+        """
+        self._entries: OrderedDict[Font, Any] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self.max_entries = max_entries
+
+    @property
+    def max_entries(self) -> int:
+        """The maximum number of fonts to retain.
+
+        :raises ValueError: If the limit is less than 1.
+        """
+        return self._max_entries
+
+    @max_entries.setter
+    def max_entries(self, value: int) -> None:
+        if value < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._max_entries = value
+        self._evict()
+
+    @property
+    def stats(self) -> FontCacheStats:
+        """The activity of the cache since it was created (or last cleared)."""
+        return FontCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            entries=len(self._entries),
+            unknown=sum(impl is _UNKNOWN for impl in self._entries.values()),
+        )
+
+    def clear(self) -> None:
+        """Discard every entry in the cache, and reset its statistics.
+
+        Fonts that have already been created are not affected.
+        """
+        self._entries.clear()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def preload(
+        self,
+        families: str | Iterable[str],
+        sizes: int | Iterable[int] = SYSTEM_DEFAULT_FONT_SIZE,
+        *,
+        weight: str = NORMAL,
+        style: str = NORMAL,
+        variant: str = NORMAL,
+    ) -> None:
+        """Load fonts in advance, so that they are already cached when they are
+        first used (e.g., call this in [`startup()`][toga.App.startup] for the fonts
+        your app's styles refer to).
+
+        Every combination of the given families and sizes is loaded. A family that
+        can't be found is cached as unknown, rather than raising an error.
+
+        :param families: The [font families][toga.style.pack.Pack.font_family] to
+            load.
+        :param sizes: The [font sizes][toga.style.pack.Pack.font_size] to load.
+        :param weight: The [font weight][toga.style.pack.Pack.font_weight].
+        :param style: The [font style][toga.style.pack.Pack.font_style].
+        :param variant: The [font variant][toga.style.pack.Pack.font_variant].
+        :raises ValueError: If a user-registered font is requested, but the font
+            can't be loaded from the registered file.
+        """
+        if isinstance(families, str):
+            families = [families]
+        if isinstance(sizes, int):
+            sizes = [sizes]
+
+        for family, size in product(families, sizes):
+            try:
+                Font(family, size, weight=weight, style=style, variant=variant)
+            except UnknownFontError:
+                pass
+
+    def _lookup(self, font: Font) -> Any:
+        """Retrieve the cached implementation of a font, marking it as the most
+        recently used.
+
+        :returns: The implementation, or `_UNKNOWN` if the font is known not to exist.
+        :raises KeyError: If the font isn't in the cache.
+        """
+        try:
+            impl = self._entries[font]
+        except KeyError:
+            self._misses += 1
+            raise
+        self._entries.move_to_end(font)
+        self._hits += 1
+        return impl
+
+    def _forget_unknown(self) -> None:
+        """Discard every entry for a font that is known not to exist."""
+        for font in [font for font, impl in self._entries.items() if impl is _UNKNOWN]:
+            del self._entries[font]
+
+    def _evict(self) -> None:
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    # Backends add fonts to the cache as they are loaded, and remove them if they turn
+    # out not to match the requested font.
+    def __getitem__(self, font: Font) -> Any:
+        return self._entries[font]
+
+    def __setitem__(self, font: Font, impl: Any) -> None:
+        self._entries[font] = impl
+        self._entries.move_to_end(font)
+        self._evict()
+
+    def __delitem__(self, font: Font) -> None:
+        del self._entries[font]
+
+    def __iter__(self) -> Iterator[Font]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_IMPL_CACHE = FontCache()
+
+
 class Font(BaseFont):
+    cache: ClassVar[FontCache] = _IMPL_CACHE
+    """The cache of loaded fonts, shared by the whole process. See
+    [`FontCache`][toga.fonts.FontCache]."""
+
     def __init__(
         self,
         family: str,
@@ -72,8 +250,7 @@ class Font(BaseFont):
         self.factory = get_factory()
 
         try:
-            self._impl = _IMPL_CACHE[self]
-
+            impl = _IMPL_CACHE._lookup(self)
         except KeyError:
             self._impl = self.factory.Font(self)
             try:
@@ -85,7 +262,13 @@ class Font(BaseFont):
                     try:
                         self._impl.load_arbitrary_system_font()
                     except UnknownFontError as exc:
+                        _IMPL_CACHE[self] = _UNKNOWN
                         raise UnknownFontError(f"Unknown font '{self}'") from exc
+            _IMPL_CACHE[self] = self._impl
+        else:
+            if impl is _UNKNOWN:
+                raise UnknownFontError(f"Unknown font '{self}'")
+            self._impl = impl
 
     def __str__(self) -> str:
         size = (
@@ -133,6 +316,8 @@ class Font(BaseFont):
             )
         font_key = Font._registered_font_key(family, weight, style, variant)
         _REGISTERED_FONT_CACHE[font_key] = str(toga.App.app.paths.app / path)
+        # The newly registered font may have previously been looked for.
+        _IMPL_CACHE._forget_unknown()
 
     @staticmethod
     def _registered_font_key(
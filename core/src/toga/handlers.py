@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import inspect
 import sys
 import traceback
 import warnings
 import weakref
 from abc import ABC
+from collections import deque
 from collections.abc import Awaitable, Callable, Generator
+from dataclasses import dataclass
+from time import perf_counter
 from typing import TYPE_CHECKING, Any, NoReturn, Protocol, TypeVar
 
 if TYPE_CHECKING:
@@ -26,6 +30,11 @@ if TYPE_CHECKING:
     HandlerT: TypeAlias = HandlerSyncT | HandlerAsyncT | HandlerGeneratorT
     WrappedHandlerT: TypeAlias = Callable[..., object]
 
+    from concurrent.futures import Future
+
+    from toga.app import App
+    from toga.window import Window
+
 
 class NativeHandler:
     def __init__(self, handler: Callable[..., object]):
@@ -80,7 +89,15 @@ async def handler_with_cleanup(
     **kwargs: object,
 ) -> object | None:
     try:
-        result = await handler(interface, *args, **kwargs)
+        monitor = HandlerMonitor._active
+        if monitor is None:
+            result = await handler(interface, *args, **kwargs)
+        else:
+            start = perf_counter()
+            try:
+                result = await handler(interface, *args, **kwargs)
+            finally:
+                monitor._record(handler, perf_counter() - start, blocking=False)
     except Exception as e:
         print("Error in async handler:", e, file=sys.stderr)
         traceback.print_exc()
@@ -126,6 +143,163 @@ def simple_handler(fn: T, *args: object, **kwargs: object) -> T:
     return _handler
 
 
+class RateLimitedHandler:
+    def __init__(
+        self,
+        handler: HandlerT,
+        interval: float,
+        *,
+        leading: bool,
+        restart: bool,
+    ):
+        """A handler whose invocations are limited in frequency.
+
+        Rather than creating a RateLimitedHandler directly, use
+        [`toga.throttle()`][toga.throttle], [`toga.debounce()`][toga.debounce] or
+        [`toga.coalesce()`][toga.coalesce].
+
+        When the handler is invoked, it is either invoked immediately, or the
+        invocation is deferred; a deferred invocation uses the arguments of the most
+        recent event, and any other events are dropped.
+
+        :param handler: The handler to invoke.
+        :param interval: The minimum time between invocations, in seconds.
+        :param leading: Whether the first event after a quiet period invokes the
+            handler immediately. If false, every invocation is deferred.
+        :param restart: Whether each event defers the pending invocation until
+            `interval` seconds after that event.
+        """
+        self.handler = handler
+        self.interval = interval
+        self.leading = leading
+        self.restart = restart
+
+    def _limit(self, handler: WrappedHandlerT, interface: object) -> WrappedHandlerT:
+        """Limit the rate at which a wrapped handler is invoked.
+
+        Each wrapped handler has its own limit, so the same RateLimitedHandler can be
+        assigned to more than one widget.
+
+        A deferred invocation is cancelled if the limited handler is discarded (e.g.,
+        because another handler has been assigned to the event), or when all the
+        deferred invocations of the interface are cancelled (e.g., because the
+        widget has been removed from its window).
+        """
+        interval = self.interval
+        # The pending invocation, its arguments, and the time of the last invocation.
+        timer: asyncio.TimerHandle | None = None
+        pending: tuple[tuple, dict] = ((), {})
+        last = -float("inf")
+        # The deferred invocations of the interface's handlers. This mustn't refer to
+        # the interface, or to the limited handler, so that neither is kept alive by
+        # a pending invocation.
+        try:
+            deferred = vars(interface).setdefault("_pending_invocations", set())
+        except TypeError:
+            deferred = set()
+
+        def cancel() -> None:
+            nonlocal timer, pending
+            if timer is not None:
+                timer.cancel()
+                timer = None
+                pending = ((), {})
+            deferred.discard(cancel)
+
+        def invoke() -> None:
+            nonlocal timer, pending, last
+            args, kwargs = pending
+            timer = None
+            pending = ((), {})
+            deferred.discard(cancel)
+            last = asyncio.get_event_loop().time()
+            handler(*args, **kwargs)
+
+        def _handler(*args: object, **kwargs: object) -> object:
+            nonlocal timer, pending, last
+            loop = asyncio.get_event_loop()
+            now = loop.time()
+            if self.leading and timer is None and now >= last + interval:
+                last = now
+                return handler(*args, **kwargs)
+
+            pending = (args, kwargs)
+            if timer is not None:
+                if not self.restart:
+                    return None
+                timer.cancel()
+            delay = interval if self.restart else max(0.0, last + interval - now)
+            timer = loop.call_later(delay, invoke)
+            deferred.add(cancel)
+            return None
+
+        # When the handler is replaced, the invocation it deferred is obsolete.
+        weakref.finalize(_handler, cancel)
+        _handler._raw = self
+        return _handler
+
+
+def _cancel_pending_invocations(interface: object) -> None:
+    """Cancel the deferred invocations of any rate-limited handlers of an object.
+
+    :param interface: The widget, window or app whose handlers are rate-limited.
+    """
+    for cancel in list(vars(interface).get("_pending_invocations", ())):
+        cancel()
+
+
+def throttle(handler: HandlerT, hz: float = 30) -> RateLimitedHandler:
+    """Limit the number of times per second that a handler is invoked.
+
+    The first event invokes the handler immediately. Events that occur within
+    `1 / hz` seconds of an invocation are collapsed into a single invocation at the
+    end of that time, using the arguments of the most recent event. This is useful for
+    handlers that respond to continuous input, such as the
+    [`on_change`][toga.Slider.on_change] handler of a slider: the handler is invoked
+    regularly while the input changes, and always for the final value.
+
+    :param handler: The handler to invoke.
+    :param hz: The maximum number of invocations per second.
+    :returns: A handler that can be assigned to an event.
+    :raises ValueError: If `hz` isn't positive.
+    """
+    if hz <= 0:
+        raise ValueError("hz must be positive")
+    return RateLimitedHandler(handler, 1 / hz, leading=True, restart=False)
+
+
+def debounce(handler: HandlerT, delay: float = 0.25) -> RateLimitedHandler:
+    """Invoke a handler once events have stopped occurring.
+
+    The handler is invoked `delay` seconds after the most recent event, using the
+    arguments of that event; each event restarts the delay. This is useful for
+    handlers that should only respond once the user has finished making a change,
+    such as a search performed by the [`on_change`][toga.TextInput.on_change]
+    handler of a text input.
+
+    :param handler: The handler to invoke.
+    :param delay: The time to wait after an event, in seconds.
+    :returns: A handler that can be assigned to an event.
+    :raises ValueError: If `delay` is negative.
+    """
+    if delay < 0:
+        raise ValueError("delay can't be negative")
+    return RateLimitedHandler(handler, delay, leading=False, restart=True)
+
+
+def coalesce(handler: HandlerT) -> RateLimitedHandler:
+    """Collapse events that occur in the same iteration of the event loop.
+
+    The handler is invoked on the next iteration of the event loop, using the
+    arguments of the most recent event. This is useful when a single change (such as
+    resizing a window) causes a burst of events, and only the final state matters.
+
+    :param handler: The handler to invoke.
+    :returns: A handler that can be assigned to an event.
+    """
+    return RateLimitedHandler(handler, 0.0, leading=False, restart=False)
+
+
 def wrapped_handler(
     interface: object,
     handler: HandlerT | NativeHandler | None,
@@ -144,6 +318,9 @@ def wrapped_handler(
 
     If the handler is a coroutine, install it on the asynchronous event loop.
 
+    If the handler is a RateLimitedHandler, the handler it contains is wrapped, and
+    invocations of that handler are limited.
+
     Returns either the native handler, or a wrapped function that will invoke the
     handler, using the interface as context. If a non-native handler, the wrapper
     function is annotated with the original handler function on the `_raw` attribute.
@@ -151,6 +328,10 @@ def wrapped_handler(
     if handler:
         if isinstance(handler, NativeHandler):
             return handler.native
+        if isinstance(handler, RateLimitedHandler):
+            return handler._limit(
+                wrapped_handler(interface, handler.handler, cleanup), interface
+            )
 
         def _handler(*args: object, **kwargs: object) -> object:
             if inspect.iscoroutinefunction(handler):
@@ -159,7 +340,15 @@ def wrapped_handler(
                 )
             else:
                 try:
-                    result = handler(interface, *args, **kwargs)
+                    monitor = HandlerMonitor._active
+                    if monitor is None:
+                        result = handler(interface, *args, **kwargs)
+                    else:
+                        start = perf_counter()
+                        try:
+                            result = handler(interface, *args, **kwargs)
+                        finally:
+                            monitor._record(handler, perf_counter() - start)
                 except Exception as e:
                     print("Error in handler:", e, file=sys.stderr)
                     traceback.print_exc()
@@ -268,6 +457,162 @@ class PermissionResult(AsyncResult):
     RESULT_TYPE = "permission"
 
 
+def _window_of(owner: object) -> Window | None:
+    """The window that contains a widget (or is a window), if any."""
+    from toga.widgets.base import Widget
+    from toga.window import Window
+
+    if isinstance(owner, Window):
+        return owner
+    if isinstance(owner, Widget):
+        return owner.window
+    return None
+
+
+class BackgroundResult(AsyncResult):
+    RESULT_TYPE = "background"
+
+    def __init__(self, future: Future, owner: object = None) -> None:
+        """The result of a function that is running in the app's executor.
+
+        The result is delivered to the event loop when the function completes. If the
+        owner's window is closed (or the owner is removed from the window) before
+        that, the result is discarded, and the result is cancelled.
+
+        :param future: The future of the function in the executor.
+        :param owner: The widget or window that will use the result.
+        """
+        super().__init__()
+        self._executor_future = future
+        self._owner = owner
+        self._window = _window_of(owner)
+        self._loop = self.future.get_loop()
+
+        if self._window is not None:
+            self._window._background_futures.add(self.future)
+        self.future.add_done_callback(self._done)
+        future.add_done_callback(self._deliver)
+
+    def cancel(self) -> bool:
+        """Cancel the function, and discard its result.
+
+        If the function has already started running, it runs to completion, but its
+        result is discarded.
+
+        :returns: True if the result was cancelled; False if it had already been
+            delivered.
+        """
+        if self.future.cancel():
+            self._executor_future.cancel()
+            return True
+        return False
+
+    def _is_stale(self) -> bool:
+        """Whether the owner of the result has left its window, or been closed."""
+        window = self._window
+        return window is not None and (
+            window.closed
+            or (self._owner is not window and _window_of(self._owner) is not window)
+        )
+
+    def _deliver(self, future: Future) -> None:
+        # Invoked in the executor's thread; the result is delivered on the event loop.
+        try:
+            self._loop.call_soon_threadsafe(self._complete, future)
+        except RuntimeError:
+            # The event loop has been closed, so nothing is waiting for the result.
+            pass
+
+    def _complete(self, future: Future) -> None:
+        if self.future.done():
+            return
+
+        if future.cancelled() or self._is_stale():
+            self.cancel()
+        elif (exc := future.exception()) is not None:
+            self.set_exception(exc)
+        else:
+            self.set_result(future.result())
+
+    def _done(self, _: asyncio.Future) -> None:
+        if self.future.cancelled():
+            self._executor_future.cancel()
+        if self._window is not None:
+            self._window._background_futures.discard(self.future)
+
+
+def run_in_executor(
+    func: Callable[..., T],
+    *args: object,
+    owner: object = None,
+) -> BackgroundResult:
+    """Run a function in the app's [`executor`][toga.App.executor], rather than on
+    the GUI thread.
+
+    The result can be awaited; it is delivered on the app's event loop, so code
+    that awaits the result can safely update the GUI.
+
+    :param func: The function to run. It mustn't use any widgets or windows. To pass
+        keyword arguments, use [`functools.partial`][].
+    :param args: The positional arguments to pass to the function.
+    :param owner: The widget or window that will use the result. If the owner's
+        window is closed (or the owner is removed from its window) before the
+        function completes, the result is discarded, and awaiting it raises
+        [`asyncio.CancelledError`][].
+    :returns: The result of the function, which must be awaited.
+    :raises RuntimeError: If no app has been created.
+    """
+    from toga.app import App
+
+    if App.app is None:
+        raise RuntimeError("An app must be created before a function can be run.")
+
+    return BackgroundResult(App.app.executor.submit(func, *args), owner=owner)
+
+
+def _call_background(handler: Callable[..., T], *args: object, **kwargs: object) -> T:
+    """Invoke the undecorated function of a [`background`][toga.background] handler.
+
+    The decorated handler is sent to the executor, rather than the undecorated
+    function; a process can only find a function by its name, and the name of the
+    function refers to the decorated handler.
+    """
+    return handler.__wrapped__(*args, **kwargs)
+
+
+def background(handler: Callable[..., T]) -> Callable[..., Awaitable[T]]:
+    """Decorate a synchronous event handler so that it runs in the app's
+    [`executor`][toga.App.executor], rather than on the GUI thread.
+
+    The widget, window or app that invokes the handler isn't passed to it, as it
+    can't be used from another thread (or sent to another process); the handler
+    receives only the remaining arguments of the event. Instead, it owns the
+    handler: if the window is closed (or the widget is removed from the window)
+    before the handler completes, its result is discarded. Otherwise, the result is
+    passed to any cleanup method on the event loop.
+
+    If the executor is a
+    [`ProcessPoolExecutor`][concurrent.futures.ProcessPoolExecutor], the handler
+    must be a module-level function, and the arguments of the event and the
+    handler's result must be picklable.
+
+    :param handler: The handler to run in the background.
+    :returns: An asynchronous handler that runs the handler in the background.
+    :raises TypeError: If the handler is asynchronous.
+    """
+    if inspect.iscoroutinefunction(handler):
+        raise TypeError("Asynchronous handlers can't be run in the background.")
+
+    @functools.wraps(handler)
+    async def _handler(owner: object, *args: object, **kwargs: object) -> T:
+        return await run_in_executor(
+            functools.partial(_call_background, _handler, *args, **kwargs),
+            owner=owner,
+        )
+
+    return _handler
+
+
 class WeakrefCallable:
     """
     A wrapper for callable that holds a weak reference to it.
@@ -289,3 +634,238 @@ class WeakrefCallable:
         function = self.ref()
         if function:
             return function(*args, **kwargs)
+
+
+@dataclass
+class HandlerStats:
+    """The time spent running an event handler.
+
+    All times are in seconds. The time taken by an `async` handler is the time from
+    when it started to when it completed, including any time spent waiting; the time
+    taken by any other handler is the time that it blocked the event loop.
+    """
+
+    calls: int = 0
+    """The number of times the handler has completed."""
+
+    total: float = 0.0
+    """The total time taken by the handler."""
+
+    max: float = 0.0
+    """The longest time taken by a single call of the handler."""
+
+    slow: int = 0
+    """The number of calls that blocked the event loop for longer than the monitor's
+    `slow_threshold`."""
+
+    @property
+    def mean(self) -> float:
+        """The average time taken by a single call of the handler."""
+        return self.total / self.calls if self.calls else 0.0
+
+
+class HandlerMonitor:
+    # The monitor of the running app, if any. Handlers are invoked on the app's main
+    # thread, and there's only one app in a process.
+    _active: HandlerMonitor | None = None
+
+    def __init__(
+        self,
+        slow_threshold: float = 0.1,
+        lag_interval: float = 0.1,
+        max_samples: int = 600,
+    ):
+        """Record the time taken by an app's event handlers, and the responsiveness
+        of its event loop.
+
+        To start monitoring an app, assign a monitor to
+        [`App.monitor`][toga.App.monitor]. While it is assigned, the monitor records:
+
+        * the time taken by every event handler, keyed by the handler's name;
+        * the *lag* of the event loop: how much later than scheduled a callback
+          is run, sampled every `lag_interval` seconds;
+        * the number of tasks that are running on the event loop.
+
+        A warning is printed whenever a handler blocks the event loop for longer
+        than `slow_threshold`.
+
+        :param slow_threshold: The time (in seconds) that a handler can block the event
+            loop before it is reported as slow.
+        :param lag_interval: The interval (in seconds) between measurements of the
+            lag of the event loop.
+        :param max_samples: The number of lag measurements to retain. When more
+            measurements have been made, the oldest are discarded.
+        :raises ValueError: If `slow_threshold` is negative, `lag_interval` isn't
+            positive, or `max_samples` is less than 1.
+        """
+        if slow_threshold < 0:
+            raise ValueError("slow_threshold can't be negative")
+        if lag_interval <= 0:
+            raise ValueError("lag_interval must be positive")
+        if max_samples < 1:
+            raise ValueError("max_samples must be at least 1")
+
+        self.slow_threshold = slow_threshold
+        self.lag_interval = lag_interval
+
+        self._app: App | None = None
+        self._handlers: dict[str, HandlerStats] = {}
+        self._lag: deque[float] = deque(maxlen=max_samples)
+        # The pending lag measurement, and the loop time at which it should run.
+        self._timer: asyncio.TimerHandle | None = None
+        self._expected = 0.0
+        self._peak_tasks = 0
+        self._created_tasks = 0
+
+    @property
+    def handlers(self) -> dict[str, HandlerStats]:
+        """The time taken by each event handler that has completed, keyed by the
+        qualified name of the handler (e.g., `"myapp.app.MyApp.on_press"`)."""
+        return dict(self._handlers)
+
+    @property
+    def lag(self) -> list[float]:
+        """The most recent measurements of the lag of the event loop, in seconds,
+        oldest first."""
+        return list(self._lag)
+
+    @property
+    def running_tasks(self) -> int:
+        """The number of tasks that are currently running on the app's event loop,
+        or 0 if the monitor isn't assigned to an app."""
+        return len(self._app._running_tasks) if self._app else 0
+
+    @property
+    def peak_running_tasks(self) -> int:
+        """The largest number of tasks that have been running at the same time."""
+        return self._peak_tasks
+
+    @property
+    def created_tasks(self) -> int:
+        """The number of tasks that have been created."""
+        return self._created_tasks
+
+    def reset(self) -> None:
+        """Discard everything that has been recorded."""
+        self._handlers.clear()
+        self._lag.clear()
+        self._peak_tasks = self.running_tasks
+        self._created_tasks = 0
+
+    def as_dict(self) -> dict[str, object]:
+        """Summarize everything that has been recorded.
+
+        :returns: A dictionary that can be serialized as JSON, containing:
+
+            * `"handlers"`: the `calls`, `total`, `mean`, `max` and `slow` count of
+              each handler, keyed by the name of the handler;
+            * `"lag"`: the number of `samples` of the lag of the event loop, and
+              their `mean` and `max`, and the `last` sample;
+            * `"tasks"`: the number of tasks that are `running`, the `peak` number
+              of running tasks, and the number of tasks that have been `created`.
+
+            All times are in seconds.
+        """
+        lag = self._lag
+        return {
+            "handlers": {
+                name: {
+                    "calls": stats.calls,
+                    "total": stats.total,
+                    "mean": stats.mean,
+                    "max": stats.max,
+                    "slow": stats.slow,
+                }
+                for name, stats in self._handlers.items()
+            },
+            "lag": {
+                "samples": len(lag),
+                "mean": sum(lag) / len(lag) if lag else 0.0,
+                "max": max(lag, default=0.0),
+                "last": lag[-1] if lag else 0.0,
+            },
+            "tasks": {
+                "running": self.running_tasks,
+                "peak": self._peak_tasks,
+                "created": self._created_tasks,
+            },
+        }
+
+    def as_json(self) -> str:
+        """Summarize everything that has been recorded, as JSON.
+
+        :returns: The content of [`as_dict()`][toga.handlers.HandlerMonitor.as_dict],
+            serialized as JSON.
+        """
+        import json
+
+        return json.dumps(self.as_dict())
+
+    ######################################################################
+    # Recording
+    ######################################################################
+
+    def _start(self, app: App) -> None:
+        """Start monitoring an app."""
+        self._app = app
+        HandlerMonitor._active = self
+        self._peak_tasks = max(self._peak_tasks, self.running_tasks)
+        self._schedule()
+
+    def _stop(self) -> None:
+        """Stop monitoring the app."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if HandlerMonitor._active is self:
+            HandlerMonitor._active = None
+        self._app = None
+
+    def _schedule(self) -> None:
+        """Schedule the next measurement of the lag of the event loop."""
+        loop = self._app.loop
+        self._expected = loop.time() + self.lag_interval
+        self._timer = loop.call_at(self._expected, self._measure_lag)
+
+    def _measure_lag(self) -> None:
+        self._lag.append(max(0.0, self._app.loop.time() - self._expected))
+        self._schedule()
+
+    def _record(
+        self,
+        handler: Callable[..., object],
+        elapsed: float,
+        blocking: bool = True,
+    ) -> None:
+        """Record a call of a handler.
+
+        :param handler: The handler that was called.
+        :param elapsed: The time taken by the handler, in seconds.
+        :param blocking: Whether the handler blocked the event loop for that time.
+        """
+        # Name a handler wrapped by simple_handler after the function it invokes.
+        handler = getattr(handler, "_raw", handler)
+        name = getattr(handler, "__qualname__", type(handler).__qualname__)
+        module = getattr(handler, "__module__", None)
+        if module:
+            name = f"{module}.{name}"
+
+        try:
+            stats = self._handlers[name]
+        except KeyError:
+            stats = self._handlers[name] = HandlerStats()
+        stats.calls += 1
+        stats.total += elapsed
+        stats.max = max(stats.max, elapsed)
+        if blocking and elapsed > self.slow_threshold:
+            stats.slow += 1
+            print(
+                f"Slow handler: {name} blocked the event loop for "
+                f"{elapsed * 1000:.1f} ms",
+                file=sys.stderr,
+            )
+
+    def _task_created(self) -> None:
+        """Record the creation of a task."""
+        self._created_tasks += 1
+        self._peak_tasks = max(self._peak_tasks, self.running_tasks)
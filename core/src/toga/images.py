@@ -1,11 +1,21 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
 import importlib
 import os
+import struct
+import threading
 import warnings
-from functools import cache
+import zlib
+from collections import OrderedDict
+from collections.abc import Hashable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from io import BytesIO
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Protocol, TypeVar
+from typing import TYPE_CHECKING, Any, ClassVar, Protocol, TypeVar
 from warnings import warn
 
 import toga
@@ -109,11 +119,189 @@ class ImageConverter(Protocol):
         :returns: The image, as an instance of the image class specified.
         """
 
+    # A converter can also define `convert_from_format_to_buffer(image_in_format)`,
+    # which returns the RGBA pixels of the image, in the same form as
+    # Image.as_buffer(), and `convert_to_format_from_buffer(buffer, image_class)`,
+    # which accepts those pixels. If they are defined, they are used in preference to
+    # convert_from_format() and convert_to_format(), so that the image isn't encoded.
+
 
 NOT_PROVIDED = object()
 
+# The orders in which the color channels of a pixel can be provided.
+PIXEL_FORMATS = ("RGBA", "BGRA")
+
+
+def _swap_red_blue(pixels: memoryview) -> bytearray:
+    """Convert RGBA pixels to BGRA, or vice versa."""
+    swapped = bytearray(pixels)
+    swapped[0::4] = pixels[2::4]
+    swapped[2::4] = pixels[0::4]
+    return swapped
+
+
+def _encode_png(width: int, height: int, pixels: BytesLikeT) -> bytes:
+    """Encode RGBA pixels as a PNG image."""
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return (
+            struct.pack(">I", len(data))
+            + kind
+            + data
+            + struct.pack(">I", zlib.crc32(kind + data))
+        )
+
+    # Each row is prefixed by the type of filter used, which is always "None".
+    stride = width * 4
+    rows = b"".join(
+        b"\x00" + pixels[row * stride : (row + 1) * stride] for row in range(height)
+    )
+    return b"".join(
+        [
+            b"\x89PNG\r\n\x1a\n",
+            # 8 bits per channel, RGBA, default compression, filtering and interlacing
+            chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)),
+            chunk(b"IDAT", zlib.compress(rows, 1)),
+            chunk(b"IEND", b""),
+        ]
+    )
+
+
+@dataclass(frozen=True)
+class ImageCacheStats:
+    """A snapshot of the activity of an [`ImageCache`][toga.images.ImageCache]."""
+
+    hits: int
+    """The number of times a decoded image was found in the cache."""
+
+    misses: int
+    """The number of times an image had to be decoded."""
+
+    evictions: int
+    """The number of entries that have been discarded to stay within the budget."""
+
+    entries: int
+    """The number of entries currently in the cache."""
+
+    size: int
+    """The approximate memory used by the entries currently in the cache, in
+    bytes."""
+
+
+class ImageCache:
+    def __init__(self, max_size: int = 64 * 1024 * 1024):
+        """A cache of decoded images, shared by every [`toga.Image`][] and
+        [`toga.Icon`][] in the process.
+
+        Images loaded from the same file (with the same modification time), or from
+        identical data, share a single native image, so that the image is only read
+        and decoded once. On backends that support it, the files of icons are decoded
+        into the same cache, so icons with the same files share their decoded images.
+
+        When the cache exceeds its memory budget, the least recently used entries are
+        discarded. A decoded image is accounted for as 4 bytes per pixel.
+
+        You shouldn't need to create an ImageCache; use the one provided as
+        [`toga.Image.cache`][toga.Image.cache].
+
+        :param max_size: The memory budget for the cache, in bytes.
+        """
+        self._entries: OrderedDict[Hashable, tuple[object, int]] = OrderedDict()
+        # Images can be loaded in background threads.
+        self._lock = threading.Lock()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self.max_size = max_size
+
+    @property
+    def max_size(self) -> int:
+        """The memory budget for the cache, in bytes. A budget of 0 disables the
+        cache.
+
+        :raises ValueError: If the budget is negative.
+        """
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value: int) -> None:
+        if value < 0:
+            raise ValueError("max_size cannot be negative")
+        with self._lock:
+            self._max_size = value
+            self._evict()
+
+    @property
+    def stats(self) -> ImageCacheStats:
+        """The activity of the cache since it was created (or last cleared)."""
+        with self._lock:
+            return ImageCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                size=self._size,
+            )
+
+    def clear(self) -> None:
+        """Discard every entry in the cache, and reset its statistics.
+
+        Images and icons that have already been created are not affected.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def _get(self, key: Hashable) -> Any:
+        """Retrieve a cached value, marking it as the most recently used.
+
+        :returns: The value, or `None` if the key isn't in the cache.
+        """
+        with self._lock:
+            try:
+                value, _ = self._entries[key]
+            except KeyError:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def _put(self, key: Hashable, value: object, nbytes: int) -> None:
+        """Add a value to the cache, evicting older entries if required.
+
+        A value that is larger than the entire budget isn't cached.
+        """
+        with self._lock:
+            if self._max_size == 0 or nbytes > self._max_size:
+                return
+            if key in self._entries:
+                self._size -= self._entries.pop(key)[1]
+            self._entries[key] = (value, nbytes)
+            self._size += nbytes
+            self._evict()
+
+    def _evict(self) -> None:
+        # Must be called with the lock held.
+        while self._size > self._max_size:
+            _, (_, nbytes) = self._entries.popitem(last=False)
+            self._size -= nbytes
+            self._evictions += 1
+
 
 class Image:
+    cache: ClassVar[ImageCache] = ImageCache()
+    """The cache of decoded images and icons, shared by the whole process. See
+    [`ImageCache`][toga.images.ImageCache]."""
+
+    # The number of images that can be decoded in the background at the same time.
+    _DECODE_THREADS = 4
+    _decoder: ClassVar[ThreadPoolExecutor | None] = None
+
     def __init__(
         self,
         src: ImageContentT = NOT_PROVIDED,
@@ -164,23 +352,35 @@ class Image:
         match src:
             # Any "lump of bytes" should be valid here.
             case bytes() | bytearray() | memoryview():
-                try:
-                    self._impl = self.factory.Image(interface=self, data=src)
-                except ImageLoadError as exc:
-                    raise ValueError("Unable to load image from data") from exc
+                key = ("image", hashlib.blake2b(src, digest_size=16).digest())
+                if not self._load_cached(key):
+                    try:
+                        self._impl = self.factory.Image(interface=self, data=src)
+                    except ImageLoadError as exc:
+                        raise ValueError("Unable to load image from data") from exc
+                    self._cache(key)
 
             case str() | Path():
                 self._path = toga.App.app.paths.app / src
                 if not self._path.is_file():
                     raise FileNotFoundError(f"Image file {self._path} does not exist")
-                data = self._path.read_bytes()
-                try:
-                    self._impl = self.factory.Image(interface=self, data=data)
-                except ImageLoadError as exc:
-                    raise ValueError(f"Unable to load image from {self._path}") from exc
+
+                # A file is only read again if it has been modified.
+                stat = self._path.stat()
+                key = ("image", str(self._path), stat.st_mtime_ns, stat.st_size)
+                if not self._load_cached(key):
+                    data = self._path.read_bytes()
+                    try:
+                        self._impl = self.factory.Image(interface=self, data=data)
+                    except ImageLoadError as exc:
+                        raise ValueError(
+                            f"Unable to load image from {self._path}"
+                        ) from exc
+                    self._cache(key)
 
             case Image():
-                self._impl = self.factory.Image(interface=self, data=src.data)
+                # Images can't be modified, so the native image can be shared.
+                self._impl = self.factory.Image(interface=self, raw=src._impl.native)
 
             case self.factory.Image.RAW_TYPE():
                 self._impl = self.factory.Image(interface=self, raw=src)
@@ -188,14 +388,116 @@ class Image:
             case _:
                 for converter in self._converters():
                     if isinstance(src, converter.image_class):
-                        data = converter.convert_from_format(src)
-                        self._impl = self.factory.Image(interface=self, data=data)
+                        to_buffer = getattr(
+                            converter, "convert_from_format_to_buffer", None
+                        )
+                        if to_buffer is not None:
+                            buffer = to_buffer(src)
+                            height, width, _ = memoryview(buffer).shape
+                            image = Image.from_buffer(width, height, "RGBA", buffer)
+                            self._impl = self.factory.Image(
+                                interface=self, raw=image._impl.native
+                            )
+                        else:
+                            data = converter.convert_from_format(src)
+                            self._impl = self.factory.Image(interface=self, data=data)
                         return
 
                 raise TypeError("Unsupported source type for Image")
 
     @classmethod
-    @cache
+    async def load_async(cls, src: ImageContentT) -> Image:
+        """Create a new image, reading and decoding it in a background thread.
+
+        Loading a large image (or a large number of images) can take long enough to
+        make an app unresponsive. Awaiting `load_async()` allows the app to continue
+        handling events while the image is loaded. A small number of images are
+        decoded at the same time; if more images are requested, they wait their turn.
+        If the awaiting task is cancelled before its image has started decoding, the
+        image isn't decoded.
+
+        :param src: The source from which to load the image. Can be any valid
+            [`ImageContentT`][toga.images.ImageContentT] type.
+        :returns: The new image.
+        :raises FileNotFoundError: If a path is provided, but that path does not exist.
+        :raises ValueError: If the source cannot be loaded as an image.
+        """
+        if Image._decoder is None:
+            Image._decoder = ThreadPoolExecutor(
+                max_workers=cls._DECODE_THREADS, thread_name_prefix="toga-image"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(Image._decoder, cls, src)
+
+    def _load_cached(self, key: Hashable) -> bool:
+        """Use the cached native image for the key, if there is one.
+
+        :returns: Whether the image was found in the cache.
+        """
+        native = self.cache._get(key)
+        if native is None:
+            return False
+        self._impl = self.factory.Image(interface=self, raw=native)
+        return True
+
+    def _cache(self, key: Hashable) -> None:
+        """Add the native image to the cache."""
+        self.cache._put(
+            key, self._impl.native, self._impl.get_width() * self._impl.get_height() * 4
+        )
+
+    @classmethod
+    def from_buffer(
+        cls,
+        width: int,
+        height: int,
+        format: str,
+        buffer: BytesLikeT,
+    ) -> Image:
+        """Create an image from raw pixel data.
+
+        The pixels are passed to the backend without being encoded in an image format,
+        so this is a fast way to display images that are generated on the fly (such as
+        video frames, or plots).
+
+        :param width: The width of the image, in pixels.
+        :param height: The height of the image, in pixels.
+        :param format: The order of the color channels in each pixel; either `"RGBA"`
+            or `"BGRA"`. Colors should not be premultiplied by alpha.
+        :param buffer: Any object supporting the buffer protocol (such as `bytes`, or
+            a NumPy array with a `uint8` data type), containing 4 bytes for each pixel.
+            Pixels are ordered by row, starting at the top left of the image, with no
+            padding between rows.
+        :returns: The new image.
+        :raises ValueError: If the format isn't recognized, or the buffer doesn't
+            contain the right amount of data for the size of the image.
+        """
+        if format not in PIXEL_FORMATS:
+            raise ValueError(f"Unsupported pixel format {format!r}")
+
+        pixels = memoryview(buffer)
+        if not pixels.c_contiguous:
+            pixels = memoryview(pixels.tobytes())
+        pixels = pixels.cast("B")
+        if width < 1 or height < 1 or len(pixels) != width * height * 4:
+            raise ValueError(
+                f"Buffer of {len(pixels)} bytes doesn't contain the pixels of a "
+                f"{width}x{height} image"
+            )
+
+        if format == "BGRA":
+            pixels = memoryview(_swap_red_blue(pixels))
+
+        factory = get_factory()
+        raw_from_pixels = getattr(factory.Image, "raw_from_pixels", None)
+        if raw_from_pixels is not None:
+            return cls(raw_from_pixels(width, height, pixels))
+        else:
+            # The backend can only load encoded images.
+            return cls(_encode_png(width, height, pixels))
+
+    @classmethod
+    @functools.cache
     def _converters(cls) -> list[ImageConverter]:
         """Return list of registered image plugin converters. Only loaded once."""
         converters = []
@@ -230,6 +532,41 @@ class Image:
         """The raw data for the image, in PNG format."""
         return self._impl.get_data()
 
+    def as_buffer(self, format: str = "RGBA") -> memoryview:
+        """Retrieve the pixels of the image.
+
+        :param format: The order of the color channels in each pixel; either `"RGBA"`
+            or `"BGRA"`. Colors are not premultiplied by alpha.
+        :returns: A read-only memoryview with a shape of `(height, width, 4)`. It can
+            be used by anything that supports the buffer protocol; for example,
+            `numpy.asarray(image.as_buffer())` creates a NumPy array that shares its
+            memory.
+        :raises ValueError: If the format isn't recognized.
+        :raises RuntimeError: If the backend can't provide the pixels of an image,
+            and Pillow isn't installed to decode the image data.
+        """
+        if format not in PIXEL_FORMATS:
+            raise ValueError(f"Unsupported pixel format {format!r}")
+
+        get_pixels = getattr(self._impl, "get_pixels", None)
+        if get_pixels is not None:
+            pixels = memoryview(get_pixels())
+        else:
+            # Decode the image data instead.
+            try:
+                import PIL.Image
+            except ImportError as exc:
+                raise RuntimeError(
+                    "Pillow must be installed to retrieve the pixels of an image "
+                    "on this platform"
+                ) from exc
+            with PIL.Image.open(BytesIO(self.data)) as pil_image:
+                pixels = memoryview(pil_image.convert("RGBA").tobytes())
+
+        if format == "BGRA":
+            pixels = memoryview(bytes(_swap_red_blue(pixels)))
+        return pixels.toreadonly().cast("B", (self.height, self.width, 4))
+
     @property
     def path(self) -> Path | None:
         """The path from which the image was opened, if any (or None)."""
@@ -257,10 +594,15 @@ class Image:
         """
         if isinstance(format, type):
             if issubclass(format, Image):
-                return format(self.data)
+                return format(self._impl.native)
 
             for converter in self._converters():
                 if issubclass(format, converter.image_class):
+                    from_buffer = getattr(
+                        converter, "convert_to_format_from_buffer", None
+                    )
+                    if from_buffer is not None:
+                        return from_buffer(self.as_buffer(), format)
                     return converter.convert_to_format(self.data, format)
 
         raise TypeError(f"Unknown conversion format for Image: {format}")
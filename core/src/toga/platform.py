@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import importlib
+import json
 import os
 import sys
 import warnings
 from functools import cache, cached_property
-from importlib.metadata import entry_points
 from types import ModuleType
+from typing import NamedTuple
 
 from . import NotImplementedWarning
 
@@ -61,6 +62,102 @@ used by `current_platform` do not exactly match the names returned by
 """
 
 
+class _EntryPoint(NamedTuple):
+    """An entry point that can be loaded without reading any package metadata."""
+
+    name: str
+    value: str
+    group: str
+
+    def load(self):
+        module_name, _, attrs = self.value.partition("[")[0].partition(":")
+        value = importlib.import_module(module_name.strip())
+        for attr in filter(None, attrs.strip().split(".")):
+            value = getattr(value, attr)
+        return value
+
+
+def _path_fingerprint() -> list:
+    """Identify the current state of the installed packages.
+
+    Installing, upgrading or removing a package modifies the directory on the Python
+    path that it's installed into, so the modification times of those directories
+    change whenever the available entry points might have changed.
+    """
+    fingerprint = [sys.version]
+    for path in sys.path:
+        try:
+            fingerprint.append([path, os.stat(path or ".").st_mtime_ns])
+        except OSError:
+            fingerprint.append([path, None])
+    return fingerprint
+
+
+@cache
+def _entry_point_index() -> dict[str, list[list[str]]]:
+    """Find the name and value of every Toga entry point, keyed by group.
+
+    Every installed package's metadata must be read to find its entry points, so this
+    is done once, rather than once per group. If the `TOGA_ENTRY_POINT_CACHE`
+    environment variable is set, the index is also saved in the file it names, and
+    used by later launches until the installed packages change.
+    """
+    cache_path = os.environ.get("TOGA_ENTRY_POINT_CACHE")
+    if cache_path:
+        # Examining the Python path has a cost, so it's only done if there's a
+        # cache to validate.
+        fingerprint = _path_fingerprint()
+        try:
+            with open(cache_path, encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached["fingerprint"] == fingerprint:
+                return cached["groups"]
+        except (OSError, ValueError, KeyError, TypeError):
+            # The cache doesn't exist, or can't be used; rebuild it.
+            pass
+
+    from importlib.metadata import entry_points as all_entry_points
+
+    found = all_entry_points()
+    index = {
+        # As of Setuptools 65.5, entry points are returned duplicated if the package
+        # is installed editable; only keep the first instance of each entry point.
+        group: [
+            list(name_value)
+            for name_value in dict.fromkeys(
+                (entry_point.name, entry_point.value)
+                for entry_point in found.select(group=group)
+            )
+        ]
+        for group in found.groups
+        if group.startswith("toga")
+    }
+
+    if cache_path:
+        try:
+            with open(f"{cache_path}.tmp", "w", encoding="utf-8") as f:
+                json.dump({"fingerprint": fingerprint, "groups": index}, f)
+            os.replace(f"{cache_path}.tmp", cache_path)
+        except OSError:
+            # The index will be rebuilt on the next launch.
+            pass
+
+    return index
+
+
+def entry_points(*, group: str) -> list[_EntryPoint]:
+    """Return the entry points in a Toga entry point group.
+
+    This is equivalent to [`importlib.metadata.entry_points`][], but only for groups
+    whose names start with `toga`; the entry points of every such group are found at
+    the same time, and may be read from a cache.
+    """
+    return [
+        _EntryPoint(name, value, group)
+        for name, value in _entry_point_index().get(group, [])
+    ]
+
+
 def find_backends():
     # As of Setuptools 65.5, entry points are returned duplicated if the package is
     # installed editable. Use a set to ensure that each entry point is only returned
@@ -27,6 +27,14 @@ class PILConverter:
         image_in_format.save(buffer, format="png", compress_level=0)
         return buffer.getvalue()
 
+    @staticmethod
+    def convert_from_format_to_buffer(image_in_format: PIL.Image.Image) -> memoryview:
+        if image_in_format.mode != "RGBA":
+            image_in_format = image_in_format.convert("RGBA")
+        return memoryview(image_in_format.tobytes()).cast(
+            "B", (image_in_format.height, image_in_format.width, 4)
+        )
+
     @staticmethod
     def convert_to_format(
         data: BytesLikeT,
@@ -38,3 +46,13 @@ class PILConverter:
         with PIL.Image.open(buffer) as pil_image:
             pil_image.load()
         return pil_image
+
+    @staticmethod
+    def convert_to_format_from_buffer(
+        buffer: memoryview,
+        image_class: type[PIL.Image.Image],
+    ) -> PIL.Image.Image:
+        height, width, _ = buffer.shape
+        return PIL.Image.frombuffer(
+            "RGBA", (width, height), buffer, "raw", "RGBA", 0, 1
+        )
@@ -0,0 +1,338 @@
+"""Measure the time taken to start a Toga app.
+
+Run as:
+
+    $ python -m toga.profile_startup myapp.app
+
+The app is started in a new Python interpreter, on the dummy backend unless another
+backend is requested with `--backend`. The time taken to import each module is
+recorded, along with the time taken by each phase of the app's startup. When the app's
+main window has been laid out, the app exits, and the timings are reported.
+
+Budgets can be set for any phase or module with `--budget NAME=MILLISECONDS`; if any
+budget is exceeded, or names a phase or module that wasn't recorded, the command exits
+with a non-zero status.
+"""
+
+from __future__ import annotations
+
+import sys
+from contextlib import contextmanager
+from time import perf_counter
+
+# Everything this module imports is imported before the app starts, so it is mostly
+# attributed to the profiler rather than to the app. Keep those imports to a minimum;
+# anything that is only needed to run the profiler (rather than the app) is imported
+# where it is used.
+
+_IMPORT_TIME_PREFIX = "import time:"
+
+
+def _parse_import_times(output: str) -> dict[str, tuple[float, float]]:
+    """Read the import times reported by `python -X importtime`.
+
+    :param output: The standard error output of the interpreter. Any lines that
+        don't report import times are ignored.
+    :returns: The time taken to import each module, as a tuple of the time spent in
+        that module alone and the time including the modules it imported, in seconds.
+        If a module was imported more than once (e.g., by a subprocess), the first
+        import is reported.
+    """
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith(_IMPORT_TIME_PREFIX):
+            continue
+        fields = line[len(_IMPORT_TIME_PREFIX) :].split("|")
+        try:
+            own, cumulative = (int(field) / 1_000_000 for field in fields[:2])
+        except ValueError:
+            # The header of the table.
+            continue
+        times.setdefault(fields[2].strip(), (own, cumulative))
+    return times
+
+
+@contextmanager
+def _instrument(phases: dict[str, float]):
+    """Record the time taken by each phase of an app's startup.
+
+    While the context is active, the duration of the first call of each of the
+    following is recorded in `phases`, in seconds:
+
+    * `Factory.<name>`: loading each implementation class from the backend;
+    * `App._create_standard_commands`: creating the app's standard commands;
+    * `App._startup`: the whole of the app's startup, including its `startup()`
+      method;
+    * `layout`: the first layout of the content of a main window.
+    """
+    from toga.app import App
+    from toga.platform import Factory
+    from toga.widgets.base import Widget
+    from toga.window import MainWindow
+
+    def main_window_content(widget):
+        window = widget.window
+        if isinstance(window, MainWindow) and widget is window.content:
+            return "layout"
+        return None
+
+    patches = [
+        (Factory, "__getattr__", lambda factory, name: f"Factory.{name}"),
+        (
+            App,
+            "_create_standard_commands",
+            lambda app: "App._create_standard_commands",
+        ),
+        (App, "_startup", lambda app: "App._startup"),
+        (Widget, "_refresh_layout", main_window_content),
+    ]
+
+    originals = []
+    for cls, name, label in patches:
+        original = cls.__dict__[name]
+        originals.append((cls, name, original))
+
+        def timed(self, *args, _original=original, _label=label, **kwargs):
+            key = _label(self, *args)
+            if key is None or key in phases:
+                return _original(self, *args, **kwargs)
+
+            start = perf_counter()
+            try:
+                return _original(self, *args, **kwargs)
+            finally:
+                phases[key] = perf_counter() - start
+
+        setattr(cls, name, timed)
+
+    try:
+        yield phases
+    finally:
+        for cls, name, original in originals:
+            setattr(cls, name, original)
+
+
+def _load_app(target: str):
+    """Create the app described by a target of the form `module[:function]`."""
+    import importlib
+
+    module_name, _, function_name = target.partition(":")
+    module = importlib.import_module(module_name)
+    return getattr(module, function_name or "main")()
+
+
+def _run(target: str, output: str) -> None:
+    """Start an app, recording the time taken by each phase of its startup.
+
+    This is invoked in the interpreter that is being profiled. The app exits as soon
+    as its startup has completed. The timings are written to `output` as JSON.
+    """
+    import importlib
+    import importlib.util
+
+    from toga.app import App
+
+    import_module = importlib.import_module
+    startup = App.__dict__["_startup"]
+
+    def timed_import_module(name, package=None):
+        # `python -X importtime` only reports modules that are imported by an import
+        # statement; this includes toga's own lazily-loaded names, and the modules that
+        # provide a backend's implementation classes.
+        name = importlib.util.resolve_name(name, package)
+        __import__(name)
+        return sys.modules[name]
+
+    def startup_then_exit(self):
+        startup(self)
+        # On most backends, startup happens once the main loop is running. As soon as
+        # it has completed (including any layout that it deferred), exit.
+        self.loop.call_soon(self.exit)
+
+    start = perf_counter()
+    phases = {}
+    importlib.import_module = timed_import_module
+    App._startup = startup_then_exit
+    try:
+        with _instrument(phases):
+            _load_app(target).main_loop()
+    finally:
+        App._startup = startup
+        importlib.import_module = import_module
+    phases["total"] = perf_counter() - start
+
+    import json
+
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(phases, f)
+
+
+def profile(
+    target: str,
+    backend: str = "toga_dummy",
+) -> tuple[dict[str, float], dict[str, tuple[float, float]]]:
+    """Start an app in a new Python interpreter, and measure its startup.
+
+    :param target: The app to start, in the form `module[:function]`. The function
+        (`main` by default) must return an instance of [`toga.App`][].
+    :param backend: The name of the backend to use.
+    :returns: A tuple of the duration of each phase of the app's startup, and the
+        time taken to import each module (as a tuple of the time spent in that module
+        alone, and the time including the modules it imported), in seconds.
+    :raises RuntimeError: If the app couldn't be started.
+    """
+    import json
+    import os
+    import subprocess
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output = os.path.join(tmp, "phases.json")
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-X",
+                "importtime",
+                "-c",
+                (
+                    "import sys; from toga.profile_startup import _run; "
+                    "_run(*sys.argv[1:])"
+                ),
+                target,
+                output,
+            ],
+            env={**os.environ, "TOGA_BACKEND": backend},
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if result.returncode != 0:
+            errors = "\n".join(
+                line
+                for line in result.stderr.splitlines()
+                if not line.startswith(_IMPORT_TIME_PREFIX)
+            )
+            raise RuntimeError(f"Unable to start {target!r}:\n{errors}")
+
+        with open(output, encoding="utf-8") as f:
+            phases = json.load(f)
+
+    return phases, _parse_import_times(result.stderr)
+
+
+def _check_budgets(
+    phases: dict[str, float],
+    imports: dict[str, tuple[float, float]],
+    budgets: dict[str, float],
+) -> tuple[list[str], list[str]]:
+    """Compare the startup timings with a set of budgets.
+
+    :param budgets: The maximum time allowed for each phase or module, in seconds.
+        The budget for a module applies to the time taken to import it, including
+        the modules it imports.
+    :returns: A description of each budget that was exceeded, and the names of any
+        budgets that don't match a phase or module that was recorded. An unknown
+        name is usually a typo, or a module that has been renamed; it is reported
+        so that the budget isn't silently ignored.
+    """
+    exceeded = []
+    unknown = []
+    for name, budget in budgets.items():
+        if name in phases:
+            elapsed = phases[name]
+        elif name in imports:
+            elapsed = imports[name][1]
+        else:
+            unknown.append(name)
+            continue
+
+        if elapsed > budget:
+            exceeded.append(
+                f"{name} took {elapsed * 1000:.1f} ms (budget {budget * 1000:.1f} ms)"
+            )
+    return exceeded, unknown
+
+
+def _budget(value: str) -> tuple[str, float]:
+    """Parse a budget of the form `NAME=MILLISECONDS`."""
+    import argparse
+
+    name, _, milliseconds = value.rpartition("=")
+    try:
+        if not name:
+            raise ValueError()
+        return name, float(milliseconds) / 1000
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"invalid budget {value!r}; use NAME=MILLISECONDS"
+        ) from None
+
+
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m toga.profile_startup",
+        description="Measure the time taken to start a Toga app.",
+    )
+    parser.add_argument(
+        "target",
+        help=(
+            "The app to start, as module[:function]. The function (main by default) "
+            "must return the app."
+        ),
+    )
+    parser.add_argument(
+        "--backend",
+        default="toga_dummy",
+        help="The backend to use (default toga_dummy).",
+    )
+    parser.add_argument(
+        "--budget",
+        dest="budgets",
+        type=_budget,
+        action="append",
+        default=[],
+        metavar="NAME=MILLISECONDS",
+        help=(
+            "The maximum time allowed for a phase of startup, or to import a module. "
+            "Can be used more than once."
+        ),
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=20,
+        help="The number of slowest modules to report (default 20).",
+    )
+    args = parser.parse_args(argv)
+
+    phases, imports = profile(args.target, backend=args.backend)
+
+    print("Startup phases:")
+    for name, elapsed in sorted(phases.items(), key=lambda item: -item[1]):
+        print(f"  {name:<50} {elapsed * 1000:10.1f} ms")
+
+    print()
+    print(f"Slowest imports (of {len(imports)}):")
+    print(f"  {'module':<50} {'self':>10}    {'cumulative':>10}")
+    slowest = sorted(imports.items(), key=lambda item: -item[1][1])[: args.top]
+    for name, (own, cumulative) in slowest:
+        print(f"  {name:<50} {own * 1000:10.1f} ms {cumulative * 1000:10.1f} ms")
+
+    exceeded, unknown = _check_budgets(phases, imports, dict(args.budgets))
+    if exceeded:
+        print()
+        print("Budgets exceeded:")
+        for description in exceeded:
+            print(f"  {description}")
+    if unknown:
+        print()
+        print("Budgets for unknown phases or modules:")
+        for name in unknown:
+            print(f"  {name}")
+    return 1 if exceeded or unknown else 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
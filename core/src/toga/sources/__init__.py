@@ -1,19 +1,27 @@
 from .accessors import to_accessor
 from .base import (
+    BatchListener,
     ListListener,
     Source,
     TreeListener,
     ValueListener,
 )
+from .columnar_source import ColumnarListSource, ColumnarRow
 from .columns import AccessorColumn, Column, ColumnT
+from .lazy_source import LazyListSource, LazyTreeSource
 from .list_source import ListSource, ListSourceT, Row
 from .tree_source import Node, TreeSource, TreeSourceT
 from .value_source import ValueSource
 
 __all__ = [
     "AccessorColumn",
+    "BatchListener",
     "Column",
     "ColumnT",
+    "ColumnarListSource",
+    "ColumnarRow",
+    "LazyListSource",
+    "LazyTreeSource",
     "ListListener",
     "ListSource",
     "ListSourceT",
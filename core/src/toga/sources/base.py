@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import warnings
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
 from typing import Generic, Protocol, TypeVar, runtime_checkable
 
 ListenerT = TypeVar("ListenerT")
@@ -81,12 +83,43 @@ class TreeListener(ListListener[ItemT], Protocol, Generic[ItemT]):
         """
 
 
+@runtime_checkable
+class BatchListener(Protocol, Generic[ItemT]):
+    """The protocol that can be implemented by a listener on a data source to receive
+    coalesced notifications of changes to many items at once.
+
+    These methods are optional. If a listener doesn't implement one of these methods,
+    the data source will send the equivalent individual notifications instead.
+    """
+
+    def source_insert_range(self, *, index: int, items: Sequence[ItemT]) -> None:
+        """A contiguous range of items has been added to the data source.
+
+        :param index: The 0-index position in the data of the first item.
+        :param items: The data objects that were added, in order.
+        """
+
+    def source_remove_range(self, *, index: int, items: Sequence[ItemT]) -> None:
+        """A contiguous range of items has been removed from the data source.
+
+        :param index: The 0-index position in the data of the first item.
+        :param items: The data objects that were removed, in order.
+        """
+
+    def source_reset(self) -> None:
+        """The content of the data source has changed in a way that can't be
+        described by individual notifications. All data should be reloaded from the
+        data source."""
+
+
 class Source(Generic[ListenerT]):
     """A base class for data sources, providing an implementation of data
     notifications."""
 
     def __init__(self) -> None:
         self._listeners: list[ListenerT] = []
+        self._batch_depth = 0
+        self._batch_changed = False
 
     @property
     def listeners(self) -> list[ListenerT]:
@@ -114,31 +147,83 @@ class Source(Generic[ListenerT]):
         """
         self._listeners.remove(listener)
 
+    @contextmanager
+    def batch(self) -> Iterator[Source]:
+        """Make a number of changes to the data source as a single update.
+
+        While the batch is active, listeners are not notified of individual changes.
+        When the batch ends, listeners receive a single `reset` notification if any
+        changes were made. Batches can be nested; notification is deferred until the
+        outermost batch ends.
+
+        ```python
+        with source.batch():
+            for price in prices:
+                source.append(price)
+        ```
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_changed:
+                self._batch_changed = False
+                self.notify("reset")
+
     def notify(self, notification: str, **kwargs: object) -> None:
         """Notify all listeners an event has occurred.
 
+        If a batch of changes is in progress, the notification is deferred until the
+        batch ends.
+
         :param notification: The notification to emit.
         :param kwargs: The data associated with the notification.
         """
+        if self._batch_depth:
+            self._batch_changed = True
+            return
+
         for listener in self._listeners:
-            method = getattr(listener, f"source_{notification}", None)
-
-            # Alias for backwards compatibility:
-            # March 2026: In 0.5.3 and earlier, notification methods
-            # didn't start with 'source_'
-            if method is None:
-                method = getattr(listener, notification, None)
-                if method is not None:
-                    warnings.warn(
-                        f"Notification handler methods on Listeners now start with "
-                        f"'source_'. Change the method name to "
-                        f"'source_{notification}'.",
-                        DeprecationWarning,
-                        stacklevel=2,
-                    )
-
-            if method:
-                method(**kwargs)
+            self._notify_listener(listener, notification, **kwargs)
+
+    def _notify_listener(
+        self, listener: ListenerT, notification: str, **kwargs: object
+    ) -> None:
+        method = getattr(listener, f"source_{notification}", None)
+
+        # Alias for backwards compatibility:
+        # March 2026: In 0.5.3 and earlier, notification methods
+        # didn't start with 'source_'
+        if method is None:
+            method = getattr(listener, notification, None)
+            if method is not None:
+                warnings.warn(
+                    f"Notification handler methods on Listeners now start with "
+                    f"'source_'. Change the method name to "
+                    f"'source_{notification}'.",
+                    DeprecationWarning,
+                    stacklevel=3,
+                )
+
+        if method:
+            method(**kwargs)
+        else:
+            self._notify_fallback(listener, notification, **kwargs)
+
+    def _notify_fallback(
+        self, listener: ListenerT, notification: str, **kwargs: object
+    ) -> None:
+        """Deliver a notification to a listener that doesn't implement it.
+
+        Subclasses can override this to describe a coalesced notification (such as
+        `insert_range`) in terms of the notifications that a listener is guaranteed
+        to implement. By default, the notification is ignored.
+
+        :param listener: The listener that doesn't implement the notification.
+        :param notification: The notification to emit.
+        :param kwargs: The data associated with the notification.
+        """
 
 
 def __getattr__(name):
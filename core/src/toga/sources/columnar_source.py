@@ -0,0 +1,360 @@
+from __future__ import annotations
+
+import sys
+from array import array
+from collections.abc import Iterable, Iterator, Mapping
+from itertools import zip_longest
+
+from .list_source import MISSING, ListSource
+
+# The position of a row that isn't known yet, and must be renumbered.
+UNKNOWN_POSITION = sys.maxsize
+
+
+class ColumnarRow:
+    """A row in a [`ColumnarListSource`][toga.sources.ColumnarListSource].
+
+    A ColumnarRow has the same attribute interface as a [`Row`][toga.sources.Row],
+    but doesn't store any data itself. It is a view onto a *slot* in the columns of
+    the data source. Rows are created when they are retrieved from the source; two
+    rows that refer to the same slot compare as equal.
+
+    Once a row has been removed from its data source, its attributes may no longer
+    be available.
+    """
+
+    __slots__ = ("_generation", "_slot", "_source")
+
+    def __init__(self, source: ColumnarListSource, slot: int, generation: int):
+        object.__setattr__(self, "_source", source)
+        object.__setattr__(self, "_slot", slot)
+        object.__setattr__(self, "_generation", generation)
+
+    def __repr__(self) -> str:
+        descriptor = " ".join(
+            f"{attr}={getattr(self, attr)!r}"
+            for attr in sorted(self._source._columns)
+            if hasattr(self, attr)
+        )
+        return (
+            f"<ColumnarRow {self._slot} "
+            f"{descriptor if descriptor else '(no attributes)'}>"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ColumnarRow):
+            return (self._source, self._slot, self._generation) == (
+                other._source,
+                other._slot,
+                other._generation,
+            )
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((id(self._source), self._slot, self._generation))
+
+    def _is_live(self) -> bool:
+        """Does this row still refer to data in the source?"""
+        generations = self._source._generations
+        return (
+            self._slot < len(generations)
+            and generations[self._slot] == self._generation
+        )
+
+    ######################################################################
+    # Utility wrappers
+    ######################################################################
+
+    def __getattr__(self, attr: str) -> object:
+        source = self._source
+        if self._is_live():
+            if attr.startswith("_"):
+                try:
+                    return source._extras[self._slot][attr]
+                except KeyError:
+                    pass
+            else:
+                try:
+                    value = source._columns[attr][self._slot]
+                except KeyError:
+                    pass
+                else:
+                    if value is not MISSING:
+                        return value
+
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {attr!r}"
+        )
+
+    def __setattr__(self, attr: str, value: object) -> None:
+        """Set an attribute on the row, notifying the source of the change.
+
+        :param attr: The attribute to change.
+        :param value: The new attribute value.
+        """
+        source = self._source
+        if not self._is_live():
+            raise AttributeError(f"{self!r} has been removed from its source")
+
+        if attr.startswith("_"):
+            source._extras.setdefault(self._slot, {})[attr] = value
+        else:
+            source._column(attr)[self._slot] = value
+            source.notify("change", item=self)
+
+    def __delattr__(self, attr: str) -> None:
+        """Remove an attribute from the row, notifying the source of the change.
+
+        :param attr: The attribute to remove.
+        """
+        # Raise an AttributeError if the attribute doesn't exist.
+        getattr(self, attr)
+
+        source = self._source
+        if attr.startswith("_"):
+            del source._extras[self._slot][attr]
+        else:
+            source._columns[attr][self._slot] = MISSING
+            source.notify("change", item=self)
+
+
+class ColumnarListSource(ListSource):
+    def __init__(
+        self,
+        accessors: Iterable[str] | None = None,
+        data: Iterable | None = None,
+        indexes: Iterable[str] = (),
+    ):
+        """A data source to store an ordered list of multiple data values, with the
+        values for each attribute stored in a single column.
+
+        A ColumnarListSource has the same interface as a
+        [`ListSource`][toga.sources.ListSource], but it doesn't create a Python
+        object for each row. Instead, the value of each attribute is stored in a
+        list, and the source returns [`ColumnarRow`][toga.sources.ColumnarRow] views
+        onto those lists. This uses much less memory for large data sets, and
+        constructing the source from a list of tuples is much faster.
+
+        :param accessors: A list of attribute names for accessing the value in each
+            column of the row. If omitted, only row data must be specified as a mapping.
+        :param data: The initial list of items in the source. Items are converted in
+            the same way as a [`ListSource`][toga.sources.ListSource].
+        :param indexes: A list of attribute names that should be indexed to speed up
+            searches. See [`ListSource.add_index()`][toga.sources.ListSource.add_index].
+        """
+        # The generation of data in each slot. A row is only live if its generation
+        # matches the generation of its slot. Generations are never reused.
+        self._next_generation = 0
+        super().__init__(accessors=accessors, data=data, indexes=indexes)
+
+    @property
+    def _data(self) -> ColumnarListSource:
+        # ListSource's search and notification helpers only need a sequence of rows.
+        return self
+
+    ######################################################################
+    # Methods required by the ListSource interface
+    ######################################################################
+
+    def __len__(self) -> int:
+        """Returns the number of items in the list."""
+        return len(self._order)
+
+    def __getitem__(self, index: int | slice) -> ColumnarRow | list[ColumnarRow]:
+        """Returns the item at position `index` of the list."""
+        if isinstance(index, slice):
+            return [self._row(slot) for slot in self._order[index]]
+        return self._row(self._order[index])
+
+    def __iter__(self) -> Iterator[ColumnarRow]:
+        return (self._row(slot) for slot in self._order)
+
+    ######################################################################
+    # Column storage
+    ######################################################################
+
+    def _row(self, slot: int) -> ColumnarRow:
+        return ColumnarRow(self, slot, self._generations[slot])
+
+    def _column(self, attr: str) -> list:
+        """The column of values for an attribute, created if necessary."""
+        try:
+            return self._columns[attr]
+        except KeyError:
+            column = self._columns[attr] = [MISSING] * len(self._generations)
+            return column
+
+    def _transpose(self, data: Iterable) -> tuple[int, dict[str, list]]:
+        """Convert row data into a list of values for each attribute.
+
+        :returns: The number of rows, and the values for each attribute, keyed by
+            attribute name.
+        """
+        data = data if isinstance(data, list) else list(data)
+        accessors = self._accessors
+        if accessors is not None and all(isinstance(item, tuple) for item in data):
+            # Fast path: transpose all the tuples at once.
+            values = list(zip_longest(*data, fillvalue=MISSING))[: len(accessors)]
+            values += [[MISSING] * len(data)] * (len(accessors) - len(values))
+            return len(data), dict(zip(accessors, values, strict=False))
+
+        columns: dict[str, list] = {}
+        for index, item in enumerate(data):
+            for attr, value in self._row_data(item).items():
+                column = columns.setdefault(attr, [MISSING] * index)
+                column.extend([MISSING] * (index - len(column)))
+                column.append(value)
+        for column in columns.values():
+            column.extend([MISSING] * (len(data) - len(column)))
+        return len(data), columns
+
+    def _row_data(self, data: object) -> Mapping[str, object]:
+        # This behavior mirrors ListSource._create_row().
+        if isinstance(data, Mapping):
+            return data
+        elif self._accessors is not None:
+            if hasattr(data, "__iter__") and not isinstance(data, str):
+                return dict(zip(self._accessors, data, strict=False))
+            else:
+                return {self._accessors[0]: data}
+        else:
+            raise ValueError("ListSource requires accessors for non-mapping row data")
+
+    def _allocate(self, data: Iterable) -> list[int]:
+        """Store row data in the columns.
+
+        :returns: The slots that hold the new rows.
+        """
+        count, values = self._transpose(data)
+        self._reclaim()
+
+        # Reuse free slots, then add new slots to the end of the columns.
+        reused = self._free[max(len(self._free) - count, 0) :] if count else []
+        del self._free[len(self._free) - len(reused) :]
+        first = len(self._generations)
+        added = count - len(reused)
+        slots = reused + list(range(first, first + added))
+
+        generation = self._next_generation
+        self._next_generation += 1
+        self._generations.extend(array("q", [generation]) * added)
+        self._positions.extend(array("q", [UNKNOWN_POSITION]) * added)
+        for slot in reused:
+            self._generations[slot] = generation
+            self._positions[slot] = UNKNOWN_POSITION
+
+        for attr in values.keys() - self._columns.keys():
+            self._columns[attr] = [MISSING] * first
+        # Reclaimed slots have already been emptied.
+        for attr, column in self._columns.items():
+            column_values = values.get(attr)
+            if column_values is None:
+                column.extend([MISSING] * added)
+            else:
+                for slot, value in zip(reused, column_values, strict=False):
+                    column[slot] = value
+                column.extend(column_values[len(reused) :])
+
+        return slots
+
+    def _release(self, slots: Iterable[int]) -> None:
+        """Mark slots as no longer in use.
+
+        The data in the slots isn't discarded until the next change to the source,
+        so that listeners can still inspect rows that have been removed.
+        """
+        for slot in slots:
+            self._positions[slot] = -1
+        self._pending.extend(slots)
+
+    def _reclaim(self) -> None:
+        """Discard the data in released slots, and make them available for reuse."""
+        if self._pending:
+            for slot in self._pending:
+                self._generations[slot] = -1
+                self._extras.pop(slot, None)
+                for column in self._columns.values():
+                    column[slot] = MISSING
+            self._free.extend(self._pending)
+            self._pending = []
+
+    ######################################################################
+    # Row storage
+    ######################################################################
+
+    def _renumber(self) -> None:
+        """Bring the positions of all rows up to date."""
+        positions = self._positions
+        order = self._order
+        for position in range(self._valid_positions, len(order)):
+            positions[order[position]] = position
+        self._valid_positions = len(order)
+
+    def _insert_rows(self, index: int, data: Iterable) -> list[ColumnarRow]:
+        slots = self._allocate(data)
+        self._invalidate_positions(index)
+        self._order[index:index] = array("q", slots)
+        rows = [self._row(slot) for slot in slots]
+        self._index_rows(rows)
+        return rows
+
+    def _delete_rows(self, start: int, stop: int) -> list[ColumnarRow]:
+        slots = self._order[start:stop]
+        rows = [self._row(slot) for slot in slots]
+        self._invalidate_positions(start)
+        del self._order[start:stop]
+        self._unindex_rows(rows)
+        self._release(slots)
+        return rows
+
+    def _replace_row(self, index: int, data: object) -> ColumnarRow:
+        old_slot = self._order[index]
+        self._unindex_rows([self._row(old_slot)])
+        [slot] = self._allocate([data])
+        self._order[index] = slot
+        # The new row takes the place (and position) of the old row.
+        self._positions[slot] = self._positions[old_slot]
+        self._release([old_slot])
+        row = self._row(slot)
+        self._index_rows([row])
+        return row
+
+    def _reset_rows(self, data: Iterable) -> None:
+        # Start with empty columns; rows that refer to the old columns are no
+        # longer live, because their generation won't match.
+        self._columns: dict[str, list] = {attr: [] for attr in (self._accessors or [])}
+        self._extras: dict[int, dict[str, object]] = {}
+        self._generations = array("q")
+        self._positions = array("q")
+        self._order = array("q")
+        self._free: list[int] = []
+        self._pending: list[int] = []
+        self._valid_positions = 0
+
+        self._order = array("q", self._allocate(data))
+        self._rebuild_indexes()
+
+    def index(self, row: ColumnarRow) -> int:
+        """The index of a specific row in the data source.
+
+        This search uses ColumnarRow instances. Two rows are considered to be the same
+        if they refer to the same slot in the data source. To search for values based
+        on equality, use
+        [`ListSource.find()`][toga.sources.ListSource.find].
+
+        :param row: The row to find in the data source.
+        :returns: The index of the row in the data source.
+        :raises ValueError: If the row cannot be found in the data source.
+        """
+        if (
+            isinstance(row, ColumnarRow)
+            and row._source is self
+            and row._is_live()
+            and (position := self._positions[row._slot]) >= 0
+        ):
+            if position >= self._valid_positions:
+                self._renumber()
+                position = self._positions[row._slot]
+            return position
+
+        raise ValueError(f"{row!r} is not in list")
@@ -1,15 +1,86 @@
 from abc import abstractmethod
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Sequence
 from typing import Any, Generic, Protocol, TypeVar, runtime_checkable
+from weakref import WeakKeyDictionary
 
 from ..icons import Icon
 from ..widgets.base import Widget
 from .accessors import build_accessors, to_accessor
+from .columnar_source import ColumnarRow
 from .list_source import Row
 
 Value = TypeVar("Value", contravariant=False, covariant=False)
 
 
+def _cell_cache(row: object) -> dict[object, tuple[str | None, Icon | None]] | None:
+    """The cache of rendered cells for a row.
+
+    Only rows in a source that has a cell cache listener can be cached, as the
+    listener discards the cells of a row when the source announces a change;
+    returns None for any other row.
+    """
+    if isinstance(row, ColumnarRow) and not row._is_live():
+        # A row that has been removed from a ColumnarListSource has no data.
+        return None
+
+    source = getattr(row, "_source", None)
+    for listener in getattr(source, "listeners", ()):
+        if isinstance(listener, _CellCacheListener):
+            return listener._cells_for(row)
+    return None
+
+
+class _CellCacheListener:
+    """A data source listener that retains the rendered cells of the source's rows.
+
+    A widget registers this listener before its backend, so that the cells of a
+    changed row are discarded before the backend displays the change. The cells of
+    a [`Row`][toga.sources.Row] are only retained while the row exists; the rows of
+    a [`ColumnarListSource`][toga.sources.ColumnarListSource] are transient views,
+    so their cells are retained until the row is removed from the source.
+    """
+
+    def __init__(self):
+        self._cells = WeakKeyDictionary()
+        self._columnar_cells = {}
+
+    def _cells_for(self, row: object) -> dict[object, tuple[str | None, Icon | None]]:
+        cache = self._columnar_cells if isinstance(row, ColumnarRow) else self._cells
+        try:
+            return cache[row]
+        except KeyError:
+            cells = cache[row] = {}
+            return cells
+
+    def _discard(self, item: object) -> None:
+        cache = self._columnar_cells if isinstance(item, ColumnarRow) else self._cells
+        cache.pop(item, None)
+
+    def source_change(self, *, item: object) -> None:
+        self._discard(item)
+
+    def source_remove(self, *, index: int, item: object, **kwargs: object) -> None:
+        self._discard(item)
+
+    def source_remove_range(self, *, index: int, items: Sequence[object]) -> None:
+        for item in items:
+            self._discard(item)
+
+    def source_clear(self) -> None:
+        self._cells.clear()
+        self._columnar_cells.clear()
+
+    source_reset = source_clear
+
+    # Insertions are implemented (and ignored) so that the source doesn't describe
+    # them in terms of other notifications.
+    def source_insert(self, *, index: int, item: object, **kwargs: object) -> None:
+        pass
+
+    def source_insert_range(self, *, index: int, items: Sequence[object]) -> None:
+        pass
+
+
 @runtime_checkable
 class ColumnT(Protocol, Generic[Value]):
     """Protocol that Column types must adhere to."""
@@ -121,6 +192,16 @@ class Column(ColumnT[Value], Generic[Value]):
         """
         return None
 
+    def prepare(self, rows: Sequence[Any]) -> None:
+        """Prepare to display many rows at once.
+
+        Backends invoke this method before displaying a range of rows, so that
+        columns can do any work that is more efficient in bulk. The base
+        implementation does nothing.
+
+        :param rows: The row objects that are about to be displayed.
+        """
+
 
 class AccessorColumn(Column[Value], Generic[Value]):
     """This is a column which implements accessor semantics.
@@ -145,12 +226,25 @@ class AccessorColumn(Column[Value], Generic[Value]):
 
     Icon values must either be an [Icon][], which will be displayed on the left
     of the cell, or `None` to display no icon.
+
+    By default, values are converted into text using [`str()`][str]. A `formatter`
+    can be provided to convert values into text; it is invoked with a list of
+    values, and must return a list of strings of the same length. This allows a
+    whole column of values to be formatted at once (see
+    [`prepare()`][toga.sources.AccessorColumn.prepare]).
+
+    While a data source is displayed by a [`toga.Table`][] or [`toga.Tree`][], the
+    text and icon for the cells of its rows are cached, and discarded when the
+    source sends a `change` notification for a row (e.g., when any attribute of the
+    row is modified), or removes the row.
     """
 
     def __init__(
         self,
         heading: str | None = None,
         accessor: str | None = None,
+        *,
+        formatter: Callable[[list[Any]], Sequence[str]] | None = None,
     ):
         if accessor is None:
             if heading is not None:
@@ -161,6 +255,11 @@ class AccessorColumn(Column[Value], Generic[Value]):
                 )
         super().__init__(heading)
         self._accessor = accessor
+        self._formatter = formatter
+        # The key for this column in the cached cells of each row. Two columns that
+        # compare as equal may format values differently, so the column itself
+        # can't be used as the key.
+        self._cache_key = object()
 
     def __eq__(self, other):
         if type(other) is type(self):
@@ -202,19 +301,8 @@ class AccessorColumn(Column[Value], Generic[Value]):
         :returns: The text to associated with this column's accessor, or None if no
             text.
         """
-        match value := self.value(row):
-            case Widget():
-                return default
-            case tuple((_, None)):
-                return default
-            case tuple((_, value)):
-                return str(value)
-            case tuple():
-                raise ValueError("Data tuples must have length 2")
-            case None:
-                return default
-            case _:
-                return str(value)
+        text = self._cell(row)[0]
+        return default if text is None else text
 
     def icon(self, row: Row[Value]) -> Icon | None:
         """Get text from the Row or Node of a ListSource or TreeSource.
@@ -227,15 +315,61 @@ class AccessorColumn(Column[Value], Generic[Value]):
         :returns: The Icon to associated with this column's accessor, or None if no
             Icon.
         """
+        return self._cell(row)[1]
+
+    def _split(self, row: Row[Value]) -> tuple[Any, Icon | None]:
+        """Split the value of a row into the value to display as text, and an icon.
+
+        :returns: The value to display as text (or None if there is no text), and the
+            icon.
+        """
         match value := self.value(row):
             case Widget():
-                return None
-            case tuple((icon, _)):
-                return icon
+                return None, None
+            case tuple((icon, text)):
+                return text, icon
             case tuple():
                 raise ValueError("Data tuples must have length 2")
             case _:
-                return getattr(value, "icon", None)
+                return value, getattr(value, "icon", None)
+
+    def _format(self, values: list[Any]) -> Sequence[str]:
+        if self._formatter is None:
+            return [str(value) for value in values]
+        return self._formatter(values)
+
+    def _cell(self, row: Row[Value]) -> tuple[str | None, Icon | None]:
+        """The text and icon for a row, using the row's cache if possible."""
+        cells = _cell_cache(row)
+        if cells is not None:
+            try:
+                return cells[self._cache_key]
+            except KeyError:
+                pass
+
+        text, icon = self._split(row)
+        cell = (None if text is None else self._format([text])[0], icon)
+        if cells is not None:
+            cells[self._cache_key] = cell
+        return cell
+
+    def prepare(self, rows: Sequence[Row[Value]]) -> None:
+        """Render the text and icons for many rows at once.
+
+        All the values that haven't already been rendered are passed to the
+        column's formatter in a single call, and the results are cached on each row.
+
+        :param rows: The row objects that are about to be displayed.
+        """
+        pending = []
+        for row in rows:
+            cells = _cell_cache(row)
+            if cells is not None and self._cache_key not in cells:
+                pending.append((cells, *self._split(row)))
+
+        texts = iter(self._format([text for _, text, _ in pending if text is not None]))
+        for cells, text, icon in pending:
+            cells[self._cache_key] = (None if text is None else next(texts), icon)
 
     def widget(self, row: Row[Value]) -> Widget | None:
         """Get a widget from the Row or Node of a ListSource or TreeSource.
@@ -0,0 +1,323 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from typing import Any
+
+from .base import Source
+from .list_source import UNDEFINED, Row, _find_items
+from .tree_source import Node, TreeSource
+
+
+class LazyListSource(Source):
+    _accessors: list[str] | None
+    # The rows that have been fetched, keyed by page number, in least-recently-used
+    # order.
+    _pages: OrderedDict[int, list[Row]]
+    # The position of each fetched row, keyed by the id() of the row.
+    _positions: dict[int, int]
+
+    def __init__(
+        self,
+        accessors: Iterable[str] | None = None,
+        *,
+        length: Callable[[], int],
+        fetch: Callable[[int, int], Iterable],
+        page_size: int = 100,
+        max_pages: int = 10,
+    ):
+        """A read-only data source for a list of data values that are only retrieved
+        when they are needed.
+
+        The data is retrieved in pages of `page_size` rows, using the `fetch`
+        callable; the most recently used `max_pages` pages are retained.
+
+        :param accessors: A list of attribute names for accessing the value in each
+            column of the row. If omitted, the fetched row data must be a mapping.
+        :param length: A callable that returns the number of rows in the data.
+        :param fetch: A callable that accepts a `start` and `stop` index, and returns
+            the data for the rows in that range. Each item is converted into a row as
+            shown [here][listsource-item].
+        :param page_size: The number of rows to fetch at a time.
+        :param max_pages: The maximum number of pages of rows to retain.
+        """
+        super().__init__()
+        match accessors:
+            case None:
+                self._accessors = None
+            case Iterable() if not isinstance(accessors, str):
+                # Copy the list of accessors
+                self._accessors = list(accessors)
+            case _:
+                raise ValueError("accessors should be a list of attribute names")
+
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        if max_pages < 1:
+            raise ValueError("max_pages must be at least 1")
+
+        self._length = length
+        self._fetch = fetch
+        self._page_size = page_size
+        self._max_pages = max_pages
+        self._pages = OrderedDict()
+        self._discard_rows()
+
+    @property
+    def accessors(self) -> list[str] | None:
+        """The attribute names for accessing the value in each column of a row."""
+        if self._accessors is None:
+            return None
+        return self._accessors.copy()
+
+    ######################################################################
+    # Methods required by the ListSource interface
+    ######################################################################
+
+    def __len__(self) -> int:
+        """Returns the number of items in the list."""
+        return self._count
+
+    def __getitem__(self, index: int | slice) -> Row | list[Row]:
+        """Returns the item at position `index` of the list, fetching it if
+        necessary."""
+        if isinstance(index, slice):
+            return [self[position] for position in range(len(self))[index]]
+
+        position = range(len(self))[index]
+        page = self._page(position // self._page_size)
+        return page[position % self._page_size]
+
+    def __iter__(self) -> Iterator[Row]:
+        return (self[position] for position in range(len(self)))
+
+    ######################################################################
+    # Fetching rows
+    ######################################################################
+
+    def _create_row(self, data: object) -> Row:
+        # This behavior mirrors ListSource._create_row().
+        if isinstance(data, Mapping):
+            row = Row(**data)
+        elif self._accessors is not None:
+            if hasattr(data, "__iter__") and not isinstance(data, str):
+                row = Row(**dict(zip(self._accessors, data, strict=False)))
+            else:
+                row = Row(**{self._accessors[0]: data})
+        else:
+            raise ValueError("ListSource requires accessors for non-mapping row data")
+        row._source = self
+        return row
+
+    def _page(self, number: int) -> list[Row]:
+        """The rows in a page, fetching them if necessary."""
+        try:
+            self._pages.move_to_end(number)
+            return self._pages[number]
+        except KeyError:
+            pass
+
+        start = number * self._page_size
+        stop = min(start + self._page_size, len(self))
+        rows = [self._create_row(data) for data in self._fetch(start, stop)]
+        self._pages[number] = rows
+        for offset, row in enumerate(rows):
+            self._positions[id(row)] = start + offset
+
+        while len(self._pages) > self._max_pages:
+            _, evicted = self._pages.popitem(last=False)
+            self._forget(evicted)
+
+        return rows
+
+    def _forget(self, rows: Iterable[Row]) -> None:
+        """Detach rows that are no longer retained by the source."""
+        for row in rows:
+            del self._positions[id(row)]
+            row._source = None
+
+    def _discard_rows(self) -> None:
+        for rows in self._pages.values():
+            self._forget(rows)
+        self._pages = OrderedDict()
+        self._positions = {}
+        self._count = self._length()
+
+    def refresh(self) -> None:
+        """Discard all the rows that have been fetched, and notify listeners that
+        the data has changed.
+
+        This should be invoked whenever the underlying data is modified. Rows that
+        were fetched before the refresh are no longer part of the source.
+        """
+        self._discard_rows()
+        self.notify("reset")
+
+    ######################################################################
+    # Notifications for listeners that don't support bulk changes
+    ######################################################################
+
+    def _notify_fallback(
+        self, listener: object, notification: str, **kwargs: object
+    ) -> None:
+        if notification == "reset":
+            # This requires every row to be fetched.
+            self._notify_listener(listener, "clear")
+            for index, row in enumerate(self):
+                self._notify_listener(listener, "insert", index=index, item=row)
+
+    ######################################################################
+    # Utility methods to make LazyListSource more list-like
+    ######################################################################
+
+    def index(self, row: Row) -> int:
+        """The index of a specific row in the data source.
+
+        Only rows that are currently retained by the source can be found. This is an
+        instance search, in the same way as
+        [`ListSource.index()`][toga.sources.ListSource.index].
+
+        :param row: The row to find in the data source.
+        :returns: The index of the row in the data source.
+        :raises ValueError: If the row isn't retained by the data source.
+        """
+        try:
+            return self._positions[id(row)]
+        except KeyError:
+            raise ValueError(f"{row!r} is not in list") from None
+
+    def find(
+        self, data: object, start: Row | None = None, default: Any = UNDEFINED
+    ) -> Row:
+        """Find the first item in the data that matches all the provided
+        attributes.
+
+        This is a value based search, in the same way as
+        [`ListSource.find()`][toga.sources.ListSource.find]. Every row up to the
+        first match will be fetched.
+
+        :param data: The data to search for. Only the values specified in data will be
+            used as matching criteria; if the row contains additional data attributes,
+            they won't be considered as part of the match.
+        :param start: The instance from which to start the search. Defaults to `None`,
+            indicating that the first match should be returned.
+        :param default: If provided, this value will be returned if no match is found.
+        :return: The matching Row object if found, or the value of `default` if
+            provided.
+        :raises ValueError: If no match is found and `default` is not provided.
+        """
+        try:
+            start_index = 0 if start is None else self.index(start) + 1
+            row = next(
+                _find_items(self, data, self._accessors, start_index, "row"),
+                UNDEFINED,
+            )
+            if row is UNDEFINED:
+                raise ValueError(f"No row matching {data!r} in data")
+            return row
+        except ValueError:
+            if default is UNDEFINED:
+                raise
+            else:
+                return default
+
+    def find_all(self, data: object) -> list[Row]:
+        """Find all the items in the data that match all the provided attributes.
+
+        This is a value based search, in the same way as
+        [`ListSource.find_all()`][toga.sources.ListSource.find_all]. Every row in the
+        data will be fetched.
+
+        :param data: The data to search for. Only the values specified in data will be
+            used as matching criteria; if the row contains additional data attributes,
+            they won't be considered as part of the match.
+        :returns: The matching Row objects, in the order they appear in the data
+            source. The list will be empty if there are no matches.
+        """
+        return list(_find_items(self, data, self._accessors, 0, "row", "find_all"))
+
+
+class _LazyNode(Node):
+    """A node whose children are fetched the first time they are needed."""
+
+    _source: LazyTreeSource
+
+    def __init__(self, **data: Any):
+        self._unfetched = False
+        super().__init__(**data)
+
+    @property
+    def _children(self) -> list[Node] | None:
+        # A node that has been discarded by its source can't fetch its children.
+        if self._unfetched and self._source is not None:
+            self._unfetched = False
+            self._fetched_children = self._source._fetch_nodes(parent=self)
+        return self._fetched_children
+
+    @_children.setter
+    def _children(self, children: list[Node] | None) -> None:
+        self._unfetched = False
+        self._fetched_children = children
+
+    def can_have_children(self) -> bool:
+        # Don't fetch the children just to find out if there are any.
+        return self._unfetched or self._fetched_children is not None
+
+
+class LazyTreeSource(TreeSource):
+    _node_class = _LazyNode
+
+    def __init__(
+        self,
+        accessors: Iterable[str] | None = None,
+        *,
+        children: Callable[[Node | None], Iterable],
+    ):
+        """A data source for a tree of data values, where the children of each node
+        are only retrieved when they are needed.
+
+        :param accessors: A list of attribute names for accessing the value in each
+            column of the row. If omitted, the fetched node data must be a mapping.
+        :param children: A callable that accepts a node (or [`None`][], for the root
+            of the tree), and returns the children of that node. Each child must be a
+            tuple of the data for the child, and a boolean indicating whether the
+            child can have children of its own. The data for each child is
+            converted into a node in the same way as a
+            [`TreeSource`][toga.sources.TreeSource].
+        """
+        self._fetch_children = children
+        super().__init__(accessors=accessors)
+        self._roots = None
+
+    @property
+    def _roots(self) -> list[Node]:
+        if self._fetched_roots is None:
+            self._fetched_roots = self._fetch_nodes(parent=None)
+        return self._fetched_roots
+
+    @_roots.setter
+    def _roots(self, roots: list[Node] | None) -> None:
+        self._fetched_roots = roots
+
+    def _fetch_nodes(self, parent: Node | None) -> list[Node]:
+        nodes = []
+        for data, can_have_children in self._fetch_children(parent):
+            node = self._create_node(parent=parent, data=data)
+            node._unfetched = bool(can_have_children)
+            nodes.append(node)
+        return nodes
+
+    def refresh(self) -> None:
+        """Discard all the nodes that have been fetched, and notify listeners that
+        the data has changed.
+
+        This should be invoked whenever the underlying data is modified. Nodes that
+        were fetched before the refresh are no longer part of the source.
+        """
+        if self._fetched_roots is not None:
+            for root in self._fetched_roots:
+                root._source = None
+        self._roots = None
+        self._reset_positions()
+        self._rebuild_indexes()
+        self.notify("reset")
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from typing import Any, Generic, TypeVar
 
 from .base import Source
 
 T = TypeVar("T")
 UNDEFINED = object()
+MISSING = object()
 
 ListSourceT = TypeVar("ListSourceT", bound=Source)
 """
@@ -15,6 +16,155 @@ A type describing any object adhering to the same interface as
 """
 
 
+class _ValueIndex:
+    def __init__(self, accessor: str, items: Iterable[object]):
+        """A hash index of the items in a data source, keyed by the value of a single
+        attribute.
+
+        Items whose value can't be hashed are kept separately, and are always
+        considered to be candidates for a match.
+
+        :param accessor: The name of the attribute to index.
+        :param items: The initial items to index.
+        """
+        self.accessor = accessor
+        # The set of items with each attribute value.
+        self._items: dict[object, set[object]] = {}
+        self._unhashable: set[object] = set()
+        # The value under which each item is currently indexed.
+        self._values: dict[object, object] = {}
+        for item in items:
+            self.add(item)
+
+    def add(self, item: object) -> None:
+        """Add an item to the index."""
+        value = getattr(item, self.accessor, MISSING)
+        self._values[item] = value
+        try:
+            self._items.setdefault(value, set()).add(item)
+        except TypeError:
+            self._unhashable.add(item)
+
+    def discard(self, item: object) -> None:
+        """Remove an item from the index."""
+        value = self._values.pop(item)
+        if item in self._unhashable:
+            self._unhashable.remove(item)
+        else:
+            bucket = self._items[value]
+            bucket.remove(item)
+            if not bucket:
+                del self._items[value]
+
+    def update(self, item: object) -> None:
+        """Re-index an item whose attributes may have changed."""
+        if item in self._values:
+            self.discard(item)
+            self.add(item)
+
+    def candidates(self, value: object) -> list[object] | None:
+        """The items that might have an attribute matching `value`.
+
+        :returns: The candidate items, in no particular order; or `None` if the
+            value can't be used to search the index.
+        """
+        try:
+            bucket = self._items.get(value, ())
+        except TypeError:
+            return None
+        return [*bucket, *self._unhashable]
+
+
+def _query(data: object, accessors: Sequence[str] | None) -> Mapping[str, object]:
+    """Convert find() data into a mapping of attribute names to values."""
+    match data:
+        case Mapping():
+            return data
+        case Iterable() if not isinstance(data, str):
+            return dict(zip(accessors, data, strict=False))
+        case _:
+            return {accessors[0]: data}
+
+
+def _indexed_candidates(
+    indexes: Mapping[str, _ValueIndex],
+    data: object,
+    accessors: Sequence[str] | None,
+) -> list[T] | None:
+    """Use an index to find the items that might match `data`.
+
+    If more than one of the attributes in `data` is indexed, the index with the
+    fewest candidates is used.
+
+    :returns: The candidate items, in no particular order; or `None` if the search
+        can't be satisfied using an index.
+    """
+    result = None
+    for attr, value in _query(data, accessors).items():
+        if attr in indexes:
+            candidates = indexes[attr].candidates(value)
+            if candidates is not None and (
+                result is None or len(candidates) < len(result)
+            ):
+                result = candidates
+    return result
+
+
+def _matches(item: object, data: object, accessors: Sequence[str] | None) -> bool:
+    """Does `item` have all the attribute values described by `data`?"""
+    try:
+        match data:
+            case Mapping():
+                return all(getattr(item, attr) == value for attr, value in data.items())
+            case Iterable() if not isinstance(data, str):
+                return all(
+                    getattr(item, attr) == value
+                    for value, attr in zip(data, accessors, strict=False)
+                )
+            case _:
+                return getattr(item, accessors[0]) == data
+    except AttributeError:
+        # Attribute didn't exist, so it's not a match
+        return False
+
+
+def _find_items(
+    candidates: Sequence[T],
+    data: object,
+    accessors: Sequence[str] | None,
+    start_index: int,
+    value_type: str,
+    method: str = "find",
+    indexes: Mapping[str, _ValueIndex] | None = None,
+    position: Callable[[T], int] | None = None,
+) -> Iterator[T]:
+    """Find-by-value implementation helper; iterate over the items matching `data`
+    in `candidates`, starting with the item at position `start_index`.
+
+    If `indexes` are provided, and any of the attributes in `data` are indexed, only
+    the items in that index are examined; `position` is used to put them in order.
+    """
+    if accessors is None and not isinstance(data, Mapping):
+        raise ValueError(
+            f"{method}() requires accessors for non-mapping {value_type} data"
+        )
+
+    if indexes:
+        indexed = _indexed_candidates(indexes, data, accessors)
+        if indexed is not None:
+            return (
+                item
+                for index, item in sorted((position(item), item) for item in indexed)
+                if index >= start_index and _matches(item, data, accessors)
+            )
+
+    return (
+        candidates[index]
+        for index in range(start_index, len(candidates))
+        if _matches(candidates[index], data, accessors)
+    )
+
+
 def _find_item(
     candidates: Sequence[T],
     data: object,
@@ -30,38 +180,13 @@ def _find_item(
     else:
         start_index = 0
 
-    if accessors is None and not isinstance(data, Mapping):
-        raise ValueError(f"find() requires accessors for non-mapping {value_type} data")
-
-    if start_index:
-        search_candidates: Iterable[T] = (
-            candidates[index] for index in range(start_index, len(candidates))
-        )
-    else:
-        search_candidates = candidates
-
-    for item in search_candidates:
-        try:
-            match data:
-                case Mapping():
-                    found = all(
-                        getattr(item, attr) == value for attr, value in data.items()
-                    )
-                case Iterable() if not isinstance(data, str):
-                    found = all(
-                        getattr(item, attr) == value
-                        for value, attr in zip(data, accessors, strict=False)
-                    )
-                case _:
-                    found = getattr(item, accessors[0]) == data
-
-            if found:
-                return item
-        except AttributeError:
-            # Attribute didn't exist, so it's not a match
-            pass
-
-    raise ValueError(error)
+    item = next(
+        _find_items(candidates, data, accessors, start_index, value_type),
+        UNDEFINED,
+    )
+    if item is UNDEFINED:
+        raise ValueError(error)
+    return item
 
 
 class Row(Generic[T]):
@@ -116,11 +241,18 @@ class Row(Generic[T]):
 class ListSource(Source):
     _data: list[Row]
     _accessors: list[str] | None
+    # The position of each row in `_data`, keyed by the id() of the row. Positions
+    # before `_valid_positions` are known to be correct; positions after that point
+    # may be out of date, and are renumbered the next time they're needed.
+    _positions: dict[int, int]
+    _valid_positions: int
+    _indexes: dict[str, _ValueIndex]
 
     def __init__(
         self,
         accessors: Iterable[str] | None = None,
         data: Iterable | None = None,
+        indexes: Iterable[str] = (),
     ):
         """A data source to store an ordered list of multiple data values.
 
@@ -128,6 +260,8 @@ class ListSource(Source):
             column of the row. If omitted, only row data must be specified as a mapping.
         :param data: The initial list of items in the source. Items are converted as
             shown [above][listsource-item].
+        :param indexes: A list of attribute names that should be indexed to speed up
+            searches. See [`ListSource.add_index()`][toga.sources.ListSource.add_index].
         """
         super().__init__()
         match accessors:
@@ -140,10 +274,10 @@ class ListSource(Source):
                 raise ValueError("accessors should be a list of attribute names")
 
         # Convert the data into row objects
-        if data is not None:
-            self._data = [self._create_row(value) for value in data]
-        else:
-            self._data = []
+        self._indexes = {}
+        self._reset_rows(data if data is not None else [])
+        for accessor in indexes:
+            self.add_index(accessor)
 
     @property
     def accessors(self) -> list[str] | None:
@@ -166,8 +300,8 @@ class ListSource(Source):
 
     def __delitem__(self, index: int) -> None:
         """Deletes the item at position `index` of the list."""
-        row = self._data[index]
-        del self._data[index]
+        position = range(len(self))[index]
+        [row] = self._delete_rows(position, position + 1)
         self.notify("remove", index=index, item=row)
 
     ######################################################################
@@ -175,6 +309,14 @@ class ListSource(Source):
     ######################################################################
 
     # This behavior is documented in list_source.rst.
+    def _clamp(self, index: int) -> int:
+        """Convert an insertion index into a position, in the same way as
+        `list.insert()`."""
+        if index < 0:
+            return max(len(self) + index, 0)
+        else:
+            return min(len(self), index)
+
     def _create_row(self, data: object) -> Row:
         if isinstance(data, Mapping):
             row = Row(**data)
@@ -188,6 +330,160 @@ class ListSource(Source):
         row._source = self
         return row
 
+    ######################################################################
+    # Notifications for listeners that don't support bulk changes
+    ######################################################################
+
+    def _notify_fallback(
+        self, listener: object, notification: str, **kwargs: object
+    ) -> None:
+        match notification:
+            case "insert_range":
+                for offset, item in enumerate(kwargs["items"]):
+                    self._notify_listener(
+                        listener, "insert", index=kwargs["index"] + offset, item=item
+                    )
+            case "remove_range":
+                for item in kwargs["items"]:
+                    self._notify_listener(
+                        listener, "remove", index=kwargs["index"], item=item
+                    )
+            case "reset":
+                self._notify_listener(listener, "clear")
+                for index, item in enumerate(self._data):
+                    self._notify_listener(listener, "insert", index=index, item=item)
+
+    ######################################################################
+    # Value indexes
+    ######################################################################
+
+    def notify(self, notification: str, **kwargs: object) -> None:
+        # A change to a row may change the value of an indexed attribute.
+        if notification == "change" and self._indexes:
+            for value_index in self._indexes.values():
+                value_index.update(kwargs.get("item"))
+        super().notify(notification, **kwargs)
+
+    def _rebuild_indexes(self) -> None:
+        self._indexes = {
+            accessor: _ValueIndex(accessor, self._data) for accessor in self._indexes
+        }
+
+    def _index_rows(self, rows: Iterable[Row]) -> None:
+        for value_index in self._indexes.values():
+            for row in rows:
+                value_index.add(row)
+
+    def _unindex_rows(self, rows: Iterable[Row]) -> None:
+        for value_index in self._indexes.values():
+            for row in rows:
+                value_index.discard(row)
+
+    def add_index(self, accessor: str) -> None:
+        """Maintain an index of the rows in the data source, keyed by the value of an
+        attribute.
+
+        When a search with [`ListSource.find()`][toga.sources.ListSource.find] or
+        [`ListSource.find_all()`][toga.sources.ListSource.find_all] includes a value
+        for an indexed attribute, only the rows with that value need to be examined,
+        rather than every row in the data source. The index is updated whenever rows
+        are added, removed or modified, so maintaining an index makes those
+        operations slightly slower. Values of an indexed attribute should be
+        hashable; rows with unhashable values are examined by every search.
+
+        :param accessor: The name of the attribute to index. If the attribute is
+            already indexed, this has no effect.
+        """
+        if accessor not in self._indexes:
+            self._indexes[accessor] = _ValueIndex(accessor, self._data)
+
+    def remove_index(self, accessor: str) -> None:
+        """Stop maintaining an index of the rows in the data source.
+
+        :param accessor: The name of the attribute whose index should be removed.
+        :raises KeyError: If the attribute isn't indexed.
+        """
+        del self._indexes[accessor]
+
+    @property
+    def indexes(self) -> list[str]:
+        """The names of the attributes that are indexed."""
+        return list(self._indexes)
+
+    ######################################################################
+    # Row storage
+    ######################################################################
+
+    def _invalidate_positions(self, index: int) -> None:
+        """Mark the positions of all rows from `index` onwards as out of date."""
+        self._valid_positions = min(self._valid_positions, index)
+
+    def _renumber(self) -> None:
+        """Bring the positions of all rows up to date."""
+        positions = self._positions
+        data = self._data
+        for position in range(self._valid_positions, len(data)):
+            positions[id(data[position])] = position
+        self._valid_positions = len(data)
+
+    def _insert_rows(self, index: int, data: Iterable) -> list[Row]:
+        """Create new rows, and insert them at position `index`.
+
+        :param index: The position of the first new row. Must be between 0 and the
+            length of the source.
+        :param data: The data for each new row.
+        :returns: The new rows.
+        """
+        rows = [self._create_row(value) for value in data]
+        self._invalidate_positions(index)
+        self._data[index:index] = rows
+        for row in rows:
+            self._positions[id(row)] = -1
+        self._index_rows(rows)
+        return rows
+
+    def _delete_rows(self, start: int, stop: int) -> list[Row]:
+        """Delete the rows between positions `start` and `stop`.
+
+        :param start: The position of the first row to delete.
+        :param stop: The position after the last row to delete. Must be no less than
+            `start`, and no more than the length of the source.
+        :returns: The deleted rows.
+        """
+        rows = self._data[start:stop]
+        self._invalidate_positions(start)
+        del self._data[start:stop]
+        for row in rows:
+            del self._positions[id(row)]
+        self._unindex_rows(rows)
+        return rows
+
+    def _replace_row(self, index: int, data: object) -> Row:
+        """Replace the row at position `index` with a new row.
+
+        :param index: The position of the row to replace.
+        :param data: The data for the new row.
+        :returns: The new row.
+        """
+        row = self._create_row(data)
+        old_row = self._data[index]
+        self._data[index] = row
+        # The new row takes the place (and position) of the old row.
+        self._positions[id(row)] = self._positions.pop(id(old_row))
+        self._unindex_rows([old_row])
+        self._index_rows([row])
+        return row
+
+    def _reset_rows(self, data: Iterable) -> None:
+        """Replace all the rows in the source.
+
+        :param data: The data for each new row.
+        """
+        self._data = [self._create_row(value) for value in data]
+        self._positions = {id(row): index for index, row in enumerate(self._data)}
+        self._valid_positions = len(self._data)
+        self._rebuild_indexes()
+
     ######################################################################
     # Utility methods to make ListSources more list-like
     ######################################################################
@@ -199,13 +495,12 @@ class ListSource(Source):
         :param value: The data for the updated item. This data will be converted
             into a Row object.
         """
-        row = self._create_row(value)
-        self._data[index] = row
+        row = self._replace_row(range(len(self))[index], value)
         self.notify("change", item=row)
 
     def clear(self) -> None:
         """Clear all data from the data source."""
-        self._data = []
+        self._reset_rows([])
         self.notify("clear")
 
     def insert(self, index: int, data: object) -> Row:
@@ -216,8 +511,7 @@ class ListSource(Source):
             into a Row object.
         :returns: The newly constructed Row object.
         """
-        row = self._create_row(data)
-        self._data.insert(index, row)
+        [row] = self._insert_rows(self._clamp(index), [data])
         self.notify("insert", index=index, item=row)
         return row
 
@@ -230,12 +524,67 @@ class ListSource(Source):
         """
         return self.insert(len(self), data)
 
+    def insert_many(self, index: int, data: Iterable) -> list[Row]:
+        """Insert multiple rows into the data source at a specific index.
+
+        Listeners receive a single `insert_range` notification for the new rows.
+
+        :param index: The index at which to insert the first item.
+        :param data: The data to insert into the ListSource. Each item will be
+            converted into a Row object.
+        :returns: The newly constructed Row objects.
+        """
+        index = self._clamp(index)
+        rows = self._insert_rows(index, data)
+        if rows:
+            self.notify("insert_range", index=index, items=rows)
+        return rows
+
+    def extend(self, data: Iterable) -> list[Row]:
+        """Insert multiple rows at the end of the data source.
+
+        Listeners receive a single `insert_range` notification for the new rows.
+
+        :param data: The data to append to the ListSource. Each item will be
+            converted into a Row object.
+        :returns: The newly constructed Row objects.
+        """
+        return self.insert_many(len(self), data)
+
+    def delete_range(self, start: int, stop: int) -> None:
+        """Delete a contiguous range of rows from the data source.
+
+        The range is interpreted in the same way as the slice `start:stop`. Listeners
+        receive a single `remove_range` notification for the deleted rows.
+
+        :param start: The index of the first row to delete.
+        :param stop: The index after the last row to delete.
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        if start >= stop:
+            return
+
+        rows = self._delete_rows(start, stop)
+        self.notify("remove_range", index=start, items=rows)
+
+    def replace_all(self, data: Iterable) -> None:
+        """Replace all the rows in the data source.
+
+        Listeners receive a single `reset` notification, rather than a notification
+        for each row that is removed and added.
+
+        :param data: The new data for the ListSource. Each item will be converted
+            into a Row object.
+        """
+        self._reset_rows(data)
+        self.notify("reset")
+
     def remove(self, row: Row) -> None:
         """Remove a row from the data source.
 
         :param row: The row to remove from the data source.
         """
-        del self[self._data.index(row)]
+        del self[self.index(row)]
 
     def index(self, row: Row) -> int:
         """The index of a specific row in the data source.
@@ -245,11 +594,34 @@ class ListSource(Source):
         same Python instance will match. To search for values based on equality,
         use [`ListSource.find()`][toga.sources.ListSource.find].
 
+        The position of each row is tracked as rows are added and removed, so this
+        lookup doesn't need to search the data source.
+
         :param row: The row to find in the data source.
         :returns: The index of the row in the data source.
         :raises ValueError: If the row cannot be found in the data source.
         """
-        return self._data.index(row)
+        try:
+            position = self._positions[id(row)]
+        except KeyError:
+            raise ValueError(f"{row!r} is not in list") from None
+
+        if position < 0 or position >= self._valid_positions:
+            self._renumber()
+            position = self._positions[id(row)]
+        return position
+
+    def _search(self, data: object, start: Row | None, method: str) -> Iterator[Row]:
+        return _find_items(
+            candidates=self._data,
+            data=data,
+            accessors=self._accessors,
+            start_index=0 if start is None else self.index(start) + 1,
+            value_type="row",
+            method=method,
+            indexes=self._indexes,
+            position=self.index,
+        )
 
     def find(
         self, data: object, start: Row | None = None, default: Any = UNDEFINED
@@ -263,6 +635,10 @@ class ListSource(Source):
         as the `start` argument. To search for a specific Row instance, use the
         [`ListSource.index()`][toga.sources.ListSource.index].
 
+        If any of the attributes in `data` are
+        [indexed][toga.sources.ListSource.add_index], only the rows with a matching
+        value for that attribute are examined.
+
         :param data: The data to search for. Only the values specified in data will be
             used as matching criteria; if the row contains additional data attributes,
             they won't be considered as part of the match.
@@ -274,16 +650,26 @@ class ListSource(Source):
         :raises ValueError: If no match is found and `default` is not provided.
         """
         try:
-            return _find_item(
-                candidates=self._data,
-                data=data,
-                accessors=self._accessors,
-                start=start,
-                error=f"No row matching {data!r} in data",
-                value_type="row",
-            )
+            row = next(self._search(data, start, "find"), UNDEFINED)
+            if row is UNDEFINED:
+                raise ValueError(f"No row matching {data!r} in data")
+            return row
         except ValueError:
             if default is UNDEFINED:
                 raise
             else:
                 return default
+
+    def find_all(self, data: object) -> list[Row]:
+        """Find all the items in the data that match all the provided attributes.
+
+        This is a value based search, in the same way as
+        [`ListSource.find()`][toga.sources.ListSource.find].
+
+        :param data: The data to search for. Only the values specified in data will be
+            used as matching criteria; if the row contains additional data attributes,
+            they won't be considered as part of the match.
+        :returns: The matching Row objects, in the order they appear in the data
+            source. The list will be empty if there are no matches.
+        """
+        return list(self._search(data, None, "find_all"))
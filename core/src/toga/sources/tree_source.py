@@ -4,7 +4,13 @@ from collections.abc import Iterable, Iterator, Mapping
 from typing import TypeVar
 
 from .base import Source
-from .list_source import Row, _find_item
+from .list_source import (
+    UNDEFINED,
+    Row,
+    _find_item,
+    _find_items,
+    _ValueIndex,
+)
 
 T = TypeVar("T")
 
@@ -204,13 +210,23 @@ class Node(Row[T]):
 
 
 class TreeSource(Source):
+    # The class used for the nodes of the tree.
+    _node_class: type[Node] = Node
     _roots: list[Node]
+    # The position of each root in `_roots`, keyed by the id() of the root. Positions
+    # before `_valid_positions` are known to be correct; positions after that point
+    # may be out of date (or missing), and are renumbered the next time they're
+    # needed.
+    _positions: dict[int, int]
+    _valid_positions: int
     _accessors: list[str] | None
+    _indexes: dict[str, _ValueIndex]
 
     def __init__(
         self,
         accessors: Iterable[str] | None = None,
         data: object | None = None,
+        indexes: Iterable[str] = (),
     ):
         super().__init__()
         match accessors:
@@ -226,6 +242,11 @@ class TreeSource(Source):
             self._roots = self._create_nodes(parent=None, value=data)
         else:
             self._roots = []
+        self._reset_positions()
+
+        self._indexes = {}
+        for accessor in indexes:
+            self.add_index(accessor)
 
     @property
     def accessors(self) -> list[str] | None:
@@ -247,9 +268,34 @@ class TreeSource(Source):
     def __delitem__(self, index: int) -> None:
         node = self._roots[index]
         del self._roots[index]
+        self._invalidate_positions(index)
+        self._positions.pop(id(node), None)
         node._source = None
+        for value_index in self._indexes.values():
+            value_index.discard(node)
         self.notify("remove", parent=None, index=index, item=node)
 
+    ######################################################################
+    # Root positions
+    ######################################################################
+
+    def _reset_positions(self) -> None:
+        """Discard the positions of all roots, as the roots have been replaced."""
+        self._positions = {}
+        self._valid_positions = 0
+
+    def _invalidate_positions(self, index: int) -> None:
+        """Mark the positions of all roots from `index` onwards as out of date."""
+        self._valid_positions = min(self._valid_positions, index)
+
+    def _renumber(self) -> None:
+        """Bring the positions of all roots up to date."""
+        positions = self._positions
+        roots = self._roots
+        for position in range(self._valid_positions, len(roots)):
+            positions[id(roots[position])] = position
+        self._valid_positions = len(roots)
+
     ######################################################################
     # Factory methods for new nodes
     ######################################################################
@@ -261,12 +307,14 @@ class TreeSource(Source):
         children: object | None = None,
     ) -> Node:
         if isinstance(data, Mapping):
-            node = Node(**data)
+            node = self._node_class(**data)
         elif self._accessors is not None:
             if hasattr(data, "__iter__") and not isinstance(data, str):
-                node = Node(**dict(zip(self._accessors, data, strict=False)))
+                node = self._node_class(
+                    **dict(zip(self._accessors, data, strict=False))
+                )
             else:
-                node = Node(**{self._accessors[0]: data})
+                node = self._node_class(**{self._accessors[0]: data})
         else:
             raise ValueError("TreeSource requires accessors for non-mapping node data")
 
@@ -293,6 +341,64 @@ class TreeSource(Source):
             case _:
                 return [self._create_node(parent=parent, data=value)]
 
+    ######################################################################
+    # Notifications for listeners that don't support bulk changes
+    ######################################################################
+
+    def _notify_fallback(
+        self, listener: object, notification: str, **kwargs: object
+    ) -> None:
+        if notification == "reset":
+            self._notify_listener(listener, "clear")
+            for index, node in enumerate(self._roots):
+                self._notify_listener(
+                    listener, "insert", parent=None, index=index, item=node
+                )
+
+    ######################################################################
+    # Value indexes
+    ######################################################################
+
+    def notify(self, notification: str, **kwargs: object) -> None:
+        # A change to a root node may change the value of an indexed attribute.
+        if notification == "change" and self._indexes:
+            for value_index in self._indexes.values():
+                value_index.update(kwargs.get("item"))
+        super().notify(notification, **kwargs)
+
+    def add_index(self, accessor: str) -> None:
+        """Maintain an index of the root nodes of the data source, keyed by the value
+        of an attribute.
+
+        This works in the same way as
+        [`ListSource.add_index()`][toga.sources.ListSource.add_index]. Only root
+        nodes are indexed, as only root nodes are examined by
+        [`TreeSource.find()`][toga.sources.TreeSource.find].
+
+        :param accessor: The name of the attribute to index. If the attribute is
+            already indexed, this has no effect.
+        """
+        if accessor not in self._indexes:
+            self._indexes[accessor] = _ValueIndex(accessor, self._roots)
+
+    def remove_index(self, accessor: str) -> None:
+        """Stop maintaining an index of the root nodes of the data source.
+
+        :param accessor: The name of the attribute whose index should be removed.
+        :raises KeyError: If the attribute isn't indexed.
+        """
+        del self._indexes[accessor]
+
+    @property
+    def indexes(self) -> list[str]:
+        """The names of the attributes that are indexed."""
+        return list(self._indexes)
+
+    def _rebuild_indexes(self) -> None:
+        self._indexes = {
+            accessor: _ValueIndex(accessor, self._roots) for accessor in self._indexes
+        }
+
     ######################################################################
     # Utility methods to make TreeSources more list-like
     ######################################################################
@@ -310,13 +416,38 @@ class TreeSource(Source):
 
         root = self._create_node(parent=None, data=data)
         self._roots[index] = root
+        # The new root takes the place (and position) of the old root.
+        position = self._positions.pop(id(old_root), None)
+        if position is not None:
+            self._positions[id(root)] = position
+        for value_index in self._indexes.values():
+            value_index.discard(old_root)
+            value_index.add(root)
         self.notify("change", item=root)
 
     def clear(self) -> None:
         """Clear all data from the data source."""
         self._roots = []
+        self._reset_positions()
+        self._rebuild_indexes()
         self.notify("clear")
 
+    def replace_all(self, data: object) -> None:
+        """Replace all the nodes in the data source.
+
+        Listeners receive a single `reset` notification, rather than a notification
+        for each node that is removed and added.
+
+        :param data: The new data for the TreeSource. This data is interpreted in the
+            same way as the `data` argument to the TreeSource constructor.
+        """
+        for root in self._roots:
+            root._source = None
+        self._roots = self._create_nodes(parent=None, value=data)
+        self._reset_positions()
+        self._rebuild_indexes()
+        self.notify("reset")
+
     def insert(self, index: int, data: object, children: object = None) -> Node:
         """Insert a root node into the data source at a specific index.
 
@@ -336,7 +467,10 @@ class TreeSource(Source):
 
         node = self._create_node(parent=None, data=data, children=children)
         self._roots.insert(index, node)
+        self._invalidate_positions(index)
         node._parent = None
+        for value_index in self._indexes.values():
+            value_index.add(node)
         self.notify("insert", parent=None, index=index, item=node)
 
         return node
@@ -377,11 +511,33 @@ class TreeSource(Source):
         same Python instance will match. To search for values based on equality,
         use [`TreeSource.find()`][toga.sources.TreeSource.find].
 
+        The position of each root node is tracked as nodes are added and removed, so
+        this lookup doesn't need to search the data source.
+
         :param node: The node to find in the data source.
         :returns: The index of the node in the child list it is a part of.
         :raises ValueError: If the node cannot be found in the data source.
         """
-        return self._roots.index(node)
+        position = self._positions.get(id(node), -1)
+        if position < 0 or position >= self._valid_positions:
+            self._renumber()
+            try:
+                position = self._positions[id(node)]
+            except KeyError:
+                raise ValueError(f"{node!r} is not in list") from None
+        return position
+
+    def _search(self, data: object, start: Node | None, method: str) -> Iterator[Node]:
+        return _find_items(
+            candidates=self._roots,
+            data=data,
+            accessors=self._accessors,
+            start_index=0 if start is None else self.index(start) + 1,
+            value_type="node",
+            method=method,
+            indexes=self._indexes,
+            position=self.index,
+        )
 
     def find(self, data: object, start: Node | None = None) -> Node:
         """Find the first item in the child nodes of the given node that matches all the
@@ -402,11 +558,21 @@ class TreeSource(Source):
         :raises ValueError: If no match is found.
         :raises ValueError: If the provided parent is not part of this TreeSource.
         """
-        return _find_item(
-            candidates=self._roots,
-            data=data,
-            accessors=self._accessors,
-            start=start,
-            error=f"No root node matching {data!r} in {self}",
-            value_type="node",
-        )
+        node = next(self._search(data, start, "find"), UNDEFINED)
+        if node is UNDEFINED:
+            raise ValueError(f"No root node matching {data!r} in {self}")
+        return node
+
+    def find_all(self, data: object) -> list[Node]:
+        """Find all the root nodes that match all the provided attributes.
+
+        This is a value based search, in the same way as
+        [`TreeSource.find()`][toga.sources.TreeSource.find].
+
+        :param data: The data to search for. Only the values specified in data will be
+            used as matching criteria; if the node contains additional data attributes,
+            they won't be considered as part of the match.
+        :returns: The matching Node objects, in the order they appear in the data
+            source. The list will be empty if there are no matches.
+        """
+        return list(self._search(data, None, "find_all"))
@@ -21,3 +21,11 @@ class ValueSource(Source):
         super().__setattr__(attr, value)
         if attr == getattr(self, "accessor", None):
             self.notify("change", item=value)
+
+    def _notify_fallback(
+        self, listener: object, notification: str, **kwargs: object
+    ) -> None:
+        if notification == "reset":
+            self._notify_listener(
+                listener, "change", item=getattr(self, self.accessor, None)
+            )
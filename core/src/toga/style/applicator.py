@@ -18,6 +18,9 @@ class TogaApplicator:
     ######################################################################
 
     def __init__(self, widget: None = None):
+        # The bounds that were most recently applied to the widget's implementation.
+        self._bounds = None
+
         if widget is not None:
             warnings.warn(
                 (
@@ -47,15 +50,31 @@ class TogaApplicator:
 
     def set_bounds(self) -> None:
         # print("  APPLY LAYOUT", self.widget, self.widget.layout)
-        self.widget._impl.set_bounds(
+        bounds = (
             self.widget.layout.absolute_content_left,
             self.widget.layout.absolute_content_top,
             self.widget.layout.content_width,
             self.widget.layout.content_height,
         )
+        # Only update the native widget if its layout box has actually changed.
+        if bounds != self._bounds:
+            self.widget._impl.set_bounds(*bounds)
+            self._bounds = bounds
+
         for child in self.widget.children:
             child.applicator.set_bounds()
 
+    def reset_bounds(self) -> None:
+        """Forget the bounds that have been applied to the widget and its children.
+
+        This must be invoked whenever the widget's implementation is moved into a
+        different native container, as the bounds will need to be re-applied in the new
+        container, even if they haven't changed.
+        """
+        self._bounds = None
+        for child in self.widget.children:
+            child.applicator.reset_bounds()
+
     def set_text_align(self, alignment: str) -> None:
         self.widget._impl.set_text_align(alignment)
 
@@ -42,7 +42,98 @@ from toga.fonts import (
 
 class PackLogic(BaseStyle):
     class Box(BaseBox):
-        pass
+        # The number of previously computed layouts that will be retained for each box.
+        LAYOUT_CACHE_SIZE = 8
+
+        def _reset(self):
+            super()._reset()
+            # The allocation arguments of the most recent layout of this box. If the
+            # node isn't dirty and is given the same allocation again, the existing
+            # layout of the node (and all its descendants) is still valid.
+            self._layout_key = None
+            # Previously computed layouts of this box, keyed by allocation arguments,
+            # in least-recently-used order. Each entry records the size of the box,
+            # plus the allocation and position of each child; this is sufficient to
+            # restore the layout of the entire subtree, provided the subtree hasn't
+            # changed in the meantime.
+            self._layout_cache = {}
+
+        def _store_layout(self) -> None:
+            """Record the current layout of the box in the layout cache."""
+            self._layout_cache.pop(self._layout_key, None)
+            self._layout_cache[self._layout_key] = (
+                self.content_width,
+                self.content_height,
+                self.min_content_width,
+                self.min_content_height,
+                [
+                    (
+                        child.layout._layout_key,
+                        child.layout.content_top,
+                        child.layout.content_left,
+                    )
+                    for child in self.node.children
+                ],
+            )
+            if len(self._layout_cache) > self.LAYOUT_CACHE_SIZE:
+                del self._layout_cache[next(iter(self._layout_cache))]
+
+        def _restore_layout(self, layout_key: tuple) -> bool:
+            """Restore a previously computed layout of the box and its descendants.
+
+            :param layout_key: The allocation arguments of the layout to restore.
+            :returns: True if the layout was restored; False if the layout (or the
+                layout of a descendant) isn't in the cache, and must be recomputed. If
+                the layout can't be restored, nothing is changed.
+            """
+            # Check that the whole subtree can be restored before restoring any of it,
+            # so that a missing entry can't leave the subtree partially restored.
+            if not self._is_cached(layout_key):
+                return False
+            self._apply_cached(layout_key)
+            return True
+
+        def _is_cached(self, layout_key: tuple) -> bool:
+            """Is a layout of the box and all its descendants available?"""
+            if layout_key == self._layout_key:
+                return True
+
+            try:
+                entry = self._layout_cache[layout_key]
+            except KeyError:
+                return False
+            return all(
+                child.layout._is_cached(child_key)
+                for child, (child_key, _, _) in zip(
+                    self.node.children, entry[4], strict=True
+                )
+            )
+
+        def _apply_cached(self, layout_key: tuple) -> None:
+            """Restore a cached layout of the box and its descendants.
+
+            The layout of the box, and of all its descendants, must be available.
+            """
+            if layout_key == self._layout_key:
+                return
+
+            # Pop and re-insert the entry to mark it as most recently used.
+            entry = self._layout_cache.pop(layout_key)
+            self._layout_cache[layout_key] = entry
+
+            width, height, min_width, min_height, children = entry
+            for child, (child_key, top, left) in zip(
+                self.node.children, children, strict=True
+            ):
+                child.layout._apply_cached(child_key)
+                child.layout.content_top = top
+                child.layout.content_left = left
+
+            self.content_width = width
+            self.content_height = height
+            self.min_content_width = min_width
+            self.min_content_height = min_height
+            self._layout_key = layout_key
 
     class IntrinsicSize(BaseIntrinsicSize):
         pass
@@ -128,6 +219,7 @@ class PackLogic(BaseStyle):
             "background_color",
             "visibility",
         }:
+            self._applicator.node.mark_layout_dirty()
             self._applicator.refresh()
 
     def __css__(self) -> str:
@@ -245,6 +337,18 @@ class PackLogic(BaseStyle):
         use_all_width: bool,
         use_all_height: bool,
     ) -> None:
+        node = self._applicator.node
+
+        # If nothing in this subtree has changed since the node was last laid out with
+        # the same allocation, the result of that layout can be reused.
+        layout_key = (alloc_width, alloc_height, use_all_width, use_all_height)
+        if node._layout_dirty:
+            # Any previously computed layouts are no longer valid.
+            node.layout._layout_cache.clear()
+        elif node.layout._restore_layout(layout_key):
+            # self._debug(f"REUSE LAYOUT for {node}")
+            return
+
         self.__class__._depth += 1
         # self._debug(
         #     f"COMPUTE LAYOUT for {node} available "
@@ -253,8 +357,6 @@ class PackLogic(BaseStyle):
         #     f"{alloc_height}{'+' if use_all_height else ''}"
         # )
 
-        node = self._applicator.node
-
         # Establish available width
         if self.width != NONE:
             # If width is specified, use it
@@ -338,6 +440,10 @@ class PackLogic(BaseStyle):
         node.layout.min_content_width = int(min_width)
         node.layout.min_content_height = int(min_height)
 
+        node.layout._layout_key = layout_key
+        node.layout._store_layout()
+        node._layout_dirty = False
+
         # self._debug("END LAYOUT", node, node.layout)
         self.__class__._depth -= 1
 
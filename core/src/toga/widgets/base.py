@@ -10,6 +10,7 @@ from warnings import warn
 from travertino.node import Node
 from travertino.style import BaseStyle
 
+from toga.handlers import _cancel_pending_invocations
 from toga.platform import get_factory
 from toga.style import Pack, TogaApplicator
 from toga.style.mixin import style_mixin
@@ -211,6 +212,7 @@ class Widget(Node, PackMixin, ABC):
                 super().add(child)
 
                 self._impl.add_child(child._impl)
+                child.applicator.reset_bounds()
                 added = True
 
         # Whatever layout we're a part of needs to be refreshed
@@ -246,6 +248,7 @@ class Widget(Node, PackMixin, ABC):
             super().insert(index, child)
 
             self._impl.insert_child(index, child._impl)
+            child.applicator.reset_bounds()
 
             # Whatever layout we're a part of needs to be refreshed
             self.refresh()
@@ -356,11 +359,19 @@ class Widget(Node, PackMixin, ABC):
             # If the widget is currently in the registry, but is being removed from a
             # window, remove the widget from the widget registry
             self.window.app.widgets._remove(self.id)
+            # Events that have been deferred by rate-limited handlers are no longer
+            # relevant.
+            _cancel_pending_invocations(self)
         elif self.window is None and window is not None:
             # If the widget is being assigned to a window for the first time, add it to
             # the widget registry
             window.app.widgets._add(self)
 
+        if window is not self._window:
+            # The widget is moving to a different native container, so any bounds
+            # that have been applied are no longer relevant.
+            self.applicator._bounds = None
+
         self._window = window
         self._impl.set_window(window)
 
@@ -377,19 +388,45 @@ class Widget(Node, PackMixin, ABC):
     def enabled(self, value: bool) -> None:
         self._impl.set_enabled(bool(value))
 
-    def refresh(self) -> None:
+    def refresh(self, *, immediate: bool = False) -> None:
+        """Refresh the layout of the widget, and the tree of widgets that contains it.
+
+        If the widget is in a window and the app's event loop is running, the layout
+        is refreshed on the next iteration of the event loop.
+
+        :param immediate: If true, refresh the layout before returning. This is used
+            by backends that need the new geometry straight away (e.g., while a window
+            is being resized).
+        """
         self._impl.refresh()
 
         # Refresh the layout
         if self._root:
             # We're not the root of the node hierarchy;
             # defer the refresh call to the root node.
-            self._root.refresh()
+            self._root.refresh(immediate=immediate)
         else:
             # We can't compute a layout until we have a container
             if self._impl.container:
-                super().refresh(self._impl.container)
-                self._impl.container.refreshed()
+                window = self.window
+                if immediate:
+                    # Any deferred refresh of this layout is superseded.
+                    if window is not None:
+                        window._pending_layouts.pop(self, None)
+                    self._refresh_layout()
+                # If the widget is in a window with a running event loop, defer the
+                # layout until the next iteration of the loop, so that a burst of
+                # changes results in a single layout pass.
+                elif window is None or not window._schedule_layout(self):
+                    self._refresh_layout()
+
+    def _refresh_layout(self) -> None:
+        # Lay out the tree rooted at this widget. If the widget has been added to
+        # another tree (or removed from its container) since the refresh was requested,
+        # there's nothing to do; any new root will have been refreshed.
+        if self._root is None and self._impl.container:
+            super().refresh(self._impl.container)
+            self._impl.container.refreshed()
 
     def focus(self) -> None:
         """Give this widget the input focus.
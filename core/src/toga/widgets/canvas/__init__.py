@@ -11,6 +11,8 @@ from .drawingaction import (
     FillText,
     LineTo,
     MoveTo,
+    Path,
+    Polyline,
     QuadraticCurveTo,
     Rect,
     ResetTransform,
@@ -25,6 +27,8 @@ from .drawingaction import (
     WriteText,
 )
 from .geometry import arc_to_bezier, sweepangle
+from .offscreen import OffscreenCanvas
+from .profiler import CanvasProfiler, FrameProfile
 from .state import BaseState, ClosePath, Fill, Rotate, Scale, State, Stroke, Translate
 
 # Make sure deprecation warnings are shown by default
@@ -59,16 +63,21 @@ __all__ = [
     "BeginPath",
     "BezierCurveTo",
     "Canvas",
+    "CanvasProfiler",
     "ClosePath",
     "DrawImage",
     "DrawingAction",
     "Ellipse",
     "Fill",
     "FillText",
+    "FrameProfile",
     "LineTo",
     "MoveTo",
+    "OffscreenCanvas",
     "OnResizeHandler",
     "OnTouchHandler",
+    "Path",
+    "Polyline",
     "QuadraticCurveTo",
     "Rect",
     "ResetTransform",
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import warnings
+from collections.abc import Iterable
 from itertools import chain
 from typing import (
     TYPE_CHECKING,
@@ -28,6 +29,7 @@ from .drawingaction import (
     SetLineWidth,
     SetStrokeStyle,
 )
+from .profiler import CanvasProfiler
 from .state import BaseState, DrawingActionDispatch, State
 
 if TYPE_CHECKING:
@@ -266,17 +268,47 @@ class Canvas(Widget, DrawingActionDispatch):
     # End backwards compatibility
     ######################################################################
 
+    @property
+    def profiler(self) -> CanvasProfiler | None:
+        """The profiler recording the time taken to draw the canvas, or `None` if the
+        canvas isn't being profiled.
+
+        Profiling is disabled by default. To start profiling, assign a
+        [`CanvasProfiler`][toga.widgets.canvas.CanvasProfiler]; to stop, assign
+        `None`.
+        """
+        return self._root_state._profiler
+
+    @profiler.setter
+    def profiler(self, profiler: CanvasProfiler | None) -> None:
+        self._root_state._profiler = profiler
+
     @property
     def _action_target(self):
         """Return the currently active state."""
         return self.root_state._active_state
 
-    def redraw(self) -> None:
+    def redraw(self, *, changed: Iterable[BaseState] | None = None) -> None:
         """Redraw the Canvas. This shouldn't normally need to be manually called; for
         more info, see
         [`DrawingAction`](/reference/api/data-representation/drawingaction.md).
+
+        :param changed: The states whose content has been modified. If provided, each
+            state is [invalidated][toga.widgets.canvas.BaseState.invalidate], and
+            (if the backend supports it) only the regions of the canvas covered by
+            those states are repainted.
         """
-        self._impl.redraw()
+        if changed is None:
+            self._impl.redraw()
+        else:
+            states = list(changed)
+            for state in states:
+                state.invalidate()
+
+            if getattr(self._impl, "SUPPORTS_PARTIAL_REDRAW", False):
+                self._impl.redraw_states(states)
+            else:
+                self._impl.redraw()
 
     @property
     def on_resize(self) -> OnResizeHandler:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from array import array
 from collections.abc import Iterable
 from dataclasses import KW_ONLY, InitVar, dataclass, fields, is_dataclass
 from enum import Enum
@@ -9,7 +10,7 @@ from typing import TYPE_CHECKING, Any
 from warnings import filterwarnings, warn
 
 from toga.colors import Color
-from toga.constants import Baseline
+from toga.constants import Baseline, PathCode
 from toga.fonts import (
     SYSTEM,
     SYSTEM_DEFAULT_FONT_SIZE,
@@ -278,6 +279,151 @@ class QuadraticCurveTo(DrawingAction):
         context.quadratic_curve_to(self.cpx, self.cpy, self.x, self.y)
 
 
+def _packed(values: object, typecode: str) -> memoryview:
+    """Convert values into a flat memoryview of a single type.
+
+    Any object that supports the buffer protocol (e.g., an `array.array`, or a
+    NumPy array) with a matching item type and a contiguous layout is used without
+    being copied; anything else is copied into a new array.
+    """
+    try:
+        view = memoryview(values)
+    except TypeError:
+        # Not a buffer; flatten any nested sequences (e.g., (x, y) tuples)
+        items = []
+        for value in values:
+            if isinstance(value, Iterable):
+                items.extend(value)
+            else:
+                items.append(value)
+        return memoryview(array(typecode, items))
+
+    if view.format == typecode and view.c_contiguous:
+        return view.cast("B").cast(typecode)
+
+    items = view.tolist()
+    if view.ndim > 1:
+        items = [item for row in items for item in row]
+    return memoryview(array(typecode, items))
+
+
+# The number of coordinates used by each path code.
+_PATH_CODE_SIZES = {
+    PathCode.MOVE_TO: 2,
+    PathCode.LINE_TO: 2,
+    PathCode.QUADRATIC_CURVE_TO: 4,
+    PathCode.BEZIER_CURVE_TO: 6,
+    PathCode.CLOSE_PATH: 0,
+}
+
+
+class Polyline(DrawingAction):
+    """The [`DrawingAction`][toga.widgets.canvas.DrawingAction] representing the
+    [polyline()][toga.Canvas.polyline] method.
+    """
+
+    def __init__(self, points: object):
+        self.points = points
+
+    def __repr__(self) -> str:
+        return f"Polyline(points=<{len(self._points) // 2} points>)"
+
+    @property
+    def points(self) -> memoryview:
+        """The coordinates of the points, as a flat sequence of `x, y` values.
+
+        When a buffer of floats is provided, it is used without being copied; any
+        changes made to the buffer will be drawn the next time the canvas is redrawn.
+        """
+        return self._points
+
+    @points.setter
+    def points(self, points: object) -> None:
+        packed = _packed(points, "d")
+        if len(packed) % 2:
+            raise ValueError("Points must have both an x and a y coordinate")
+        self._points = packed
+
+    def _draw(self, context: Any) -> None:
+        if not self._points:
+            return
+
+        if (polyline := getattr(context, "polyline", None)) is not None:
+            polyline(self._points)
+        else:
+            points = iter(self._points)
+            context.move_to(next(points), next(points))
+            for x, y in zip(points, points, strict=True):
+                context.line_to(x, y)
+
+
+class Path(DrawingAction):
+    """The [`DrawingAction`][toga.widgets.canvas.DrawingAction] representing the
+    [path()][toga.Canvas.path] method.
+    """
+
+    def __init__(self, codes: object, coords: object):
+        self.set_path(codes, coords)
+
+    def __repr__(self) -> str:
+        return f"Path(codes=<{len(self._codes)} codes>)"
+
+    @property
+    def codes(self) -> memoryview:
+        """The [`PathCode`][toga.constants.PathCode] of each operation in the path,
+        as a sequence of bytes."""
+        return self._codes
+
+    @property
+    def coords(self) -> memoryview:
+        """The coordinates used by the operations in the path, as a flat sequence of
+        `x, y` values."""
+        return self._coords
+
+    def set_path(self, codes: object, coords: object) -> None:
+        """Replace the operations in the path.
+
+        The codes and coordinates are validated and stored in the same way as
+        [`Canvas.path()`][toga.Canvas.path].
+
+        :param codes: The operations in the path.
+        :param coords: The coordinates used by the operations.
+        :raises ValueError: If a code is unknown, or the number of coordinates doesn't
+            match the codes.
+        """
+        codes = _packed(codes, "B")
+        coords = _packed(coords, "d")
+
+        # Count each type of code at C speed, rather than iterating over the codes.
+        raw = codes.tobytes()
+        counts = {code: raw.count(bytes([code])) for code in PathCode}
+        if sum(counts.values()) != len(codes):
+            raise ValueError("Path codes must be PathCode values")
+        if sum(_PATH_CODE_SIZES[code] * n for code, n in counts.items()) != len(coords):
+            raise ValueError("The number of coordinates doesn't match the path codes")
+
+        self._codes = codes
+        self._coords = coords
+
+    def _draw(self, context: Any) -> None:
+        if (path := getattr(context, "path", None)) is not None:
+            path(self._codes, self._coords)
+        else:
+            coords = iter(self._coords)
+            for code in self._codes:
+                match code:
+                    case PathCode.MOVE_TO:
+                        context.move_to(next(coords), next(coords))
+                    case PathCode.LINE_TO:
+                        context.line_to(next(coords), next(coords))
+                    case PathCode.QUADRATIC_CURVE_TO:
+                        context.quadratic_curve_to(*(next(coords) for _ in range(4)))
+                    case PathCode.BEZIER_CURVE_TO:
+                        context.bezier_curve_to(*(next(coords) for _ in range(6)))
+                    case _:
+                        context.close_path()
+
+
 @dataclass(repr=False)
 class Arc(DrawingAction):
     """The [`DrawingAction`][toga.widgets.canvas.DrawingAction] representing the
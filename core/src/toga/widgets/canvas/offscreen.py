@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import toga
+from toga.platform import get_factory
+
+from .canvas import BLACK_COLOR, drawing_context_property
+from .drawingaction import (
+    Restore,
+    Save,
+    SetFillStyle,
+    SetLineDash,
+    SetLineWidth,
+    SetStrokeStyle,
+)
+from .state import DrawingActionDispatch, State
+
+if TYPE_CHECKING:
+    from toga.images import ColorT, ImageT
+
+
+class OffscreenCanvas(DrawingActionDispatch):
+    def __init__(self, width: int, height: int, root_state: State | None = None):
+        """Create a canvas that is drawn to an image, rather than displayed.
+
+        An OffscreenCanvas has the same drawing methods as [`toga.Canvas`][], but it
+        isn't a widget; it doesn't need to be part of a window, and it doesn't need a
+        running app. This makes it suitable for generating images in bulk, in a
+        background thread or in a pool of worker processes. Each thread or process
+        should create (and draw on) its own canvases.
+
+        The canvas is only drawn when its content is requested.
+
+        :param width: The width of the canvas, in pixels.
+        :param height: The height of the canvas, in pixels.
+        :param root_state: The state containing the drawing actions to render (e.g.,
+            the [`root_state`][toga.Canvas.root_state] of an existing canvas). If not
+            provided, a new, empty state is used.
+        :raises ValueError: If the width or height isn't a positive integer.
+        """
+        for name, value in [("width", width), ("height", height)]:
+            if not isinstance(value, int) or value < 1:
+                raise ValueError(f"{name} must be a positive integer")
+
+        self._width = width
+        self._height = height
+        self._root_state = State() if root_state is None else root_state
+
+        self.factory = get_factory()
+        self._impl = self.factory.OffscreenCanvas(
+            interface=self, width=width, height=height
+        )
+
+    @property
+    def width(self) -> int:
+        """The width of the canvas, in pixels."""
+        return self._width
+
+    @property
+    def height(self) -> int:
+        """The height of the canvas, in pixels."""
+        return self._height
+
+    @property
+    def root_state(self) -> State:
+        """The root state for the canvas. See
+        [`DrawingAction`](/reference/api/data-representation/drawingaction.md).
+        """
+        return self._root_state
+
+    @property
+    def _action_target(self):
+        """Return the currently active state."""
+        return self.root_state._active_state
+
+    def redraw(self) -> None:
+        """No-op; an offscreen canvas is drawn when its content is requested."""
+
+    ###########################################################################
+    # State management & attributes
+    ###########################################################################
+
+    def save(self) -> Save:
+        """Save the current state of the drawing context.
+
+        :returns: The `Save`
+            [`DrawingAction`][toga.widgets.canvas.DrawingAction] for the operation.
+        """
+        save = Save()
+        self._add_to_target(save)
+        return save
+
+    def restore(self) -> Restore:
+        """Restore to the previous state of the drawing context.
+
+        :returns: The `Restore`
+            [`DrawingAction`][toga.widgets.canvas.DrawingAction] for the operation.
+        """
+        restore = Restore()
+        self._add_to_target(restore)
+        return restore
+
+    fill_style: ColorT = drawing_context_property(SetFillStyle, BLACK_COLOR)
+    """The current fill color."""
+    stroke_style: ColorT = drawing_context_property(SetStrokeStyle, BLACK_COLOR)
+    """The current stroke color."""
+    line_width: float = drawing_context_property(SetLineWidth, 1.0)
+    """The current width of the stroke."""
+    line_dash: list[float] = drawing_context_property(SetLineDash, [])
+    """The current dash pattern to follow when drawing the line, expressed as
+    alternating lengths of dashes and spaces. The default is a solid line."""
+
+    ###########################################################################
+    # Rendering
+    ###########################################################################
+
+    def as_rgba(self) -> bytes:
+        """Render the canvas as raw pixel data.
+
+        :returns: The color of each pixel, as 4 bytes of red, green, blue and alpha
+            (not premultiplied). Pixels are ordered by row, starting at the top left
+            of the canvas; there is no padding between rows.
+        """
+        return bytes(self._impl.get_rgba_data())
+
+    def as_png(self) -> bytes:
+        """Render the canvas as a PNG image.
+
+        :returns: The PNG-encoded image data.
+        """
+        return bytes(self._impl.get_image_data())
+
+    def as_image(self, format: type[ImageT] = toga.Image) -> ImageT:
+        """Render the canvas as an image.
+
+        :param format: Format to provide. Defaults to [`Image`][toga.images.Image]; also
+            supports [`PIL.Image.Image`][] if Pillow is installed, as well as any image
+            types defined by installed [image format plugins][image-format-plugins].
+        :returns: The canvas as an image of the specified type.
+        """
+        return toga.Image(self.as_png()).as_format(format)
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from time import perf_counter
+
+
+@dataclass
+class FrameProfile:
+    """The time taken to draw a single frame of a [`Canvas`][toga.Canvas].
+
+    All times are in seconds. The time attributed to a state doesn't include the time
+    taken to draw the actions it contains; it is the time spent saving and restoring
+    the drawing context, and applying the state's own settings.
+    """
+
+    duration: float = 0.0
+    """The total time taken to draw the frame."""
+
+    counts: dict[str, int] = field(default_factory=dict)
+    """The number of drawing actions of each type that were drawn (including the root
+    state), keyed by the name of the drawing action's class (e.g., `"FillText"`)."""
+
+    times: dict[str, float] = field(default_factory=dict)
+    """The time spent drawing actions of each type, keyed by the name of the drawing
+    action's class."""
+
+    stacks: dict[tuple[str, ...], float] = field(default_factory=dict)
+    """The time spent drawing each type of action at each position in the tree of
+    states, keyed by the names of the classes of the states that contain the action,
+    followed by the name of the action's class. The first name is always the root
+    state of the canvas."""
+
+
+class CanvasProfiler:
+    # The frame being recorded on each thread, if any: the profiler recording it, the
+    # frame, and the action being drawn at each level of the state tree ([name, start
+    # time, time spent drawing contained actions]). A canvas is drawn on the GUI
+    # thread, but an offscreen canvas can be drawn on any thread at the same time.
+    _recording = threading.local()
+
+    def __init__(self, max_frames: int = 60):
+        """Record the time taken to draw a [`Canvas`][toga.Canvas].
+
+        To start profiling a canvas, assign a profiler to
+        [`Canvas.profiler`][toga.Canvas.profiler]. A frame is recorded every time the
+        backend draws the canvas.
+
+        :param max_frames: The number of frames to retain. When more frames have been
+            drawn, the oldest frames are discarded.
+        :raises ValueError: If `max_frames` is less than 1.
+        """
+        if max_frames < 1:
+            raise ValueError("max_frames must be at least 1")
+
+        self._frames: deque[FrameProfile] = deque(maxlen=max_frames)
+
+    @property
+    def frames(self) -> list[FrameProfile]:
+        """The most recently drawn frames, oldest first."""
+        return list(self._frames)
+
+    @property
+    def last_frame(self) -> FrameProfile | None:
+        """The most recently drawn frame, or `None` if no frames have been drawn."""
+        return self._frames[-1] if self._frames else None
+
+    def reset(self) -> None:
+        """Discard all the recorded frames."""
+        self._frames.clear()
+
+    def flame_graph(self) -> str:
+        """Describe the time spent drawing the recorded frames, in the "folded stacks"
+        format used by flame graph tools such as `flamegraph.pl` and speedscope.
+
+        Each line contains the names of the classes in the state tree, separated by
+        semicolons, followed by the total number of microseconds spent drawing that
+        type of action at that position in the tree, across all the recorded frames.
+
+        :returns: The folded stacks, one per line.
+        """
+        totals: dict[tuple[str, ...], float] = {}
+        for frame in self._frames:
+            for stack, elapsed in frame.stacks.items():
+                totals[stack] = totals.get(stack, 0.0) + elapsed
+
+        return "\n".join(
+            f"{';'.join(stack)} {round(elapsed * 1_000_000)}"
+            for stack, elapsed in sorted(totals.items())
+        )
+
+    ######################################################################
+    # Recording
+    ######################################################################
+
+    @classmethod
+    def _active(cls) -> CanvasProfiler | None:
+        """The profiler that is recording a frame on the current thread, if any."""
+        return getattr(cls._recording, "profiler", None)
+
+    @contextmanager
+    def _record_frame(self, root: object) -> Iterator[None]:
+        """Record a frame, drawing the root state of the canvas.
+
+        While the frame is being recorded, this is the active profiler on the current
+        thread, which is used to time the drawing actions in every state of the
+        canvas.
+        """
+        recording = CanvasProfiler._recording
+        recording.profiler = self
+        recording.frame = frame = FrameProfile()
+        recording.stack = []
+        self._start(root)
+        try:
+            yield
+        finally:
+            # If drawing failed, discard the timings of any interrupted actions.
+            del recording.stack[1:]
+            frame.duration = self._stop()
+            self._frames.append(frame)
+            recording.profiler = recording.frame = recording.stack = None
+
+    def _start(self, action: object) -> None:
+        """Start timing a drawing action."""
+        CanvasProfiler._recording.stack.append(
+            [type(action).__name__, perf_counter(), 0.0]
+        )
+
+    def _stop(self) -> float:
+        """Stop timing the current drawing action.
+
+        :returns: The total time taken to draw the action, including any actions that
+            it contains.
+        """
+        recording = CanvasProfiler._recording
+        elapsed = perf_counter() - recording.stack[-1][1]
+        name, _, contained = recording.stack.pop()
+        if recording.stack:
+            recording.stack[-1][2] += elapsed
+
+        frame = recording.frame
+        own = elapsed - contained
+        stack = (*(entry[0] for entry in recording.stack), name)
+        frame.counts[name] = frame.counts.get(name, 0) + 1
+        frame.times[name] = frame.times.get(name, 0.0) + own
+        frame.stacks[stack] = frame.stacks.get(stack, 0.0) + own
+        return elapsed
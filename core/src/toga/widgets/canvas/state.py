@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import warnings
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from contextlib import AbstractContextManager
 from dataclasses import KW_ONLY, InitVar, dataclass
 from math import pi
@@ -23,6 +23,8 @@ from .drawingaction import (
     FillText,
     LineTo,
     MoveTo,
+    Path,
+    Polyline,
     QuadraticCurveTo,
     Rect,
     ResetTransform,
@@ -32,6 +34,7 @@ from .drawingaction import (
     color_property,
 )
 from .geometry import CornerRadiusT
+from .profiler import CanvasProfiler
 
 if TYPE_CHECKING:
     from toga.colors import ColorT
@@ -42,6 +45,44 @@ if TYPE_CHECKING:
 warnings.filterwarnings("default", category=DeprecationWarning)
 
 
+def _modifies(method):
+    """Wrap a list method so that it records a modification of the list."""
+
+    def modify(self, *args, **kwargs):
+        self._version += 1
+        return method(self, *args, **kwargs)
+
+    modify.__name__ = method.__name__
+    modify.__doc__ = method.__doc__
+    return modify
+
+
+class _DrawingActionList(list):
+    """A list of drawing actions that records every modification.
+
+    Any change to the list (including replacing an item in place) increments its
+    version, so that a cached rendering of the state that owns the list can tell
+    that the list has changed.
+    """
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self._version = 0
+
+    __setitem__ = _modifies(list.__setitem__)
+    __delitem__ = _modifies(list.__delitem__)
+    __iadd__ = _modifies(list.__iadd__)
+    __imul__ = _modifies(list.__imul__)
+    append = _modifies(list.append)
+    extend = _modifies(list.extend)
+    insert = _modifies(list.insert)
+    pop = _modifies(list.pop)
+    remove = _modifies(list.remove)
+    clear = _modifies(list.clear)
+    sort = _modifies(list.sort)
+    reverse = _modifies(list.reverse)
+
+
 class DrawingActionDispatch(ABC):
     @property
     @abstractmethod
@@ -115,6 +156,52 @@ class DrawingActionDispatch(ABC):
         self._redraw_with_warning_if_state()
         return line_to
 
+    def polyline(self, points: object) -> Polyline:
+        """Draw a sequence of connected line segments.
+
+        This starts a new sub-path at the first point, and draws a line segment to
+        each subsequent point. It is equivalent to a [`move_to()`][toga.Canvas.move_to]
+        followed by a [`line_to()`][toga.Canvas.line_to] for each remaining point, but
+        is much more efficient for a large number of points.
+
+        :param points: The points to draw. This can be a sequence of `(x, y)` pairs, or
+            any object supporting the buffer protocol (such as an
+            [`array.array`][array.array], or a NumPy array with a shape of `(N, 2)`)
+            that contains `x, y` coordinates. A contiguous buffer of 64-bit floats
+            is used without being copied.
+        :returns: The `Polyline` [`DrawingAction`][toga.widgets.canvas.DrawingAction]
+            for the operation.
+        :raises ValueError: If a point doesn't have both an x and a y coordinate.
+        """
+        polyline = Polyline(points)
+        self._add_to_target(polyline)
+        self._redraw_with_warning_if_state()
+        return polyline
+
+    def path(self, codes: object, coords: object) -> Path:
+        """Draw a path described by a sequence of operations.
+
+        Each operation in the path is described by a
+        [`PathCode`][toga.constants.PathCode], and uses the next points from the
+        coordinates. This is much more efficient than invoking the equivalent drawing
+        methods individually for a large number of operations.
+
+        :param codes: The operations in the path. This can be a sequence of
+            [`PathCode`][toga.constants.PathCode] values, or any object supporting the
+            buffer protocol that contains unsigned bytes (such as a NumPy array of
+            `uint8`); a contiguous buffer of bytes is used without being copied.
+        :param coords: The coordinates used by the operations, in the same formats
+            accepted by [`polyline()`][toga.Canvas.polyline].
+        :returns: The `Path` [`DrawingAction`][toga.widgets.canvas.DrawingAction] for
+            the operation.
+        :raises ValueError: If a code is unknown, or the number of coordinates doesn't
+            match the codes.
+        """
+        path = Path(codes, coords)
+        self._add_to_target(path)
+        self._redraw_with_warning_if_state()
+        return path
+
     def bezier_curve_to(
         self,
         cp1x: float,
@@ -571,6 +658,7 @@ class DrawingActionDispatch(ABC):
         stroke_style: ColorT | None = None,
         line_width: float | None = None,
         line_dash: list[float] | None = None,
+        cached: bool = False,
     ) -> AbstractContextManager[State]:
         """A context manager that saves the current state of the Canvas context, and
         restores it upon exiting.
@@ -582,6 +670,8 @@ class DrawingActionDispatch(ABC):
         :param stroke_style: Sets the [`stroke_style`][toga.Canvas.stroke_style].
         :param line_width: Sets the [`line_width`][toga.Canvas.line_width].
         :param line_dash: Sets the [`line_dash`][toga.Canvas.line_dash].
+        :param cached: Should the rendered output of the state be retained between
+            redraws? See [`BaseState.cached`][toga.widgets.canvas.BaseState.cached].
 
         :return: Yields the new `State`
           [`DrawingAction`][toga.widgets.canvas.DrawingAction].
@@ -592,6 +682,7 @@ class DrawingActionDispatch(ABC):
             line_width=line_width,
             line_dash=line_dash,
         )
+        state.cached = cached
         self._add_to_target(state)
         self._redraw_with_warning_if_state()
         return state
@@ -781,20 +872,122 @@ class BaseState(DrawingAction, DrawingActionDispatch, ABC):
     managers.
     """
 
-    drawing_actions: list[DrawingAction]
-    """The list of all drawing actions contained by this state.
+    cached: bool
+    """Should the rendered output of this state be retained between redraws?
+
+    A cached state is only rendered again when its content changes; otherwise, the
+    retained output is reused. Drawing actions that are added to, removed from, or
+    replaced in the state (or any state it contains) are detected automatically; if
+    you modify the attributes of a drawing action, you must call
+    [`invalidate()`][toga.widgets.canvas.BaseState.invalidate] on the state that
+    contains it.
 
-    If you add or remove drawing actions to this list, you'll need to call
-    [`Canvas.redraw()`][toga.Canvas.redraw] for the changes to be rendered.
+    On backends that don't support caching, this attribute has no effect.
     """
 
     def __post_init__(self):
-        self.drawing_actions = []
+        self._drawing_actions = _DrawingActionList()
         self._can_be_entered = True
+        self.cached = False
+        # Incremented whenever the state is invalidated.
+        self._version = 0
+        # The states whose content was used to produce the cached rendering, and
+        # the rendering itself (along with a snapshot of that content).
+        self._dependencies = None
+        self._cache = None
+        # The profiler for the canvas, if this is the root state of a canvas that is
+        # being profiled.
+        self._profiler = None
+
+    @property
+    def drawing_actions(self) -> list[DrawingAction]:
+        """The list of all drawing actions contained by this state.
+
+        If you add or remove drawing actions to this list, you'll need to call
+        [`Canvas.redraw()`][toga.Canvas.redraw] for the changes to be rendered.
+        """
+        return self._drawing_actions
+
+    @drawing_actions.setter
+    def drawing_actions(self, actions: Iterable[DrawingAction]) -> None:
+        self._drawing_actions = _DrawingActionList(actions)
+        # The new list's version is unrelated to the version of the old list.
+        self._version += 1
 
     @abstractmethod
     def _draw(self, context: Any) -> None: ...
 
+    def _draw_actions(self, context: Any) -> None:
+        """Draw the actions contained by this state, using the cached rendering of any
+        cached sub-states if the context supports it."""
+        profiler = CanvasProfiler._active()
+        if profiler is None and self._profiler is not None:
+            # This is the root state of a canvas that is being profiled.
+            with self._profiler._record_frame(self):
+                self._draw_actions(context)
+            return
+
+        draw_cached = getattr(context, "draw_cached", None)
+        for action in self.drawing_actions:
+            if profiler is not None:
+                profiler._start(action)
+            if (
+                draw_cached is not None
+                and isinstance(action, BaseState)
+                and action.cached
+            ):
+                draw_cached(action)
+            else:
+                action._draw(context)
+            if profiler is not None:
+                profiler._stop()
+
+    def invalidate(self) -> None:
+        """Discard any cached rendering that includes this state.
+
+        This must be called if an attribute of a drawing action in this state has been
+        modified; the change will be rendered the next time the canvas is redrawn.
+        """
+        self._version += 1
+
+    def _snapshot(self) -> list[tuple[int, int]]:
+        """Describe the content of this state, and all the states it contains, in a
+        way that changes whenever the content is modified."""
+        if self._dependencies is None:
+            self._dependencies = [self]
+            for state in self._dependencies:
+                self._dependencies.extend(
+                    action
+                    for action in state.drawing_actions
+                    if isinstance(action, BaseState)
+                )
+
+        return [
+            (state._version, state._drawing_actions._version)
+            for state in self._dependencies
+        ]
+
+    def _cached_rendering(
+        self, render: Callable[[], object], context_key: object = None
+    ) -> object:
+        """Retrieve the cached rendering of this state, rendering it if necessary.
+
+        This is used by backends to implement caching.
+
+        :param render: A callable that renders the state, returning a backend-specific
+            object that can be used to reproduce the rendering.
+        :param context_key: A description of any aspect of the drawing context that
+            affects the rendering (e.g., the inherited fill style).
+        :returns: The object returned by `render`, either now or when the state was
+            last rendered.
+        """
+        if self._cache is None or self._cache[0] != (self._snapshot(), context_key):
+            # The states that are part of this state may have changed.
+            self._dependencies = None
+            rendering = render()
+            self._cache = ((self._snapshot(), context_key), rendering)
+        return self._cache[1]
+
     @property
     def _action_target(self):
         # State itself holds its drawing actions.
@@ -983,8 +1176,7 @@ class State(BaseState):
         if self.line_dash is not None:
             context.set_line_dash(self.line_dash)
 
-        for action in self.drawing_actions:
-            action._draw(context)
+        self._draw_actions(context)
 
         context.restore()
 
@@ -1023,8 +1215,7 @@ class ClosePath(BaseState):
         context.save()
         context.begin_path()
 
-        for action in self.drawing_actions:
-            action._draw(context)
+        self._draw_actions(context)
 
         context.close_path()
         context.restore()
@@ -1074,8 +1265,7 @@ class Fill(BaseState):
             context.in_fill = True  # 4-2026: Backwards compatibility for Toga <= 0.5.3
             context.begin_path()
 
-            for action in self.drawing_actions:
-                action._draw(context)
+            self._draw_actions(context)
 
             context.in_fill = False  # 4-2026: Backwards compatibility for Toga <= 0.5.3
 
@@ -1114,8 +1304,7 @@ class Stroke(BaseState):
             context.in_stroke = True  # Backwards compatibility for Toga <= 0.5.3
             context.begin_path()
 
-            for action in self.drawing_actions:
-                action._draw(context)
+            self._draw_actions(context)
 
             context.in_stroke = False  # Backwards compatibility for Toga <= 0.5.3
 
@@ -1136,8 +1325,7 @@ class TransformState(BaseState, ABC):
         context.save()
         self._call_method(context)
 
-        for action in self.drawing_actions:
-            action._draw(context)
+        self._draw_actions(context)
 
         context.restore()
 
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import warnings
 from typing import TYPE_CHECKING, Any, Literal
 
 from travertino.size import at_least
@@ -10,6 +12,7 @@ from toga.widgets.base import StyleT, Widget
 
 if TYPE_CHECKING:
     from toga.images import ImageContentT, ImageT
+    from toga.window import Window
 
 
 def rehint_imageview(
@@ -73,6 +76,7 @@ class ImageView(Widget):
         image: ImageContentT | None = None,
         id: str | None = None,
         style: StyleT | None = None,
+        placeholder: ImageContentT | None = None,
         **kwargs,
     ):
         """Create a new image view.
@@ -83,11 +87,15 @@ class ImageView(Widget):
         :param id: The ID for the widget.
         :param style: A style object. If no style is provided, a default style will be
             applied to the widget.
+        :param placeholder: An image to display while images are loaded in the
+            background. See [`placeholder`][toga.ImageView.placeholder].
         :param kwargs: Initial [Pack](/reference/api/style/pack.md) style properties.
             These override matching properties on the `style` argument.
         """
-        # Prime the image attribute
+        # Prime the image attributes
         self._image = None
+        self._load_task: asyncio.Task | None = None
+        self.placeholder = placeholder
 
         super().__init__(id, style, **kwargs)
 
@@ -124,16 +132,85 @@ class ImageView(Widget):
 
     @image.setter
     def image(self, image: ImageContentT) -> None:
-        if isinstance(image, toga.Image):
-            self._image = image
-        elif image is None:
-            self._image = None
+        # Any image that is still being loaded has been superseded.
+        self._cancel_load()
+
+        if isinstance(image, toga.Image) or image is None:
+            self._set_image(image)
+        elif self._placeholder is not None and self._running_loop() is not None:
+            self._set_image(self._placeholder)
+            self._load_task = asyncio.create_task(self._load(image))
         else:
-            self._image = toga.Image(image)
+            self._set_image(toga.Image(image))
 
-        self._impl.set_image(self._image)
+    @property
+    def placeholder(self) -> toga.Image | None:
+        """The image to display while an image is loaded in the background.
+
+        If a placeholder is set, and the app's event loop is running, an
+        [`image`][toga.ImageView.image] that isn't already a [`toga.Image`][] is
+        loaded with [`Image.load_async()`][toga.Image.load_async]. The placeholder
+        is displayed until the image has loaded; [`image`][toga.ImageView.image]
+        returns the placeholder while the image is loading. If the image can't be
+        loaded, a [`RuntimeWarning`][] is issued, and the placeholder remains. If
+        the image view is removed from its window before the image has loaded,
+        loading is cancelled.
+
+        When setting a placeholder, you can provide any valid
+        [image content][toga.images.ImageContentT] type; or [`None`][] to load
+        images synchronously.
+        """
+        return self._placeholder
+
+    @placeholder.setter
+    def placeholder(self, placeholder: ImageContentT | None) -> None:
+        if isinstance(placeholder, toga.Image) or placeholder is None:
+            self._placeholder = placeholder
+        else:
+            self._placeholder = toga.Image(placeholder)
+
+    @Widget.window.setter
+    def window(self, window: Window | None) -> None:
+        # An image view that has been removed from its window doesn't need the image
+        # it is loading.
+        if window is None:
+            self._cancel_load()
+
+        # Invoke the superclass property setter
+        Widget.window.fset(self, window)
+
+    def _set_image(self, image: toga.Image | None) -> None:
+        self._image = image
+        self._impl.set_image(image)
         self.refresh()
 
+    @staticmethod
+    def _running_loop() -> asyncio.AbstractEventLoop | None:
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+    async def _load(self, src: ImageContentT) -> None:
+        try:
+            image = await toga.Image.load_async(src)
+        except Exception as exc:
+            # The load runs in the background, so there's no caller to raise to.
+            warnings.warn(
+                f"Unable to load image ({exc}); continuing to display placeholder",
+                RuntimeWarning,
+                stacklevel=1,
+            )
+        else:
+            self._set_image(image)
+        # A cancelled load stops at the await, so this never discards a newer load.
+        self._load_task = None
+
+    def _cancel_load(self) -> None:
+        if self._load_task is not None:
+            self._load_task.cancel()
+            self._load_task = None
+
     def as_image(self, format: type[ImageT] = toga.Image) -> ImageT:
         """Return the image in the specified format.
 
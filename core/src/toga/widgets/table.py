@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import warnings
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Mapping, Sequence
 from typing import Any, Generic, Literal, Protocol, TypeVar
 
 import toga
 from toga.handlers import wrapped_handler
 from toga.sources import AccessorColumn, ColumnT, ListSource, ListSourceT, Row, Source
+from toga.sources.columns import _CellCacheListener
 
 from .base import StyleT, Widget
 
@@ -220,6 +221,7 @@ class Table(Widget, Generic[Value]):
             else:
                 data = ListSource(accessors=accessor_order, data=data)
 
+        self._cell_cache = _CellCacheListener()
         self.data = data
 
         self.on_select = on_select
@@ -265,6 +267,7 @@ class Table(Widget, Generic[Value]):
     def data(self, data: ListSourceT | Iterable | None) -> None:
         old_data = getattr(self, "_data", None)
         if old_data is not None:
+            self._data.remove_listener(self._cell_cache)
             self._data.remove_listener(self._impl)
 
         if data is None:
@@ -284,6 +287,9 @@ class Table(Widget, Generic[Value]):
                 ]
             self._data = ListSource(accessors=accessors, data=data)
 
+        # Rendered cells of changed rows must be discarded before the backend
+        # displays the change.
+        self._data.add_listener(self._cell_cache)
         self._data.add_listener(self._impl)
         self._impl.change_source(source=self._data)
 
@@ -535,6 +541,17 @@ class Table(Widget, Generic[Value]):
         else:
             return [column.heading for column in self._columns]
 
+    def _prepare_rows(self, rows: Sequence[Any]) -> None:
+        """Render the cells of rows that are about to be displayed.
+
+        Backends invoke this before displaying a range of rows, so that columns can
+        format all the values in the range at once. Columns that don't provide a
+        `prepare()` method are skipped.
+        """
+        for column in self._columns:
+            if (prepare := getattr(column, "prepare", None)) is not None:
+                prepare(rows)
+
     ######################################################################
     # 2026-02: Backwards compatibility for <= 0.5.3
     ######################################################################
@@ -7,6 +7,7 @@ from typing import Any, Literal, Protocol, TypeVar
 import toga
 from toga.handlers import wrapped_handler
 from toga.sources import AccessorColumn, ColumnT, Node, Source, TreeSource, TreeSourceT
+from toga.sources.columns import _CellCacheListener
 from toga.style import Pack
 
 from .base import Widget
@@ -215,6 +216,7 @@ class Tree(Widget):
             else:
                 data = TreeSource(accessors=accessor_order, data=data)
 
+        self._cell_cache = _CellCacheListener()
         self.data = data
 
         self.on_select = on_select
@@ -260,6 +262,7 @@ class Tree(Widget):
     def data(self, data: TreeSourceT | object | None) -> None:
         old_data = getattr(self, "_data", None)
         if old_data is not None:
+            self._data.remove_listener(self._cell_cache)
             self._data.remove_listener(self._impl)
 
         if data is None:
@@ -279,6 +282,9 @@ class Tree(Widget):
                 ]
             self._data = TreeSource(accessors=accessors, data=data)
 
+        # Rendered cells of changed rows must be discarded before the backend
+        # displays the change.
+        self._data.add_listener(self._cell_cache)
         self._data.add_listener(self._impl)
         self._impl.change_source(source=self._data)
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import warnings
 from builtins import id as identifier
 from collections.abc import Iterator, MutableSet
@@ -10,7 +11,7 @@ import toga
 from toga import dialogs
 from toga.command import CommandSet
 from toga.constants import WindowState
-from toga.handlers import AsyncResult, wrapped_handler
+from toga.handlers import AsyncResult, _cancel_pending_invocations, wrapped_handler
 from toga.images import Image
 from toga.platform import get_factory
 from toga.types import Position, Size
@@ -241,6 +242,15 @@ class Window:
         self._content: Widget | None = None
         self._closed = False
 
+        # Layout roots whose refresh has been deferred to the next iteration of the
+        # event loop, and the handle for the scheduled flush of those refreshes.
+        self._pending_layouts: dict[Widget, None] = {}
+        self._layout_handle: asyncio.Handle | None = None
+
+        # The futures of functions running in the background for widgets in this
+        # window, which are cancelled if the window is closed.
+        self._background_futures: set[asyncio.Future] = set()
+
         self._resizable = resizable
         self._closable = closable
         self._minimizable = minimizable
@@ -394,6 +404,15 @@ class Window:
         # The actual logic for closing a window. This is abstracted so that the testbed
         # can monkeypatch this method, recording the close request without actually
         # closing the app.
+        if self._layout_handle is not None:
+            self._layout_handle.cancel()
+            self._layout_handle = None
+        self._pending_layouts.clear()
+        for future in self._background_futures:
+            future.cancel()
+        self._background_futures.clear()
+        _cancel_pending_invocations(self)
+
         if self.content:
             self.content.window = None
         self.app.windows.discard(self)
@@ -419,6 +438,8 @@ class Window:
             }:
                 raise ValueError(f"A window in {self.state} state cannot be shown.")
             else:
+                # Make sure the content has been laid out before it is displayed.
+                self.flush_layout()
                 self._impl.show()
 
     ######################################################################
@@ -452,6 +473,45 @@ class Window:
         # Update the geometry of the widget
         widget.refresh()
 
+    def _schedule_layout(self, widget: Widget) -> bool:
+        """Defer a refresh of the layout rooted at a widget to the next iteration of the
+        event loop.
+
+        Any number of refresh requests made before the event loop next iterates will
+        result in a single layout pass.
+
+        :param widget: The root widget of the layout that needs to be refreshed.
+        :returns: True if the refresh has been deferred; False if there is no running
+            event loop, and the layout must be refreshed immediately.
+        """
+        loop = self.app.loop
+        if not loop.is_running():
+            return False
+
+        self._pending_layouts[widget] = None
+        if self._layout_handle is None:
+            self._layout_handle = loop.call_soon(self.flush_layout)
+        return True
+
+    def flush_layout(self) -> None:
+        """Immediately perform any layout refreshes that are pending for the window.
+
+        When the app's event loop is running, changes to the content of a window (adding
+        or removing widgets, or changing style properties that affect layout) don't
+        immediately update the window's layout. Instead, a single refresh of the layout
+        is performed on the next iteration of the event loop. If you need to inspect
+        the geometry of a widget immediately after making a change, call this method
+        first.
+        """
+        if self._layout_handle is not None:
+            self._layout_handle.cancel()
+            self._layout_handle = None
+
+        pending = list(self._pending_layouts)
+        self._pending_layouts.clear()
+        for widget in pending:
+            widget._refresh_layout()
+
     @property
     def widgets(self) -> FilteredWidgetRegistry:
         """The widgets contained in the window.
@@ -628,6 +688,7 @@ class Window:
             [image format plugins](/reference/api/resources/image/image-format-plugins.md).
         :returns: An image containing the window content, in the format requested.
         """  # noqa: E501
+        self.flush_layout()
         return Image(self._impl.get_image_data()).as_format(format)
 
     async def dialog(
@@ -13,6 +13,10 @@ def reset_global_state():
     EventLog.reset()
     # Reset the global window count
     toga_window._window_count = -1
+    # Discard any images and icons cached by previous tests
+    toga.Image.cache.clear()
+    # Discard any fonts cached by previous tests
+    toga.Font.cache.clear()
 
 
 @pytest.fixture(autouse=True)
@@ -0,0 +1,281 @@
+from unittest.mock import Mock, call
+
+import pytest
+
+from toga.sources import ColumnarListSource, ColumnarRow, ListSource
+
+
+@pytest.fixture
+def source():
+    return ColumnarListSource(
+        data=[
+            ("first", 111),
+            ("second", 222),
+            ("third", 333),
+        ],
+        accessors=["val1", "val2"],
+    )
+
+
+def test_is_list_source(source):
+    """A columnar list source is a list source."""
+    assert isinstance(source, ListSource)
+    assert len(source) == 3
+    assert isinstance(source[0], ColumnarRow)
+    assert [row.val1 for row in source] == ["first", "second", "third"]
+    assert [row.val2 for row in source[1:]] == [222, 333]
+
+    with pytest.raises(IndexError):
+        source[3]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        # Tuples use the fast path
+        [("first", 111), ("second",), ("third", 333, "extra")],
+        # Anything else is converted one row at a time
+        [["first", 111], {"val1": "second"}, ("third", 333, "extra")],
+    ],
+)
+def test_data(data):
+    """Rows can be created from a mix of data."""
+    source = ColumnarListSource(data=data, accessors=["val1", "val2"])
+
+    assert source[0].val1 == "first"
+    assert source[0].val2 == 111
+    assert source[1].val1 == "second"
+    assert not hasattr(source[1], "val2")
+    assert source[2].val2 == 333
+
+
+def test_data_with_missing_columns():
+    """Tuples that are shorter than the accessors leave attributes unset."""
+    source = ColumnarListSource(data=[("first",), ("second",)], accessors=["a", "b"])
+
+    assert source[1].a == "second"
+    assert not hasattr(source[1], "b")
+
+
+def test_flat_data():
+    """Rows can be created from scalar values."""
+    source = ColumnarListSource(data=["a", 2], accessors=["value"])
+
+    assert [row.value for row in source] == ["a", 2]
+
+
+def test_mapping_data():
+    """Rows of mapping data can have different attributes."""
+    source = ColumnarListSource(data=[{"a": 1}, {"b": 2}])
+
+    assert source.accessors is None
+    assert source[0].a == 1
+    assert not hasattr(source[0], "b")
+    assert source[1].b == 2
+
+    row = source.append({"c": 3})
+    assert row.c == 3
+    assert not hasattr(row, "a")
+    assert not hasattr(source[0], "c")
+
+    with pytest.raises(
+        ValueError,
+        match=r"ListSource requires accessors for non-mapping row data",
+    ):
+        source.append(1)
+
+
+def test_row(source):
+    """Rows are views onto the columns of the source."""
+    listener = Mock()
+    source.add_listener(listener)
+    row = source[0]
+
+    # Rows referring to the same data are equal
+    assert row == source[0]
+    assert hash(row) == hash(source[0])
+    assert row != source[1]
+    assert row != "first"
+    assert repr(row) == "<ColumnarRow 0 val1='first' val2=111>"
+
+    # An existing attribute can be updated
+    row.val1 = "new value"
+    assert source[0].val1 == "new value"
+    listener.source_change.assert_called_once_with(item=row)
+    listener.reset_mock()
+
+    # A new attribute can be added
+    row.val3 = "other value"
+    assert source[0].val3 == "other value"
+    assert not hasattr(source[1], "val3")
+    listener.source_change.assert_called_once_with(item=row)
+    listener.reset_mock()
+
+    # Deleting an attribute causes a change notification
+    del row.val3
+    assert not hasattr(row, "val3")
+    listener.source_change.assert_called_once_with(item=row)
+    listener.reset_mock()
+
+    with pytest.raises(AttributeError, match=r"no attribute 'val3'"):
+        del row.val3
+    with pytest.raises(AttributeError, match=r"no attribute 'missing'"):
+        _ = row.missing
+
+    # Attributes with an underscore are stored, but aren't notifiable events
+    row._impl = "impl"
+    assert source[0]._impl == "impl"
+    assert not hasattr(source[1], "_impl")
+    del row._impl
+    assert not hasattr(row, "_impl")
+    listener.source_change.assert_not_called()
+
+    del row.val1
+    del row.val2
+    assert repr(row) == "<ColumnarRow 0 (no attributes)>"
+
+
+def test_removed_row(source):
+    """A row that has been removed is no longer live."""
+    listener = Mock()
+    source.add_listener(listener)
+    row = source[1]
+    row._impl = "impl"
+
+    del source[1]
+
+    # A listener can inspect the removed row
+    listener.source_remove.assert_called_once_with(item=row, index=1)
+    assert row.val1 == "second"
+
+    # ... but once the source has changed, the row's data is discarded, and its
+    # slot can be reused.
+    new_row = source.append(("fourth", 444))
+    assert new_row != row
+    assert not hasattr(row, "val1")
+    assert not hasattr(row, "_impl")
+    assert not hasattr(new_row, "_impl")
+    with pytest.raises(AttributeError, match=r"has been removed from its source"):
+        row.val1 = "changed"
+    with pytest.raises(ValueError, match=r"not in list"):
+        source.index(row)
+
+    assert [row.val1 for row in source] == ["first", "third", "fourth"]
+
+
+def test_index(source):
+    """The index of a row is kept up to date as the source is modified."""
+    first, second, third = source
+
+    def assert_positions():
+        for i, row in enumerate(source):
+            assert source.index(row) == i
+
+    assert_positions()
+
+    zeroth = source.insert(0, ("zeroth", 0))
+    assert source.index(third) == 3
+    assert_positions()
+
+    new = source.insert(-1, ("new", 999))
+    assert source.index(new) == 3
+    assert source.index(third) == 4
+    assert_positions()
+
+    source.remove(second)
+    with pytest.raises(ValueError, match=r"not in list"):
+        source.index(second)
+    assert_positions()
+
+    # Replace a row
+    source[1] = ("replacement", 123)
+    assert source.index(source[1]) == 1
+    with pytest.raises(ValueError, match=r"not in list"):
+        source.index(first)
+    assert_positions()
+
+    # Rows from other sources can't be found
+    other = ColumnarListSource(data=[("zeroth", 0)], accessors=["val1", "val2"])
+    with pytest.raises(ValueError, match=r"not in list"):
+        source.index(other[0])
+    with pytest.raises(ValueError, match=r"not in list"):
+        source.index(None)
+
+    # Clear the list; rows from before the clear aren't in the list, even
+    # though their slots have been reused.
+    source.clear()
+    assert len(source) == 0
+    row = source.append(("only", 1))
+    assert source.index(row) == 0
+    with pytest.raises(ValueError, match=r"not in list"):
+        source.index(zeroth)
+    assert not hasattr(zeroth, "val1")
+
+
+def test_bulk_changes(source):
+    """Bulk changes are notified in the same way as a ListSource."""
+    listener = Mock()
+    source.add_listener(listener)
+
+    rows = source.insert_many(1, [("new1", 901), {"val1": "new2", "val2": 902}])
+    assert [row.val1 for row in source] == ["first", "new1", "new2", "second", "third"]
+    listener.source_insert_range.assert_called_once_with(index=1, items=rows)
+
+    deleted = source[0:2]
+    source.delete_range(0, 2)
+    assert [row.val1 for row in source] == ["new2", "second", "third"]
+    listener.source_remove_range.assert_called_once_with(index=0, items=deleted)
+
+    # Freed slots are reused, along with new slots.
+    rows = source.extend([("a", 1), ("b", 2), ("c", 3)])
+    assert [row.val1 for row in source] == ["new2", "second", "third", "a", "b", "c"]
+    assert [source.index(row) for row in rows] == [3, 4, 5]
+    assert not any(hasattr(row, "val1") for row in deleted)
+
+    source.replace_all([("x", 1), ("y", 2)])
+    assert [row.val1 for row in source] == ["x", "y"]
+    listener.source_reset.assert_called_once_with()
+
+
+def test_reset_fallback(source):
+    """A listener that doesn't support reset is sent a clear, and then the rows."""
+    listener = Mock(spec=["source_insert", "source_clear"])
+    source.add_listener(listener)
+
+    source.replace_all([("new1", 1), ("new2", 2)])
+
+    listener.source_clear.assert_called_once_with()
+    assert listener.source_insert.call_args_list == [
+        call(index=0, item=source[0]),
+        call(index=1, item=source[1]),
+    ]
+
+
+def test_find(source):
+    """Rows can be found by value, with or without an index."""
+    source.append(("second", 444))
+
+    assert source.find("second") == source[1]
+    assert source.find("second", start=source[1]) == source[3]
+    assert source.find_all({"val2": 444}) == [source[3]]
+
+    source.add_index("val1")
+    assert source.find_all("second") == [source[1], source[3]]
+    source[1].val1 = "changed"
+    assert source.find_all("second") == [source[3]]
+    source[0] = ("second", 0)
+    assert source.find_all("second") == [source[0], source[3]]
+    del source[3]
+    assert source.find_all("second") == [source[0]]
+
+
+def test_indexes_on_construction():
+    """Indexes can be requested when the source is created."""
+    source = ColumnarListSource(
+        data=[("a", 1), ("b", 2), ("a", 3)],
+        accessors=["val1", "val2"],
+        indexes=["val1"],
+    )
+
+    assert source.indexes == ["val1"]
+    assert source.find_all("a") == [source[0], source[2]]
@@ -1,7 +1,10 @@
+from unittest.mock import Mock
+
 import pytest
 
 from toga.icons import Icon
-from toga.sources import AccessorColumn, Column
+from toga.sources import AccessorColumn, Column, ColumnarListSource, ListSource
+from toga.sources.columns import _CellCacheListener
 from toga.sources.list_source import Row
 from toga.widgets.label import Label
 
@@ -41,6 +44,12 @@ class SimpleColumn(Column):
 LABEL_WIDGET = Label("Test")
 
 
+def cached_source(source):
+    """Attach a cell cache to a source, as a Table or Tree does."""
+    source.add_listener(_CellCacheListener())
+    return source
+
+
 @pytest.mark.parametrize(
     "heading, heading_property",
     [
@@ -327,3 +336,191 @@ def test_accessor_column_text_default(row, text):
     column = AccessorColumn(None, "x")
 
     assert column.text(row, DEFAULT) == text
+
+
+def test_cell_cache():
+    """The text and icon of a row are cached until the row changes."""
+    column = AccessorColumn(None, "x")
+    source = cached_source(
+        ListSource(accessors=["x"], data=[(ValueWithIcon(Icon.DEFAULT_ICON, "test"),)])
+    )
+    row = source[0]
+
+    assert column.text(row) == "test"
+    assert column.icon(row) == Icon.DEFAULT_ICON
+
+    # Changing the value object itself isn't visible to the cache...
+    row.x.text = "changed"
+    assert column.text(row) == "test"
+
+    # ... unless the source announces the change...
+    source.notify("change", item=row)
+    assert column.text(row) == "changed"
+
+    # ... and changing an attribute of the row is always visible.
+    row.x = "new value"
+    assert column.text(row) == "new value"
+    assert column.icon(row) is None
+    del row.x
+    assert column.text(row, DEFAULT) == DEFAULT
+
+    # Private attributes don't discard the cache.
+    row.x = ValueWithoutIcon("value")
+    assert column.text(row) == "value"
+    row.x.text = "changed"
+    row._impl = "impl"
+    assert column.text(row) == "value"
+
+
+@pytest.mark.parametrize(
+    "modify",
+    [
+        pytest.param(lambda source: source.remove(source[0]), id="remove"),
+        pytest.param(lambda source: source.clear(), id="clear"),
+        pytest.param(lambda source: source.notify("reset"), id="reset"),
+    ],
+)
+def test_cell_cache_discarded(modify):
+    """The cached cells of rows are discarded when rows are removed from the
+    source."""
+    column = AccessorColumn(None, "x")
+    source = cached_source(ListSource(accessors=["x"], data=[(ValueWithoutIcon(1),)]))
+    row = source[0]
+    listener = source.listeners[0]
+
+    assert column.text(row) == "1"
+    assert row in listener._cells
+
+    modify(source)
+    assert row not in listener._cells
+
+
+def test_cell_cache_columns():
+    """Columns that compare as equal have separate cached cells."""
+    row = cached_source(ListSource(accessors=["x"], data=[(1,)]))[0]
+    column = AccessorColumn(None, "x")
+    other = AccessorColumn(None, "x", formatter=lambda values: ["other"] * len(values))
+    assert column == other
+
+    assert column.text(row) == "1"
+    assert other.text(row) == "other"
+
+
+def test_uncached_rows():
+    """Rows that aren't in a source with a cell cache aren't cached."""
+
+    class CustomRow:
+        x = 1
+
+    column = AccessorColumn(None, "x")
+    # A source whose listeners don't include a cell cache.
+    source = ListSource(accessors=["x"], data=[(1,)])
+    source.add_listener(Mock())
+    for row in [
+        CustomRow(),
+        Row(x=1),
+        source[0],
+    ]:
+        assert column.text(row) == "1"
+        row.x = 2
+        assert column.text(row) == "2"
+
+    # Preparing uncached rows does nothing
+    column.prepare([row])
+    row.x = 3
+    assert column.text(row) == "3"
+
+
+def test_formatter():
+    """A formatter can convert a column of values into text at once."""
+    calls = []
+
+    def formatter(values):
+        calls.append(values)
+        return [f"{value:.2f}" for value in values]
+
+    column = AccessorColumn(None, "x", formatter=formatter)
+    source = cached_source(ListSource(accessors=["x"]))
+    for value in [1, (Icon.DEFAULT_ICON, 2), (Icon.DEFAULT_ICON, None)]:
+        source.append({"x": value})
+    source.append({})
+    source.append({"x": LABEL_WIDGET})
+    source.append({"x": 3})
+    rows = list(source)
+
+    # A single row is formatted on its own
+    assert column.text(rows[-1]) == "3.00"
+    assert calls == [[3]]
+
+    # Prepare formats all the uncached values in a single call.
+    column.prepare(rows)
+    assert calls == [[3], [1, 2]]
+    assert [column.text(row, DEFAULT) for row in rows] == [
+        "1.00",
+        "2.00",
+        DEFAULT,
+        DEFAULT,
+        DEFAULT,
+        "3.00",
+    ]
+    assert [column.icon(row) for row in rows] == [
+        None,
+        Icon.DEFAULT_ICON,
+        Icon.DEFAULT_ICON,
+        None,
+        None,
+        None,
+    ]
+    assert calls == [[3], [1, 2]]
+
+    # Once every row is cached, there's nothing to format.
+    column.prepare(rows)
+    assert calls == [[3], [1, 2], []]
+
+
+def test_prepare_invalid_tuple():
+    """Invalid data tuples are reported when rows are prepared."""
+    column = AccessorColumn(None, "x")
+
+    with pytest.raises(ValueError, match=r"Data tuples must have length 2"):
+        column.prepare(cached_source(ListSource(accessors=["x"], data=[(("test",),)])))
+
+
+def test_column_prepare():
+    """Preparing rows for a column without a cache does nothing."""
+    column = SimpleColumn("test")
+    column.prepare(["row"])
+    assert column.text("row") == "row"
+
+
+def test_columnar_cell_cache():
+    """The cells of a columnar row are cached until the row changes."""
+    source = cached_source(ColumnarListSource(data=[(1,), (2,)], accessors=["x"]))
+    column = AccessorColumn(None, "x")
+    row = source[0]
+    listener = source.listeners[0]
+
+    column.prepare(source)
+    assert column.text(row) == "1"
+    # The cells are retained for the slot, not for a specific view of the row.
+    assert column.text(source[0]) == "1"
+    assert len(listener._columnar_cells) == 2
+
+    row.x = 10
+    assert column.text(row) == "10"
+    del row.x
+    assert column.text(row, DEFAULT) == DEFAULT
+
+    # A row that has been removed from the source isn't cached
+    removed = source[1]
+    del source[1]
+    source.append((3,))
+    assert column.text(removed, DEFAULT) == DEFAULT
+    assert removed not in listener._columnar_cells
+
+    # Removing a range of rows discards their cells.
+    source.insert_many(0, [(4,), (5,)])
+    column.prepare(source)
+    rows = list(source)
+    source.delete_range(0, 2)
+    assert not any(row in listener._columnar_cells for row in rows[:2])
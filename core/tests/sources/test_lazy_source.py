@@ -0,0 +1,335 @@
+from unittest.mock import Mock, call
+
+import pytest
+
+from toga.sources import LazyListSource, LazyTreeSource, Row
+
+
+class Data:
+    """Some data in an external store, recording each fetch."""
+
+    def __init__(self, count):
+        self.values = [(f"row {i}", i) for i in range(count)]
+        self.fetched = []
+
+    def length(self):
+        return len(self.values)
+
+    def fetch(self, start, stop):
+        self.fetched.append((start, stop))
+        return self.values[start:stop]
+
+
+@pytest.fixture
+def data():
+    return Data(95)
+
+
+@pytest.fixture
+def source(data):
+    return LazyListSource(
+        accessors=["name", "value"],
+        length=data.length,
+        fetch=data.fetch,
+        page_size=10,
+        max_pages=3,
+    )
+
+
+def test_invalid_accessors(data):
+    """Accessors for a lazy list source must be a list of attribute names."""
+    with pytest.raises(
+        ValueError,
+        match=r"accessors should be a list of attribute names",
+    ):
+        LazyListSource(accessors="name", length=data.length, fetch=data.fetch)
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        ({"page_size": 0}, r"page_size must be at least 1"),
+        ({"max_pages": 0}, r"max_pages must be at least 1"),
+    ],
+)
+def test_invalid_paging(data, kwargs, message):
+    """The page size and number of pages must be positive."""
+    with pytest.raises(ValueError, match=message):
+        LazyListSource(length=data.length, fetch=data.fetch, **kwargs)
+
+
+def test_accessors(source):
+    """The accessors of the source can be retrieved."""
+    assert source.accessors == ["name", "value"]
+
+    source = LazyListSource(length=lambda: 0, fetch=Mock())
+    assert source.accessors is None
+
+
+def test_fetch(source, data):
+    """Rows are only fetched when they are needed."""
+    # Creating the source doesn't fetch any rows.
+    assert len(source) == 95
+    assert data.fetched == []
+
+    row = source[42]
+    assert isinstance(row, Row)
+    assert (row.name, row.value) == ("row 42", 42)
+    assert data.fetched == [(40, 50)]
+
+    # Rows on the same page are retained.
+    assert source[49].value == 49
+    assert source[42] is row
+    assert data.fetched == [(40, 50)]
+
+    # The last page is short; negative indices are allowed.
+    assert source[-1].value == 94
+    assert data.fetched == [(40, 50), (90, 95)]
+
+    # A slice only fetches the pages it covers.
+    assert [row.value for row in source[18:22]] == [18, 19, 20, 21]
+    assert data.fetched == [(40, 50), (90, 95), (10, 20), (20, 30)]
+
+    with pytest.raises(IndexError):
+        source[95]
+
+
+def test_non_mapping_data_requires_accessors(data):
+    """Fetched data must be a mapping if there are no accessors."""
+    source = LazyListSource(length=data.length, fetch=data.fetch)
+    with pytest.raises(
+        ValueError,
+        match=r"ListSource requires accessors for non-mapping row data",
+    ):
+        source[0]
+
+    source = LazyListSource(
+        length=lambda: 2,
+        fetch=lambda start, stop: [{"value": 1}, {"value": 2}][start:stop],
+    )
+    assert source[1].value == 2
+
+
+def test_flat_data():
+    """Fetched data can be a scalar value."""
+    source = LazyListSource(
+        accessors=["value"],
+        length=lambda: 3,
+        fetch=lambda start, stop: ["a", "b", "c"][start:stop],
+    )
+    assert [row.value for row in source] == ["a", "b", "c"]
+
+
+def test_eviction(source, data):
+    """Only the most recently used pages are retained."""
+    first = source[0]
+    source[10]
+    source[20]
+    # Using the first page again makes it the most recently used page.
+    assert source[1].value == 1
+    assert source.index(first) == 0
+
+    # Fetching a fourth page evicts the least recently used page.
+    source[30]
+    assert data.fetched == [(0, 10), (10, 20), (20, 30), (30, 40)]
+    assert source.index(first) == 0
+    with pytest.raises(ValueError, match=r"not in list"):
+        source.index(Row())
+
+    # The evicted page is fetched again if needed.
+    source[10]
+    assert data.fetched[-1] == (10, 20)
+
+
+def test_evicted_row(source):
+    """An evicted row is detached from the source."""
+    listener = Mock()
+    source.add_listener(listener)
+    row = source[0]
+    source[10]
+    source[20]
+    source[30]
+
+    with pytest.raises(ValueError, match=r"not in list"):
+        source.index(row)
+    row.value = 999
+    listener.source_change.assert_not_called()
+
+    # A retained row notifies listeners when it changes.
+    retained = source[35]
+    retained.value = 999
+    listener.source_change.assert_called_once_with(item=retained)
+    assert source.index(retained) == 35
+
+
+def test_iter(source, data):
+    """Iterating over the source fetches every page."""
+    assert sum(row.value for row in source) == sum(range(95))
+    assert len(data.fetched) == 10
+
+
+def test_refresh(source, data):
+    """A refresh discards the fetched rows, and re-reads the length."""
+    listener = Mock()
+    source.add_listener(listener)
+    row = source[0]
+
+    data.values = data.values[:5]
+    source.refresh()
+
+    assert len(source) == 5
+    listener.source_reset.assert_called_once_with()
+    with pytest.raises(ValueError, match=r"not in list"):
+        source.index(row)
+    assert source[0] is not row
+    assert data.fetched == [(0, 10), (0, 5)]
+
+
+def test_reset_fallback(source, data):
+    """A listener that doesn't support reset is sent a clear, and then every row."""
+    listener = Mock(spec=["source_insert", "source_clear"])
+    data.values = data.values[:2]
+    source.add_listener(listener)
+
+    source.refresh()
+
+    listener.source_clear.assert_called_once_with()
+    assert listener.source_insert.call_args_list == [
+        call(index=0, item=source[0]),
+        call(index=1, item=source[1]),
+    ]
+
+    # Any other notification that the listener doesn't implement is ignored.
+    source.notify("unknown")
+
+
+def test_find(source, data):
+    """Rows can be found by value, fetching rows until a match is found."""
+    assert source.find({"value": 15}) is source[15]
+    assert data.fetched == [(0, 10), (10, 20)]
+
+    assert source.find("row 15", start=source[3]) is source[15]
+    assert source.find("row 15", start=source[15], default=None) is None
+    with pytest.raises(ValueError, match=r"No row matching 'missing' in data"):
+        source.find("missing")
+
+    # A start row that isn't retained can't be used.
+    assert source.find("row 15", start=Row(), default=None) is None
+
+
+def test_find_all(source):
+    """All the rows matching some data can be found."""
+    # Every row is fetched, so the first match has been evicted by the time the
+    # search finishes.
+    [row] = source.find_all({"value": 15})
+    assert row.name == "row 15"
+    with pytest.raises(ValueError, match=r"not in list"):
+        source.index(row)
+    assert source.find_all("missing") == []
+
+
+class TreeData:
+    """A tree of data in an external store, recording each fetch."""
+
+    def __init__(self):
+        self.fetched = []
+
+    def children(self, parent):
+        self.fetched.append(None if parent is None else parent.name)
+        if parent is None:
+            return [(("root 0", 0), True), (("root 1", 1), False)]
+        return [((f"{parent.name}.{i}", i), i == 0) for i in range(3)]
+
+
+@pytest.fixture
+def tree_data():
+    return TreeData()
+
+
+@pytest.fixture
+def tree_source(tree_data):
+    return LazyTreeSource(accessors=["name", "value"], children=tree_data.children)
+
+
+def test_tree_fetch(tree_source, tree_data):
+    """The children of a node are only fetched when they are needed."""
+    assert tree_data.fetched == []
+
+    assert len(tree_source) == 2
+    assert tree_data.fetched == [None]
+
+    root = tree_source[0]
+    assert root.name == "root 0"
+    # A node that can have children doesn't need them to be fetched to say so.
+    assert root.can_have_children()
+    assert not tree_source[1].can_have_children()
+    assert tree_data.fetched == [None]
+
+    # Fetch the children of the first root.
+    assert [child.name for child in root] == [
+        "root 0.0",
+        "root 0.1",
+        "root 0.2",
+    ]
+    assert tree_data.fetched == [None, "root 0"]
+    assert root[1]._parent is root
+    assert root[1]._source is tree_source
+
+    # The children are retained.
+    assert len(root) == 3
+    assert root[0].can_have_children()
+    assert not root[1].can_have_children()
+    assert tree_data.fetched == [None, "root 0"]
+
+    # A leaf node has no children.
+    assert len(tree_source[1]) == 0
+    assert tree_data.fetched == [None, "root 0"]
+
+
+def test_tree_changes(tree_source, tree_data):
+    """Fetched nodes can be modified."""
+    listener = Mock()
+    tree_source.add_listener(listener)
+    root = tree_source[0]
+
+    child = root.append(("new", 3), children=[(("grandchild", 0), None)])
+    assert tree_data.fetched == [None, "root 0"]
+    assert len(root) == 4
+    assert child[0].name == "grandchild"
+    listener.source_insert.assert_called_once_with(parent=root, index=3, item=child)
+
+    # Adding children to a leaf node makes it a branch.
+    leaf = tree_source[1]
+    leaf.append(("new child", 0))
+    assert len(leaf) == 1
+
+
+def test_tree_refresh(tree_source, tree_data):
+    """A refresh discards the fetched nodes."""
+    listener = Mock()
+    tree_source.add_listener(listener)
+    root = tree_source[0]
+
+    tree_source.refresh()
+
+    listener.source_reset.assert_called_once_with()
+    assert root._source is None
+    assert tree_data.fetched == [None]
+    assert tree_source[0] is not root
+    assert tree_data.fetched == [None, None]
+    # The positions of the discarded roots are discarded too.
+    assert tree_source.index(tree_source[1]) == 1
+    with pytest.raises(ValueError, match=r"not in list"):
+        tree_source.index(root)
+
+    # Refreshing a source that hasn't fetched any nodes
+    tree_source.refresh()
+    tree_source.refresh()
+    assert tree_data.fetched == [None, None]
+
+    # Indexes are rebuilt, which requires the roots to be fetched.
+    tree_source.add_index("name")
+    assert tree_source.find("root 1") is tree_source[1]
+    tree_source.refresh()
+    assert tree_data.fetched == [None, None, None, None]
+    assert tree_source.find("root 0") is tree_source[0]
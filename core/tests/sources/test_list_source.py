@@ -1,8 +1,8 @@
-from unittest.mock import Mock
+from unittest.mock import Mock, call
 
 import pytest
 
-from toga.sources import ListSource, Row
+from toga.sources import ListSource, Row, list_source
 
 
 @pytest.fixture
@@ -420,6 +420,66 @@ def test_index(source):
         source.index(Row())
 
 
+def test_index_after_changes(source):
+    """The index of a row is kept up to date as the list source is modified."""
+    first, second, third = source[0], source[1], source[2]
+
+    def assert_positions():
+        for i, row in enumerate(source):
+            assert source.index(row) == i
+
+    # Insert at the start of the list; every existing row moves.
+    zeroth = source.insert(0, {"val1": "zeroth", "val2": 0})
+    assert source.index(third) == 3
+    assert_positions()
+
+    # Append to the end of the list
+    fourth = source.append({"val1": "fourth", "val2": 444})
+    assert source.index(fourth) == 4
+    assert_positions()
+
+    # Insert with an index past the end of the list
+    fifth = source.insert(99, {"val1": "fifth", "val2": 555})
+    assert source.index(fifth) == 5
+
+    # Insert with a negative index
+    new = source.insert(-1, {"val1": "new", "val2": 999})
+    assert source.index(new) == 5
+    assert source.index(fifth) == 6
+    assert_positions()
+
+    # Delete with a negative index
+    del source[-2]
+    assert source.index(fifth) == 5
+    with pytest.raises(ValueError, match=r"not in list"):
+        source.index(new)
+    assert_positions()
+
+    # Remove a row from the middle of the list
+    source.remove(second)
+    assert source.index(first) == 1
+    assert source.index(third) == 2
+    with pytest.raises(ValueError, match=r"not in list"):
+        source.index(second)
+    with pytest.raises(ValueError, match=r"not in list"):
+        source.remove(second)
+    assert_positions()
+
+    # Replace a row
+    source[1] = {"val1": "replacement", "val2": 123}
+    assert source.index(source[1]) == 1
+    with pytest.raises(ValueError, match=r"not in list"):
+        source.index(first)
+    assert_positions()
+
+    # Clear the list
+    source.clear()
+    with pytest.raises(ValueError, match=r"not in list"):
+        source.index(zeroth)
+    row = source.append({"val1": "only", "val2": 1})
+    assert source.index(row) == 0
+
+
 def test_find(source):
     """You can find the index of any matching row within a list source."""
 
@@ -473,3 +533,366 @@ def test_find_with_default(source):
 
     # If the given default value is None, None will be returned if no match is found
     assert source.find({"val1": "not there", "val2": 999}, default=None) is None
+
+
+class BasicListener:
+    """A listener that only implements the individual list notifications."""
+
+    def __init__(self):
+        self.source_insert = Mock()
+        self.source_remove = Mock()
+        self.source_change = Mock()
+        self.source_clear = Mock()
+
+
+@pytest.mark.parametrize(
+    "index, effective_index",
+    [
+        (1, 1),
+        (-1, 2),
+        (-10, 0),
+        (10, 3),
+    ],
+)
+def test_insert_many(source, index, effective_index):
+    """Multiple rows can be inserted with a single notification."""
+    listener = Mock()
+    source.add_listener(listener)
+
+    rows = source.insert_many(index, [("new1", 901), {"val1": "new2", "val2": 902}])
+
+    assert len(source) == 5
+    assert [row.val1 for row in rows] == ["new1", "new2"]
+    assert source[effective_index] is rows[0]
+    assert source[effective_index + 1] is rows[1]
+    assert source.index(rows[1]) == effective_index + 1
+
+    listener.source_insert_range.assert_called_once_with(
+        index=effective_index, items=rows
+    )
+    listener.source_insert.assert_not_called()
+
+
+def test_insert_many_empty(source):
+    """Inserting no rows doesn't notify listeners."""
+    listener = Mock()
+    source.add_listener(listener)
+
+    assert source.insert_many(1, []) == []
+
+    assert len(source) == 3
+    listener.source_insert_range.assert_not_called()
+
+
+def test_extend(source):
+    """Multiple rows can be appended with a single notification."""
+    listener = Mock()
+    source.add_listener(listener)
+
+    rows = source.extend(("new", i) for i in range(5))
+
+    assert len(source) == 8
+    assert [row.val2 for row in source[3:]] == [0, 1, 2, 3, 4]
+    assert source.index(rows[-1]) == 7
+
+    listener.source_insert_range.assert_called_once_with(index=3, items=rows)
+
+
+def test_insert_range_fallback(source):
+    """A listener that doesn't support bulk inserts is notified of each row."""
+    listener = BasicListener()
+    source.add_listener(listener)
+
+    rows = source.insert_many(1, [("new1", 901), ("new2", 902)])
+
+    assert listener.source_insert.call_args_list == [
+        call(index=1, item=rows[0]),
+        call(index=2, item=rows[1]),
+    ]
+
+
+@pytest.mark.parametrize(
+    "start, stop, removed",
+    [
+        (0, 2, ["first", "second"]),
+        (1, 10, ["second", "third"]),
+        (-2, -1, ["second"]),
+    ],
+)
+def test_delete_range(source, start, stop, removed):
+    """A range of rows can be deleted with a single notification."""
+    listener = Mock()
+    source.add_listener(listener)
+    rows = list(source)
+    deleted = [row for row in rows if row.val1 in removed]
+    kept = [row for row in rows if row.val1 not in removed]
+
+    source.delete_range(start, stop)
+
+    assert list(source) == kept
+    for i, row in enumerate(kept):
+        assert source.index(row) == i
+    for row in deleted:
+        with pytest.raises(ValueError, match=r"not in list"):
+            source.index(row)
+
+    listener.source_remove_range.assert_called_once_with(
+        index=rows.index(deleted[0]), items=deleted
+    )
+    listener.source_remove.assert_not_called()
+
+
+def test_delete_empty_range(source):
+    """Deleting an empty range doesn't notify listeners."""
+    listener = Mock()
+    source.add_listener(listener)
+
+    source.delete_range(2, 1)
+
+    assert len(source) == 3
+    listener.source_remove_range.assert_not_called()
+
+
+def test_remove_range_fallback(source):
+    """A listener that doesn't support bulk removal is notified of each row."""
+    listener = BasicListener()
+    source.add_listener(listener)
+    rows = list(source)
+
+    source.delete_range(0, 2)
+
+    assert listener.source_remove.call_args_list == [
+        call(index=0, item=rows[0]),
+        call(index=0, item=rows[1]),
+    ]
+
+
+def test_replace_all(source):
+    """All the rows of a source can be replaced with a single notification."""
+    listener = Mock()
+    source.add_listener(listener)
+    old_row = source[0]
+
+    source.replace_all([("new1", 1), ("new2", 2)])
+
+    assert [row.val1 for row in source] == ["new1", "new2"]
+    assert source.index(source[1]) == 1
+    with pytest.raises(ValueError, match=r"not in list"):
+        source.index(old_row)
+
+    listener.source_reset.assert_called_once_with()
+    listener.source_clear.assert_not_called()
+    listener.source_insert.assert_not_called()
+
+
+def test_reset_fallback(source):
+    """A listener that doesn't support reset is sent a clear, and then the rows."""
+    listener = BasicListener()
+    source.add_listener(listener)
+
+    source.replace_all([("new1", 1), ("new2", 2)])
+
+    listener.source_clear.assert_called_once_with()
+    assert listener.source_insert.call_args_list == [
+        call(index=0, item=source[0]),
+        call(index=1, item=source[1]),
+    ]
+
+    # Any other notification that the listener doesn't implement is ignored.
+    source.notify("unknown")
+
+
+def test_batch(source):
+    """Changes to a list source can be batched into a single notification."""
+    listener = Mock()
+    source.add_listener(listener)
+
+    with source.batch():
+        source.append(("new", 444))
+        source[0].val2 = 999
+        del source[1]
+
+    assert [row.val1 for row in source] == ["first", "third", "new"]
+    listener.source_reset.assert_called_once_with()
+    listener.source_insert.assert_not_called()
+    listener.source_change.assert_not_called()
+    listener.source_remove.assert_not_called()
+
+
+def test_find_all(source):
+    """All the rows matching some data can be found."""
+    source.append({"val1": "second", "val2": 444})
+    source.append({"val1": "fourth", "val2": 222})
+
+    assert source.find_all({"val1": "second"}) == [source[1], source[3]]
+    assert source.find_all(("second", 444)) == [source[3]]
+    assert source.find_all(222) == []
+    assert source.find_all({"val2": 222}) == [source[1], source[4]]
+    assert source.find_all({"val1": "missing"}) == []
+
+
+def test_find_all_requires_accessors():
+    """find_all() requires accessors for non-mapping data."""
+    source = ListSource(data=[{"value": 1}])
+    with pytest.raises(
+        ValueError,
+        match=r"find_all\(\) requires accessors for non-mapping row data",
+    ):
+        source.find_all(1)
+
+
+@pytest.fixture
+def indexed_source():
+    return ListSource(
+        data=[
+            {"val1": "first", "val2": 111},
+            {"val1": "second", "val2": 222},
+            {"val1": "third", "val2": 333},
+            {"val1": "second", "val2": 444},
+        ],
+        accessors=["val1", "val2"],
+        indexes=["val1"],
+    )
+
+
+def test_add_index(source):
+    """Indexes can be added to and removed from a source."""
+    assert source.indexes == []
+
+    source.add_index("val1")
+    assert source.indexes == ["val1"]
+
+    # Adding an index twice is a no-op
+    source.add_index("val1")
+    source.add_index("val2")
+    assert source.indexes == ["val1", "val2"]
+
+    source.remove_index("val1")
+    assert source.indexes == ["val2"]
+
+    with pytest.raises(KeyError):
+        source.remove_index("val1")
+
+
+def test_indexed_find(indexed_source, monkeypatch):
+    """A search on an indexed attribute only examines rows with a matching value."""
+    source = indexed_source
+    examined = []
+    original = list_source._matches
+
+    def counting_matches(item, data, accessors):
+        examined.append(item)
+        return original(item, data, accessors)
+
+    monkeypatch.setattr(list_source, "_matches", counting_matches)
+
+    assert source.find({"val1": "third"}) is source[2]
+    assert examined == [source[2]]
+
+    # Searches using accessor order and the first accessor use the index
+    examined.clear()
+    assert source.find(("second", 444)) is source[3]
+    assert examined == [source[1], source[3]]
+
+    examined.clear()
+    assert source.find("third") is source[2]
+    assert examined == [source[2]]
+
+    # Matches are returned in source order, and start is respected
+    assert source.find({"val1": "second"}) is source[1]
+    assert source.find({"val1": "second"}, start=source[1]) is source[3]
+    assert source.find({"val1": "second"}, start=source[2]) is source[3]
+    assert source.find_all({"val1": "second"}) == [source[1], source[3]]
+
+    # A search that doesn't match the index
+    examined.clear()
+    assert source.find({"val1": "missing"}, default=None) is None
+    assert source.find_all({"val1": "missing"}) == []
+    assert examined == []
+
+    # A search that doesn't include an indexed attribute examines every row
+    examined.clear()
+    assert source.find({"val2": 333}) is source[2]
+    assert examined == [source[0], source[1], source[2]]
+
+    # If several attributes are indexed, the smallest set of candidates is used
+    source.add_index("val2")
+    examined.clear()
+    assert source.find({"val1": "second", "val2": 444}) is source[3]
+    assert examined == [source[3]]
+
+
+def test_index_maintained(indexed_source):
+    """Value indexes are updated when the source is modified."""
+    source = indexed_source
+
+    # Modify an indexed attribute
+    row = source[0]
+    row.val1 = "second"
+    assert source.find_all({"val1": "second"}) == [source[0], source[1], source[3]]
+    assert source.find_all({"val1": "first"}) == []
+
+    # Remove an indexed attribute
+    del row.val1
+    assert source.find_all({"val1": "second"}) == [source[1], source[3]]
+
+    # Modifying a non-indexed attribute doesn't affect the index
+    source[1].val2 = 999
+    assert source.find({"val1": "second"}) is source[1]
+
+    # Insert rows
+    new_row = source.insert(0, {"val1": "second", "val2": 0})
+    assert source.find({"val1": "second"}) is new_row
+    new_rows = source.extend([("new", 1), ("new", 2)])
+    assert source.find_all("new") == new_rows
+
+    # Replace a row
+    old_row = source[2]
+    source[2] = ("replacement", 3)
+    assert source.find_all("second") == [new_row, source[4]]
+    assert source.find("replacement") is source[2]
+    old_row.val1 = "second"
+    assert source.find_all("second") == [new_row, source[4]]
+
+    # Delete rows
+    del source[0]
+    assert source.find_all("second") == [source[3]]
+    source.delete_range(3, 5)
+    assert source.find_all("second") == []
+    assert source.find_all("new") == [source[3]]
+
+    # Changes inside a batch are indexed immediately
+    with source.batch():
+        source[0].val1 = "batched"
+        assert source.find("batched") is source[0]
+
+    # Replace all the rows
+    source.replace_all([("second", 1), ("new", 2)])
+    assert source.find_all("second") == [source[0]]
+    assert source.find_all("new") == [source[1]]
+
+    # Clear the source
+    source.clear()
+    assert source.find_all("second") == []
+    source.append(("second", 1))
+    assert source.find_all("second") == [source[0]]
+
+
+def test_index_unhashable():
+    """Rows with unhashable values are examined by every indexed search."""
+    source = ListSource(
+        data=[("first", 1), (["second"], 2), ("third", 3)],
+        accessors=["val1", "val2"],
+        indexes=["val1"],
+    )
+
+    assert source.find_all({"val1": "third"}) == [source[2]]
+    assert source.find({"val1": ["second"]}) is source[1]
+
+    # A row's value can change between hashable and unhashable
+    source[1].val1 = "second"
+    assert source.find({"val1": "second"}) is source[1]
+    source[0].val1 = ["first"]
+    assert source.find({"val1": ["first"]}) is source[0]
+    del source[0]
+    assert source.find({"val1": ["first"]}, default=None) is None
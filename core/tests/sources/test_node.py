@@ -473,6 +473,10 @@ def test_find(node, child_b):
     # Find the child by a full match of values, starting at the first match
     assert node.find({"val1": "value a", "val2": 333}) == child_c
 
+    # A search that doesn't match raises an error
+    with pytest.raises(ValueError, match=r"No child matching {'val1': 'missing'}"):
+        node.find({"val1": "missing"})
+
 
 def test_found_leaf(leaf_node):
     """A child cannot be found from a leaf node."""
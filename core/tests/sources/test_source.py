@@ -71,6 +71,59 @@ def test_missing_listener_method():
     full_listener.source_message1.assert_called_once_with()
 
 
+def test_batch():
+    """Notifications made during a batch are coalesced into a single reset."""
+    listener = Mock()
+    source = Source()
+    source.add_listener(listener)
+
+    with source.batch() as batch:
+        assert batch is source
+        source.notify("message1")
+        # Batches can be nested
+        with source.batch():
+            source.notify("message2", arg1=11)
+        # Nothing has been notified yet
+        listener.source_reset.assert_not_called()
+
+    listener.source_message1.assert_not_called()
+    listener.source_message2.assert_not_called()
+    listener.source_reset.assert_called_once_with()
+
+    # Notifications are delivered immediately once the batch is complete.
+    source.notify("message3")
+    listener.source_message3.assert_called_once_with()
+
+
+def test_empty_batch():
+    """A batch that makes no changes doesn't notify listeners."""
+    listener = Mock()
+    source = Source()
+    source.add_listener(listener)
+
+    with source.batch():
+        pass
+
+    listener.source_reset.assert_not_called()
+
+
+def test_batch_exception():
+    """If a batch raises an exception, changes made so far are still notified."""
+    listener = Mock()
+    source = Source()
+    source.add_listener(listener)
+
+    with pytest.raises(RuntimeError), source.batch():
+        source.notify("message1")
+        raise RuntimeError("Oops")
+
+    listener.source_reset.assert_called_once_with()
+
+    # The source is no longer batching
+    source.notify("message2")
+    listener.source_message2.assert_called_once_with()
+
+
 def test_deprecated_listener_method():
     """Listener method names should start with 'source'."""
 
@@ -1,4 +1,4 @@
-from unittest.mock import Mock
+from unittest.mock import Mock, call
 
 import pytest
 
@@ -491,6 +491,49 @@ def test_clear(source, listener):
     listener.source_clear.assert_called_once_with()
 
 
+def test_replace_all(source, listener):
+    """All the nodes of a TreeSource can be replaced with a single notification."""
+    old_root = source[0]
+
+    source.replace_all({("group3", 3): [({"val1": "C first", "val2": 310}, None)]})
+
+    assert len(source) == 1
+    assert source[0].val1 == "group3"
+    assert source[0][0].val1 == "C first"
+    assert source[0][0]._parent is source[0]
+    # The old root is no longer part of the source
+    assert old_root._source is None
+
+    listener.source_reset.assert_called_once_with()
+    listener.source_clear.assert_not_called()
+
+
+def test_reset_fallback(source):
+    """A listener that doesn't support reset is sent a clear, and then the roots."""
+
+    class BasicListener:
+        def __init__(self):
+            self.source_insert = Mock()
+            self.source_clear = Mock()
+
+    listener = BasicListener()
+    source.add_listener(listener)
+
+    with source.batch():
+        source[0][0].val2 = 999
+        source.append({"val1": "new"})
+
+    listener.source_clear.assert_called_once_with()
+    assert listener.source_insert.call_args_list == [
+        call(parent=None, index=0, item=source[0]),
+        call(parent=None, index=1, item=source[1]),
+        call(parent=None, index=2, item=source[2]),
+    ]
+
+    # Any other notification that the listener doesn't implement is ignored.
+    source.notify("unknown")
+
+
 @pytest.mark.parametrize(
     "index, actual_index",
     [
@@ -654,6 +697,52 @@ def test_index(source):
     assert source.index(root) == 1
 
 
+def test_index_after_changes(source):
+    """The index of a root is kept up to date as the tree source is modified."""
+    first, second = source[0], source[1]
+
+    def assert_positions():
+        for i, root in enumerate(source):
+            assert source.index(root) == i
+
+    # Insert at the start; every existing root moves.
+    zeroth = source.insert(0, {"val1": "zeroth", "val2": 0})
+    assert source.index(second) == 2
+    assert_positions()
+
+    third = source.append({"val1": "third", "val2": 333})
+    assert source.index(third) == 3
+
+    # Remove a root from the middle.
+    source.remove(first)
+    assert source.index(second) == 1
+    assert source.index(third) == 2
+    with pytest.raises(ValueError, match=r"not in list"):
+        source.index(first)
+    assert_positions()
+
+    # Replace a root
+    source[1] = {"val1": "replacement", "val2": 123}
+    assert source.index(source[1]) == 1
+    with pytest.raises(ValueError, match=r"not in list"):
+        source.index(second)
+    assert_positions()
+
+    # A child isn't a root.
+    with pytest.raises(ValueError, match=r"not in list"):
+        source.index(second[0])
+
+    # Replacing all the roots discards their positions.
+    source.replace_all([({"val1": "only", "val2": 1}, None)])
+    with pytest.raises(ValueError, match=r"not in list"):
+        source.index(zeroth)
+    assert source.index(source[0]) == 0
+
+    source.clear()
+    root = source.append({"val1": "new", "val2": 2})
+    assert source.index(root) == 0
+
+
 def test_find(source):
     """A node can be found by value."""
     root1 = source[1]
@@ -689,3 +778,77 @@ def test_non_mapping_find_requires_accessors():
         match=r"find\(\) requires accessors for non-mapping node data",
     ):
         source[0].find(1)
+
+
+def test_find_all(source):
+    """All the root nodes matching some data can be found."""
+    root2 = source.append({"val1": "group1", "val2": 333})
+
+    assert source.find_all({"val1": "group1"}) == [source[0], root2]
+    assert source.find_all(("group1", 333)) == [root2]
+    assert source.find_all({"val1": "missing"}) == []
+    # Only root nodes are searched
+    assert source.find_all({"val1": "A first"}) == []
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_indexed_find(source, indexed):
+    """Root nodes can be found using an index."""
+    if indexed:
+        source.add_index("val1")
+        assert source.indexes == ["val1"]
+
+    root2 = source.insert(0, {"val1": "group2", "val2": 0})
+    root3 = source.append({"val1": "group2", "val2": 3})
+
+    assert source.find({"val1": "group2"}) is root2
+    assert source.find({"val1": "group2"}, start=root2) is source[2]
+    assert source.find_all("group2") == [root2, source[2], root3]
+    assert source.find_all("group3") == []
+
+    # Modify a root node
+    root2.val1 = "group3"
+    assert source.find_all("group2") == [source[2], root3]
+    assert source.find("group3") is root2
+
+    # Modifying a child node doesn't affect the search
+    source[1][0].val1 = "group2"
+    assert source.find_all("group2") == [source[2], root3]
+
+    # Replace a root node
+    source[0] = {"val1": "group4", "val2": 4}
+    assert source.find_all("group3") == []
+    assert source.find("group4") is source[0]
+
+    # Remove a root node
+    source.remove(root3)
+    assert source.find_all("group2") == [source[2]]
+
+    # Replace all the nodes
+    source.replace_all([({"val1": "group2", "val2": 5}, None)])
+    assert source.find_all("group2") == [source[0]]
+
+    # Clear the source
+    source.clear()
+    assert source.find_all("group2") == []
+    with pytest.raises(ValueError, match=r"No root node matching 'group2'"):
+        source.find("group2")
+
+
+def test_index_on_construction():
+    """A tree source can be constructed with indexes."""
+    source = TreeSource(
+        accessors=["val1", "val2"],
+        data=[(("first", 1), None), (("second", 2), None)],
+        indexes=["val1"],
+    )
+    assert source.indexes == ["val1"]
+    assert source.find("second") is source[1]
+
+    # Adding an index twice is a no-op
+    source.add_index("val1")
+    assert source.indexes == ["val1"]
+
+    source.remove_index("val1")
+    assert source.indexes == []
+    assert source.find("second") is source[1]
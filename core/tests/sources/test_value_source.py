@@ -52,3 +52,25 @@ def test_listener():
     source.something = 1234
 
     listener.source_change.assert_not_called()
+
+
+def test_batch():
+    """A listener that doesn't support reset is notified of the value after a
+    batch."""
+
+    class BasicListener:
+        def __init__(self):
+            self.source_change = Mock()
+
+    source = ValueSource(42)
+    listener = BasicListener()
+    source.add_listener(listener)
+
+    with source.batch():
+        source.value = 37
+        source.value = 99
+
+    listener.source_change.assert_called_once_with(item=99)
+
+    # Any other notification that the listener doesn't implement is ignored.
+    source.notify("unknown")
@@ -0,0 +1,279 @@
+from travertino.size import at_least
+
+from toga.style.pack import CENTER, COLUMN, END, ROW, Pack
+
+from ..utils import ExampleNode, ExampleViewport, assert_layout
+
+
+def _tree():
+    return ExampleNode(
+        "app",
+        style=Pack(direction=COLUMN),
+        children=[
+            ExampleNode(
+                "first",
+                style=Pack(direction=ROW),
+                children=[
+                    ExampleNode("label", style=Pack(), size=(50, 20)),
+                ],
+            ),
+            ExampleNode(
+                "second",
+                style=Pack(direction=ROW, height=100),
+                children=[
+                    ExampleNode("button", style=Pack(), size=(30, 30)),
+                ],
+            ),
+        ],
+    )
+
+
+def _layout_counter(monkeypatch):
+    """Count the number of times each node is actually laid out."""
+    counts = {}
+    original = Pack._layout_children
+
+    def _layout_children(self, *args, **kwargs):
+        name = self._applicator.node.name
+        counts[name] = counts.get(name, 0) + 1
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(Pack, "_layout_children", _layout_children)
+    return counts
+
+
+def test_clean_layout_retained(monkeypatch):
+    """If nothing has changed, a second layout doesn't recompute anything."""
+    root = _tree()
+    counts = _layout_counter(monkeypatch)
+
+    root.style.layout(ExampleViewport(640, 480))
+    assert counts == {"app": 1, "first": 1, "second": 1}
+    assert not root.layout_dirty
+
+    counts.clear()
+    root.style.layout(ExampleViewport(640, 480))
+    assert counts == {}
+
+
+def test_dirty_subtree(monkeypatch):
+    """Only the modified subtree and its ancestors are laid out again."""
+    root = _tree()
+    first, second = root.children
+    counts = _layout_counter(monkeypatch)
+
+    root.style.layout(ExampleViewport(640, 480))
+    counts.clear()
+
+    # Change the intrinsic size of the label in the first box.
+    first.children[0].intrinsic.width = 80
+    assert first.layout_dirty
+    assert not second.layout_dirty
+
+    root.style.layout(ExampleViewport(640, 480))
+    assert counts == {"app": 1, "first": 1}
+
+    assert_layout(
+        root,
+        (80, 120),
+        (640, 480),
+        {
+            "origin": (0, 0),
+            "content": (640, 480),
+            "children": [
+                {
+                    "origin": (0, 0),
+                    "content": (80, 20),
+                    "children": [{"origin": (0, 0), "content": (80, 20)}],
+                },
+                {
+                    "origin": (0, 20),
+                    "content": (30, 100),
+                    "children": [{"origin": (0, 20), "content": (30, 30)}],
+                },
+            ],
+        },
+    )
+
+
+def test_style_change(monkeypatch):
+    """A change to a layout-affecting style property marks the node as dirty."""
+    root = _tree()
+    first, second = root.children
+    counts = _layout_counter(monkeypatch)
+
+    root.style.layout(ExampleViewport(640, 480))
+    counts.clear()
+
+    # A property that can't affect layout doesn't cause a re-layout.
+    second.style.color = "red"
+    root.style.layout(ExampleViewport(640, 480))
+    assert counts == {}
+
+    second.style.height = 50
+    root.style.layout(ExampleViewport(640, 480))
+    assert counts == {"app": 1, "second": 1}
+    assert second.layout.content_height == 50
+    # The unchanged sibling keeps its existing layout.
+    assert first.layout.content_height == 20
+
+
+def test_new_allocation(monkeypatch):
+    """A clean node that is given a different allocation is laid out again."""
+    root = _tree()
+    counts = _layout_counter(monkeypatch)
+
+    root.style.layout(ExampleViewport(640, 480))
+    counts.clear()
+
+    root.style.layout(ExampleViewport(800, 600))
+    assert counts == {"app": 1, "first": 1, "second": 1}
+    assert (root.layout.content_width, root.layout.content_height) == (800, 600)
+
+
+def _flex_tree():
+    return ExampleNode(
+        "app",
+        style=Pack(direction=ROW),
+        children=[
+            ExampleNode(
+                "sidebar",
+                style=Pack(direction=COLUMN, width=100, margin=5),
+                children=[
+                    ExampleNode("item1", style=Pack(), size=(at_least(40), 20)),
+                    ExampleNode("item2", style=Pack(flex=1), size=(at_least(40), 20)),
+                ],
+            ),
+            ExampleNode(
+                "main",
+                style=Pack(direction=COLUMN, flex=1, gap=10),
+                children=[
+                    ExampleNode(
+                        "header",
+                        style=Pack(direction=ROW, justify_content=CENTER),
+                        children=[
+                            ExampleNode("title", style=Pack(), size=(at_least(80), 30)),
+                        ],
+                    ),
+                    ExampleNode(
+                        "body",
+                        style=Pack(flex=2, align_items=END),
+                        size=(at_least(100), at_least(50)),
+                    ),
+                    ExampleNode("footer", style=Pack(flex=1), size=(at_least(10), 20)),
+                ],
+            ),
+        ],
+    )
+
+
+def _snapshot(node):
+    return (
+        node.layout.min_width,
+        node.layout.min_height,
+        node.layout.absolute_content_left,
+        node.layout.absolute_content_top,
+        node.layout.content_width,
+        node.layout.content_height,
+        [_snapshot(child) for child in node.children],
+    )
+
+
+def test_cached_layouts(monkeypatch):
+    """Layouts restored from the cache are identical to freshly computed layouts."""
+    root = _flex_tree()
+    counts = _layout_counter(monkeypatch)
+
+    sizes = [(640, 480), (800, 600), (300, 200), (640, 480), (800, 600), (640, 480)]
+    for i, (width, height) in enumerate(sizes):
+        fresh = _flex_tree()
+        fresh.style.layout(ExampleViewport(width, height))
+
+        counts.clear()
+        root.style.layout(ExampleViewport(width, height))
+        assert _snapshot(root) == _snapshot(fresh)
+
+        if i >= 3:
+            # Every size has been seen before, so nothing is recomputed.
+            assert counts == {}
+
+
+def test_cache_invalidated_by_change(monkeypatch):
+    """A change in a subtree invalidates cached layouts of the subtree's ancestors."""
+    root = _flex_tree()
+    root.style.layout(ExampleViewport(640, 480))
+    root.style.layout(ExampleViewport(800, 600))
+
+    # Change the size of the title, then revisit a previously seen size.
+    title = root.children[1].children[0].children[0]
+    title.intrinsic.width = at_least(120)
+
+    root.style.layout(ExampleViewport(640, 480))
+
+    fresh = _flex_tree()
+    fresh.children[1].children[0].children[0].intrinsic.width = at_least(120)
+    fresh.style.layout(ExampleViewport(640, 480))
+    assert _snapshot(root) == _snapshot(fresh)
+
+
+def test_cache_size(monkeypatch):
+    """The number of cached layouts for each box is bounded."""
+    root = _flex_tree()
+    monkeypatch.setattr(Pack.Box, "LAYOUT_CACHE_SIZE", 3)
+    counts = _layout_counter(monkeypatch)
+
+    for width in range(100, 600, 100):
+        root.style.layout(ExampleViewport(width, 480))
+    assert len(root.layout._layout_cache) == 3
+
+    # The most recent sizes are reused...
+    counts.clear()
+    root.style.layout(ExampleViewport(400, 480))
+    assert counts == {}
+
+    # ... but older sizes have been evicted, and must be recomputed.
+    root.style.layout(ExampleViewport(100, 480))
+    assert counts["app"] == 1
+
+    fresh = _flex_tree()
+    fresh.style.layout(ExampleViewport(100, 480))
+    assert _snapshot(root) == _snapshot(fresh)
+
+
+def test_child_cache_evicted(monkeypatch):
+    """If a descendant's cached layout has been evicted, the layout is recomputed,
+    and no part of the subtree is restored from the cache."""
+    root = _flex_tree()
+    header = root.children[1].children[0]
+    root.style.layout(ExampleViewport(640, 480))
+    root_key = root.layout._layout_key
+    header_key = header.layout._layout_key
+    root.style.layout(ExampleViewport(800, 600))
+    current_key = root.layout._layout_key
+
+    # Evict the header's layout for 640x480. The sidebar, which is laid out before
+    # the header, still has a cached layout.
+    del header.layout._layout_cache[header_key]
+
+    restored = {}
+    original = Pack.Box._apply_cached
+
+    def _apply_cached(self, layout_key):
+        restored[self.node.name] = layout_key
+        return original(self, layout_key)
+
+    monkeypatch.setattr(Pack.Box, "_apply_cached", _apply_cached)
+    counts = _layout_counter(monkeypatch)
+
+    assert not root.layout._restore_layout(root_key)
+    # Nothing was restored; the tree still has the layout for 800x600.
+    assert restored == {}
+    assert root.layout._layout_key == current_key
+
+    root.style.layout(ExampleViewport(640, 480))
+    assert counts["app"] == 1
+    assert counts["header"] == 1
+
+    fresh = _flex_tree()
+    fresh.style.layout(ExampleViewport(640, 480))
+    assert _snapshot(root) == _snapshot(fresh)
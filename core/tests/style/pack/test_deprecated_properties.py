@@ -144,6 +144,17 @@ def test_alignment_align_items_invalid(direction, alignment, get_fn):
     assert get_fn(style, "align_items") is None
 
 
+def test_alignment_copy():
+    """A copy of a style with a deprecated alignment has the same alignment."""
+    with pytest.warns(DeprecationWarning):
+        style = Pack(direction=COLUMN, alignment=RIGHT)
+    dup = style.copy()
+
+    assert dup.align_items == END
+    with pytest.warns(DeprecationWarning):
+        assert dup.alignment == RIGHT
+
+
 def test_bogus_property_name():
     """Invalid property name in brackets should be an error.
 
@@ -87,6 +87,33 @@ def test_set_bounds(widget, child, grandchild):
     assert_action_performed_with(grandchild, "set bounds", x=1, y=2, width=3, height=4)
 
 
+def test_set_bounds_unchanged(widget, child, grandchild):
+    """Bounds are only passed to widgets whose layout box has changed."""
+    widget.applicator.set_bounds()
+    EventLog.reset()
+
+    # Move the grandchild; nothing else changes.
+    grandchild.layout.content_width = 50
+    widget.applicator.set_bounds()
+
+    assert_action_not_performed(widget, "set bounds")
+    assert_action_not_performed(child, "set bounds")
+    assert_action_performed_with(grandchild, "set bounds", x=0, y=0, width=50, height=0)
+
+
+def test_reset_bounds(widget, child, grandchild):
+    """Once bounds have been reset, they are re-applied even if unchanged."""
+    widget.applicator.set_bounds()
+    EventLog.reset()
+
+    child.applicator.reset_bounds()
+    widget.applicator.set_bounds()
+
+    assert_action_not_performed(widget, "set bounds")
+    assert_action_performed_with(child, "set bounds", x=0, y=0, width=0, height=0)
+    assert_action_performed_with(grandchild, "set bounds", x=0, y=0, width=0, height=0)
+
+
 def test_text_align(widget):
     """Text alignment can be set on a widget."""
     widget.applicator.set_text_align(RIGHT)
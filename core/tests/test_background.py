@@ -0,0 +1,265 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+import toga
+from toga.handlers import BackgroundResult, wrapped_handler
+from toga_dummy.utils import assert_action_performed
+
+
+def thread_name(*args, **kwargs):
+    return threading.current_thread().name, args, kwargs
+
+
+@toga.background
+def process_id(*args, **kwargs):
+    return os.getpid(), args, kwargs
+
+
+@pytest.fixture
+def blocked():
+    """An event that blocks a function running in the background until it is set."""
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+def test_no_app(monkeypatch):
+    """A function can't be run in the background without an app."""
+    monkeypatch.setattr(toga.App, "app", None)
+
+    with pytest.raises(
+        RuntimeError,
+        match=r"An app must be created before a function can be run.",
+    ):
+        toga.run_in_executor(thread_name)
+
+
+async def test_run_in_executor(app):
+    """A function can be run in the app's executor."""
+    result = toga.run_in_executor(thread_name, 1, 2)
+
+    assert isinstance(result, BackgroundResult)
+    name, args, kwargs = await result
+    assert name.startswith("toga-background")
+    assert args == (1, 2)
+    assert kwargs == {}
+
+
+async def test_run_in_executor_error(app):
+    """An error raised by the function is raised when the result is awaited."""
+
+    def fail():
+        raise ValueError("Problem in background")
+
+    with pytest.raises(ValueError, match=r"Problem in background"):
+        await toga.run_in_executor(fail)
+
+
+async def test_owner(app):
+    """A widget in an open window receives the result."""
+    box = toga.Box()
+    window = toga.Window(content=box)
+
+    result = toga.run_in_executor(thread_name, owner=box)
+    assert window._background_futures == {result.future}
+
+    assert (await result)[1] == ()
+    assert window._background_futures == set()
+
+
+async def test_owner_window_closed(app, blocked):
+    """If the owner's window is closed, the result is discarded."""
+    box = toga.Box()
+    window = toga.Window(content=box)
+
+    result = toga.run_in_executor(blocked.wait, owner=box)
+    window.close()
+    blocked.set()
+
+    with pytest.raises(asyncio.CancelledError):
+        await result
+    assert window._background_futures == set()
+
+
+@pytest.mark.parametrize("window_owner", [False, True])
+async def test_owner_closed_before_delivery(app, blocked, window_owner):
+    """If the window has been closed when the result is delivered, it is
+    discarded."""
+    box = toga.Box()
+    window = toga.Window(content=box)
+
+    result = toga.run_in_executor(blocked.wait, owner=window if window_owner else box)
+    # Closing the window without cancelling the result.
+    window._background_futures.clear()
+    window.close()
+    blocked.set()
+
+    with pytest.raises(asyncio.CancelledError):
+        await result
+
+
+async def test_owner_removed(app, blocked):
+    """If the owner is removed from its window, the result is discarded."""
+    box = toga.Box()
+    window = toga.Window(content=box)
+
+    result = toga.run_in_executor(blocked.wait, owner=box)
+    window.content = toga.Box()
+    blocked.set()
+
+    with pytest.raises(asyncio.CancelledError):
+        await result
+
+
+async def test_no_window(app):
+    """An owner that isn't in a window always receives the result."""
+    assert (await toga.run_in_executor(thread_name, 3, owner=toga.Box()))[1] == (3,)
+    assert (await toga.run_in_executor(thread_name, 4, owner=app))[1] == (4,)
+
+
+async def test_cancel(app, blocked):
+    """A function that hasn't started running can be cancelled."""
+    app.executor = ThreadPoolExecutor(max_workers=1)
+    running = toga.run_in_executor(blocked.wait)
+    waiting = toga.run_in_executor(thread_name)
+
+    assert waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    assert waiting._executor_future.cancelled()
+
+    blocked.set()
+    assert await running
+    # A result that has been delivered can't be cancelled.
+    assert not running.cancel()
+
+
+async def test_exit(app, blocked):
+    """When the app exits, functions that haven't started running are cancelled."""
+    app.executor = ThreadPoolExecutor(max_workers=1)
+    running = toga.run_in_executor(blocked.wait)
+    waiting = toga.run_in_executor(thread_name)
+
+    app.exit()
+    assert_action_performed(app, "exit")
+
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    blocked.set()
+    assert await running
+    assert app._executor is None
+
+
+async def test_loop_closed(app, blocked):
+    """If the event loop has been closed, the result is not delivered."""
+    result = toga.run_in_executor(blocked.wait)
+    loop = asyncio.new_event_loop()
+    loop.close()
+    result._loop = loop
+
+    # Wait for the function (and the delivery of its result) to complete.
+    blocked.set()
+    app.executor.shutdown(wait=True)
+
+    assert not result.future.done()
+    result.cancel()
+
+
+def test_executor(app):
+    """The app has a default executor, which can be replaced."""
+    executor = app.executor
+    assert isinstance(executor, ThreadPoolExecutor)
+    assert executor._max_workers == toga.App.BACKGROUND_THREADS
+    assert app.executor is executor
+
+    # Assigning the same executor has no effect.
+    app.executor = executor
+    assert not executor._shutdown
+
+    # Replacing the executor shuts down the previous executor.
+    other = Mock()
+    app.executor = other
+    assert app.executor is other
+    assert executor._shutdown
+
+    # Restoring the default shuts down the replacement.
+    app.executor = None
+    other.shutdown.assert_called_once_with(wait=False)
+    assert isinstance(app.executor, ThreadPoolExecutor)
+    assert app.executor is not executor
+
+
+async def test_background(app):
+    """A synchronous handler can be run in the background."""
+    cleanup = Mock()
+    button = toga.Button()
+    toga.Window(content=button)
+
+    handler = toga.background(thread_name)
+    assert handler.__wrapped__ is thread_name
+
+    wrapped = wrapped_handler(button, handler, cleanup=cleanup)
+    name, args, kwargs = await wrapped("arg1", kwarg1=3)
+
+    assert name.startswith("toga-background")
+    # The button owns the handler, but isn't passed to it.
+    assert args == ("arg1",)
+    assert kwargs == {"kwarg1": 3}
+    cleanup.assert_called_once_with(button, (name, args, kwargs), "arg1", kwarg1=3)
+
+
+async def test_background_process_pool(app):
+    """A handler can be run in the background in another process."""
+    app.executor = ProcessPoolExecutor(max_workers=1)
+    try:
+        button = toga.Button()
+        window = toga.Window(content=button)
+
+        wrapped = wrapped_handler(button, process_id)
+        task = wrapped("arg1", kwarg1=3)
+        await asyncio.sleep(0)
+        assert len(window._background_futures) == 1
+
+        pid, args, kwargs = await task
+        assert pid != os.getpid()
+        assert args == ("arg1",)
+        assert kwargs == {"kwarg1": 3}
+    finally:
+        app.executor = None
+
+
+async def test_background_owner(app, blocked):
+    """A handler in the background is owned by the widget that invokes it."""
+    cleanup = Mock()
+    button = toga.Button()
+    window = toga.Window(content=button)
+
+    wrapped = wrapped_handler(button, toga.background(blocked.wait), cleanup=cleanup)
+    task = wrapped()
+    await asyncio.sleep(0)
+    assert len(window._background_futures) == 1
+
+    window.close()
+    blocked.set()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    cleanup.assert_not_called()
+
+
+def test_background_async():
+    """An asynchronous handler can't be run in the background."""
+
+    async def handler(widget):
+        pass
+
+    with pytest.raises(
+        TypeError,
+        match=r"Asynchronous handlers can't be run in the background.",
+    ):
+        toga.background(handler)
@@ -17,7 +17,11 @@ from toga.fonts import (
     SMALL_CAPS,
     SYSTEM,
     SYSTEM_DEFAULT_FONT_SIZE,
+    FontCache,
+    FontCacheStats,
+    UnknownFontError,
 )
+from toga_dummy.fonts import Font as DummyFont
 
 
 @pytest.fixture
@@ -223,3 +227,114 @@ def test_register_font_variant(app, path, registered):
         Path(_REGISTERED_FONT_CACHE[("Custom Font", BOLD, NORMAL, NORMAL)]).resolve()
         == registered.resolve()
     )
+
+
+def test_cached_font():
+    """A font is only loaded once."""
+    font1 = toga.Font(SERIF, 12)
+    font2 = toga.Font(SERIF, 12)
+    font3 = toga.Font(SERIF, 13)
+
+    assert font2._impl is font1._impl
+    assert font3._impl is not font1._impl
+    assert toga.Font.cache.stats == FontCacheStats(
+        hits=1, misses=2, evictions=0, entries=2, unknown=0
+    )
+
+
+def test_cached_unknown_font(monkeypatch):
+    """A font that doesn't exist is only looked for once."""
+    lookups = []
+    original = DummyFont.load_arbitrary_system_font
+
+    def load_arbitrary_system_font(self):
+        lookups.append(self.interface.family)
+        original(self)
+
+    monkeypatch.setattr(
+        DummyFont, "load_arbitrary_system_font", load_arbitrary_system_font
+    )
+
+    for _ in range(2):
+        with pytest.raises(UnknownFontError, match=r"Unknown font 'Bogus Font 12pt'"):
+            toga.Font("Bogus Font", 12)
+
+    assert lookups == ["Bogus Font"]
+    assert toga.Font.cache.stats == FontCacheStats(
+        hits=1, misses=1, evictions=0, entries=1, unknown=1
+    )
+
+
+def test_register_forgets_unknown_fonts(app):
+    """Registering a font forgets the fonts that are known not to exist."""
+    toga.Font(SERIF, 12)
+    with pytest.raises(UnknownFontError):
+        toga.Font("Bogus Font", 12)
+
+    toga.Font.register("Bogus Font", "path/to/bogus.ttf")
+    assert toga.Font.cache.stats.entries == 1
+    assert toga.Font.cache.stats.unknown == 0
+
+
+def test_cache_eviction():
+    """The least recently used fonts are evicted to stay within the limit."""
+    cache = FontCache(max_entries=2)
+    assert cache.max_entries == 2
+    font1, font2, font3 = (toga.Font(SERIF, size) for size in [10, 11, 12])
+
+    cache[font1] = "impl 1"
+    cache[font2] = "impl 2"
+    assert cache._lookup(font1) == "impl 1"
+    cache[font3] = "impl 3"
+
+    assert list(cache) == [font1, font3]
+    assert len(cache) == 2
+    assert cache[font3] == "impl 3"
+    with pytest.raises(KeyError):
+        cache._lookup(font2)
+    assert cache.stats == FontCacheStats(
+        hits=1, misses=1, evictions=1, entries=2, unknown=0
+    )
+
+    # Reducing the limit evicts entries.
+    cache.max_entries = 1
+    assert list(cache) == [font3]
+
+    del cache[font3]
+    assert len(cache) == 0
+
+    cache[font1] = "impl 1"
+    cache.clear()
+    assert cache.stats == FontCacheStats(
+        hits=0, misses=0, evictions=0, entries=0, unknown=0
+    )
+
+
+def test_cache_invalid_limit():
+    """The cache must be able to hold at least one font."""
+    with pytest.raises(ValueError, match=r"max_entries must be at least 1"):
+        FontCache(max_entries=0)
+
+
+@pytest.mark.parametrize(
+    "families, sizes, expected",
+    [
+        (SERIF, 12, [(SERIF, 12)]),
+        (
+            [SERIF, "Bogus Font"],
+            [12, 14],
+            [(SERIF, 12), (SERIF, 14), ("Bogus Font", 12), ("Bogus Font", 14)],
+        ),
+        ([MONOSPACE], SYSTEM_DEFAULT_FONT_SIZE, [(MONOSPACE, -1)]),
+    ],
+)
+def test_preload(families, sizes, expected):
+    """Fonts can be loaded in advance."""
+    toga.Font.cache.preload(families, sizes, weight=BOLD)
+
+    assert [(font.family, font.size) for font in toga.Font.cache] == expected
+    assert all(font.weight == BOLD for font in toga.Font.cache)
+
+    # The fonts are now cached.
+    toga.Font(expected[0][0], expected[0][1], weight=BOLD)
+    assert toga.Font.cache.stats.hits == 1
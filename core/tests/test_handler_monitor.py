@@ -0,0 +1,225 @@
+import asyncio
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from toga.handlers import (
+    HandlerMonitor,
+    HandlerStats,
+    simple_handler,
+    wrapped_handler,
+)
+
+
+@pytest.fixture
+def monitor(app):
+    monitor = HandlerMonitor(slow_threshold=0.05, lag_interval=0.01)
+    app.monitor = monitor
+    yield monitor
+    app.monitor = None
+
+
+def sync_handler(obj, *args, **kwargs):
+    return 42
+
+
+async def async_handler(obj, *args, **kwargs):
+    await asyncio.sleep(0.01)
+    return 42
+
+
+@pytest.mark.parametrize(
+    "slow_threshold, lag_interval, max_samples, message",
+    [
+        (-1, 0.1, 10, r"slow_threshold can't be negative"),
+        (0.1, 0, 10, r"lag_interval must be positive"),
+        (0.1, 0.1, 0, r"max_samples must be at least 1"),
+    ],
+)
+def test_invalid_arguments(slow_threshold, lag_interval, max_samples, message):
+    """A monitor must have valid settings."""
+    with pytest.raises(ValueError, match=message):
+        HandlerMonitor(slow_threshold, lag_interval, max_samples)
+
+
+def test_unmonitored(app):
+    """Handlers are not timed unless a monitor is assigned."""
+    monitor = HandlerMonitor()
+    assert app.monitor is None
+
+    wrapped_handler(Mock(), sync_handler)()
+
+    assert monitor.handlers == {}
+    assert monitor.running_tasks == 0
+    assert HandlerMonitor._active is None
+
+
+def test_assign(app, monitor):
+    """A monitor can be assigned to and removed from an app."""
+    assert app.monitor is monitor
+    assert HandlerMonitor._active is monitor
+    assert monitor._timer is not None
+
+    # Replacing the monitor stops the old one.
+    other = HandlerMonitor()
+    app.monitor = other
+    assert HandlerMonitor._active is other
+    assert monitor._timer is None
+    assert monitor.running_tasks == 0
+
+    app.monitor = None
+    assert app.monitor is None
+    assert HandlerMonitor._active is None
+    assert other._timer is None
+
+    # Stopping a monitor that isn't active doesn't affect the active monitor.
+    app.monitor = monitor
+    other._stop()
+    assert HandlerMonitor._active is monitor
+
+
+def test_sync_handler(monitor, capsys):
+    """The time taken by a synchronous handler is recorded."""
+    obj = Mock()
+    wrapped = wrapped_handler(obj, sync_handler)
+
+    assert wrapped() == 42
+    assert wrapped() == 42
+
+    stats = monitor.handlers[f"{__name__}.sync_handler"]
+    assert stats.calls == 2
+    assert 0 <= stats.max <= stats.total
+    assert stats.mean == pytest.approx(stats.total / 2)
+    assert stats.slow == 0
+    assert capsys.readouterr().err == ""
+
+
+def test_slow_handler(monitor, capsys):
+    """A warning is printed when a handler blocks the event loop for too long."""
+    monitor.slow_threshold = 0
+
+    wrapped_handler(Mock(), sync_handler)()
+
+    assert monitor.handlers[f"{__name__}.sync_handler"].slow == 1
+    assert (
+        f"Slow handler: {__name__}.sync_handler blocked the event loop for"
+        in capsys.readouterr().err
+    )
+
+
+def test_handler_error(monitor, capsys):
+    """A handler that raises an error is still timed."""
+
+    def handler(obj):
+        raise RuntimeError("Problem in handler")
+
+    wrapped_handler(Mock(), handler)()
+
+    assert monitor.handlers[f"{__name__}.{handler.__qualname__}"].calls == 1
+    assert "Error in handler: Problem in handler" in capsys.readouterr().err
+
+
+def test_handler_names(monitor):
+    """Handlers are named after the function or object that is invoked."""
+
+    class Callable:
+        def __call__(self, obj):
+            pass
+
+    def method(*args):
+        pass
+
+    wrapped_handler(Mock(), Callable())()
+    wrapped_handler(Mock(), simple_handler(method, 1))()
+    # A builtin method doesn't have a module.
+    wrapped_handler(Mock(), [].append)()
+
+    assert set(monitor.handlers) == {
+        f"{__name__}.{Callable.__qualname__}",
+        f"{__name__}.{method.__qualname__}",
+        "list.append",
+    }
+
+
+async def test_async_handler(monitor, capsys):
+    """The time taken by an asynchronous handler is recorded, but it isn't slow."""
+    monitor.slow_threshold = 0
+
+    assert await wrapped_handler(Mock(), async_handler)() == 42
+
+    stats = monitor.handlers[f"{__name__}.async_handler"]
+    assert stats.calls == 1
+    assert stats.max >= 0.01
+    assert stats.slow == 0
+    assert capsys.readouterr().err == ""
+
+
+async def test_lag(monitor):
+    """The lag of the event loop is measured periodically."""
+    await asyncio.sleep(0.05)
+
+    assert len(monitor.lag) >= 1
+    assert all(lag >= 0 for lag in monitor.lag)
+
+
+async def test_max_samples(app):
+    """Only the most recent lag measurements are retained."""
+    monitor = HandlerMonitor(lag_interval=0.001, max_samples=3)
+    app.monitor = monitor
+    try:
+        await asyncio.sleep(0.05)
+    finally:
+        app.monitor = None
+
+    assert len(monitor.lag) == 3
+
+
+async def test_tasks(app, monitor):
+    """The number of running tasks is recorded."""
+    created = monitor.created_tasks
+    tasks = [asyncio.ensure_future(asyncio.sleep(0.01)) for _ in range(3)]
+    assert monitor.running_tasks >= 3
+    assert monitor.peak_running_tasks >= 3
+    assert monitor.created_tasks == created + 3
+
+    await asyncio.gather(*tasks)
+    assert monitor.running_tasks < 3
+    assert monitor.peak_running_tasks >= 3
+
+
+async def test_export(app, monitor):
+    """Everything that has been recorded can be exported as JSON."""
+    wrapped_handler(Mock(), sync_handler)()
+    await asyncio.sleep(0.02)
+
+    summary = json.loads(monitor.as_json())
+    assert summary == monitor.as_dict()
+    assert summary["handlers"][f"{__name__}.sync_handler"]["calls"] == 1
+    lag = summary["lag"]
+    assert lag["samples"] == len(monitor.lag) >= 1
+    assert lag["max"] == max(monitor.lag)
+    assert lag["last"] == monitor.lag[-1]
+    assert lag["mean"] == pytest.approx(sum(monitor.lag) / len(monitor.lag))
+    assert summary["tasks"] == {
+        "running": monitor.running_tasks,
+        "peak": monitor.peak_running_tasks,
+        "created": monitor.created_tasks,
+    }
+
+    # Everything that has been recorded can be discarded.
+    monitor.reset()
+    assert monitor.as_dict() == {
+        "handlers": {},
+        "lag": {"samples": 0, "mean": 0.0, "max": 0.0, "last": 0.0},
+        "tasks": {
+            "running": monitor.running_tasks,
+            "peak": monitor.running_tasks,
+            "created": 0,
+        },
+    }
+
+
+def test_stats():
+    """The average time of a handler that hasn't been called is 0."""
+    assert HandlerStats().mean == 0.0
@@ -1,12 +1,14 @@
 import asyncio
 import gc
-from unittest.mock import Mock
+from unittest.mock import Mock, call
 
 import pytest
 
+import toga
 from toga.handlers import (
     AsyncResult,
     NativeHandler,
+    RateLimitedHandler,
     WeakrefCallable,
     simple_handler,
     wrapped_handler,
@@ -862,3 +864,209 @@ def test_weakref_none_result_when_function_gone():
     # Calling the wrapper should not raise an error
     result = wrc(10)
     assert result is None
+
+
+class Clock:
+    """Control the time of the running event loop."""
+
+    def __init__(self, monkeypatch):
+        self.loop = asyncio.get_running_loop()
+        self.now = self.loop.time()
+        monkeypatch.setattr(self.loop, "time", lambda: self.now)
+
+    async def advance(self, seconds):
+        """Advance the time, and run any callbacks that are now due."""
+        self.now += seconds
+        # The first iteration of the event loop makes the callbacks ready; the second
+        # runs them.
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+async def clock(monkeypatch):
+    return Clock(monkeypatch)
+
+
+async def test_throttle(clock):
+    """A throttled handler is invoked at most once per interval."""
+    obj = Mock()
+    handler = Mock(return_value=42)
+
+    throttled = toga.throttle(handler, hz=10)
+    assert isinstance(throttled, RateLimitedHandler)
+    wrapped = wrapped_handler(obj, throttled)
+    assert wrapped._raw is throttled
+
+    # The first event invokes the handler immediately.
+    assert wrapped(1) == 42
+    handler.assert_called_once_with(obj, 1)
+    handler.reset_mock()
+
+    # Events within the interval are collapsed into one invocation at the end of
+    # the interval, with the most recent arguments.
+    assert wrapped(2) is None
+    await clock.advance(0.05)
+    assert wrapped(3, kwarg=4) is None
+    handler.assert_not_called()
+
+    await clock.advance(0.05)
+    handler.assert_called_once_with(obj, 3, kwarg=4)
+    handler.reset_mock()
+
+    # The deferred invocation starts a new interval.
+    wrapped(5)
+    await clock.advance(0.05)
+    handler.assert_not_called()
+    await clock.advance(0.05)
+    handler.assert_called_once_with(obj, 5)
+    handler.reset_mock()
+
+    # Once the interval has passed, an event invokes the handler immediately.
+    await clock.advance(0.1)
+    wrapped(6)
+    handler.assert_called_once_with(obj, 6)
+
+
+async def test_debounce(clock):
+    """A debounced handler is invoked once events stop."""
+    obj = Mock()
+    handler = Mock()
+    wrapped = wrapped_handler(obj, toga.debounce(handler, delay=0.1))
+
+    assert wrapped(1) is None
+    await clock.advance(0.05)
+    # Each event restarts the delay.
+    wrapped(2)
+    await clock.advance(0.05)
+    wrapped(3)
+    await clock.advance(0.05)
+    handler.assert_not_called()
+
+    await clock.advance(0.05)
+    handler.assert_called_once_with(obj, 3)
+
+
+async def test_coalesce(clock):
+    """Events in the same iteration of the event loop invoke a coalesced handler
+    once."""
+    obj = Mock()
+    handler = Mock()
+    wrapped = wrapped_handler(obj, toga.coalesce(handler))
+
+    for i in range(5):
+        assert wrapped(i) is None
+    handler.assert_not_called()
+
+    await clock.advance(0)
+    handler.assert_called_once_with(obj, 4)
+    handler.reset_mock()
+
+    wrapped(5)
+    await clock.advance(0)
+    handler.assert_called_once_with(obj, 5)
+
+
+async def test_rate_limit_independent(clock):
+    """Each assignment of a rate-limited handler is limited independently."""
+    handler = Mock()
+    throttled = toga.throttle(handler)
+    first = wrapped_handler("first", throttled)
+    second = wrapped_handler("second", throttled)
+
+    first()
+    second()
+    assert handler.call_args_list == [call("first"), call("second")]
+
+
+async def test_rate_limit_async(clock):
+    """An asynchronous handler can be rate-limited."""
+    obj = Mock()
+    cleanup = Mock()
+    handler_call = {}
+
+    async def handler(interface, *args, **kwargs):
+        handler_call["args"] = (interface, *args)
+        return 42
+
+    wrapped = wrapped_handler(obj, toga.coalesce(handler), cleanup=cleanup)
+    wrapped(1)
+    wrapped(2)
+    await clock.advance(0)
+    # The handler's task has been created; allow it to run.
+    await asyncio.sleep(0)
+
+    assert handler_call["args"] == (obj, 2)
+    cleanup.assert_called_once_with(obj, 42, 2)
+
+
+async def test_rate_limit_reassigned(app, clock):
+    """A deferred invocation is cancelled if the handler is replaced."""
+    handler = Mock()
+    slider = toga.Slider(min=0, max=100, on_change=toga.debounce(handler, delay=0.1))
+
+    slider.value = 10
+    assert len(slider._pending_invocations) == 1
+    slider.on_change = None
+    assert slider._pending_invocations == set()
+
+    await clock.advance(0.1)
+    handler.assert_not_called()
+
+
+@pytest.mark.parametrize("close", [False, True])
+async def test_rate_limit_removed(app, clock, close):
+    """A deferred invocation is cancelled if the widget is removed from its window,
+    or the window is closed."""
+    handler = Mock()
+    slider = toga.Slider(min=0, max=100, on_change=toga.throttle(handler, hz=10))
+    window = toga.Window(content=slider)
+
+    slider.value = 10
+    handler.assert_called_once_with(slider)
+    handler.reset_mock()
+    slider.value = 20
+    assert len(slider._pending_invocations) == 1
+
+    if close:
+        window.close()
+    else:
+        window.content = toga.Box()
+    assert slider._pending_invocations == set()
+    await clock.advance(0.1)
+    handler.assert_not_called()
+
+    # Once the interval has passed, the handler is invoked immediately again.
+    slider.value = 30
+    handler.assert_called_once_with(slider)
+
+
+async def test_rate_limit_window_closed(app, clock):
+    """A deferred invocation of a window's handler is cancelled if the window is
+    closed."""
+    handler = Mock()
+    window = toga.Window(on_resize=toga.debounce(handler, delay=0.1))
+
+    window.on_resize()
+    assert len(window._pending_invocations) == 1
+    window.close()
+    assert window._pending_invocations == set()
+
+    await clock.advance(0.1)
+    handler.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "limit, message",
+    [
+        (lambda handler: toga.throttle(handler, hz=0), r"hz must be positive"),
+        (
+            lambda handler: toga.debounce(handler, delay=-1),
+            r"delay can't be negative",
+        ),
+    ],
+)
+def test_rate_limit_invalid(limit, message):
+    """Rate limits must be valid."""
+    with pytest.raises(ValueError, match=message):
+        limit(Mock())
@@ -289,3 +289,15 @@ def test_cached_icons(app, name, path):
 
     # Retrieve the icon a second time; The same instance is returned.
     assert id(getattr(toga.Icon, name)) == id(icon)
+
+
+def test_icon_implementations(app):
+    """Each icon has its own implementation, even if it has the same files as
+    another icon."""
+    icon1 = toga.Icon("resources/sample")
+    icon2 = toga.Icon("resources/sample")
+
+    assert icon2._impl is not icon1._impl
+    assert icon1._impl.interface is icon1
+    assert icon2._impl.interface is icon2
+    assert icon1 == icon2
@@ -1,3 +1,6 @@
+import os
+import sys
+import threading
 from pathlib import Path
 from re import escape
 
@@ -5,12 +8,15 @@ import PIL.Image
 import pytest
 
 import toga
+from toga.images import ImageCache, ImageCacheStats
+from toga.plugins.image_formats import PILConverter
+from toga_dummy.images import Image as DummyImage
 from toga_dummy.plugins.image_formats import (
     CustomImage,
     CustomImageSubclass,
     DisabledImageConverter,
 )
-from toga_dummy.utils import assert_action_performed_with
+from toga_dummy.utils import EventLog, assert_action_performed_with
 
 RELATIVE_FILE_PATH = Path("resources/sample.png")
 ABSOLUTE_FILE_PATH = Path(__file__).parent / "resources/sample.png"
@@ -130,6 +136,133 @@ def test_create_from_bad_bytes():
         toga.Image(b"not an image")
 
 
+def test_cached_file(app, tmp_path):
+    """Images loaded from the same file share a native image, until the file is
+    modified."""
+    path = tmp_path / "image.png"
+    path.write_bytes(BYTES)
+
+    image1 = toga.Image(path)
+    image2 = toga.Image(path)
+    assert image2._impl.native is image1._impl.native
+    assert image2.path == path
+    assert_action_performed_with(image2, "load image from raw")
+    assert toga.Image.cache.stats == ImageCacheStats(
+        hits=1, misses=1, evictions=0, entries=1, size=144 * 72 * 4
+    )
+
+    # Once the file has been modified, it is read again.
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    image3 = toga.Image(path)
+    assert image3._impl.native is not image1._impl.native
+    assert_action_performed_with(image3, "load image data", data=BYTES)
+
+
+def test_cached_bytes():
+    """Images created from identical data share a native image."""
+    image1 = toga.Image(BYTES)
+    image2 = toga.Image(bytearray(BYTES))
+    assert image2._impl.native is image1._impl.native
+    assert toga.Image.cache.stats.hits == 1
+
+    # An image that can't be loaded isn't cached.
+    for _ in range(2):
+        with pytest.raises(ValueError, match=r"Unable to load image from data"):
+            toga.Image(b"not an image")
+    assert toga.Image.cache.stats.entries == 1
+
+
+def test_cache_disabled(monkeypatch):
+    """If the cache has no budget, every image is decoded."""
+    monkeypatch.setattr(toga.Image, "cache", ImageCache(max_size=0))
+    image1 = toga.Image(BYTES)
+    image2 = toga.Image(BYTES)
+
+    assert image2._impl.native is not image1._impl.native
+    assert toga.Image.cache.stats == ImageCacheStats(
+        hits=0, misses=2, evictions=0, entries=0, size=0
+    )
+
+
+def test_cache_eviction():
+    """The least recently used entries are evicted to stay within the budget."""
+    cache = ImageCache(max_size=100)
+    assert cache.max_size == 100
+
+    cache._put("a", 1, 40)
+    cache._put("b", 2, 40)
+    assert cache._get("a") == 1
+    # Adding c exceeds the budget; b is the least recently used.
+    cache._put("c", 3, 40)
+    assert cache._get("b") is None
+    assert cache._get("a") == 1
+    assert cache._get("c") == 3
+    assert cache.stats == ImageCacheStats(
+        hits=3, misses=1, evictions=1, entries=2, size=80
+    )
+
+    # Replacing an entry doesn't count its old size.
+    cache._put("c", 4, 60)
+    assert cache._get("c") == 4
+    assert cache.stats.size == 100
+    assert cache.stats.evictions == 1
+
+    # An entry that is larger than the budget isn't cached.
+    cache._put("d", 5, 101)
+    assert cache._get("d") is None
+    assert cache.stats.entries == 2
+
+    # Reducing the budget evicts entries.
+    cache.max_size = 70
+    assert cache._get("a") is None
+    assert cache._get("c") == 4
+    assert cache.stats.evictions == 2
+
+    cache.clear()
+    assert cache.stats == ImageCacheStats(
+        hits=0, misses=0, evictions=0, entries=0, size=0
+    )
+
+
+def test_cache_invalid_budget():
+    """The budget of the cache can't be negative."""
+    with pytest.raises(ValueError, match=r"max_size cannot be negative"):
+        ImageCache(max_size=-1)
+
+
+async def test_load_async(app, monkeypatch):
+    """An image can be loaded in a background thread."""
+    threads = []
+    original_init = DummyImage.__init__
+
+    def init(self, *args, **kwargs):
+        threads.append(threading.current_thread().name)
+        original_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(DummyImage, "__init__", init)
+
+    image = await toga.Image.load_async(ABSOLUTE_FILE_PATH)
+    assert type(image) is toga.Image
+    assert image.path == ABSOLUTE_FILE_PATH
+    assert image.size == (144, 72)
+    assert threads[0].startswith("toga-image")
+
+    # Subclasses are loaded as the subclass; the decoder threads are reused.
+    image = await ImageSubclass.load_async(BYTES)
+    assert type(image) is ImageSubclass
+    assert threads[1].startswith("toga-image")
+
+
+async def test_load_async_failure(app):
+    """Errors loading an image in the background are raised to the caller."""
+    with pytest.raises(FileNotFoundError):
+        await toga.Image.load_async("does/not/exist.png")
+
+    with pytest.raises(ValueError, match=r"Unable to load image from data"):
+        await toga.Image.load_async(b"not an image")
+
+
 def test_create_from_raw():
     """An image can be created from a raw data source."""
     orig = toga.Image(BYTES)
@@ -180,15 +313,20 @@ def test_invalid_input_format():
         toga.Image(42)
 
 
-def test_create_from_pil(app):
+@pytest.mark.parametrize("mode", ["RGBA", "RGB"])
+def test_create_from_pil(app, mode):
     """An image can be created from a PIL image."""
     with PIL.Image.open(ABSOLUTE_FILE_PATH) as pil_image:
-        pil_image.load()
+        pil_image = pil_image.convert(mode)
     toga_image = toga.Image(pil_image)
 
     assert isinstance(toga_image, toga.Image)
     assert toga_image.size == (144, 72)
 
+    # The pixels are passed to the backend without being encoded.
+    assert_action_performed_with(toga_image, "load image from raw")
+    assert toga_image.as_buffer().tobytes() == pil_image.convert("RGBA").tobytes()
+
 
 def test_create_from_toga_image(app):
     """An image can be created from another Toga image."""
@@ -198,9 +336,13 @@ def test_create_from_toga_image(app):
     assert isinstance(toga_image_2, toga.Image)
     assert toga_image_2.size == (144, 72)
 
+    # The native image is shared, rather than being encoded and decoded.
+    assert_action_performed_with(toga_image_2, "load image from raw")
+    assert toga_image_2._impl.native is toga_image._impl.native
+
 
 @pytest.mark.parametrize("kwargs", [{"data": BYTES}, {"path": ABSOLUTE_FILE_PATH}])
-def test_deprecated_arguments(kwargs):
+def test_deprecated_arguments(app, kwargs):
     with pytest.deprecated_call():
         toga.Image(**kwargs)
 
@@ -250,6 +392,129 @@ def test_data(app):
     assert from_data.height == image.height
 
 
+# A 3x2 image, with a different color in each pixel.
+RGBA_PIXELS = bytes(
+    [
+        *(255, 0, 0, 255),
+        *(0, 255, 0, 255),
+        *(0, 0, 255, 255),
+        *(255, 255, 0, 128),
+        *(0, 255, 255, 64),
+        *(0, 0, 0, 0),
+    ]
+)
+BGRA_PIXELS = bytes(
+    [
+        *(0, 0, 255, 255),
+        *(0, 255, 0, 255),
+        *(255, 0, 0, 255),
+        *(0, 255, 255, 128),
+        *(255, 255, 0, 64),
+        *(0, 0, 0, 0),
+    ]
+)
+
+
+@pytest.mark.parametrize(
+    "format, buffer",
+    [
+        ("RGBA", RGBA_PIXELS),
+        ("RGBA", bytearray(RGBA_PIXELS)),
+        ("BGRA", BGRA_PIXELS),
+        # A buffer with a shape
+        ("RGBA", memoryview(RGBA_PIXELS).cast("B", (2, 3, 4))),
+        # A buffer that isn't contiguous
+        ("RGBA", memoryview(bytes(b for p in RGBA_PIXELS for b in (p, 0)))[::2]),
+    ],
+)
+def test_from_buffer(format, buffer):
+    """An image can be created from raw pixel data."""
+    image = toga.Image.from_buffer(3, 2, format, buffer)
+
+    assert image.size == (3, 2)
+    assert_action_performed_with(image, "load image from raw")
+
+    pixels = image.as_buffer()
+    assert pixels.shape == (2, 3, 4)
+    assert pixels.readonly
+    assert pixels.tobytes() == RGBA_PIXELS
+    assert image.as_buffer("BGRA").tobytes() == BGRA_PIXELS
+
+
+def test_from_buffer_subclass():
+    """An image subclass can be created from raw pixel data."""
+    image = ImageSubclass.from_buffer(3, 2, "RGBA", RGBA_PIXELS)
+    assert isinstance(image, ImageSubclass)
+
+
+def test_from_buffer_encoded(monkeypatch):
+    """If the backend can't use raw pixel data, the pixels are encoded as a PNG."""
+    monkeypatch.delattr(DummyImage, "raw_from_pixels")
+    image = toga.Image.from_buffer(3, 2, "BGRA", BGRA_PIXELS)
+
+    [action] = EventLog.performed_actions(image, "load image data")
+    assert action["data"].startswith(b"\x89PNG\r\n\x1a\n")
+    assert image.as_buffer().tobytes() == RGBA_PIXELS
+
+
+@pytest.mark.parametrize(
+    "width, height, format, buffer, message",
+    [
+        (3, 2, "RGB", RGBA_PIXELS, r"Unsupported pixel format 'RGB'"),
+        (
+            3,
+            3,
+            "RGBA",
+            RGBA_PIXELS,
+            r"Buffer of 24 bytes doesn't contain the pixels of a 3x3 image",
+        ),
+        (
+            0,
+            0,
+            "RGBA",
+            b"",
+            r"Buffer of 0 bytes doesn't contain the pixels of a 0x0 image",
+        ),
+    ],
+)
+def test_from_buffer_invalid(width, height, format, buffer, message):
+    """The pixel data for an image must be valid."""
+    with pytest.raises(ValueError, match=message):
+        toga.Image.from_buffer(width, height, format, buffer)
+
+
+def test_as_buffer(app):
+    """The pixels of an image can be retrieved."""
+    image = toga.Image(ABSOLUTE_FILE_PATH)
+
+    pixels = image.as_buffer()
+    assert_action_performed_with(image, "get pixels")
+    assert pixels.shape == (72, 144, 4)
+    with PIL.Image.open(ABSOLUTE_FILE_PATH) as pil_image:
+        assert pixels.tobytes() == pil_image.convert("RGBA").tobytes()
+
+    with pytest.raises(ValueError, match=r"Unsupported pixel format 'ARGB'"):
+        image.as_buffer("ARGB")
+
+
+def test_as_buffer_decoded(monkeypatch):
+    """If the backend can't provide the pixels of an image, the image data is
+    decoded."""
+    monkeypatch.delattr(DummyImage, "get_pixels")
+    image = toga.Image.from_buffer(3, 2, "RGBA", RGBA_PIXELS)
+
+    assert image.as_buffer().tobytes() == RGBA_PIXELS
+    assert image.as_buffer("BGRA").tobytes() == BGRA_PIXELS
+
+    # Decoding the image data requires Pillow.
+    monkeypatch.setitem(sys.modules, "PIL.Image", None)
+    with pytest.raises(
+        RuntimeError,
+        match=r"Pillow must be installed to retrieve the pixels of an image",
+    ):
+        image.as_buffer()
+
+
 def test_image_save(tmp_path):
     """An image can be saved."""
     save_path = tmp_path / "save.png"
@@ -289,6 +554,27 @@ def test_as_format_pil(app):
     assert isinstance(pil_image, PIL.Image.Image)
     assert pil_image.size == (144, 72)
 
+    # The image is created from the pixels, rather than from encoded data.
+    assert_action_performed_with(toga_image, "get pixels")
+    assert pil_image.mode == "RGBA"
+    assert pil_image.tobytes() == toga_image.as_buffer().tobytes()
+
+
+def test_pil_converter_to_data():
+    """The PIL converter can encode an image."""
+    with PIL.Image.open(ABSOLUTE_FILE_PATH) as pil_image:
+        data = PILConverter.convert_from_format(pil_image)
+
+    assert data.startswith(b"\x89PNG")
+    assert toga.Image(data).size == (144, 72)
+
+
+def test_pil_converter_from_data():
+    """The PIL converter can create an image from encoded data."""
+    pil_image = PILConverter.convert_to_format(BYTES, PIL.Image.Image)
+    assert isinstance(pil_image, PIL.Image.Image)
+    assert pil_image.size == (144, 72)
+
 
 @pytest.mark.parametrize("ImageClass", [CustomImage, CustomImageSubclass])
 def test_create_from_custom_class(app, ImageClass):
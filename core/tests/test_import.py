@@ -1,7 +1,25 @@
+import importlib.util
+import shutil
+import subprocess
 import sys
+from importlib.metadata import version
+from pathlib import Path
 
 import pytest
 
+import toga
+from toga._imports import toga_core_imports
+
+
+@pytest.fixture(scope="module")
+def generate_imports():
+    """The script that generates the table of names imported on demand."""
+    path = Path(__file__).parents[2] / "tools/generate_imports.py"
+    spec = importlib.util.spec_from_file_location("generate_imports", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
 
 def test_lazy_succeed(monkeypatch):
     """Submodules are imported on demand."""
@@ -36,3 +54,56 @@ def test_lazy_fail():
         AttributeError, match="module 'toga' has no attribute 'nonexistent'"
     ):
         _ = toga.nonexistent
+
+
+def test_import_table(generate_imports):
+    """The table of names imported on demand matches the type stub."""
+    stub = Path(toga.__file__).with_suffix(".pyi")
+    assert toga_core_imports == generate_imports.read_stub(stub), (
+        "toga/_imports.py is out of date; regenerate it by running "
+        "`python tools/generate_imports.py`"
+    )
+    assert toga.__all__ == list(toga_core_imports)
+
+
+def test_generate_import_table(generate_imports, tmp_path):
+    """The table of names imported on demand can be regenerated from the stub."""
+    source = Path(toga.__file__).parent
+    shutil.copy(source / "_imports.py", tmp_path / "_imports.py")
+    (tmp_path / "__init__.pyi").write_text(
+        "from toga.app import App as App\nfrom toga.widgets.box import Box as Box\n",
+        encoding="utf-8",
+    )
+
+    generate_imports.generate(tmp_path / "_imports.py")
+    content = (tmp_path / "_imports.py").read_text(encoding="utf-8")
+    assert (
+        "toga_core_imports = {\n"
+        '    "App": "toga.app",\n'
+        '    "Box": "toga.widgets.box",\n'
+        "}\n"
+    ) in content
+    assert '"Button"' not in content
+    # The rest of the file is preserved.
+    assert content.startswith("# This file is generated from __init__.pyi")
+    assert content.endswith('"Box": "toga.widgets.box",\n}\n')
+
+
+def test_version():
+    """The version of toga can be retrieved."""
+    assert toga.__version__ == version("toga-core")
+
+
+def test_import_metadata():
+    """Importing toga doesn't read any package metadata."""
+    # Depending on how packages have been installed, the metadata module may already
+    # have been imported when Python starts; toga mustn't be the reason it's imported.
+    check = "print('importlib.metadata' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", f"import sys; {check}; import toga; {check}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    before, after = result.stdout.split()
+    assert after == before
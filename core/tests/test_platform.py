@@ -1,3 +1,6 @@
+import importlib.metadata
+import json
+import os
 import sys
 from importlib.metadata import EntryPoint
 from unittest.mock import Mock
@@ -8,6 +11,7 @@ import toga.platform
 from toga.platform import (
     Factory,
     current_platform,
+    entry_points,
     get_backend,
     get_current_platform,
     get_factory,
@@ -421,3 +425,123 @@ def test_get_platform_factory_deprecated():
     ):
         factory = _get_platform_factory()
         assert factory.__name__ == "toga_dummy.factory"
+
+
+@pytest.fixture
+def entry_point_cache(monkeypatch, tmp_path):
+    """Entry points are found from scratch, and cached in a temporary file."""
+    path = tmp_path / "entry-points.json"
+    monkeypatch.setenv("TOGA_ENTRY_POINT_CACHE", str(path))
+    toga.platform._entry_point_index.cache_clear()
+    yield path
+    toga.platform._entry_point_index.cache_clear()
+
+
+def _reload_index():
+    toga.platform._entry_point_index.cache_clear()
+    return toga.platform._entry_point_index()
+
+
+def test_entry_points():
+    """The entry points in a Toga group can be found and loaded."""
+    found = {
+        entry_point.name: entry_point
+        for entry_point in entry_points(group="toga_core.backend.toga_dummy")
+    }
+    assert found["App"].group == "toga_core.backend.toga_dummy"
+    assert found["App"].value == "toga_dummy.app:App"
+    assert found["App"].load() is App
+
+    assert entry_points(group="toga.nonexistent") == []
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("toga_dummy", "toga_dummy"),
+        ("toga_dummy.app:App", App),
+        ("os:path.join", os.path.join),
+        ("toga_dummy.app : App [extra]", App),
+    ],
+)
+def test_entry_point_load(value, expected):
+    """An entry point can refer to a module, or an attribute of a module."""
+    entry_point = toga.platform._EntryPoint("name", value, "toga.group")
+    if isinstance(expected, str):
+        assert entry_point.load() is sys.modules[expected]
+    else:
+        assert entry_point.load() is expected
+
+
+def test_entry_point_cache(monkeypatch, entry_point_cache):
+    """Entry points can be cached between launches."""
+    index = toga.platform._entry_point_index()
+    assert ["dummy", "toga_dummy"] in index["toga.backends"]
+    assert "console_scripts" not in index
+
+    # The cache file has been written.
+    cached = json.loads(entry_point_cache.read_text(encoding="utf-8"))
+    assert cached["groups"] == index
+
+    # The next launch uses the cache, without reading any package metadata.
+    def no_metadata():
+        raise AssertionError("Package metadata shouldn't be read")
+
+    with monkeypatch.context() as m:
+        m.setattr(importlib.metadata, "entry_points", no_metadata)
+        assert _reload_index() == index
+
+        [backend] = toga.platform.find_backends()
+        assert backend.value == "toga_dummy"
+
+    # If the cache is corrupted, the entry points are found again.
+    entry_point_cache.write_text("{not json", encoding="utf-8")
+    assert _reload_index() == index
+    assert json.loads(entry_point_cache.read_text(encoding="utf-8"))["groups"] == index
+
+
+def test_entry_point_no_cache(monkeypatch):
+    """If there is no entry point cache, the Python path isn't examined."""
+    monkeypatch.delenv("TOGA_ENTRY_POINT_CACHE", raising=False)
+
+    def no_fingerprint():
+        raise AssertionError("The Python path shouldn't be examined")
+
+    monkeypatch.setattr(toga.platform, "_path_fingerprint", no_fingerprint)
+    try:
+        index = _reload_index()
+        assert ["dummy", "toga_dummy"] in index["toga.backends"]
+    finally:
+        toga.platform._entry_point_index.cache_clear()
+
+
+def test_entry_point_cache_invalidated(monkeypatch, entry_point_cache):
+    """The entry point cache is ignored if the installed packages have changed."""
+    toga.platform._entry_point_index()
+
+    # Record a cached value that no longer matches the installed packages.
+    cached = json.loads(entry_point_cache.read_text(encoding="utf-8"))
+    cached["groups"] = {"toga.backends": [["stale", "stale_module"]]}
+    entry_point_cache.write_text(json.dumps(cached), encoding="utf-8")
+    assert _reload_index() == cached["groups"]
+
+    # Adding a directory to the Python path changes the fingerprint.
+    monkeypatch.syspath_prepend(entry_point_cache.parent / "nonexistent")
+    index = _reload_index()
+    assert ["dummy", "toga_dummy"] in index["toga.backends"]
+    assert [entry_point.value for entry_point in toga.platform.find_backends()] == [
+        "toga_dummy"
+    ]
+
+
+def test_entry_point_cache_unwritable(monkeypatch, tmp_path):
+    """If the cache can't be written, entry points are still found."""
+    monkeypatch.setenv(
+        "TOGA_ENTRY_POINT_CACHE", str(tmp_path / "nonexistent" / "cache.json")
+    )
+    try:
+        index = _reload_index()
+        assert ["dummy", "toga_dummy"] in index["toga.backends"]
+        assert not (tmp_path / "nonexistent").exists()
+    finally:
+        toga.platform._entry_point_index.cache_clear()
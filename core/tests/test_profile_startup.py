@@ -0,0 +1,246 @@
+import importlib
+import json
+import sys
+
+import pytest
+
+import toga
+from toga import profile_startup
+from toga.platform import Factory
+from toga.widgets.base import Widget
+
+APP_MODULE = """
+import toga
+
+
+class StartupApp(toga.App):
+    def startup(self):
+        self.main_window = toga.MainWindow()
+        self.main_window.content = toga.Box(children=[toga.Label("Hello")])
+        self.main_window.show()
+
+
+def main():
+    return StartupApp("Startup App", "org.beeware.toga.startup-app")
+
+
+def broken():
+    raise RuntimeError("Can't start")
+"""
+
+
+@pytest.fixture
+def app_module(monkeypatch, tmp_path):
+    """A module containing an app, which can be imported by name."""
+    (tmp_path / "startup_app.py").write_text(APP_MODULE, encoding="utf-8")
+    # The app is found in the current directory, in the new interpreter as well.
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(tmp_path)
+    monkeypatch.delitem(sys.modules, "startup_app", raising=False)
+    return "startup_app"
+
+
+def test_parse_import_times():
+    """The output of `python -X importtime` can be parsed."""
+    output = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+Some other output
+import time:      1500 |       2500 | toga
+import time:       900 |        900 | toga
+"""
+    assert profile_startup._parse_import_times(output) == {
+        "_io": (0.00012, 0.00012),
+        "toga": (0.0015, 0.0025),
+    }
+
+
+async def test_instrument(app_module):
+    """The phases of an app's startup are timed."""
+    originals = [
+        Factory.__getattr__,
+        toga.App._startup,
+        toga.App._create_standard_commands,
+        Widget._refresh_layout,
+    ]
+
+    phases = {}
+    with profile_startup._instrument(phases):
+        app = profile_startup._load_app(f"{app_module}:main")
+        # A second layout of the main window isn't timed, and neither is the layout
+        # of any other window.
+        app.main_window.content.refresh()
+        app.main_window.flush_layout()
+        window = toga.Window(content=toga.Box())
+        window.flush_layout()
+
+    assert isinstance(app, toga.App)
+    assert set(phases) >= {
+        "App._startup",
+        "App._create_standard_commands",
+        "layout",
+    }
+    assert all(elapsed >= 0 for elapsed in phases.values())
+
+    # The original methods have been restored.
+    assert originals == [
+        Factory.__getattr__,
+        toga.App._startup,
+        toga.App._create_standard_commands,
+        Widget._refresh_layout,
+    ]
+
+
+async def test_run(app_module, tmp_path):
+    """An app can be started, and the phases of its startup recorded."""
+    startup = toga.App._startup
+    import_module = importlib.import_module
+    output = tmp_path / "phases.json"
+
+    profile_startup._run(app_module, str(output))
+
+    phases = json.loads(output.read_text(encoding="utf-8"))
+    assert {"App._startup", "layout", "total"} <= set(phases)
+    assert phases["total"] >= phases["App._startup"]
+    assert toga.App._startup is startup
+    assert importlib.import_module is import_module
+
+
+def test_profile(app_module):
+    """An app can be profiled in a new interpreter."""
+    phases, imports = profile_startup.profile(app_module)
+
+    assert {"App._startup", "layout", "total"} <= set(phases)
+    # The dummy backend was used.
+    assert "Factory.App" in phases
+    assert "toga_dummy.app" in imports
+    own, cumulative = imports["toga.app"]
+    assert 0 < own <= cumulative
+
+
+def test_profile_failure(app_module):
+    """If the app can't be started, an error is raised."""
+    with pytest.raises(
+        RuntimeError,
+        match=r"(?s)Unable to start 'startup_app:broken':.*Can't start",
+    ):
+        profile_startup.profile(f"{app_module}:broken")
+
+
+def test_check_budgets():
+    """Phases and imports can be compared with a budget."""
+    phases = {"App._startup": 0.2, "layout": 0.01}
+    imports = {"toga.app": (0.001, 0.1)}
+
+    assert profile_startup._check_budgets(
+        phases,
+        imports,
+        {
+            "App._startup": 0.1,
+            "layout": 0.1,
+            "toga.app": 0.05,
+            "toga.window": 0.001,
+        },
+    ) == (
+        [
+            "App._startup took 200.0 ms (budget 100.0 ms)",
+            "toga.app took 100.0 ms (budget 50.0 ms)",
+        ],
+        ["toga.window"],
+    )
+
+
+@pytest.fixture
+def profiled(monkeypatch):
+    """Profiling returns a known set of timings."""
+
+    def profile(target, backend):
+        assert target == "myapp.app"
+        assert backend == "toga_gtk"
+        return (
+            {"App._startup": 0.2, "layout": 0.01},
+            {"toga": (0.002, 0.003), "toga.app": (0.001, 0.1)},
+        )
+
+    monkeypatch.setattr(profile_startup, "profile", profile)
+
+
+def test_main(profiled, capsys):
+    """The startup of an app can be reported."""
+    assert (
+        profile_startup.main(
+            [
+                "myapp.app",
+                "--backend",
+                "toga_gtk",
+                "--top",
+                "1",
+                "--budget",
+                "layout=100",
+            ]
+        )
+        == 0
+    )
+
+    output = capsys.readouterr().out
+    assert output.index("App._startup") < output.index("layout")
+    assert "Slowest imports (of 2):" in output
+    assert "toga.app" in output
+    # Only the slowest module is reported.
+    assert "  toga " not in output
+    assert "Budgets exceeded" not in output
+    assert "unknown" not in output
+
+
+def test_main_budget_exceeded(profiled, capsys):
+    """If a budget is exceeded, the command fails."""
+    assert (
+        profile_startup.main(
+            [
+                "myapp.app",
+                "--backend=toga_gtk",
+                "--budget",
+                "toga.app=50",
+                "--budget",
+                "layout=50",
+            ]
+        )
+        == 1
+    )
+
+    output = capsys.readouterr().out
+    assert "Budgets exceeded:\n  toga.app took 100.0 ms (budget 50.0 ms)\n" in output
+    assert "unknown" not in output
+
+
+def test_main_unknown_budget(profiled, capsys):
+    """If a budget names a phase or module that wasn't recorded, the command
+    fails."""
+    assert (
+        profile_startup.main(
+            [
+                "myapp.app",
+                "--backend=toga_gtk",
+                "--budget",
+                "toga.appp=1000",
+                "--budget",
+                "layout=50",
+            ]
+        )
+        == 1
+    )
+
+    output = capsys.readouterr().out
+    assert "Budgets exceeded" not in output
+    assert "Budgets for unknown phases or modules:\n  toga.appp\n" in output
+
+
+@pytest.mark.parametrize("budget", ["layout", "=10", "layout=fast"])
+def test_main_invalid_budget(budget, capsys):
+    """Budgets must be of the form NAME=MILLISECONDS."""
+    with pytest.raises(SystemExit):
+        profile_startup.main(["myapp.app", "--budget", budget])
+
+    assert (
+        f"invalid budget '{budget}'; use NAME=MILLISECONDS" in capsys.readouterr().err
+    )
@@ -9,7 +9,12 @@ from toga.constants import FillRule
 from toga.fonts import SYSTEM, SYSTEM_DEFAULT_FONT_SIZE, Font
 from toga.widgets.canvas import ClosePath, Fill, State, Stroke
 from toga.widgets.canvas.canvas import drawing_context_property
-from toga_dummy.utils import assert_action_not_performed, assert_action_performed
+from toga_dummy.utils import (
+    EventLog,
+    assert_action_not_performed,
+    assert_action_performed,
+    assert_action_performed_with,
+)
 
 BLACK_COLOR = Color.parse(BLACK)
 CORNFLOWERBLUE_COLOR = Color.parse(CORNFLOWERBLUE)
@@ -95,6 +100,40 @@ def test_redraw(widget):
     ]
 
 
+def test_redraw_changed_states(widget):
+    """The canvas can be redrawn after specific states have changed."""
+    with widget.state(cached=True) as cached:
+        rect = widget.rect(0, 0, 10, 10)
+
+    EventLog.reset()
+    rect.x = 5
+    widget.redraw(changed=[cached])
+
+    # The state has been invalidated, and only its region is redrawn.
+    assert_action_performed_with(widget, "redraw states", states=[cached])
+    assert_action_performed_with(widget, "render cached state", state=cached)
+    assert_action_not_performed(widget, "redraw")
+    assert widget._impl.draw_instructions[2] == (
+        "rect",
+        {"x": 5, "y": 0, "width": 10, "height": 10},
+    )
+
+
+def test_redraw_changed_states_unsupported(widget, monkeypatch):
+    """If the backend can't redraw part of the canvas, the whole canvas is redrawn."""
+    monkeypatch.setattr(widget._impl, "SUPPORTS_PARTIAL_REDRAW", False)
+    with widget.state(cached=True) as cached:
+        rect = widget.rect(0, 0, 10, 10)
+
+    EventLog.reset()
+    rect.x = 5
+    widget.redraw(changed=(state for state in [cached]))
+
+    assert_action_performed(widget, "redraw")
+    assert_action_not_performed(widget, "redraw states")
+    assert_action_performed_with(widget, "render cached state", state=cached)
+
+
 def test_closed_path(widget):
     """A canvas can produce a ClosedPath sub-state."""
     with widget.close_path() as closed_path:
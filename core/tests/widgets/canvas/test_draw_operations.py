@@ -1,14 +1,16 @@
+from array import array
 from pathlib import Path
 
 import pytest
 
 from toga.colors import REBECCAPURPLE, rgb
-from toga.constants import Baseline, FillRule
+from toga.constants import Baseline, FillRule, PathCode
 from toga.fonts import SYSTEM, SYSTEM_DEFAULT_FONT_SIZE, Font
 from toga.images import Image
 from toga.widgets.canvas import Arc, Ellipse, Fill, Stroke
 from toga.widgets.canvas.drawingaction import color_property
 from toga_dummy.utils import assert_action_not_performed, assert_action_performed
+from toga_dummy.widgets.canvas import Context
 
 REBECCA_PURPLE_COLOR = rgb(102, 51, 153)
 ABSOLUTE_FILE_PATH = Path(__file__).parent.parent.parent / "resources/toga.png"
@@ -430,6 +432,192 @@ def test_quadratic_curve_to(widget):
     assert draw_op.y == 40
 
 
+@pytest.mark.parametrize(
+    "points",
+    [
+        # A list of (x, y) pairs
+        [(10, 20), (30, 40), (50, 60)],
+        # A flat list of coordinates
+        [10, 20, 30, 40, 50, 60],
+        # A buffer of integers, which must be copied
+        array("i", [10, 20, 30, 40, 50, 60]),
+        # A 2D buffer of floats
+        memoryview(array("d", [10, 20, 30, 40, 50, 60])).cast("B").cast("d", (3, 2)),
+        # A 2D buffer of integers
+        memoryview(array("i", [10, 20, 30, 40, 50, 60])).cast("B").cast("i", (3, 2)),
+    ],
+)
+def test_polyline(widget, points):
+    """A polyline operation can be added."""
+    draw_op = widget.polyline(points)
+
+    assert_action_performed(widget, "redraw")
+    assert repr(draw_op) == "Polyline(points=<3 points>)"
+
+    # The first and last instructions save/restore the root state, and can be ignored.
+    assert widget._impl.draw_instructions[1:-1] == [
+        ("polyline", {"points": [10.0, 20.0, 30.0, 40.0, 50.0, 60.0]}),
+    ]
+
+    # The points can be retrieved as a flat sequence of floats.
+    assert draw_op.points.format == "d"
+    assert draw_op.points.tolist() == [10.0, 20.0, 30.0, 40.0, 50.0, 60.0]
+
+
+def test_polyline_shared_buffer(widget):
+    """A buffer of floats is used by a polyline without being copied."""
+    points = array("d", [10, 20, 30, 40])
+    draw_op = widget.polyline(points)
+
+    # Modify the points in place, and redraw
+    points[3] = 99
+    widget.redraw()
+
+    assert widget._impl.draw_instructions[1:-1] == [
+        ("polyline", {"points": [10.0, 20.0, 30.0, 99.0]}),
+    ]
+
+    # The points can be replaced.
+    draw_op.points = [(1, 2)]
+    widget.redraw()
+    assert widget._impl.draw_instructions[1:-1] == [
+        ("polyline", {"points": [1.0, 2.0]}),
+    ]
+
+
+def test_polyline_empty(widget):
+    """An empty polyline doesn't draw anything."""
+    draw_op = widget.polyline([])
+
+    assert repr(draw_op) == "Polyline(points=<0 points>)"
+    assert widget._impl.draw_instructions[1:-1] == []
+
+
+def test_polyline_invalid(widget):
+    """A polyline must have an x and y coordinate for each point."""
+    with pytest.raises(
+        ValueError,
+        match=r"Points must have both an x and a y coordinate",
+    ):
+        widget.polyline([10, 20, 30])
+
+
+def test_polyline_fallback(widget, monkeypatch):
+    """A polyline can be drawn on a backend that doesn't support polylines."""
+    monkeypatch.delattr(Context, "polyline")
+    widget.polyline([(10, 20), (30, 40), (50, 60)])
+
+    assert widget._impl.draw_instructions[1:-1] == [
+        ("move to", {"x": 10.0, "y": 20.0}),
+        ("line to", {"x": 30.0, "y": 40.0}),
+        ("line to", {"x": 50.0, "y": 60.0}),
+    ]
+
+
+PATH_CODES = [
+    PathCode.MOVE_TO,
+    PathCode.LINE_TO,
+    PathCode.QUADRATIC_CURVE_TO,
+    PathCode.BEZIER_CURVE_TO,
+    PathCode.CLOSE_PATH,
+]
+PATH_COORDS = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14]
+
+
+@pytest.mark.parametrize(
+    "codes, coords",
+    [
+        (PATH_CODES, PATH_COORDS),
+        (bytes(PATH_CODES), array("d", PATH_COORDS)),
+        (array("B", PATH_CODES), [(1, 2), (3, 4, 5, 6), (7, 8, 9, 10, 11, 12), 13, 14]),
+    ],
+)
+def test_path(widget, codes, coords):
+    """A path operation can be added."""
+    draw_op = widget.path(codes, coords)
+
+    assert_action_performed(widget, "redraw")
+    assert repr(draw_op) == "Path(codes=<5 codes>)"
+
+    # The first and last instructions save/restore the root state, and can be ignored.
+    assert widget._impl.draw_instructions[1:-1] == [
+        (
+            "path",
+            {"codes": [0, 1, 2, 3, 4], "coords": [float(c) for c in PATH_COORDS]},
+        ),
+    ]
+
+    # All the attributes can be retrieved.
+    assert draw_op.codes.tolist() == [0, 1, 2, 3, 4]
+    assert draw_op.coords.tolist() == [float(c) for c in PATH_COORDS]
+
+
+def test_set_path(widget):
+    """The operations in a path can be replaced."""
+    draw_op = widget.path([PathCode.MOVE_TO], [10, 20])
+
+    draw_op.set_path([PathCode.MOVE_TO, PathCode.LINE_TO], [1, 2, 3, 4])
+    widget.redraw()
+
+    assert repr(draw_op) == "Path(codes=<2 codes>)"
+    assert widget._impl.draw_instructions[1:-1] == [
+        ("path", {"codes": [0, 1], "coords": [1.0, 2.0, 3.0, 4.0]}),
+    ]
+
+
+@pytest.mark.parametrize(
+    "codes, coords, message",
+    [
+        ([PathCode.MOVE_TO, 42], [1, 2], r"Path codes must be PathCode values"),
+        (
+            [PathCode.MOVE_TO, PathCode.LINE_TO],
+            [1, 2, 3],
+            r"The number of coordinates doesn't match the path codes",
+        ),
+        (
+            [PathCode.CLOSE_PATH],
+            [1, 2],
+            r"The number of coordinates doesn't match the path codes",
+        ),
+    ],
+)
+def test_path_invalid(widget, codes, coords, message):
+    """The codes and coordinates of a path must be consistent."""
+    with pytest.raises(ValueError, match=message):
+        widget.path(codes, coords)
+
+    # An invalid replacement leaves the path unchanged.
+    draw_op = widget.path([PathCode.MOVE_TO], [10, 20])
+    with pytest.raises(ValueError, match=message):
+        draw_op.set_path(codes, coords)
+    assert draw_op.codes.tolist() == [0]
+    assert draw_op.coords.tolist() == [10.0, 20.0]
+
+
+def test_path_fallback(widget, monkeypatch):
+    """A path can be drawn on a backend that doesn't support paths."""
+    monkeypatch.delattr(Context, "path")
+    widget.path(PATH_CODES, PATH_COORDS)
+
+    assert widget._impl.draw_instructions[1:-1] == [
+        ("move to", {"x": 1.0, "y": 2.0}),
+        ("line to", {"x": 3.0, "y": 4.0}),
+        ("quadratic curve to", {"cpx": 5.0, "cpy": 6.0, "x": 7.0, "y": 8.0}),
+        (
+            "bezier curve to",
+            {
+                "cp1x": 9.0,
+                "cp1y": 10.0,
+                "cp2x": 11.0,
+                "cp2y": 12.0,
+                "x": 13.0,
+                "y": 14.0,
+            },
+        ),
+        "close path",
+    ]
+
+
 @pytest.mark.parametrize(
     "kwargs, args_repr, draw_kwargs",
     [
@@ -0,0 +1,98 @@
+from io import BytesIO
+
+import PIL.Image
+import pytest
+
+import toga
+from toga.widgets.canvas import OffscreenCanvas, State
+from toga_dummy.utils import assert_action_performed, assert_action_performed_with
+
+
+@pytest.fixture
+def canvas():
+    return OffscreenCanvas(40, 30)
+
+
+def test_create(canvas):
+    """An offscreen canvas can be created."""
+    assert_action_performed_with(canvas, "create OffscreenCanvas", width=40, height=30)
+    assert canvas.width == 40
+    assert canvas.height == 30
+    assert isinstance(canvas.root_state, State)
+
+
+@pytest.mark.parametrize(
+    "width, height, message",
+    [
+        (0, 30, r"width must be a positive integer"),
+        (40, -1, r"height must be a positive integer"),
+        (40.5, 30, r"width must be a positive integer"),
+    ],
+)
+def test_invalid_size(width, height, message):
+    """An offscreen canvas must have a positive integer size."""
+    with pytest.raises(ValueError, match=message):
+        OffscreenCanvas(width, height)
+
+
+def test_draw(canvas):
+    """Drawing actions are rendered when the content is requested."""
+    canvas.fill_style = "red"
+    with canvas.fill():
+        canvas.rect(0, 0, 10, 10)
+    canvas.save()
+    canvas.line_width = 2
+    canvas.restore()
+
+    # Nothing has been drawn yet.
+    assert canvas._impl.draw_instructions == []
+    assert canvas.fill_style == toga.colors.rgb(255, 0, 0)
+    assert canvas.line_width == 1.0
+
+    data = canvas.as_rgba()
+    assert_action_performed(canvas, "get RGBA data")
+    assert canvas._impl.draw_instructions[1:-1] == [
+        ("set fill style", toga.colors.rgb(255, 0, 0)),
+        "save",
+        "begin path",
+        ("rect", {"x": 0, "y": 0, "width": 10, "height": 10}),
+        ("fill", {"fill_rule": toga.constants.FillRule.NONZERO}),
+        "restore",
+        "save",
+        ("set line width", 2),
+        "restore",
+    ]
+
+    # 4 bytes per pixel, with no padding between rows.
+    assert data == bytes(40 * 30 * 4)
+
+
+def test_as_png(canvas):
+    """An offscreen canvas can be rendered as a PNG."""
+    data = canvas.as_png()
+
+    assert_action_performed(canvas, "get image data")
+    image = PIL.Image.open(BytesIO(data))
+    assert image.format == "PNG"
+    assert image.size == (40, 30)
+
+
+@pytest.mark.parametrize("format", [toga.Image, PIL.Image.Image])
+def test_as_image(canvas, format):
+    """An offscreen canvas can be rendered as an image."""
+    image = canvas.as_image(format=format)
+
+    assert isinstance(image, format)
+    assert image.size == (40, 30)
+
+
+def test_existing_state(widget):
+    """The content of an existing canvas can be rendered offscreen."""
+    widget.rect(0, 0, 10, 10)
+    canvas = OffscreenCanvas(40, 30, root_state=widget.root_state)
+
+    assert canvas.root_state is widget.root_state
+    canvas.as_png()
+    assert canvas._impl.draw_instructions[1:-1] == [
+        ("rect", {"x": 0, "y": 0, "width": 10, "height": 10}),
+    ]
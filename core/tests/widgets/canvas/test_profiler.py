@@ -0,0 +1,183 @@
+from itertools import count
+from threading import Thread
+
+import pytest
+
+from toga.widgets.canvas import (
+    CanvasProfiler,
+    DrawingAction,
+    FrameProfile,
+    OffscreenCanvas,
+)
+
+
+@pytest.fixture(autouse=True)
+def clock(monkeypatch):
+    """Every reading of the clock advances it by one second."""
+    monkeypatch.setattr("toga.widgets.canvas.profiler.perf_counter", count().__next__)
+
+
+@pytest.fixture
+def drawing(widget):
+    widget.rect(0, 0, 10, 10)
+    with widget.fill():
+        widget.arc(5, 5, 3)
+    return widget
+
+
+def test_not_profiled(drawing):
+    """By default, a canvas isn't profiled."""
+    assert drawing.profiler is None
+    drawing.redraw()
+    assert CanvasProfiler._active() is None
+
+
+def test_profile(drawing):
+    """The time taken to draw each action can be recorded."""
+    drawing.profiler = profiler = CanvasProfiler()
+    assert drawing.profiler is profiler
+    assert profiler.frames == []
+    assert profiler.last_frame is None
+
+    drawing.redraw()
+
+    # The time spent drawing a state doesn't include the actions it contains.
+    frame = FrameProfile(
+        duration=7,
+        counts={"State": 1, "Rect": 1, "Fill": 1, "Arc": 1},
+        times={"State": 3, "Rect": 1, "Fill": 2, "Arc": 1},
+        stacks={
+            ("State",): 3,
+            ("State", "Rect"): 1,
+            ("State", "Fill"): 2,
+            ("State", "Fill", "Arc"): 1,
+        },
+    )
+    assert profiler.frames == [frame]
+    assert profiler.last_frame == frame
+
+    # The drawing itself isn't affected.
+    assert drawing._impl.draw_instructions[1] == (
+        "rect",
+        {"x": 0, "y": 0, "width": 10, "height": 10},
+    )
+
+
+def test_flame_graph(drawing):
+    """The time spent in each part of the state tree can be described as folded
+    stacks."""
+    drawing.profiler = profiler = CanvasProfiler()
+    assert profiler.flame_graph() == ""
+
+    drawing.redraw()
+    drawing.redraw()
+
+    # Times are in microseconds, summed over all the frames.
+    assert profiler.flame_graph() == (
+        "State 6000000\nState;Fill 4000000\nState;Fill;Arc 2000000\nState;Rect 2000000"
+    )
+
+
+def test_max_frames(drawing):
+    """Only the most recent frames are retained."""
+    drawing.profiler = profiler = CanvasProfiler(max_frames=2)
+
+    # Adding an action redraws the canvas.
+    drawing.rect(20, 20, 10, 10)
+    drawing.redraw()
+    drawing.redraw()
+
+    assert len(profiler.frames) == 2
+    assert profiler.frames[-1] is profiler.last_frame
+
+    profiler.reset()
+    assert profiler.frames == []
+    assert profiler.last_frame is None
+
+
+def test_invalid_max_frames():
+    """At least one frame must be retained."""
+    with pytest.raises(ValueError, match=r"max_frames must be at least 1"):
+        CanvasProfiler(max_frames=0)
+
+
+def test_stop_profiling(drawing):
+    """Profiling can be stopped."""
+    drawing.profiler = profiler = CanvasProfiler()
+    drawing.redraw()
+
+    drawing.profiler = None
+    drawing.redraw()
+
+    assert drawing.profiler is None
+    assert len(profiler.frames) == 1
+
+
+def test_cached_state(widget):
+    """A cached state is only profiled in detail when it is rendered."""
+    with widget.state(cached=True) as state:
+        widget.rect(0, 0, 10, 10)
+    widget.profiler = profiler = CanvasProfiler()
+
+    state.invalidate()
+    widget.redraw()
+    widget.redraw()
+
+    rendered, reused = profiler.frames
+    assert rendered.counts == {"State": 2, "Rect": 1}
+    assert ("State", "State", "Rect") in rendered.stacks
+    assert reused.counts == {"State": 2}
+
+
+class RenderInThread(DrawingAction):
+    """Render an offscreen canvas in another thread while being drawn."""
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+
+    def _draw(self, context):
+        thread = Thread(target=self.canvas.as_rgba)
+        thread.start()
+        thread.join()
+
+
+def test_threads(widget):
+    """Each thread only records frames into the profiler of the canvas it's drawing."""
+    offscreen = OffscreenCanvas(10, 10)
+    offscreen.rect(0, 0, 10, 10)
+    widget.profiler = profiler = CanvasProfiler()
+    widget.root_state.drawing_actions.append(RenderInThread(offscreen))
+
+    # The offscreen canvas isn't profiled, so nothing is recorded for it.
+    widget.redraw()
+    assert profiler.last_frame.counts == {"State": 1, "RenderInThread": 1}
+
+    # A profiled offscreen canvas records into its own profiler.
+    offscreen.root_state._profiler = offscreen_profiler = CanvasProfiler()
+    widget.redraw()
+    assert profiler.last_frame.counts == {"State": 1, "RenderInThread": 1}
+    assert offscreen_profiler.last_frame.counts == {"State": 1, "Rect": 1}
+    assert CanvasProfiler._active() is None
+
+
+class Broken(DrawingAction):
+    def _draw(self, context):
+        raise RuntimeError("Can't draw")
+
+
+def test_failed_drawing(widget):
+    """A frame is still recorded if drawing fails."""
+    widget.profiler = profiler = CanvasProfiler()
+    with widget.state():
+        widget.root_state.drawing_actions[0].drawing_actions.append(Broken())
+
+    with pytest.raises(RuntimeError, match=r"Can't draw"):
+        widget.redraw()
+
+    assert profiler.last_frame.counts == {"State": 1}
+    assert CanvasProfiler._active() is None
+
+    # Profiling continues once the problem has been fixed.
+    widget.root_state.drawing_actions.clear()
+    widget.redraw()
+    assert profiler.last_frame.counts == {"State": 1}
@@ -5,13 +5,19 @@ from toga.constants import FillRule
 from toga.widgets.canvas import (
     ClosePath,
     Fill,
+    MoveTo,
     Rotate,
     Scale,
     State,
     Stroke,
     Translate,
 )
-from toga_dummy.utils import assert_action_performed
+from toga_dummy.utils import (
+    EventLog,
+    assert_action_not_performed,
+    assert_action_performed,
+    assert_action_performed_with,
+)
 
 REBECCA_PURPLE_COLOR = rgb(102, 51, 153)
 BLACK_COLOR = rgb(0, 0, 0)
@@ -396,3 +402,170 @@ def test_enter_state_out_of_order(widget):
 
     with pytest.raises(RuntimeError, match=NON_REENTRANT_MATCH), stroke:
         pass
+
+
+def test_cached_state(widget):
+    """The rendering of a cached state is reused until the state changes."""
+    with widget.state() as uncached:
+        pass
+    with widget.state(cached=True) as cached:
+        rect = widget.rect(0, 0, 10, 10)
+        with widget.state() as nested:
+            widget.line_to(30, 40)
+    widget.fill()
+
+    assert not uncached.cached
+    assert cached.cached
+    assert repr(cached) == "State()"
+
+    def assert_instructions(x, nested_instructions):
+        # The first and last instructions can be ignored; they're the root state
+        assert widget._impl.draw_instructions[1:-1] == [
+            "save",
+            "restore",
+            "save",
+            ("rect", {"x": x, "y": 0, "width": 10, "height": 10}),
+            "save",
+            *nested_instructions,
+            "restore",
+            "restore",
+            "save",
+            ("fill", {"fill_rule": FillRule.NONZERO}),
+            "restore",
+        ]
+
+    line = [("line to", {"x": 30, "y": 40})]
+    assert_instructions(0, line)
+
+    # Redrawing the canvas uses the cached rendering.
+    EventLog.reset()
+    widget.redraw()
+    assert_action_not_performed(widget, "render cached state")
+    assert_instructions(0, line)
+
+    # Modifying an attribute of an action isn't detected...
+    rect.x = 5
+    widget.redraw()
+    assert_action_not_performed(widget, "render cached state")
+    assert_instructions(0, line)
+
+    # ... until the state is invalidated.
+    cached.invalidate()
+    widget.redraw()
+    assert_action_performed_with(widget, "render cached state", state=cached)
+    assert_instructions(5, line)
+
+    # Adding an action to a nested state is detected.
+    EventLog.reset()
+    nested.drawing_actions.append(MoveTo(1, 2))
+    widget.redraw()
+    assert_action_performed_with(widget, "render cached state", state=cached)
+    assert_instructions(5, [*line, ("move to", {"x": 1, "y": 2})])
+
+    # Invalidating a nested state invalidates the cached state that contains it.
+    EventLog.reset()
+    nested.drawing_actions[-1].y = 3
+    nested.invalidate()
+    widget.redraw()
+    assert_action_performed_with(widget, "render cached state", state=cached)
+    assert_instructions(5, [*line, ("move to", {"x": 1, "y": 3})])
+
+
+@pytest.mark.parametrize(
+    "replace",
+    [
+        lambda actions: actions.__setitem__(0, MoveTo(7, 8)),
+        lambda actions: actions.__setitem__(slice(0, 1), [MoveTo(7, 8)]),
+        lambda actions: (actions.pop(), actions.append(MoveTo(7, 8))),
+        lambda actions: (actions.clear(), actions.extend([MoveTo(7, 8)])),
+    ],
+)
+def test_cached_state_replace_action(widget, replace):
+    """Replacing an action in place, without changing the number of actions, is
+    detected."""
+    with widget.state(cached=True) as cached:
+        widget.line_to(30, 40)
+
+    EventLog.reset()
+    replace(cached.drawing_actions)
+    widget.redraw()
+    assert_action_performed_with(widget, "render cached state", state=cached)
+    assert ("move to", {"x": 7, "y": 8}) in widget._impl.draw_instructions
+    assert ("line to", {"x": 30, "y": 40}) not in widget._impl.draw_instructions
+
+
+def test_cached_state_reorder_actions(widget):
+    """Reordering the actions of a cached state is detected."""
+    with widget.state(cached=True) as cached:
+        widget.move_to(1, 2)
+        widget.line_to(30, 40)
+
+    def assert_order(*actions):
+        instructions = [
+            instruction
+            for instruction in widget._impl.draw_instructions
+            if instruction[0] in {"move to", "line to"}
+        ]
+        assert [instruction[0] for instruction in instructions] == list(actions)
+
+    for modify, order in [
+        (lambda actions: actions.reverse(), ["line to", "move to"]),
+        (lambda actions: actions.sort(key=lambda a: a.x), ["move to", "line to"]),
+        (lambda actions: actions.__delitem__(0), ["line to"]),
+        (lambda actions: actions.__iadd__([MoveTo(1, 2)]), ["line to", "move to"]),
+        (lambda actions: actions.__imul__(2), ["line to", "move to"] * 2),
+        (
+            lambda actions: actions.insert(0, MoveTo(1, 2)),
+            ["move to", "line to", "move to", "line to", "move to"],
+        ),
+        (
+            lambda actions: actions.remove(actions[1]),
+            ["move to", "move to", "line to", "move to"],
+        ),
+    ]:
+        EventLog.reset()
+        modify(cached.drawing_actions)
+        widget.redraw()
+        assert_action_performed_with(widget, "render cached state", state=cached)
+        assert_order(*order)
+
+    # The list of actions can be replaced entirely.
+    EventLog.reset()
+    cached.drawing_actions = [MoveTo(1, 2)]
+    widget.redraw()
+    assert_action_performed_with(widget, "render cached state", state=cached)
+    assert_order("move to")
+
+
+def test_nested_cached_states(widget):
+    """A cached state can contain other cached states."""
+    with widget.state(cached=True) as outer:
+        with widget.state(cached=True) as inner:
+            widget.line_to(30, 40)
+        widget.rect(0, 0, 10, 10)
+
+    EventLog.reset()
+    inner.invalidate()
+    widget.redraw()
+    assert [
+        action["state"]
+        for action in EventLog.performed_actions(widget, "render cached state")
+    ] == [outer, inner]
+
+    # The inner state is rendered as part of the outer state; if only the outer
+    # state changes, the inner rendering is reused.
+    EventLog.reset()
+    outer.invalidate()
+    widget.redraw()
+    assert [
+        action["state"]
+        for action in EventLog.performed_actions(widget, "render cached state")
+    ] == [outer]
+    assert widget._impl.draw_instructions[1:-1] == [
+        "save",
+        "save",
+        ("line to", {"x": 30, "y": 40}),
+        "restore",
+        ("rect", {"x": 0, "y": 0, "width": 10, "height": 10}),
+        "restore",
+    ]
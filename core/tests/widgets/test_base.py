@@ -1227,6 +1227,31 @@ def test_refresh_child(widget):
     assert_action_performed(widget, "refresh")
 
 
+def test_refresh_unchanged_bounds(app, widget):
+    """Bounds are only applied to widgets whose layout has changed."""
+    child1 = ExampleLeafWidget(id="child1_id")
+    child2 = ExampleLeafWidget(id="child2_id")
+    widget.add(child1, child2)
+
+    window = toga.Window()
+    window.content = widget
+    assert_action_performed(child1, "set bounds")
+
+    # Refreshing an unchanged layout doesn't apply bounds again.
+    EventLog.reset()
+    widget.refresh()
+    assert_action_not_performed(widget, "set bounds")
+    assert_action_not_performed(child1, "set bounds")
+    assert_action_not_performed(child2, "set bounds")
+
+    # A widget that is re-added to its parent has its bounds re-applied, even if the
+    # layout is unchanged.
+    widget.remove(child2)
+    widget.add(child2)
+    assert_action_performed(child2, "set bounds")
+    assert_action_not_performed(child1, "set bounds")
+
+
 def test_focus(widget):
     """A widget can be given focus."""
     widget.focus()
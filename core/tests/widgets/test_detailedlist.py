@@ -3,7 +3,7 @@ from unittest.mock import Mock
 import pytest
 
 import toga
-from toga.sources import ListSource
+from toga.sources import LazyListSource, ListSource
 from toga_dummy.utils import (
     assert_action_not_performed,
     assert_action_performed,
@@ -278,6 +278,29 @@ def test_refresh(detailedlist, on_refresh_handler):
     )
 
 
+def test_lazy_source():
+    """A detailed list only fetches the rows of a lazy source that are visible."""
+    fetch = Mock(
+        side_effect=lambda start, stop: [(f"Item {i}", "") for i in range(start, stop)]
+    )
+    source = LazyListSource(
+        accessors=["title", "subtitle"],
+        length=lambda: 1_000_000,
+        fetch=fetch,
+        page_size=50,
+    )
+    detailedlist = toga.DetailedList(data=source)
+
+    # Setting the data doesn't fetch any rows.
+    assert_action_performed_with(detailedlist, "change source", source=source)
+    fetch.assert_not_called()
+
+    # Only the pages covering the visible rows are fetched.
+    detailedlist._impl.simulate_scroll(0, 20)
+    assert_action_performed_with(detailedlist, "fetch rows", start=0, stop=20)
+    fetch.assert_called_once_with(0, 50)
+
+
 def test_scroll_to_top(detailedlist):
     """A DetailedList can be scrolled to the top."""
     detailedlist.scroll_to_top()
@@ -1,3 +1,4 @@
+import asyncio
 from pathlib import Path
 from unittest.mock import ANY
 
@@ -117,6 +118,118 @@ def test_set_image(widget):
     assert widget.image == image
 
 
+PLACEHOLDER_PATH = Path(__file__).parent.parent / "resources/sample.png"
+
+
+def test_placeholder_without_loop(app):
+    """If the event loop isn't running, images are loaded synchronously, even if
+    there is a placeholder."""
+    widget = toga.ImageView(image=ABSOLUTE_FILE_PATH, placeholder=PLACEHOLDER_PATH)
+
+    assert isinstance(widget.placeholder, toga.Image)
+    assert widget.placeholder.path == PLACEHOLDER_PATH
+    assert widget.image.path == ABSOLUTE_FILE_PATH
+
+
+async def test_placeholder(app):
+    """If there is a placeholder, images are loaded in the background."""
+    placeholder = toga.Image(PLACEHOLDER_PATH)
+    widget = toga.ImageView(image=ABSOLUTE_FILE_PATH, placeholder=placeholder)
+
+    # The placeholder is displayed while the image is loaded.
+    assert widget.placeholder is placeholder
+    assert widget.image is placeholder
+    assert_action_performed_with(widget, "set image", image=placeholder)
+
+    await widget._load_task
+    assert widget._load_task is None
+    assert widget.image.path == ABSOLUTE_FILE_PATH
+    assert_action_performed_with(widget, "set image", image=widget.image)
+
+    # A Toga image is displayed immediately.
+    image = toga.Image(PLACEHOLDER_PATH)
+    widget.image = image
+    assert widget.image is image
+    assert widget._load_task is None
+
+    # Without a placeholder, images are loaded synchronously.
+    widget.placeholder = None
+    widget.image = ABSOLUTE_FILE_PATH
+    assert widget.image.path == ABSOLUTE_FILE_PATH
+    assert widget._load_task is None
+
+
+async def test_placeholder_failed_load(app):
+    """If an image can't be loaded, the placeholder remains."""
+    widget = toga.ImageView(placeholder=PLACEHOLDER_PATH)
+    widget.image = "does/not/exist.png"
+
+    with pytest.warns(
+        RuntimeWarning,
+        match=r"Unable to load image \(.*does not exist\); continuing to display "
+        r"placeholder",
+    ):
+        await widget._load_task
+    assert widget.image is widget.placeholder
+    assert widget._load_task is None
+
+
+async def test_placeholder_backend_error(app, monkeypatch):
+    """If the backend can't decode an image, the placeholder remains."""
+
+    async def load_async(src):
+        raise OSError("Corrupt image")
+
+    monkeypatch.setattr(toga.Image, "load_async", load_async)
+    widget = toga.ImageView(placeholder=PLACEHOLDER_PATH)
+    widget.image = ABSOLUTE_FILE_PATH
+
+    with pytest.warns(
+        RuntimeWarning,
+        match=r"Unable to load image \(Corrupt image\); continuing to display "
+        r"placeholder",
+    ):
+        await widget._load_task
+    assert widget.image is widget.placeholder
+    assert widget._load_task is None
+
+
+async def test_placeholder_superseded(app):
+    """If a new image is set while an image is loading, the load is cancelled."""
+    widget = toga.ImageView(placeholder=PLACEHOLDER_PATH)
+    widget.image = ABSOLUTE_FILE_PATH
+    first_load = widget._load_task
+    widget.image = PLACEHOLDER_PATH
+    second_load = widget._load_task
+
+    with pytest.raises(asyncio.CancelledError):
+        await first_load
+    await second_load
+    assert widget.image.path == PLACEHOLDER_PATH
+
+    # Setting an image directly also cancels the load.
+    widget.image = ABSOLUTE_FILE_PATH
+    load = widget._load_task
+    widget.image = None
+    with pytest.raises(asyncio.CancelledError):
+        await load
+    assert widget.image is None
+
+
+async def test_placeholder_removed(app):
+    """If the image view is removed from its window, the load is cancelled."""
+    widget = toga.ImageView(placeholder=PLACEHOLDER_PATH)
+    window = toga.Window(content=widget)
+    widget.image = ABSOLUTE_FILE_PATH
+    load = widget._load_task
+
+    window.content = toga.Box()
+    assert widget.window is None
+    with pytest.raises(asyncio.CancelledError):
+        await load
+    assert widget.image is widget.placeholder
+
+
 def test_set_image_none(app):
     """The image can be cleared."""
     widget = toga.ImageView(image=ABSOLUTE_FILE_PATH)
@@ -290,6 +290,24 @@ def test_insert_item(widget, source, on_change_handler):
     assert widget.value == selection
 
 
+def test_insert_many(widget, source, on_change_handler):
+    """Multiple rows can be inserted into the source."""
+    # Store the original selection
+    selection = widget.value
+
+    source.insert_many(
+        1, [{"key": "new1", "value": 998}, {"key": "new2", "value": 999}]
+    )
+
+    # The backend doesn't support bulk inserts, so each item is added individually
+    assert_action_performed_with(widget, "insert item", index=1, item=source[1])
+    assert_action_performed_with(widget, "insert item", index=2, item=source[2])
+
+    # This doesn't change the widget
+    on_change_handler.assert_not_called()
+    assert widget.value == selection
+
+
 def test_remove(widget, source, on_change_handler):
     """If you remove an item that isn't selected, no change is generated."""
     # Store the original selection
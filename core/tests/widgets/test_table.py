@@ -3,7 +3,7 @@ from unittest.mock import Mock, patch
 import pytest
 
 import toga
-from toga.sources import AccessorColumn, ListSource, Source
+from toga.sources import AccessorColumn, LazyListSource, ListSource, Source
 from toga_dummy.utils import (
     assert_action_not_performed,
     assert_action_performed,
@@ -803,6 +803,105 @@ def test_activation(table, on_activate_handler):
     on_activate_handler.assert_called_once_with(table, row=table.data[1])
 
 
+def test_lazy_source():
+    """A table only fetches the rows of a lazy source that are visible."""
+    fetch = Mock(
+        side_effect=lambda start, stop: [(i, i * 10) for i in range(start, stop)]
+    )
+    source = LazyListSource(
+        accessors=["key", "value"],
+        length=lambda: 1_000_000,
+        fetch=fetch,
+        page_size=50,
+    )
+    table = toga.Table(["Key", "Value"], data=source)
+
+    # Setting the data doesn't fetch any rows.
+    assert_action_performed_with(table, "change source", source=source)
+    fetch.assert_not_called()
+
+    # Only the pages covering the visible rows are fetched.
+    table._impl.simulate_scroll(520, 560)
+    assert_action_performed_with(table, "fetch rows", start=520, stop=560)
+    assert fetch.call_args_list == [((500, 550),), ((550, 600),)]
+
+    # The selection is retrieved from the source.
+    table._impl.simulate_selection(530)
+    assert table.selection.value == 5300
+    assert fetch.call_count == 2
+
+
+def test_prepare_rows():
+    """Visible rows are formatted a column at a time."""
+
+    class CustomColumn:
+        heading = "Custom"
+
+        def value(self, row):
+            return row.key
+
+        def text(self, row, default=None):
+            return str(row.key)
+
+        def icon(self, row):
+            return None
+
+        def widget(self, row):
+            return None
+
+    formatter = Mock(side_effect=lambda values: [f"<{value}>" for value in values])
+    table = toga.Table(
+        [AccessorColumn("Value", formatter=formatter), CustomColumn()],
+        data=[{"key": i, "value": i * 10} for i in range(100)],
+    )
+
+    table._impl.simulate_scroll(10, 20)
+    assert_action_performed_with(table, "fetch rows", start=10, stop=20)
+    formatter.assert_called_once_with([i * 10 for i in range(10, 20)])
+
+    # Rows that have already been formatted aren't formatted again.
+    formatter.reset_mock()
+    table._impl.simulate_scroll(15, 25)
+    formatter.assert_called_once_with([i * 10 for i in range(20, 25)])
+
+    # A changed row is formatted again.
+    formatter.reset_mock()
+    table.data[22].value = 999
+    table._impl.simulate_scroll(15, 25)
+    formatter.assert_called_once_with([999])
+    assert table.columns[0].text(table.data[22]) == "<999>"
+
+
+def test_change_notification():
+    """A row is rendered again when its source announces a change to it."""
+    table = toga.Table(["Value"], data=[{"value": [1, 2]}, {"value": [3]}])
+    row = table.data[0]
+    assert table.columns[0].text(row) == "[1, 2]"
+
+    # Modifying a mutable value in place can't be detected by the row.
+    row.value.append(3)
+    assert table.columns[0].text(row) == "[1, 2]"
+
+    table.data.notify("change", item=row)
+    assert table.columns[0].text(row) == "[1, 2, 3]"
+    assert_action_performed_with(table, "change row", item=row)
+
+    # Inserting other rows doesn't affect the cache...
+    table.data.append({"value": [4]})
+    row.value.append(4)
+    assert table.columns[0].text(row) == "[1, 2, 3]"
+
+    # ... but a reset discards it.
+    table.data.notify("reset")
+    assert table.columns[0].text(row) == "[1, 2, 3, 4]"
+
+    # Once the table uses a different source, changes to the old source are
+    # ignored.
+    old_data = table.data
+    table.data = [{"value": "new"}]
+    assert old_data.listeners == []
+
+
 def test_scroll_to_top(table):
     """A table can be scrolled to the top."""
     table.scroll_to_top()
@@ -3,7 +3,7 @@ from unittest.mock import Mock, patch
 import pytest
 
 import toga
-from toga.sources import AccessorColumn, Source, TreeSource
+from toga.sources import AccessorColumn, LazyTreeSource, Source, TreeSource
 from toga_dummy.utils import (
     assert_action_performed,
     assert_action_performed_with,
@@ -931,6 +931,48 @@ def test_expand_collapse(tree):
     assert_action_performed_with(tree, "collapse all")
 
 
+def test_lazy_source():
+    """A tree only fetches the children of a lazy source's nodes when they are
+    expanded."""
+    children = Mock(
+        side_effect=lambda parent: [((f"Node {i}", i), True) for i in range(3)]
+    )
+    source = LazyTreeSource(accessors=["key", "value"], children=children)
+    tree = toga.Tree(["Key", "Value"], data=source)
+
+    # Setting the data doesn't fetch any nodes.
+    assert_action_performed_with(tree, "change source", source=source)
+    children.assert_not_called()
+
+    # Expanding a node fetches its children.
+    tree._impl.simulate_expand((1,))
+    assert_action_performed_with(tree, "fetch children", node=source[1], count=3)
+    assert children.call_args_list == [((None,),), ((source[1],),)]
+
+
+def test_change_notification():
+    """A node is rendered again when its source announces a change to it."""
+    tree = toga.Tree(["Value"], data=[({"value": [1]}, [({"value": [2]}, None)])])
+    node = tree.data[0][0]
+    assert tree.columns[0].text(node) == "[2]"
+
+    # Modifying a mutable value in place can't be detected by the node.
+    node.value.append(3)
+    tree.data.notify("change", item=node)
+    assert tree.columns[0].text(node) == "[2, 3]"
+
+    # Removing the node discards its cells.
+    assert node in tree._cell_cache._cells
+    del tree.data[0][0]
+    assert node not in tree._cell_cache._cells
+
+    # Once the tree uses a different source, changes to the old source are
+    # ignored.
+    old_data = tree.data
+    tree.data = []
+    assert old_data.listeners == []
+
+
 def test_activation(tree, on_activate_handler):
     """A row can be activated."""
 
@@ -1,3 +1,4 @@
+import asyncio
 from pathlib import Path
 from unittest.mock import Mock
 
@@ -700,6 +701,117 @@ def test_move_in_window_state(state):
     window.close()
 
 
+def test_refresh_without_event_loop(window):
+    """If the event loop isn't running, layout refreshes happen immediately."""
+    label = toga.Label("Hello")
+    window.content = toga.Box(children=[label])
+    assert_action_performed(label, "set bounds")
+
+    EventLog.reset()
+    label.style.width = 50
+    assert_action_performed_with(label, "set bounds", width=50)
+    assert window._layout_handle is None
+
+
+async def test_deferred_refresh(window):
+    """While the event loop is running, layout refreshes are coalesced."""
+    box = toga.Box()
+    window.content = box
+    assert window._layout_handle is not None
+    assert_action_not_performed(box, "set bounds")
+
+    # Add a burst of children
+    labels = [toga.Label(f"Label {i}") for i in range(5)]
+    for label in labels:
+        box.add(label)
+
+    # Layout is deferred; only a single refresh is pending
+    assert list(window._pending_layouts) == [box]
+    for label in labels:
+        assert_action_not_performed(label, "set bounds")
+
+    # Allow the event loop to iterate; the layout is performed.
+    await asyncio.sleep(0)
+    assert window._layout_handle is None
+    assert not window._pending_layouts
+    for label in labels:
+        assert_action_performed(label, "set bounds")
+
+
+async def test_flush_layout(window):
+    """Pending layout refreshes can be forced to occur immediately."""
+    box = toga.Box()
+    window.content = box
+    label = toga.Label("Hello")
+    box.add(label)
+    assert_action_not_performed(label, "set bounds")
+
+    window.flush_layout()
+    assert_action_performed(label, "set bounds")
+    assert window._layout_handle is None
+
+    # Flushing again is a no-op.
+    EventLog.reset()
+    window.flush_layout()
+    assert_action_not_performed(label, "set bounds")
+
+
+async def test_immediate_refresh(window):
+    """A refresh requested by the backend (e.g., on resize) happens immediately."""
+    box = toga.Box()
+    window.content = box
+    label = toga.Label("Hello")
+    box.add(label)
+    assert list(window._pending_layouts) == [box]
+
+    # An immediate refresh of any widget in the tree lays out the whole tree, and
+    # supersedes the pending refresh.
+    label.refresh(immediate=True)
+    assert_action_performed(label, "set bounds")
+    assert not window._pending_layouts
+
+    # A widget that isn't in a window can also be refreshed immediately.
+    other = toga.Box()
+    other._impl.container = window._impl.container
+    EventLog.reset()
+    other.refresh(immediate=True)
+    assert_action_performed(other, "set bounds")
+
+
+async def test_deferred_refresh_reparented(window):
+    """If a pending root is added to another tree, it isn't laid out separately."""
+    box = toga.Box()
+    window.content = box
+    window.flush_layout()
+
+    # Refresh a standalone root, then make it part of the window content.
+    other = toga.Box()
+    other._impl.container = window._impl.container
+    other.window = window
+    other.refresh()
+    assert other in window._pending_layouts
+
+    box.add(other)
+    EventLog.reset()
+    window.flush_layout()
+    assert_action_performed(box, "refresh")
+    assert_action_performed(other, "set bounds")
+
+
+async def test_close_cancels_pending_refresh(window):
+    """Closing a window cancels any pending layout refresh."""
+    box = toga.Box()
+    window.content = box
+    assert window._layout_handle is not None
+
+    window.close()
+    assert window._layout_handle is None
+    assert not window._pending_layouts
+
+    await asyncio.sleep(0)
+    assert_action_not_performed(box, "set bounds")
+
+
 def test_close_direct(window, app):
     """A window can be closed directly."""
     on_close_handler = Mock(return_value=True)
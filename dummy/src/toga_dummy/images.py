@@ -48,6 +48,10 @@ class Image(LoggedObject):
             self._action("load image from raw")
             self.native = raw
 
+    @staticmethod
+    def raw_from_pixels(width, height, pixels):
+        return DummyImage(PIL.Image.frombytes("RGBA", (width, height), pixels))
+
     def get_width(self):
         if self.native.raw is None:
             return 60
@@ -61,5 +65,9 @@ class Image(LoggedObject):
     def get_data(self):
         return self.native.data
 
+    def get_pixels(self):
+        self._action("get pixels")
+        return self.native.raw.convert("RGBA").tobytes()
+
     def save(self, path):
         self._action("save", path=path)
@@ -1,8 +1,13 @@
+from io import BytesIO
 from pathlib import Path
+from types import SimpleNamespace
+
+import PIL.Image
 
 import toga_dummy
 from toga.fonts import SYSTEM, SYSTEM_DEFAULT_FONT_SIZE
 
+from ..utils import LoggedObject
 from .base import Widget
 
 
@@ -16,6 +21,19 @@ class Context:
     def save(self):
         self.impl.draw_instructions.append("save")
 
+    def draw_cached(self, state):
+        self.impl.draw_instructions.extend(
+            state._cached_rendering(lambda: self._record(state))
+        )
+
+    def _record(self, state):
+        # Render the state into a separate list of instructions, which can be
+        # replayed until the state changes.
+        self.impl._action("render cached state", state=state)
+        recording = SimpleNamespace(draw_instructions=[], _action=self.impl._action)
+        state._draw(Context(recording))
+        return recording.draw_instructions
+
     def restore(self):
         self.impl.draw_instructions.append("restore")
 
@@ -45,6 +63,14 @@ class Context:
     def line_to(self, x, y):
         self.impl.draw_instructions.append(("line to", {"x": x, "y": y}))
 
+    def polyline(self, points):
+        self.impl.draw_instructions.append(("polyline", {"points": points.tolist()}))
+
+    def path(self, codes, coords):
+        self.impl.draw_instructions.append(
+            ("path", {"codes": codes.tolist(), "coords": coords.tolist()})
+        )
+
     # Basic shapes
     def bezier_curve_to(self, cp1x, cp1y, cp2x, cp2y, x, y):
         self.impl.draw_instructions.append(
@@ -193,11 +219,20 @@ class Context:
 
 
 class Canvas(Widget):
+    SUPPORTS_PARTIAL_REDRAW = True
+
     def create(self):
         self._action("create Canvas")
 
     def redraw(self):
         self._action("redraw")
+        self._draw()
+
+    def redraw_states(self, states):
+        self._action("redraw states", states=states)
+        self._draw()
+
+    def _draw(self):
         self.draw_instructions = []
         self.interface.root_state._draw(Context(self))
 
@@ -262,3 +297,29 @@ class Canvas(Widget):
 
     def simulate_alt_drag(self, x, y):
         self.interface.on_alt_drag(x=x, y=y)
+
+
+class OffscreenCanvas(LoggedObject):
+    def __init__(self, interface, width, height):
+        super().__init__()
+        self.interface = interface
+        self._action("create OffscreenCanvas", width=width, height=height)
+        self.draw_instructions = []
+
+    def _draw(self):
+        self.draw_instructions = []
+        self.interface.root_state._draw(Context(self))
+
+        # The dummy backend doesn't rasterize the drawing actions; the result is
+        # always a transparent image of the right size.
+        return PIL.Image.new("RGBA", (self.interface.width, self.interface.height))
+
+    def get_rgba_data(self):
+        self._action("get RGBA data")
+        return self._draw().tobytes()
+
+    def get_image_data(self):
+        self._action("get image data")
+        buffer = BytesIO()
+        self._draw().save(buffer, format="png")
+        return buffer.getvalue()
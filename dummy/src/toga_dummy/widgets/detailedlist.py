@@ -25,6 +25,9 @@ class DetailedList(Widget):
     def source_insert(self, *, index, item):
         self._action("insert item", index=index, item=item)
 
+    def source_insert_range(self, *, index, items):
+        self._action("insert items", index=index, items=items)
+
     # Alias for backwards compatibility:
     # March 2026: In 0.5.3 and earlier, notification methods
     # didn't start with 'source_'
@@ -57,6 +60,9 @@ class DetailedList(Widget):
     def source_remove(self, *, index, item):
         self._action("remove item", index=index, item=item)
 
+    def source_remove_range(self, *, index, items):
+        self._action("remove items", index=index, items=items)
+
     # Alias for backwards compatibility:
     # March 2026: In 0.5.3 and earlier, notification methods
     # didn't start with 'source_'
@@ -73,6 +79,9 @@ class DetailedList(Widget):
     def source_clear(self):
         self._action("clear")
 
+    def source_reset(self):
+        self._action("reset")
+
     def get_selection(self):
         return self._get_value("selection", None)
 
@@ -95,5 +104,13 @@ class DetailedList(Widget):
         self._set_value("selection", row)
         self.interface.on_select()
 
+    def simulate_scroll(self, start, stop):
+        # Render the rows that have become visible; this is the only time a backend
+        # needs to retrieve rows from the data source.
+        for row in self.interface.data[start:stop]:
+            for accessor in self.interface.accessors:
+                getattr(row, accessor, None)
+        self._action("fetch rows", start=start, stop=stop)
+
     def stimulate_refresh(self):
         self.interface.on_refresh()
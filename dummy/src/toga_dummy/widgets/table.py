@@ -25,6 +25,9 @@ class Table(Widget):
     def source_insert(self, *, index, item):
         self._action("insert row", index=index, item=item)
 
+    def source_insert_range(self, *, index, items):
+        self._action("insert rows", index=index, items=items)
+
     # Alias for backwards compatibility:
     # March 2026: In 0.5.3 and earlier, notification methods
     # didn't start with 'source_'
@@ -57,6 +60,9 @@ class Table(Widget):
     def source_remove(self, *, index, item):
         self._action("remove row", item=item, index=index)
 
+    def source_remove_range(self, *, index, items):
+        self._action("remove rows", index=index, items=items)
+
     # Alias for backwards compatibility:
     # March 2026: In 0.5.3 and earlier, notification methods
     # didn't start with 'source_'
@@ -73,6 +79,9 @@ class Table(Widget):
     def source_clear(self):
         self._action("clear")
 
+    def source_reset(self):
+        self._action("reset")
+
     def get_selection(self):
         return self._get_value(
             "selection",
@@ -94,3 +103,14 @@ class Table(Widget):
 
     def simulate_activate(self, row):
         self.interface.on_activate(row=self.interface.data[row])
+
+    def simulate_scroll(self, start, stop):
+        # Render the cells of the rows that have become visible; this is the only
+        # time a backend needs to retrieve rows from the data source.
+        rows = self.interface.data[start:stop]
+        self.interface._prepare_rows(rows)
+        for row in rows:
+            for column in self.interface._columns:
+                column.text(row, self.interface.missing_value)
+                column.icon(row)
+        self._action("fetch rows", start=start, stop=stop)
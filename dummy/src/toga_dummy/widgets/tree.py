@@ -83,6 +83,9 @@ class Tree(Widget):
     def source_clear(self):
         self._action("clear")
 
+    def source_reset(self):
+        self._action("reset")
+
     def get_selection(self):
         if self.interface.multiple_select:
             return [
@@ -118,3 +121,9 @@ class Tree(Widget):
 
     def simulate_activate(self, path):
         self.interface.on_activate(node=node_for_path(self.interface.data, path))
+
+    def simulate_expand(self, path):
+        # Expanding a node is the first time a backend needs to retrieve the
+        # children of the node from the data source.
+        node = node_for_path(self.interface.data, path)
+        self._action("fetch children", node=node, count=len(node))
@@ -13,7 +13,7 @@ from .statusicons import MenuStatusIcon, SimpleStatusIcon, StatusIconSet
 from .widgets.activityindicator import ActivityIndicator
 from .widgets.box import Box
 from .widgets.button import Button
-from .widgets.canvas import Canvas
+from .widgets.canvas import Canvas, OffscreenCanvas
 from .widgets.dateinput import DateInput
 from .widgets.detailedlist import DetailedList
 from .widgets.divider import Divider
@@ -68,6 +68,7 @@ __all__ = [
     "MenuStatusIcon",
     "MultilineTextInput",
     "NumberInput",
+    "OffscreenCanvas",
     "OptionContainer",
     "PasswordInput",
     "ProgressBar",
@@ -32,37 +32,64 @@ class Icon:
         if not path:
             raise FileNotFoundError("No icon variants found")
 
-        # Preload all the required icon sizes
+        # Only the largest variant is loaded up front, to confirm that the icon can
+        # be loaded; other sizes are loaded the first time they are requested.
+        largest = max(self.path)
         try:
-            for size, path in self.path.items():
-                if GTK_VERSION < (4, 0, 0):  # pragma: no-cover-if-gtk4
-                    native = GdkPixbuf.Pixbuf.new_from_file(str(path)).scale_simple(
-                        size, size, GdkPixbuf.InterpType.BILINEAR
-                    )
-                else:  # pragma: no-cover-if-gtk3
-                    native = Gtk.Image.new_from_paintable(
-                        Gdk.Texture.new_from_filename(str(path))
-                    )
-                self._native[size] = native
+            self._load(largest)
         except GLib.GError as exc:
-            raise ValueError(f"Unable to load icon from {path}") from exc
+            raise ValueError(f"Unable to load icon from {self.path[largest]}") from exc
 
     if GTK_VERSION < (4, 0, 0):  # pragma: no-cover-if-gtk4
 
+        @staticmethod
+        def _decode(path):
+            # The decoded file is shared with any other icon (or image) that has
+            # been loaded from the same file, and is charged to the image cache.
+            stat = path.stat()
+            key = ("image", str(path), stat.st_mtime_ns, stat.st_size)
+            pixbuf = toga.Image.cache._get(key)
+            if pixbuf is None:
+                pixbuf = GdkPixbuf.Pixbuf.new_from_file(str(path))
+                toga.Image.cache._put(
+                    key, pixbuf, pixbuf.get_width() * pixbuf.get_height() * 4
+                )
+            return pixbuf
+
+        def _load(self, size):
+            native = self._decode(self.path[size]).scale_simple(
+                size, size, GdkPixbuf.InterpType.BILINEAR
+            )
+            self._native[size] = native
+            return native
+
         def native(self, size):
             try:
                 return self._native[size]
             except KeyError:
-                # self._native will have at least one entry, and it will have been
-                # populated in reverse size order, so the first value returned will
-                # be the largest size discovered.
-                native = self._native[next(iter(self._native))].scale_simple(
-                    size, size, GdkPixbuf.InterpType.BILINEAR
-                )
-                self._native[size] = native
-                return native
+                pass
+
+            if size in self.path:
+                try:
+                    return self._load(size)
+                except GLib.GError:
+                    # Fall back to scaling the largest variant.
+                    pass
+
+            native = self._native[max(self.path)].scale_simple(
+                size, size, GdkPixbuf.InterpType.BILINEAR
+            )
+            self._native[size] = native
+            return native
     else:  # pragma: no-cover-if-gtk3
 
+        def _load(self, size):
+            native = Gtk.Image.new_from_paintable(
+                Gdk.Texture.new_from_filename(str(self.path[size]))
+            )
+            self._native[size] = native
+            return native
+
         def native(self):
             # On GTK4, the size of the image itself does not matter;  when it is
             # used as an icon, its size can be modified using set_icon_size.  Use
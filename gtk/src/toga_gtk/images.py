@@ -19,6 +19,18 @@ class Image:
         else:
             self.native = raw
 
+    @staticmethod
+    def raw_from_pixels(width, height, pixels):
+        return GdkPixbuf.Pixbuf.new_from_bytes(
+            GLib.Bytes.new(bytes(pixels)),
+            GdkPixbuf.Colorspace.RGB,
+            True,  # has alpha
+            8,  # bits per sample
+            width,
+            height,
+            width * 4,  # row stride
+        )
+
     def get_width(self):
         return self.native.get_width()
 
@@ -34,6 +46,22 @@ class Image:
             # in test conditions
             raise ValueError("Unable to get PNG data for image")
 
+    def get_pixels(self):
+        pixbuf = self.native
+        if not pixbuf.get_has_alpha():
+            pixbuf = pixbuf.add_alpha(False, 0, 0, 0)
+
+        pixels = pixbuf.read_pixel_bytes().get_data()
+        row_length = pixbuf.get_width() * 4
+        rowstride = pixbuf.get_rowstride()
+        if rowstride == row_length:
+            return pixels
+        # Remove the padding at the end of each row.
+        return b"".join(
+            pixels[row * rowstride : row * rowstride + row_length]
+            for row in range(pixbuf.get_height())
+        )
+
     def save(self, path):
         path = Path(path)
         try:
@@ -1,13 +1,15 @@
+import re
+import sys
 from copy import copy
 from dataclasses import dataclass
 from io import BytesIO
-from math import ceil
+from math import ceil, floor
 
 from travertino.size import at_least
 
 from toga import Font
 from toga.colors import rgb
-from toga.constants import Baseline, FillRule
+from toga.constants import Baseline, FillRule, PathCode
 from toga.fonts import SYSTEM_DEFAULT_FONT_SIZE
 from toga.handlers import WeakrefCallable
 from toga.widgets.canvas.geometry import round_rect
@@ -26,6 +28,22 @@ from .base import Widget
 
 BLACK = native_color(rgb(0, 0, 0))
 
+# Cairo stores each pixel as a native-endian 32-bit ARGB value; these are the
+# offsets of the red, green, blue and alpha bytes within a pixel.
+if sys.byteorder == "little":  # pragma: no branch
+    CAIRO_RGBA_OFFSETS = (2, 1, 0, 3)
+else:  # pragma: no cover
+    CAIRO_RGBA_OFFSETS = (1, 2, 3, 0)
+
+# Translation tables that unpremultiply a color component by each alpha value.
+UNPREMULTIPLY = [bytes(256)] + [
+    bytes(min(255, (value * 255 + alpha // 2) // alpha) for value in range(256))
+    for alpha in range(1, 256)
+]
+
+# Matches the alpha of a pixel that is neither transparent nor opaque.
+TRANSLUCENT = re.compile(rb"[\x01-\xfe]")
+
 
 @dataclass(slots=True)
 class State:
@@ -35,9 +53,11 @@ class State:
 
 
 class Context:
-    def __init__(self, impl, native):
+    def __init__(self, impl, native, recording=False):
         self.impl = impl
         self.native = native
+        # Is this context rendering a cached state, rather than the canvas itself?
+        self.recording = recording
         self.original_transform_matrix = self.native.get_matrix()
         self.set_line_width(1.0)
         self.states = [State()]
@@ -59,6 +79,57 @@ class Context:
         self.native.restore()
         self.states.pop()
 
+    def draw_cached(self, state):
+        # The rendering depends on the attributes inherited from the enclosing states.
+        dashes, offset = self.native.get_dash()
+        context_key = (
+            self.state.fill_style,
+            self.state.stroke_style,
+            self.native.get_line_width(),
+            tuple(dashes),
+            offset,
+        )
+        recording = state._cached_rendering(lambda: self._record(state), context_key)
+
+        # A recording surface is replayed as vector operations, using the current
+        # transform.
+        self.native.save()
+        self.native.set_source_surface(recording, 0, 0)
+        self.native.paint()
+        self.native.restore()
+
+        if not self.recording:
+            self.impl._painted(state, self._canvas_bounds(recording))
+
+    def _record(self, state):
+        recording = cairo.RecordingSurface(cairo.CONTENT_COLOR_ALPHA, None)
+        context = Context(self.impl, cairo.Context(recording), recording=True)
+        context.states = [copy(self.state)]
+        context.set_line_width(self.native.get_line_width())
+        context.native.set_dash(*self.native.get_dash())
+        state._draw(context)
+        return recording
+
+    def _canvas_bounds(self, recording):
+        """The bounds of a recording drawn with the current transform, in canvas
+        coordinates."""
+        x, y, width, height = recording.ink_extents()
+        # Multiplying by the identity matrix creates a copy that can be inverted.
+        inverse = cairo.Matrix().multiply(self.original_transform_matrix)
+        inverse.invert()
+        matrix = self.native.get_matrix().multiply(inverse)
+        points = [
+            matrix.transform_point(px, py)
+            for px in (x, x + width)
+            for py in (y, y + height)
+        ]
+        return (
+            floor(min(px for px, _ in points)),
+            floor(min(py for _, py in points)),
+            ceil(max(px for px, _ in points)),
+            ceil(max(py for _, py in points)),
+        )
+
     # Setting attributes
     def set_fill_style(self, color):
         self.state.fill_style = native_color(color)
@@ -85,6 +156,31 @@ class Context:
     def line_to(self, x, y):
         self.native.line_to(x, y)
 
+    def polyline(self, points):
+        line_to = self.native.line_to
+        points = iter(points)
+        self.native.move_to(next(points), next(points))
+        for x, y in zip(points, points, strict=True):
+            line_to(x, y)
+
+    def path(self, codes, coords):
+        move_to = self.native.move_to
+        line_to = self.native.line_to
+        curve_to = self.native.curve_to
+        coords = iter(coords)
+        for code in codes:
+            match code:
+                case PathCode.MOVE_TO:
+                    move_to(next(coords), next(coords))
+                case PathCode.LINE_TO:
+                    line_to(next(coords), next(coords))
+                case PathCode.QUADRATIC_CURVE_TO:
+                    self.quadratic_curve_to(*(next(coords) for _ in range(4)))
+                case PathCode.BEZIER_CURVE_TO:
+                    curve_to(*(next(coords) for _ in range(6)))
+                case _:
+                    self.native.close_path()
+
     # Basic shapes
 
     def bezier_curve_to(self, cp1x, cp1y, cp2x, cp2y, x, y):
@@ -218,7 +314,7 @@ class Context:
     # user would already have received an exception when trying to create a Font.
     def _text_path(self, text, x, y, font, baseline, line_height):
         pango_context = self.impl._pango_context(font)
-        metrics = self.impl._font_metrics(pango_context, line_height)
+        metrics = font_metrics(pango_context, line_height)
         lines = text.splitlines()
         total_height = metrics.line_height * len(lines)
 
@@ -261,6 +357,8 @@ class Context:
 
 
 class Canvas(Widget):
+    SUPPORTS_PARTIAL_REDRAW = True
+
     def create(self):
         if cairo is None:  # pragma: no cover
             raise RuntimeError(
@@ -269,6 +367,9 @@ class Canvas(Widget):
             )
 
         self.native = Gtk.DrawingArea()
+        # The bounds of each cached state in the most recent paint, keyed by the id()
+        # of the state.
+        self._bounds = {}
 
         if GTK_VERSION < (4, 0, 0):  # pragma: no-cover-if-gtk4
             self.native.connect("draw", self.gtk3_draw_callback)
@@ -344,7 +445,24 @@ class Canvas(Widget):
             cairo_context.fill()
 
         context = Context(self, cairo_context)
+        self._painting = {}
         self.interface.root_state._draw(context)
+        self._bounds = self._painting
+
+    def _painted(self, state, bounds):
+        self._painting[id(state)] = bounds
+        if GTK_VERSION < (4, 0, 0):  # pragma: no-cover-if-gtk4
+            # If the state has grown or moved, the repainted region may not have
+            # covered it; repaint its new location as well.
+            old_bounds = self._bounds.get(id(state))
+            if old_bounds is not None and old_bounds != bounds:
+                self._queue_draw_bounds(bounds)
+        else:  # pragma: no-cover-if-gtk3
+            pass
+
+    def _queue_draw_bounds(self, bounds):  # pragma: no-cover-if-gtk4
+        left, top, right, bottom = bounds
+        self.native.queue_draw_area(left, top, right - left, bottom - top)
 
     if GTK_VERSION < (4, 0, 0):  # pragma: no-cover-if-gtk4
 
@@ -421,44 +539,30 @@ class Canvas(Widget):
     def redraw(self):
         self.native.queue_draw()
 
+    def redraw_states(self, states):
+        if GTK_VERSION < (4, 0, 0):  # pragma: no-cover-if-gtk4
+            try:
+                regions = [self._bounds[id(state)] for state in states]
+            except KeyError:
+                # A state that hasn't been painted (or is nested inside another
+                # cached state) has no known bounds.
+                self.native.queue_draw()
+            else:
+                for bounds in regions:
+                    self._queue_draw_bounds(bounds)
+        else:  # pragma: no-cover-if-gtk3
+            # GTK4 always repaints the whole widget.
+            self.native.queue_draw()
+
     # Text
 
     def _pango_context(self, font):
-        # TODO: detect the actual default family and size (see tests_backend/fonts.py).
-        if font.interface.size == SYSTEM_DEFAULT_FONT_SIZE:
-            font = Font(
-                font.interface.family,
-                size=10,
-                weight=font.interface.weight,
-                style=font.interface.style,
-                variant=font.interface.variant,
-            )._impl
-
-        pango_context = self.native.create_pango_context()
-        pango_context.set_font_description(font.native)
-        return pango_context
-
-    def _font_metrics(self, pango_context, line_height):
-        pango_font = pango_context.load_font(pango_context.get_font_description())
-        pango_metrics = pango_font.get_metrics()
-        ascent = pango_metrics.get_ascent() / Pango.SCALE
-        descent = pango_metrics.get_descent() / Pango.SCALE
-
-        if line_height is None:
-            # get_height was added in Pango 1.44, but Debian Buster comes with 1.42.
-            scaled_line_height = ascent + descent
-        else:
-            font_size = (
-                pango_font.describe_with_absolute_size().get_size() / Pango.SCALE
-            )
-            scaled_line_height = font_size * line_height
-
-        return FontMetrics(ascent, descent, scaled_line_height)
+        return with_font(self.native.create_pango_context(), font)
 
     def measure_text(self, text, font, line_height):
         pango_context = self._pango_context(font)
         layout = Pango.Layout(pango_context)
-        metrics = self._font_metrics(pango_context, line_height)
+        metrics = font_metrics(pango_context, line_height)
 
         widths = []
         for line in text.splitlines():
@@ -499,3 +603,96 @@ class FontMetrics:
     ascent: float
     descent: float
     line_height: int
+
+
+def with_font(pango_context, font):
+    """Configure a Pango context to use a font."""
+    # TODO: detect the actual default family and size (see tests_backend/fonts.py).
+    if font.interface.size == SYSTEM_DEFAULT_FONT_SIZE:
+        font = Font(
+            font.interface.family,
+            size=10,
+            weight=font.interface.weight,
+            style=font.interface.style,
+            variant=font.interface.variant,
+        )._impl
+
+    pango_context.set_font_description(font.native)
+    return pango_context
+
+
+def font_metrics(pango_context, line_height):
+    pango_font = pango_context.load_font(pango_context.get_font_description())
+    pango_metrics = pango_font.get_metrics()
+    ascent = pango_metrics.get_ascent() / Pango.SCALE
+    descent = pango_metrics.get_descent() / Pango.SCALE
+
+    if line_height is None:
+        # get_height was added in Pango 1.44, but Debian Buster comes with 1.42.
+        scaled_line_height = ascent + descent
+    else:
+        font_size = pango_font.describe_with_absolute_size().get_size() / Pango.SCALE
+        scaled_line_height = font_size * line_height
+
+    return FontMetrics(ascent, descent, scaled_line_height)
+
+
+class OffscreenCanvas:
+    def __init__(self, interface, width, height):
+        self.interface = interface
+        self.surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, width, height)
+
+    def _draw(self):
+        cairo_context = cairo.Context(self.surface)
+        # Start with a transparent surface
+        cairo_context.set_operator(cairo.OPERATOR_CLEAR)
+        cairo_context.paint()
+        cairo_context.set_operator(cairo.OPERATOR_OVER)
+
+        self._cairo_context = cairo_context
+        self.interface.root_state._draw(Context(self, cairo_context))
+        self.surface.flush()
+
+    def _pango_context(self, font):
+        return with_font(PangoCairo.create_context(self._cairo_context), font)
+
+    def _painted(self, state, bounds):
+        # An offscreen canvas is always drawn in full.
+        pass
+
+    def get_rgba_data(self):
+        self._draw()
+        width = self.surface.get_width()
+        height = self.surface.get_height()
+        stride = self.surface.get_stride()
+        data = self.surface.get_data()
+
+        # Drop any padding at the end of each row.
+        row_length = width * 4
+        if stride == row_length:
+            pixels = bytes(data)
+        else:
+            pixels = b"".join(
+                data[row * stride : row * stride + row_length] for row in range(height)
+            )
+
+        # Cairo stores premultiplied ARGB; reorder the components into RGBA.
+        rgba = bytearray(len(pixels))
+        for index, offset in enumerate(CAIRO_RGBA_OFFSETS):
+            rgba[index::4] = pixels[offset::4]
+
+        # Transparent pixels are already zero, and opaque pixels don't need to be
+        # unpremultiplied; only translucent pixels (e.g., at the antialiased edges
+        # of shapes) need to be converted individually.
+        for match in TRANSLUCENT.finditer(pixels[CAIRO_RGBA_OFFSETS[3] :: 4]):
+            start = match.start() * 4
+            table = UNPREMULTIPLY[rgba[start + 3]]
+            for component in range(start, start + 3):
+                rgba[component] = table[rgba[component]]
+        return bytes(rgba)
+
+    def get_image_data(self):
+        self._draw()
+        data = BytesIO()
+        self.surface.write_to_png(data)
+        return data.getbuffer()
@@ -3,6 +3,7 @@ import html
 from travertino.size import at_least
 
 from toga.handlers import WeakrefCallable
+from toga.sources import LazyListSource
 from toga_gtk.libs import GTK_VERSION, Gdk, Gio, Gtk, Pango
 
 from .base import Widget
@@ -246,6 +247,11 @@ class DetailedList(Widget):
         return DetailedListRow(self.interface, item)
 
     def change_source(self, source):
+        # A list box creates the widget for every row in its model when the row is
+        # added, so a lazy source would have every row retrieved.
+        if isinstance(source, LazyListSource):
+            raise TypeError("DetailedList doesn't support lazy sources on GTK")
+
         self.store.remove_all()
         for item in source:
             self.store.append(self.row_factory(item))
@@ -270,6 +276,13 @@ class DetailedList(Widget):
         self.native_detailedlist.show_all()
         self.update_refresh_button()
 
+    def source_insert_range(self, *, index, items):
+        self.hide_actions()
+        # Splice all the new rows into the store as a single change.
+        self.store.splice(index, 0, [self.row_factory(item) for item in items])
+        self.native_detailedlist.show_all()
+        self.update_refresh_button()
+
     # Alias for backwards compatibility:
     # March 2026: In 0.5.3 and earlier, notification methods
     # didn't start with 'source_'
@@ -304,6 +317,11 @@ class DetailedList(Widget):
         self.store.remove(index)
         self.update_refresh_button()
 
+    def source_remove_range(self, *, index, items):
+        self.hide_actions()
+        self.store.splice(index, len(items), [])
+        self.update_refresh_button()
+
     # Alias for backwards compatibility:
     # March 2026: In 0.5.3 and earlier, notification methods
     # didn't start with 'source_'
@@ -322,6 +340,16 @@ class DetailedList(Widget):
         self.store.remove_all()
         self.update_refresh_button()
 
+    def source_reset(self):
+        self.hide_actions()
+        self.store.splice(
+            0,
+            self.store.get_n_items(),
+            [self.row_factory(item) for item in self.interface.data],
+        )
+        self.native_detailedlist.show_all()
+        self.update_refresh_button()
+
     def get_selection(self):
         item_impl = self.native_detailedlist.get_selected_row()
         if item_impl is None:
@@ -1,8 +1,10 @@
 import warnings
+from collections import OrderedDict
 
 from travertino.size import at_least
 
 from toga.handlers import WeakrefCallable
+from toga.sources import LazyListSource
 
 from ..libs import GTK_VERSION, GdkPixbuf, GObject, Gtk
 from .base import Widget
@@ -30,6 +32,112 @@ class TogaRow(GObject.Object):
             )
 
 
+class LazyRowModel(GObject.Object, Gtk.TreeModel):
+    """A tree model that presents the rows of a lazy source.
+
+    The model doesn't store a row for each row of the source. A row is only
+    retrieved from the source when the tree view asks for one of its values; the
+    values of recently displayed rows are retained, so that redrawing the visible
+    rows doesn't fetch them again.
+    """
+
+    # The number of rows that are retrieved and rendered together.
+    CHUNK_SIZE = 50
+    # The maximum number of rendered rows that are retained.
+    CACHE_SIZE = 1000
+
+    def __init__(self, impl):
+        super().__init__()
+        self.impl = impl
+        self.n_rows = len(impl.interface.data)
+        self.types = [TogaRow.__gtype__] + [
+            GdkPixbuf.Pixbuf.__gtype__,
+            GObject.TYPE_STRING,
+        ] * len(impl.interface._columns)
+        self._values = OrderedDict()
+
+    def _iter(self, index):
+        if 0 <= index < self.n_rows:
+            iter = Gtk.TreeIter()
+            # A user_data of 0 can't be distinguished from an unset value.
+            iter.user_data = index + 1
+            return True, iter
+        return False, None
+
+    def _row(self, index):
+        try:
+            values = self._values[index]
+            self._values.move_to_end(index)
+        except KeyError:
+            # Retrieve and render the chunk of rows that contains the index, so that
+            # the source can fetch (and the columns can format) them all at once.
+            start = index - index % self.CHUNK_SIZE
+            indices = range(start, min(start + self.CHUNK_SIZE, self.n_rows))
+            rows = [self.impl.interface.data[i] for i in indices]
+            self.impl.interface._prepare_rows(rows)
+            for i, row in zip(indices, rows, strict=True):
+                self._values[i] = self.impl._row_values(row)
+            while len(self._values) > self.CACHE_SIZE:
+                self._values.popitem(last=False)
+            values = self._values[index]
+        return values
+
+    def invalidate(self, index):
+        self._values.pop(index, None)
+        valid, iter = self._iter(index)
+        if valid:
+            self.row_changed(Gtk.TreePath.new_from_indices([index]), iter)
+
+    def do_get_flags(self):
+        return Gtk.TreeModelFlags.LIST_ONLY | Gtk.TreeModelFlags.ITERS_PERSIST
+
+    def do_get_n_columns(self):
+        return len(self.types)
+
+    def do_get_column_type(self, column):
+        return self.types[column]
+
+    def do_get_iter(self, path):
+        return self._iter(path.get_indices()[0])
+
+    def do_get_path(self, iter):
+        return Gtk.TreePath.new_from_indices([iter.user_data - 1])
+
+    def do_get_value(self, iter, column):
+        return self._row(iter.user_data - 1)[column]
+
+    def do_iter_next(self, iter):
+        valid, next_iter = self._iter(iter.user_data)
+        if valid:
+            iter.user_data = next_iter.user_data
+        return valid
+
+    def do_iter_previous(self, iter):
+        valid, previous_iter = self._iter(iter.user_data - 2)
+        if valid:
+            iter.user_data = previous_iter.user_data
+        return valid
+
+    def do_iter_children(self, parent):
+        if parent is None:
+            return self._iter(0)
+        return False, None
+
+    def do_iter_has_child(self, iter):
+        return False
+
+    def do_iter_n_children(self, iter):
+        return self.n_rows if iter is None else 0
+
+    def do_iter_nth_child(self, parent, n):
+        if parent is None:
+            return self._iter(n)
+        return False, None
+
+    def do_iter_parent(self, child):
+        return False, None
+
+
 class Table(Widget):
     def create(self):
         self.store = None
@@ -64,12 +172,21 @@ class Table(Widget):
     def _create_columns(self):
         self.native_table.set_headers_visible(self.interface._show_headings)
         toga_columns = self.interface._columns
+        # The rows of a lazy source all have the same height, and columns aren't
+        # sized to fit their content; otherwise, GTK would retrieve every row of the
+        # source to measure it. Instead, a column is sized to fit its heading, and
+        # expands to fill the available space.
+        lazy = isinstance(self.interface.data, LazyListSource)
+        self.native_table.set_fixed_height_mode(lazy)
 
         for i, toga_column in enumerate(toga_columns):
             column = Gtk.TreeViewColumn(
                 toga_column.heading if toga_column.heading else str(id(toga_column))
             )
-            column.set_sizing(Gtk.TreeViewColumnSizing.AUTOSIZE)
+            if lazy:
+                column.set_sizing(Gtk.TreeViewColumnSizing.FIXED)
+            else:
+                column.set_sizing(Gtk.TreeViewColumnSizing.AUTOSIZE)
             column.set_expand(True)
             column.set_resizable(True)
             column.set_min_width(16)
@@ -91,12 +208,25 @@ class Table(Widget):
         self.native_table.grab_focus()
 
     def gtk_on_row_activated(self, widget, path, column):
-        row = self.store[path][0].value
+        # The rows of the store are in the same order as the data source; retrieve
+        # the row from the source, as a lazy source may not have rendered it yet.
+        row = self.interface.data[path.get_indices()[0]]
         self.interface.on_activate(row=row)
 
     def gtk_on_select(self, selection):
         self.interface.on_select()
 
+    def _create_store(self):
+        if isinstance(self.interface.data, LazyListSource):
+            self.store = LazyRowModel(self)
+        else:
+            types = [TogaRow] + [GdkPixbuf.Pixbuf, str] * len(self.interface._columns)
+            self.store = Gtk.ListStore(*types)
+            rows = list(self.interface.data)
+            self.interface._prepare_rows(rows)
+            for i, row in enumerate(rows):
+                self.source_insert(index=i, item=row)
+
     def change_source(self, source):
         if GTK_VERSION < (4, 0, 0):  # pragma: no-cover-if-gtk4
             # Temporarily disconnecting the TreeStore improves performance for large
@@ -123,11 +253,7 @@ class Table(Widget):
                     # It's a new or unknown column
                     pass
 
-            types = [TogaRow] + [GdkPixbuf.Pixbuf, str] * len(self.interface._columns)
-            self.store = Gtk.ListStore(*types)
-
-            for i, row in enumerate(self.interface.data):
-                self.source_insert(index=i, item=row)
+            self._create_store()
 
             self.native_table.set_model(self.store)
             self.refresh()
@@ -147,7 +273,7 @@ class Table(Widget):
         )
         self.source_insert(index=index, item=item)
 
-    def source_insert(self, *, index, item):
+    def _row_values(self, item):
         row = TogaRow(item)
         values = [row]
         for column in self.interface._columns:
@@ -159,8 +285,21 @@ class Table(Widget):
             )
             # warn about widgets
             row.warn_widget(column)
+        return values
 
-        self.store.insert(index, values)
+    def source_insert(self, *, index, item):
+        self.store.insert(index, self._row_values(item))
+
+    def source_insert_range(self, *, index, items):
+        if GTK_VERSION < (4, 0, 0):  # pragma: no-cover-if-gtk4
+            # Disconnect the ListStore so that the view is only updated once.
+            self.native_table.set_model(None)
+            self.interface._prepare_rows(items)
+            for offset, item in enumerate(items):
+                self.source_insert(index=index + offset, item=item)
+            self.native_table.set_model(self.store)
+        else:  # pragma: no-cover-if-gtk3
+            pass
 
     # Alias for backwards compatibility:
     # March 2026: In 0.5.3 and earlier, notification methods
@@ -177,11 +316,10 @@ class Table(Widget):
 
     def source_change(self, *, item):
         index = self.interface.data.index(item)
-        row = self.store[index]
-        for i, column in enumerate(self.interface._columns):
-            row[i * 2 + 1] = row[0].icon(column)
-            row[i * 2 + 2] = row[0].text(column, self.interface.missing_value)
-            row[0].warn_widget(column)
+        if isinstance(self.store, LazyRowModel):
+            self.store.invalidate(index)
+        else:
+            self.store.set_row(self.store.get_iter(index), self._row_values(item))
 
     # Alias for backwards compatibility:
     # March 2026: In 0.5.3 and earlier, notification methods
@@ -199,6 +337,15 @@ class Table(Widget):
     def source_remove(self, *, index, item):
         del self.store[index]
 
+    def source_remove_range(self, *, index, items):
+        if GTK_VERSION < (4, 0, 0):  # pragma: no-cover-if-gtk4
+            self.native_table.set_model(None)
+            for _ in items:
+                del self.store[index]
+            self.native_table.set_model(self.store)
+        else:  # pragma: no-cover-if-gtk3
+            pass
+
     # Alias for backwards compatibility:
     # March 2026: In 0.5.3 and earlier, notification methods
     # didn't start with 'source_'
@@ -215,15 +362,24 @@ class Table(Widget):
     def source_clear(self):
         self.store.clear()
 
+    def source_reset(self):
+        if GTK_VERSION < (4, 0, 0):  # pragma: no-cover-if-gtk4
+            self.native_table.set_model(None)
+            self._create_store()
+            self.native_table.set_model(self.store)
+        else:  # pragma: no-cover-if-gtk3
+            pass
+
     def get_selection(self):
         if self.interface.multiple_select:
-            store, itrs = self.selection.get_selected_rows()
-            return [self.interface.data.index(store[itr][0].value) for itr in itrs]
+            # The rows of the store are in the same order as the data source.
+            store, paths = self.selection.get_selected_rows()
+            return [path.get_indices()[0] for path in paths]
         else:
             store, iter = self.selection.get_selected()
             if iter is None:
                 return None
-            return self.interface.data.index(store[iter][0].value)
+            return store.get_path(iter).get_indices()[0]
 
     def scroll_to_row(self, row):
         # Core API guarantees row exists, and there's > 1 row.
@@ -1,6 +1,7 @@
 from travertino.size import at_least
 
 from toga.handlers import WeakrefCallable
+from toga.sources import LazyTreeSource
 
 from ..libs import GTK_VERSION, GdkPixbuf, Gtk
 from .base import Widget
@@ -17,6 +18,9 @@ class Tree(Widget):
         self.native_tree.connect(
             "row-activated", WeakrefCallable(self.gtk_on_row_activated)
         )
+        self.native_tree.connect(
+            "test-expand-row", WeakrefCallable(self.gtk_on_test_expand_row)
+        )
 
         if GTK_VERSION < (4, 0, 0):  # pragma: no-cover-if-gtk4
             self.selection = self.native_tree.get_selection()
@@ -72,6 +76,28 @@ class Tree(Widget):
         node = self.store[path][0].value
         self.interface.on_activate(node=node)
 
+    def gtk_on_test_expand_row(self, widget, iter, path):
+        self._populate(iter)
+        # Allow the row to expand.
+        return False
+
+    def _populate(self, iter):
+        # Replace the placeholder child of a lazily populated row with the children
+        # of its node. This is the first time the children of the node are needed.
+        placeholder = self.store.iter_children(iter)
+        if self._is_placeholder(placeholder):
+            self.store.remove(placeholder)
+            node = self.store[iter][0].value
+            for i, child in enumerate(node):
+                self.source_insert(parent=node, index=i, item=child)
+
+    def _node_iter(self, node):
+        # Ensure that the ancestors of the node have been populated, so that the node
+        # has a row in the store.
+        if getattr(node, "_impl", None) is None and node._parent is not None:
+            self._populate(self._node_iter(node._parent))
+        return getattr(node, "_impl", None)
+
     def change_source(self, source):
         if GTK_VERSION < (4, 0, 0):  # pragma: no-cover-if-gtk4
             # Temporarily disconnecting the TreeStore improves performance for large
@@ -121,12 +147,27 @@ class Tree(Widget):
         if parent is None:
             iter = None
         else:
-            iter = parent._impl
+            iter = getattr(parent, "_impl", None)
+            if iter is None or self._is_placeholder(self.store.iter_children(iter)):
+                # The children of the parent haven't been populated yet; the item
+                # will be added when the parent is expanded.
+                return
 
         item._impl = self.store.insert(iter, index, values)
 
-        for i, child in enumerate(item):
-            self.source_insert(parent=item, index=i, item=child)
+        if isinstance(self.interface.data, LazyTreeSource):
+            # Don't retrieve the children of a lazy node until the node is expanded;
+            # a placeholder child ensures that the node can be expanded.
+            if item.can_have_children():
+                self.store.insert(
+                    item._impl, 0, [None] + [None, ""] * len(self.interface._columns)
+                )
+        else:
+            for i, child in enumerate(item):
+                self.source_insert(parent=item, index=i, item=child)
+
+    def _is_placeholder(self, iter):
+        return iter is not None and self.store[iter][0] is None
 
     # Alias for backwards compatibility:
     # March 2026: In 0.5.3 and earlier, notification methods
@@ -142,6 +183,9 @@ class Tree(Widget):
         self.source_change(item=item)
 
     def source_change(self, *, item):
+        if getattr(item, "_impl", None) is None:
+            # The item hasn't been added to the store yet.
+            return
         row = self.store[item._impl]
         for i, column in enumerate(self.interface._columns):
             row[i * 2 + 1] = row[0].icon(column)
@@ -162,6 +206,9 @@ class Tree(Widget):
         self.source_remove(index=index, item=item, parent=parent)
 
     def source_remove(self, *, index, item, parent=None):
+        if getattr(item, "_impl", None) is None:
+            # The item was never added to the store.
+            return
         del self.store[item._impl]
         item._impl = None
 
@@ -181,6 +228,17 @@ class Tree(Widget):
     def source_clear(self):
         self.store.clear()
 
+    def source_reset(self):
+        if GTK_VERSION < (4, 0, 0):  # pragma: no-cover-if-gtk4
+            # Disconnect the TreeStore so that the view is only updated once.
+            self.native_tree.set_model(None)
+            self.store.clear()
+            for i, node in enumerate(self.interface.data):
+                self.source_insert(parent=None, index=i, item=node)
+            self.native_tree.set_model(self.store)
+        else:  # pragma: no-cover-if-gtk3
+            pass
+
     def get_selection(self):
         if self.interface.multiple_select:
             store, itrs = self.selection.get_selected_rows()
@@ -192,15 +250,13 @@ class Tree(Widget):
             return store[iter][0].value
 
     def expand_node(self, node):
-        self.native_tree.expand_row(
-            self.native_tree.get_model().get_path(node._impl), True
-        )
+        self.native_tree.expand_row(self.store.get_path(self._node_iter(node)), True)
 
     def expand_all(self):
         self.native_tree.expand_all()
 
     def collapse_node(self, node):
-        self.native_tree.collapse_row(self.native_tree.get_model().get_path(node._impl))
+        self.native_tree.collapse_row(self.store.get_path(self._node_iter(node)))
 
     def collapse_all(self):
         self.native_tree.collapse_all()
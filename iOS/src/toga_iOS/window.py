@@ -104,7 +104,7 @@ class Window:
         if (container.width, container.height) != self.last_refreshed_size:
             self.last_refreshed_size = (container.width, container.height)
             self.interface.on_resize()
-            self.interface.content.refresh()
+            self.interface.content.refresh(immediate=True)
 
     # The testbed won't instantiate a simple app, so we can't test this
     # handler
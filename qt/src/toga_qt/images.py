@@ -25,6 +25,13 @@ class Image:
         else:
             self.native = raw
 
+    @staticmethod
+    def raw_from_pixels(width, height, pixels):
+        # The QImage doesn't own the data it is created from, so make a copy.
+        return QImage(
+            bytes(pixels), width, height, width * 4, QImage.Format.Format_RGBA8888
+        ).copy()
+
     def get_width(self):
         return self.native.width()
 
@@ -38,6 +45,11 @@ class Image:
             raise ValueError("Unable to get PNG data for image")
         return buffer.data().data()
 
+    def get_pixels(self):
+        # 32-bit pixels are always aligned, so there is no padding between rows.
+        image = self.native.convertToFormat(QImage.Format.Format_RGBA8888)
+        return bytes(image.constBits())
+
     def save(self, path):
         path = Path(path)
         filetype = {
@@ -9,13 +9,14 @@ from PySide6.QtGui import (
     QPainterPath,
     QPaintEvent,
     QPen,
+    QPolygonF,
     QTransform,
 )
 from PySide6.QtWidgets import QWidget
 from travertino.size import at_least
 
 from toga.colors import rgb
-from toga.constants import Baseline, FillRule
+from toga.constants import Baseline, FillRule, PathCode
 from toga.widgets.canvas.geometry import arc_to_bezier, round_rect, sweepangle
 
 from ..colors import native_color
@@ -110,6 +111,30 @@ class Context:
         else:
             self._path.lineTo(x, y)
 
+    def polyline(self, points):
+        # addPolygon() starts a new sub-path at the first point.
+        points = iter(points)
+        self._path.addPolygon(
+            QPolygonF([QPointF(x, y) for x, y in zip(points, points, strict=True)])
+        )
+
+    def path(self, codes, coords):
+        path = self._path
+        line_to = self.line_to
+        coords = iter(coords)
+        for code in codes:
+            match code:
+                case PathCode.MOVE_TO:
+                    path.moveTo(next(coords), next(coords))
+                case PathCode.LINE_TO:
+                    line_to(next(coords), next(coords))
+                case PathCode.QUADRATIC_CURVE_TO:
+                    path.quadTo(*(next(coords) for _ in range(4)))
+                case PathCode.BEZIER_CURVE_TO:
+                    path.cubicTo(*(next(coords) for _ in range(6)))
+                case _:
+                    path.closeSubpath()
+
     # Basic shapes
 
     def bezier_curve_to(self, cp1x, cp1y, cp2x, cp2y, x, y):
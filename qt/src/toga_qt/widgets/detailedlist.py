@@ -79,12 +79,18 @@ class ListSourceModel(QAbstractListModel):
         self.endResetModel()
 
     def insert_item(self, index):
-        self.beginInsertRows(QModelIndex(), index, index)
+        self.insert_items(index, 1)
+
+    def insert_items(self, index, count):
+        self.beginInsertRows(QModelIndex(), index, index + count - 1)
         # Nothing to do, insertion has already happened
         self.endInsertRows()
 
     def remove_item(self, index):
-        self.beginRemoveRows(QModelIndex(), index, index)
+        self.remove_items(index, 1)
+
+    def remove_items(self, index, count):
+        self.beginRemoveRows(QModelIndex(), index, index + count - 1)
         # Nothing to do, removal has already happened
         self.endRemoveRows()
 
@@ -560,6 +566,9 @@ class DetailedList(Widget):
     def source_insert(self, *, index, item):
         self.native_model.insert_item(index)
 
+    def source_insert_range(self, *, index, items):
+        self.native_model.insert_items(index, len(items))
+
     # Alias for backwards compatibility:
     # March 2026: In 0.5.3 and earlier, notification methods
     # didn't start with 'source_'
@@ -592,6 +601,9 @@ class DetailedList(Widget):
     def source_remove(self, *, index, item):
         self.native_model.remove_item(index)
 
+    def source_remove_range(self, *, index, items):
+        self.native_model.remove_items(index, len(items))
+
     # Alias for backwards compatibility:
     # March 2026: In 0.5.3 and earlier, notification methods
     # didn't start with 'source_'
@@ -608,6 +620,9 @@ class DetailedList(Widget):
     def source_clear(self):
         self.native_model.reset_source()
 
+    def source_reset(self):
+        self.native_model.reset_source()
+
     def update_toolbar(self):
         if not self.refresh_enabled:
             self.refresh_bar.hide()
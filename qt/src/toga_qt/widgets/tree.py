@@ -329,6 +329,9 @@ class Tree(Widget):
     def source_clear(self):
         self.native_model.reset_source()
 
+    def source_reset(self):
+        self.native_model.reset_source()
+
     def get_selection(self):
         # Deduplicate selection using row tuples and nodes.
         indexes = sorted(
@@ -179,7 +179,7 @@ class Window:
 
     def qt_container_resize(self, event):
         if self.interface.content:
-            self.interface.content.refresh()
+            self.interface.content.refresh(immediate=True)
 
     def content_refreshed(self, container):
         min_width = self.interface.content.layout.min_width
@@ -111,7 +111,7 @@ class TogaWindow(TextualScreen):
     def on_resize(self, event) -> None:
         self.interface.on_resize()
         if self.interface.content is not None:
-            self.interface.content.refresh()
+            self.interface.content.refresh(immediate=True)
 
 
 class Window:
@@ -0,0 +1,42 @@
+"""Regenerate the table of names that `toga` imports on demand.
+
+The table in `core/src/toga/_imports.py` is generated from the type stub
+`core/src/toga/__init__.pyi`, so that the stub doesn't need to be parsed every time
+toga is imported. After changing the stub, run this script from the root of the
+repository:
+
+    $ python tools/generate_imports.py
+"""
+
+from pathlib import Path
+
+IMPORTS_PATH = Path(__file__).parents[1] / "core/src/toga/_imports.py"
+
+
+def read_stub(stub):
+    """Read the names imported by a stub file, and the modules they come from."""
+    imports = {}
+    with stub.open(encoding="utf-8") as f:
+        for line in f:
+            match line.split():
+                case "from", module_name, "import", class_name, "as", _:
+                    imports[class_name] = module_name
+    return imports
+
+
+def generate(path=IMPORTS_PATH):
+    """Rewrite the import table in `path`, using the stub in the same directory."""
+    imports = read_stub(path.with_name("__init__.pyi"))
+    table = "".join(f'    "{name}": "{module}",\n' for name, module in imports.items())
+
+    content = path.read_text(encoding="utf-8")
+    start = content.index("toga_core_imports = {\n")
+    end = content.index("\n}\n", start) + 3
+    path.write_text(
+        f"{content[:start]}toga_core_imports = {{\n{table}}}\n{content[end:]}",
+        encoding="utf-8",
+    )
+
+
+if __name__ == "__main__":
+    generate()
@@ -3,6 +3,9 @@ from __future__ import annotations
 import string
 import warnings
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from functools import lru_cache
+from itertools import repeat
 
 from .constants import *  # noqa: F403
 
@@ -40,28 +43,7 @@ class Color(ABC):
             return value
 
         elif isinstance(value, str):
-            if result := NAMED_COLOR.get(value.lower()):
-                return result
-
-            pound, *digits = value
-            if pound == "#" and all(d in string.hexdigits for d in digits):
-                if len(digits) in {3, 4}:
-                    r, g, b, *a = digits
-                    return rgb(
-                        r=int(f"{r}{r}", 16),
-                        g=int(f"{g}{g}", 16),
-                        b=int(f"{b}{b}", 16),
-                        a=(int(f"{a[0]}{a[0]}", 16) / 0xFF) if a else 1.0,
-                    )
-
-                elif len(digits) in {6, 8}:
-                    r1, r2, g1, g2, b1, b2, *a = digits
-                    return rgb(
-                        r=int(f"{r1}{r2}", 16),
-                        g=int(f"{g1}{g2}", 16),
-                        b=int(f"{b1}{b2}", 16),
-                        a=(int(f"{a[0]}{a[1]}", 16) / 0xFF) if a else 1.0,
-                    )
+            return _parse_string(value)
 
         raise ValueError(f"Unknown color: {value!r}")
 
@@ -230,6 +212,17 @@ class rgb(Color):
     def __hash__(self):
         return hash(("RGB-color", self.r, self.g, self.b, self.a))
 
+    def __eq__(self, other):
+        # Compare two rgb colors directly, rather than through their rgb properties.
+        if type(other) is rgb:
+            return (
+                self._r == other._r
+                and self._g == other._g
+                and self._b == other._b
+                and self._a == other._a
+            )
+        return super().__eq__(other)
+
     def __repr__(self):
         return f"rgb({self.r}, {self.g}, {self.b}, {self.a})"
 
@@ -331,6 +324,20 @@ class hsl(Color):
     def __hash__(self):
         return hash(("HSL-color", self.h, self.s, self.l, self.a))
 
+    def __eq__(self, other):
+        # Identical hsl colors are equal without being converted. Different hsl
+        # values can describe the same color (e.g., any hue of black), so other hsl
+        # colors still need to be compared as rgb.
+        if (
+            type(other) is hsl
+            and self._h == other._h
+            and self._s == other._s
+            and self._l == other._l
+            and self._a == other._a
+        ):
+            return True
+        return super().__eq__(other)
+
     def __repr__(self):
         return f"hsl({self.h}, {self.s}, {self.l}, {self.a})"
 
@@ -386,6 +393,102 @@ class hsl(Color):
 # As in CSS, hsla is simply a direct alias for hsl.
 hsla = hsl
 
+
+# Parsed colors are immutable, so the same instance can be returned every time a
+# string is parsed. Apps tend to use a small number of distinct color strings (e.g.,
+# in a theme) many times.
+@lru_cache(maxsize=1024)
+def _parse_string(value: str) -> Color:
+    if result := NAMED_COLOR.get(value.lower()):
+        return result
+
+    digits = value[1:]
+    if value[:1] == "#" and all(d in string.hexdigits for d in digits):
+        if len(digits) in {3, 4}:
+            # Each digit is repeated; 0xN * 17 == 0xNN.
+            r, g, b, *a = (int(d, 16) * 17 for d in digits)
+            return rgb(r, g, b, (a[0] / 0xFF) if a else 1.0)
+
+        elif len(digits) in {6, 8}:
+            r, g, b, *a = (int(digits[i : i + 2], 16) for i in range(0, len(digits), 2))
+            return rgb(r, g, b, (a[0] / 0xFF) if a else 1.0)
+
+    raise ValueError(f"Unknown color: {value!r}")
+
+
+def _convert_all(colors: Iterable[Color | str], attr: str) -> list[Color]:
+    converted = {}
+    result = []
+    for value in colors:
+        try:
+            result.append(converted[value])
+        except KeyError:
+            converted[value] = getattr(Color.parse(value), attr)
+            result.append(converted[value])
+    return result
+
+
+def to_rgb(colors: Iterable[Color | str]) -> list[rgb]:
+    """Convert a collection of colors to RGB.
+
+    Each distinct color is only parsed and converted once, so this is faster than
+    converting each color individually when colors are repeated (e.g., in the cells of a
+    heatmap).
+
+    :param colors: The colors to convert. Can be instances of `rgb` or `hsl`, or any
+        string accepted by `Color.parse()`.
+    :returns: The colors in RGB format, in the same order.
+    :raises ValueError: If a string can't be parsed as a color.
+    """
+    return _convert_all(colors, "rgb")
+
+
+def to_hsl(colors: Iterable[Color | str]) -> list[hsl]:
+    """Convert a collection of colors to HSL.
+
+    Each distinct color is only parsed and converted once.
+
+    :param colors: The colors to convert. Can be instances of `rgb` or `hsl`, or any
+        string accepted by `Color.parse()`.
+    :returns: The colors in HSL format, in the same order.
+    :raises ValueError: If a string can't be parsed as a color.
+    """
+    return _convert_all(colors, "hsl")
+
+
+def blend_over(
+    front_colors: Iterable[Color | str],
+    back_color: Color | str | Iterable[Color | str],
+) -> list[rgb]:
+    """Composite a collection of colors over a background, using the same "over"
+    straight alpha blending operation as `Color.blend_over()`.
+
+    Each distinct pair of colors is only blended once.
+
+    :param front_colors: The colors to composite.
+    :param back_color: The background color; or a collection of background colors,
+        one for each front color.
+    :returns: The blended colors, in the same order as the front colors.
+    :raises ValueError: If a string can't be parsed as a color, or a different number
+        of front and back colors is provided.
+    """
+    if isinstance(back_color, (Color, str)):
+        pairs = zip(front_colors, repeat(Color.parse(back_color)))
+    else:
+        pairs = zip(front_colors, back_color, strict=True)
+
+    blended = {}
+    result = []
+    for pair in pairs:
+        try:
+            result.append(blended[pair])
+        except KeyError:
+            front, back = pair
+            blended[pair] = Color.parse(front).blend_over(Color.parse(back))
+            result.append(blended[pair])
+    return result
+
+
 ######################################################################
 # 12-2025: Backwards compatibility for Travertino/Toga < 0.5.4
 ######################################################################
@@ -563,6 +666,9 @@ __all__ = [
     "rgb",
     "hsla",
     "hsl",
+    "to_rgb",
+    "to_hsl",
+    "blend_over",
     "color",  # Backwards compatibility for Toga < 0.5.0
     "NAMED_COLOR",
     "TRANSPARENT",  # noqa: F405
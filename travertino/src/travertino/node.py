@@ -5,6 +5,10 @@ class Node:
         self._parent = None
         self._root = None
 
+        # A node starts out needing layout; this is cleared by the style's layout
+        # algorithm once the node (and all its descendants) have been laid out.
+        self._layout_dirty = True
+
         # Explicitly set the internal attribute first, since the setter for style will
         # access the applicator property.
         self._applicator = None
@@ -32,7 +36,10 @@ class Node:
     def style(self, style):
         self._style = style.copy()
         self.intrinsic = self.style.IntrinsicSize()
+        # Let the intrinsic size notify the node when it changes.
+        self.intrinsic._node = self
         self.layout = self.style.Box(self)
+        self.mark_layout_dirty()
 
         if self.applicator:
             self.style._applicator = self.applicator
@@ -94,6 +101,25 @@ class Node:
         else:
             return self._children
 
+    @property
+    def layout_dirty(self):
+        """Does this node (or any of its descendants) need to be laid out again?"""
+        return self._layout_dirty
+
+    def mark_layout_dirty(self):
+        """Flag that this node needs to be laid out again.
+
+        Since the size of a node can depend on the size of its children, every ancestor
+        of the node is also marked as dirty. Any node that isn't dirty (and isn't being
+        given a different allocation of space by its parent) can retain its existing
+        layout.
+        """
+        node = self
+        # If a node is already dirty, all its ancestors will already be dirty too.
+        while node is not None and not node._layout_dirty:
+            node._layout_dirty = True
+            node = node._parent
+
     @property
     def can_have_children(self):
         """Determine if the node can have children.
@@ -117,6 +143,7 @@ class Node:
         self._children.append(child)
         child._parent = self
         self._set_root(child, self.root)
+        self.mark_layout_dirty()
 
     def insert(self, index, child):
         """Insert a node as a child of this one.
@@ -133,6 +160,7 @@ class Node:
         self._children.insert(index, child)
         child._parent = self
         self._set_root(child, self.root)
+        self.mark_layout_dirty()
 
     def remove(self, child):
         """Remove child from this node.
@@ -148,6 +176,7 @@ class Node:
         self._children.remove(child)
         child._parent = None
         self._set_root(child, None)
+        self.mark_layout_dirty()
 
     def clear(self):
         """Clear all children from this node."""
@@ -159,6 +188,7 @@ class Node:
             child._parent = None
             self._set_root(child, None)
         self._children = []
+        self.mark_layout_dirty()
 
     def refresh(self, viewport):
         """Refresh the layout and appearance of the tree this node is contained in."""
@@ -19,11 +19,41 @@ class BaseIntrinsicSize:
 
     width: The width of the node.
     height: The height of the node.
+
+    If the intrinsic size is bound to a node, any change in size will mark that node
+    as needing layout.
     """
 
+    # The node whose intrinsic size is being described. This is assigned by the node.
+    _node = None
+
     def __init__(self, width=None, height=None):
-        self.width = width
-        self.height = height
+        self._width = width
+        self._height = height
+
+    def _changed(self):
+        if self._node is not None:
+            self._node.mark_layout_dirty()
+
+    @property
+    def width(self):
+        return self._width
+
+    @width.setter
+    def width(self, value):
+        if value != self._width:
+            self._width = value
+            self._changed()
+
+    @property
+    def height(self):
+        return self._height
+
+    @height.setter
+    def height(self, value):
+        if value != self._height:
+            self._height = value
+            self._changed()
 
     def __repr__(self):
         return f"({self.width}, {self.height})"
@@ -131,9 +131,20 @@ class BaseStyle(ABC):  # noqa: B024
                 ######################################################################
 
     def copy(self, applicator=None):
-        """Create a duplicate of this style declaration."""
+        """Create a duplicate of this style declaration.
+
+        Stored property values have already been validated, and are never mutated in
+        place, so the duplicate shares them with this declaration instead of validating
+        each of them again. Assigning a new value to a property of either declaration
+        doesn't affect the other.
+        """
         dup = self.__class__()
-        dup.update(**self)
+        # Each property that has been set stores its value as "_<name>".
+        vars(dup).update(
+            (key, value)
+            for key, value in vars(self).items()
+            if key[1:] in self._ALL_PROPERTIES and key[0] == "_"
+        )
 
         ######################################################################
         # 10-2024: Backwards compatibility for Toga < 0.5.0
@@ -2,7 +2,7 @@ import re
 
 import pytest
 
-from travertino.colors import hsl, rgb
+from travertino.colors import Color, blend_over, hsl, rgb
 
 from ..utils import assert_equal_color
 
@@ -153,3 +153,27 @@ def test_alpha_unblend_over(front_color, back_color, expected_blended_color):
         # The derived front color from the blended color, will be equal to the
         # original front color, within the given tolerance range.
         assert_equal_color(calculated_front_color, front_color.rgb, abs=3)
+
+
+def test_blend_over_collection():
+    """A collection of colors can be composited over a single back color."""
+    front = [rgb(255, 0, 0, 0.5), "#0000ff80", rgb(255, 0, 0, 0.5), "red"]
+    blended = blend_over(front, "white")
+
+    assert blended == [
+        Color.parse(color).blend_over(rgb(255, 255, 255)) for color in front
+    ]
+    # Repeated colors are only blended once.
+    assert blended[0] is blended[2]
+
+
+def test_blend_over_pairs():
+    """A collection of colors can be composited over a collection of back colors."""
+    front = [rgb(255, 0, 0, 0.5), rgb(255, 0, 0, 0.5)]
+    back = [rgb(0, 0, 255), hsl(0, 0, 1)]
+    blended = blend_over(front, back)
+
+    assert blended == [front[0].blend_over(back[0]), front[1].blend_over(back[1])]
+
+    with pytest.raises(ValueError):
+        blend_over(front, back[:1])
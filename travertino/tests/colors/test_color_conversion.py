@@ -1,6 +1,6 @@
 import pytest
 
-from travertino.colors import hsl, rgb
+from travertino.colors import hsl, rgb, to_hsl, to_rgb
 
 from ..utils import assert_equal_color
 
@@ -164,3 +164,32 @@ def test_rgb_to_hsl(rgb_color, hsl_color):
 def test_hsl_to_rgb(rgb_color, hsl_color):
     """An hsl color can be converted to rgb."""
     assert_equal_color(hsl_color.rgb, rgb_color)
+
+
+def test_to_rgb():
+    """A collection of colors can be converted to RGB."""
+    colors = to_rgb([hsl(0, 1, 0.5), "#00ff00", rgb(0, 0, 255), "#00ff00"])
+
+    assert colors == [rgb(255, 0, 0), rgb(0, 255, 0), rgb(0, 0, 255), rgb(0, 255, 0)]
+    assert all(type(color) is rgb for color in colors)
+    # Repeated colors are only converted once.
+    assert colors[1] is colors[3]
+
+
+def test_to_hsl():
+    """A collection of colors can be converted to HSL."""
+    colors = to_hsl(color for color in ["red", rgb(0, 255, 0), "red"])
+
+    assert [(color.h, color.s, color.l) for color in colors] == [
+        (0, 1, 0.5),
+        (120, 1, 0.5),
+        (0, 1, 0.5),
+    ]
+    assert all(type(color) is hsl for color in colors)
+    assert colors[0] is colors[2]
+
+
+def test_convert_invalid():
+    """Invalid colors can't be converted."""
+    with pytest.raises(ValueError, match=r"Unknown color: 'not a color'"):
+        to_rgb(["red", "not a color"])
@@ -188,3 +188,27 @@ def test_read_only(color, attributes):
     for attribute in attributes:
         with pytest.raises(AttributeError):
             setattr(color, attribute, 0)
+
+
+@pytest.mark.parametrize(
+    "color, other, equal",
+    [
+        (rgb(10, 20, 30), rgb(10, 20, 30), True),
+        (rgb(10, 20, 30), rgb(10, 20, 31), False),
+        (rgb(10, 20, 30), rgb(10, 20, 30, 0.5), False),
+        (hsl(10, 0.2, 0.3), hsl(10, 0.2, 0.3), True),
+        (hsl(10, 0.2, 0.3), hsl(11, 0.2, 0.3), False),
+        # Different HSL values can describe the same color.
+        (hsl(10, 0.5, 0), hsl(200, 0.2, 0), True),
+        # Colors of different types are compared as RGB.
+        (rgb(255, 0, 0), hsl(0, 1, 0.5), True),
+        (hsl(0, 1, 0.5), rgb(255, 0, 0), True),
+        (rgb(255, 0, 0), "red", False),
+    ],
+)
+def test_equality(color, other, equal):
+    """Colors are equal if they describe the same RGB color."""
+    assert (color == other) is equal
+    # A color is always equal to itself.
+    same = color
+    assert color == same
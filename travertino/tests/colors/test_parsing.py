@@ -92,3 +92,10 @@ def test_deprecated():
         match=r"The color\(\) function is deprecated\. Use Color\.parse\(\) instead\.",
     ):
         color("#FFF")
+
+
+def test_parse_cached():
+    """Parsing the same string returns the same color instance."""
+    assert Color.parse("#abcdef") is Color.parse("#abcdef")
+    assert Color.parse("#ABCDEF") == Color.parse("#abcdef")
+    assert Color.parse("red") is Color.parse("RED")
@@ -1,8 +1,11 @@
+from unittest.mock import Mock
+
 import pytest
 
 from travertino.properties.validated import list_property, validated_property
 
 from .style_classes import (
+    VALUE1,
     VALUE2,
     VALUE3,
     VALUES,
@@ -51,6 +54,43 @@ def test_create_and_copy(StyleClass):
     assert dup.implicit == VALUE3
 
 
+def test_copy_shares_values(monkeypatch):
+    """A copy shares the already-validated values of the original."""
+    style = Style(explicit_const=VALUE2, list_prop=[VALUE3, 10])
+    style._applicator = Mock()
+
+    def no_validation(self, value):
+        raise AssertionError("Values shouldn't be validated again")
+
+    monkeypatch.setattr(validated_property, "validate", no_validation)
+    monkeypatch.setattr(list_property, "validate", no_validation)
+
+    dup = style.copy()
+    assert dup.explicit_const == VALUE2
+    assert dup.list_prop is style.list_prop
+    assert "implicit" not in dup
+
+    # The copy doesn't have an applicator, so nothing has been applied.
+    assert dup._applicator is None
+    dup.apply.assert_not_called()
+
+
+def test_copy_independent():
+    """Changing a copy doesn't change the original, and vice versa."""
+    style = Style(explicit_const=VALUE2, implicit=VALUE3)
+    dup = style.copy()
+
+    dup.explicit_const = VALUE1
+    del dup.implicit
+    style.explicit_value = 20
+
+    assert style.explicit_const == VALUE2
+    assert style.implicit == VALUE3
+    assert dup.explicit_const == VALUE1
+    assert "implicit" not in dup
+    assert "explicit_value" not in dup
+
+
 @pytest.mark.parametrize("StyleClass", [Style, DeprecatedStyle])
 def test_str(StyleClass):
     style = StyleClass()
@@ -328,9 +328,9 @@ def test_create_with_no_applicator():
     assert node.style.int_prop == 5
     assert node.style is not style
 
-    # Since no applicator has been assigned, the overall style wasn't applied. However,
-    # apply("int_prop") was still called.
-    node.style.apply.assert_called_once_with("int_prop")
+    # Copying a style doesn't apply its properties, and since no applicator has been
+    # assigned, the overall style wasn't applied either.
+    node.style.apply.assert_not_called()
 
 
 def test_create_with_applicator():
@@ -351,9 +351,9 @@ def test_create_with_applicator():
     assert applicator.node is node
     assert node.style._applicator is applicator
 
-    # First, call("int_prop") is called when style object is created.
-    # Assigning a non-None applicator should always apply style.
-    assert node.style.apply.mock_calls == [call("int_prop"), call()]
+    # Copying a style doesn't apply its properties, but assigning a non-None
+    # applicator should always apply style.
+    assert node.style.apply.mock_calls == [call()]
 
 
 @pytest.mark.parametrize(
@@ -442,9 +442,9 @@ def test_assign_style_with_applicator():
 
     assert node.style != style_1
 
-    # call("int_prop") is called when the style object is created.
-    # Since an applicator has already been assigned, assigning style applies the style.
-    assert node.style.apply.mock_calls == [call("int_prop"), call()]
+    # Copying a style doesn't apply its properties, but since an applicator has
+    # already been assigned, assigning style applies the style.
+    assert node.style.apply.mock_calls == [call()]
 
 
 def test_assign_style_with_no_applicator():
@@ -463,9 +463,8 @@ def test_assign_style_with_no_applicator():
 
     assert node.style != style_1
 
-    # Since no applicator has been assigned, the overall style wasn't applied. However,
-    # apply("int_prop") was still called when creating the style.
-    node.style.apply.assert_called_once_with("int_prop")
+    # Since no applicator has been assigned, the style wasn't applied.
+    node.style.apply.assert_not_called()
 
 
 def test_apply_before_node_is_ready():
@@ -501,3 +500,87 @@ def test_applicator_has_node_reference():
     with catch_warnings():
         filterwarnings("error", category=RuntimeWarning)
         Node(style=AttributeTestStyle(), applicator=Mock())
+
+
+def _clean(node):
+    # Simulate a layout pass that has laid out the full tree.
+    node._layout_dirty = False
+    for child in node.children:
+        _clean(child)
+
+
+def test_layout_dirty():
+    """Marking a node as dirty also marks all its ancestors as dirty."""
+    style = Style()
+    grandchild = Node(style=style)
+    child = Node(style=style, children=[grandchild])
+    sibling = Node(style=style)
+    node = Node(style=style, children=[child, sibling])
+
+    # A new node needs layout
+    assert node.layout_dirty
+
+    _clean(node)
+    assert not node.layout_dirty
+
+    grandchild.mark_layout_dirty()
+
+    assert grandchild.layout_dirty
+    assert child.layout_dirty
+    assert node.layout_dirty
+    # Siblings are unaffected
+    assert not sibling.layout_dirty
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda node, child: node.add(Node(style=Style())),
+        lambda node, child: node.insert(0, Node(style=Style())),
+        lambda node, child: node.remove(child),
+        lambda node, child: node.clear(),
+    ],
+)
+def test_layout_dirty_on_children_change(mutate):
+    """Changing the children of a node marks it as dirty."""
+    child = Node(style=Style())
+    node = Node(style=Style(), children=[child])
+    root = Node(style=Style(), children=[node])
+
+    _clean(root)
+    mutate(node, child)
+
+    assert node.layout_dirty
+    assert root.layout_dirty
+
+
+def test_layout_dirty_on_intrinsic_change():
+    """Changing the intrinsic size of a node marks it as dirty."""
+    child = Node(style=Style())
+    node = Node(style=Style(), children=[child])
+
+    _clean(node)
+    # Assigning the same size doesn't mark the node as dirty.
+    child.intrinsic.width = None
+    assert not node.layout_dirty
+
+    child.intrinsic.width = 10
+    assert child.layout_dirty
+    assert node.layout_dirty
+
+    _clean(node)
+    child.intrinsic.height = 20
+    assert child.layout_dirty
+    assert node.layout_dirty
+
+
+def test_layout_dirty_on_style_change():
+    """Assigning a new style to a node marks it as dirty."""
+    child = Node(style=Style())
+    node = Node(style=Style(), children=[child])
+
+    _clean(node)
+    child.style = Style(int_prop=3)
+
+    assert child.layout_dirty
+    assert node.layout_dirty
@@ -1,4 +1,5 @@
 from typing import NamedTuple
+from unittest.mock import Mock
 
 import pytest
 
@@ -49,3 +50,21 @@ def test_size_repr(box):
     assert repr(box.size) == "(1, 2)"
     box.size.width = at_least(10)
     assert repr(box.size) == "(at least 10, 2)"
+
+
+def test_size_change_notification():
+    """If bound to a node, a change in size is reported to the node."""
+    size = BaseIntrinsicSize(width=10, height=at_least(20))
+    size._node = Mock()
+
+    # Assigning equal values isn't a change.
+    size.width = 10
+    size.height = at_least(20)
+    size._node.mark_layout_dirty.assert_not_called()
+
+    size.width = at_least(10)
+    size._node.mark_layout_dirty.assert_called_once_with()
+
+    size._node.mark_layout_dirty.reset_mock()
+    size.height = 20
+    size._node.mark_layout_dirty.assert_called_once_with()
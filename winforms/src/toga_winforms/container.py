@@ -50,7 +50,7 @@ class Container(Scalable):
             force_refresh = True
 
         if force_refresh and self.content:
-            self.content.interface.refresh()
+            self.content.interface.refresh(immediate=True)
 
     def refreshed(self):
         layout = self.content.interface.layout